@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.frame_source import Frame, extract_ts_sec, list_images
+from app.session import (
+    ACTION_PICK_COACH,
+    ACTION_PLAYPLAN_COACH,
+    ACTION_PLAYPLAN_DRAFT,
+    DraftSession,
+)
+from app.settings import Settings
+from core.clock import FrameTimeline, VirtualClock
+
+# 테스트셋 폴더 안의 정답 전환 시각 파일
+LABELS_FILENAME = "transitions.json"
+
+# 코치 호출이 맞는 실제 상태
+ACTION_PHASE = {
+    ACTION_PICK_COACH: "PICK",
+    ACTION_PLAYPLAN_DRAFT: "PICK",
+    ACTION_PLAYPLAN_COACH: "PREPARE",
+}
+
+
+@dataclass(frozen=True)
+class TransitionLabel:
+    state: str  # 전환 후 상태
+    ts: float  # 전환 시각(초, 프레임 시계 기준)
+
+
+@dataclass(frozen=True)
+class SessionLabels:
+    initial_state: str
+    transitions: Tuple[TransitionLabel, ...]
+
+    def truth_at(self, ts: float) -> str:
+        state = self.initial_state
+        for label in self.transitions:
+            if label.ts > ts:
+                break
+            state = label.state
+        return state
+
+    def label_for(self, state: str) -> Optional[TransitionLabel]:
+        return next((label for label in self.transitions if label.state == state), None)
+
+
+def load_transition_labels(folder: Path, frame_period_sec: float = 1.0) -> SessionLabels:
+    """
+    <testset>/transitions.json 읽기.
+
+    {"initial": "BAN",
+     "transitions": [{"state": "PICK", "frame": "lol_client_1770452190299.png"},
+                     {"state": "PREPARE", "ts": 1770452260.5}]}
+
+    frame으로 주면 그 프레임의 시각(파일명 timestamp, 없으면 직전 프레임 + frame_period_sec)을 쓴다.
+    """
+    folder = Path(folder)
+    data = json.loads((folder / LABELS_FILENAME).read_text(encoding="utf-8"))
+
+    frame_ts: Dict[str, float] = {}
+    timeline = FrameTimeline(frame_period_sec)
+    for idx, path in enumerate(list_images(folder), start=1):
+        ts = timeline.next(extract_ts_sec(path.name), idx)
+        if ts is not None:
+            frame_ts[path.name] = ts
+
+    transitions = []
+    for item in data["transitions"]:
+        if "ts" in item:
+            ts = float(item["ts"])
+        elif item.get("frame") in frame_ts:
+            ts = frame_ts[item["frame"]]
+        else:
+            raise ValueError(f"전환 라벨에 ts/frame이 없거나 프레임을 찾을 수 없음: {item}")
+        transitions.append(TransitionLabel(state=item["state"], ts=ts))
+
+    transitions.sort(key=lambda label: label.ts)
+    return SessionLabels(initial_state=data.get("initial", "BAN"), transitions=tuple(transitions))
+
+
+# ======================
+# Result
+# ======================
+@dataclass
+class SessionBenchmark:
+    session_id: str
+    frames: int = 0
+
+    # 전환별 stable 상태 반영 지연: {"state", "label_ts", "detected_ts", "latency_s", "latency_frames"}
+    transitions: List[dict] = field(default_factory=list)
+
+    # 코치 호출 결정: {"action", "frame", "ts", "latency_s"}
+    decisions: List[dict] = field(default_factory=list)
+
+    # 실제 상태와 다른 stable 전환 / 코치 호출: {"kind", "frame", "ts", "state", "truth"}
+    false_triggers: List[dict] = field(default_factory=list)
+
+    # 프레임당 파이프라인 시간(ms)
+    frame_ms: Dict[str, float] = field(default_factory=dict)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def _frame_ms_stats(costs: Sequence[float]) -> Dict[str, float]:
+    if not costs:
+        return {}
+    ms = np.asarray(costs) * 1000.0
+    return {
+        "mean": round(float(ms.mean()), 3),
+        "p50": round(float(np.percentile(ms, 50)), 3),
+        "p95": round(float(np.percentile(ms, 95)), 3),
+        "max": round(float(ms.max()), 3),
+    }
+
+
+# ======================
+# Run
+# ======================
+def benchmark_session(
+    session_id: str,
+    frames: Iterable[Frame],
+    labels: SessionLabels,
+    settings: Settings,
+    frame_period_sec: float = 1.0,
+) -> SessionBenchmark:
+    """
+    실제 파이프라인(DraftSession.step)을 프레임 시각에 맞춘 VirtualClock으로 돌려서
+    라벨 대비 전환 지연 / 오탐 / 프레임당 비용을 잰다.
+    코치 API는 호출하지 않고, run_main처럼 PICK 코치는 1회, PLAYPLAN에서 종료한다.
+    """
+    bench = SessionBenchmark(session_id=session_id)
+    clock = VirtualClock()
+    session = DraftSession(settings, session_id=session_id, clock=clock)
+
+    pending = {label.state: label for label in labels.transitions}
+    label_frame: Dict[str, int] = {}
+    costs: List[float] = []
+    prev_stable: Optional[str] = None
+
+    timeline = FrameTimeline(frame_period_sec)
+    for frame in frames:
+        now = timeline.next(frame.ts, frame.index)
+        if now is None:
+            print(f"[WARN] {session_id} 프레임 시각이 뒤로 감, 건너뜀:", frame.name)
+            continue
+
+        clock.set(now)
+        t0 = time.perf_counter()
+        res = session.step(frame.image, frame.image.size)
+        costs.append(time.perf_counter() - t0)
+        bench.frames += 1
+
+        truth = labels.truth_at(now)
+        for state, label in pending.items():
+            if state not in label_frame and now >= label.ts:
+                label_frame[state] = bench.frames
+
+        # 전환 지연: 라벨 시각 이후 처음 stable이 그 상태가 된 프레임
+        label = pending.get(res.stable_state)
+        if label is not None and res.stable_state in label_frame:
+            pending.pop(res.stable_state)
+            bench.transitions.append(
+                {
+                    "state": label.state,
+                    "label_ts": label.ts,
+                    "detected_ts": now,
+                    "latency_s": round(now - label.ts, 3),
+                    "latency_frames": bench.frames - label_frame[label.state],
+                }
+            )
+
+        if (
+            prev_stable is not None
+            and res.stable_state != prev_stable
+            and res.stable_state != truth
+        ):
+            bench.false_triggers.append(
+                {
+                    "kind": "state",
+                    "frame": frame.index,
+                    "ts": now,
+                    "state": res.stable_state,
+                    "truth": truth,
+                }
+            )
+        prev_stable = res.stable_state
+
+        if res.action is None:
+            continue
+
+        phase = ACTION_PHASE[res.action]
+        phase_label = labels.label_for(phase)
+        bench.decisions.append(
+            {
+                "action": res.action,
+                "frame": frame.index,
+                "ts": now,
+                "latency_s": None if phase_label is None else round(now - phase_label.ts, 3),
+            }
+        )
+        if truth != phase:
+            bench.false_triggers.append(
+                {
+                    "kind": "action",
+                    "frame": frame.index,
+                    "ts": now,
+                    "state": res.action,
+                    "truth": truth,
+                }
+            )
+
+        if res.action == ACTION_PICK_COACH:
+            session.mark_pick_coached()
+        elif res.action == ACTION_PLAYPLAN_DRAFT:
+            session.mark_playplan_drafted()
+        elif res.action == ACTION_PLAYPLAN_COACH:
+            session.mark_playplan_coached()
+            break
+
+    session.finish()
+
+    for state, label in pending.items():
+        bench.transitions.append(
+            {
+                "state": state,
+                "label_ts": label.ts,
+                "detected_ts": None,
+                "latency_s": None,
+                "latency_frames": None,
+            }
+        )
+    bench.transitions.sort(key=lambda t: t["label_ts"])
+    bench.frame_ms = _frame_ms_stats(costs)
+    return bench
+
+
+def summarize(benches: Sequence[SessionBenchmark]) -> dict:
+    """세션 여러 개 합산: 전환 상태별 평균/최대 지연, 미검출 수, 오탐 수, 프레임 비용."""
+    by_state: Dict[str, List[Optional[float]]] = {}
+    for bench in benches:
+        for t in bench.transitions:
+            by_state.setdefault(t["state"], []).append(t["latency_s"])
+
+    latency = {}
+    for state, values in by_state.items():
+        found = [v for v in values if v is not None]
+        latency[state] = {
+            "mean_s": round(float(np.mean(found)), 3) if found else None,
+            "max_s": round(float(np.max(found)), 3) if found else None,
+            "missed": len(values) - len(found),
+        }
+
+    all_ms = [b.frame_ms["mean"] for b in benches if b.frame_ms]
+    frames = sum(b.frames for b in benches)
+    return {
+        "sessions": len(benches),
+        "frames": frames,
+        "transition_latency": latency,
+        "false_triggers": sum(len(b.false_triggers) for b in benches),
+        "frame_ms_mean": round(
+            float(np.average(all_ms, weights=[b.frames for b in benches if b.frame_ms])), 3
+        )
+        if all_ms
+        else None,
+        "frame_ms_p95_max": max((b.frame_ms["p95"] for b in benches if b.frame_ms), default=None),
+    }
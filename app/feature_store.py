@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import hashlib
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.features import FEATURE_PIPELINE_VERSION, FrameFeatures
+from app.frame_source import extract_ts_sec
+from app.offline import extract_features_parallel
+from config.path import PATHS
+
+# timer_seconds None 표현
+_NO_SECONDS = -1
+
+
+def file_hash(path: Path) -> str:
+    """프레임 파일 내용 해시 (파일명/위치가 바뀌어도 같은 프레임이면 같은 키)."""
+    return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+
+
+def default_store_path(version: int = FEATURE_PIPELINE_VERSION) -> Path:
+    return PATHS.FEATURE_CACHE_DIR / f"features_v{version}.npz"
+
+
+class FeatureStore:
+    """
+    프레임 내용 해시 -> FrameFeatures 캐시 (.npz, 컬럼 단위 저장).
+    파일 이름에 파이프라인 버전이 들어가므로 버전이 바뀌면 자동으로 새 캐시를 쓴다.
+
+    index/name/ts는 파일 경로에 딸린 값이라 저장하지 않고 조회할 때 다시 채운다.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else default_store_path()
+        self._rows: Dict[str, FrameFeatures] = {}
+        self._dirty = False
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def load(self) -> None:
+        if not self.path.exists():
+            return
+
+        with np.load(self.path, allow_pickle=False) as z:
+            if int(z["version"]) != FEATURE_PIPELINE_VERSION:
+                return
+            cols = {k: z[k] for k in z.files}
+
+        for i, key in enumerate(cols["hash"]):
+            sec = int(cols["timer_seconds"][i])
+            self._rows[str(key)] = FrameFeatures(
+                index=0,
+                name="",
+                ts=None,
+                status_text_raw=str(cols["status_text_raw"][i]),
+                status_text_norm=str(cols["status_text_norm"][i]),
+                raw_state=str(cols["raw_state"][i]),
+                ban_std=float(cols["ban_std"][i]),
+                timer_seconds=None if sec == _NO_SECONDS else sec,
+                timer_near_zero=bool(cols["timer_near_zero"][i]),
+                dual_symmetry=bool(cols["dual_symmetry"][i]),
+            )
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+
+        keys = list(self._rows)
+        rows = [self._rows[k] for k in keys]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp = self.path.with_suffix(".tmp.npz")
+        np.savez_compressed(
+            tmp,
+            version=np.int32(FEATURE_PIPELINE_VERSION),
+            hash=np.array(keys, dtype="U40"),
+            status_text_raw=np.array([r.status_text_raw for r in rows], dtype=str),
+            status_text_norm=np.array([r.status_text_norm for r in rows], dtype=str),
+            raw_state=np.array([r.raw_state for r in rows], dtype=str),
+            ban_std=np.array([r.ban_std for r in rows], dtype=np.float64),
+            timer_seconds=np.array(
+                [_NO_SECONDS if r.timer_seconds is None else r.timer_seconds for r in rows],
+                dtype=np.int16,
+            ),
+            timer_near_zero=np.array([r.timer_near_zero for r in rows], dtype=bool),
+            dual_symmetry=np.array([r.dual_symmetry for r in rows], dtype=bool),
+        )
+        tmp.replace(self.path)
+        self._dirty = False
+
+    def get(self, key: str, index: int, path: Path) -> Optional[FrameFeatures]:
+        row = self._rows.get(key)
+        if row is None:
+            return None
+        return replace(row, index=index, name=path.name, ts=extract_ts_sec(path.name))
+
+    def put(self, key: str, feat: FrameFeatures) -> None:
+        self._rows[key] = feat
+        self._dirty = True
+
+
+def load_or_extract_features(
+    paths: Sequence[Path], store: FeatureStore, workers: int = 0
+) -> Tuple[List[FrameFeatures], int]:
+    """
+    캐시에 있는 프레임은 그대로 쓰고, 없는 프레임만 병렬 추출 후 캐시에 저장.
+    반환: (입력 순서의 피처 리스트, 캐시 hit 수)
+    """
+    keys = [file_hash(p) for p in paths]
+    out: List[Optional[FrameFeatures]] = [
+        store.get(key, idx, p) for idx, (key, p) in enumerate(zip(keys, paths), start=1)
+    ]
+
+    missing = [i for i, feat in enumerate(out) if feat is None]
+    hits = len(paths) - len(missing)
+
+    if missing:
+        fresh = extract_features_parallel([paths[i] for i in missing], workers=workers)
+        for i, feat in zip(missing, fresh):
+            feat = replace(feat, index=i + 1)
+            out[i] = feat
+            store.put(keys[i], feat)
+        store.save()
+
+    return out, hits
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from PIL import Image
+
+from app.rois import Rois, extract_rois
+from core.ocr_engine import extract_text
+from pipeline.classifier import StateClassifier
+from pipeline.normalizer import TextNormalizer
+from pipeline.pick_stage_detector import PickStageResult, detect_pick_kind_from_banned_strips
+from pipeline.prepare_phase_detector import analyze_prepare_timer
+
+# OCR/전처리/판정 로직이 바뀌어 피처 값이 달라지면 올린다 (피처 캐시 무효화)
+FEATURE_PIPELINE_VERSION = 2
+
+
+@dataclass(frozen=True)
+class FrameFeatures:
+    """
+    프레임 1장에서 뽑은, 임계값/버퍼 크기와 무관한 값들.
+    상태 머신은 이 값들만으로 재생할 수 있다 (DraftSession.step_features).
+    """
+
+    index: int
+    name: str
+    ts: Optional[float]
+
+    status_text_raw: str
+    status_text_norm: str
+    raw_state: str
+
+    ban_std: float  # 밴 strip(우리+상대) 표준편차
+
+    timer_seconds: Optional[int]
+    timer_near_zero: bool
+    dual_symmetry: bool
+
+    @property
+    def dual_now(self) -> bool:
+        # is_dual_timer_effective와 같은 규칙
+        return (not self.timer_near_zero) and self.dual_symmetry
+
+    def pick_result(self, std_threshold: float) -> PickStageResult:
+        # detect_ban_strip_variance: is_filled = std >= threshold
+        kind = "PICK_REAL" if self.ban_std >= std_threshold else "PICK_FAKE"
+        return PickStageResult(kind=kind, std=self.ban_std)
+
+
+_normalizer = TextNormalizer()
+_classifier = StateClassifier()
+
+
+def extract_features(
+    index: int, name: str, ts: Optional[float], frame_img: Image.Image, window_size: Tuple[int, int]
+) -> FrameFeatures:
+    return extract_features_from_rois(index, name, ts, extract_rois(frame_img, window_size))
+
+
+def extract_features_from_rois(
+    index: int, name: str, ts: Optional[float], rois: Rois
+) -> FrameFeatures:
+    status_text_raw = extract_text(rois.status_img)
+    status_text_norm = _normalizer.normalize(status_text_raw)
+    raw_state = _classifier.classify(status_text_norm)
+
+    pick_res = detect_pick_kind_from_banned_strips(rois.bans_my_img, rois.bans_enemy_img)
+    timer = analyze_prepare_timer(rois.timer_bar_img, rois.timer_digits_img)
+
+    return FrameFeatures(
+        index=index,
+        name=name,
+        ts=ts,
+        status_text_raw=status_text_raw,
+        status_text_norm=status_text_norm,
+        raw_state=raw_state,
+        ban_std=pick_res.std,
+        timer_seconds=timer.seconds,
+        timer_near_zero=timer.near_zero,
+        dual_symmetry=timer.symmetry,
+    )
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+from PIL import Image
+
+IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".webp", ".bmp"}
+
+# lol_client_1770452190299.png 같은 파일명의 timestamp(ms)
+TS_PATTERN = re.compile(r".*_(\d{10,})\.[a-z]+$", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Frame:
+    index: int
+    name: str
+    ts: Optional[float]  # 초 단위 (파일명에 timestamp가 없으면 None)
+    image: Image.Image
+
+
+def list_images(folder: Path) -> list[Path]:
+    paths = [p for p in folder.iterdir() if p.is_file() and p.suffix.lower() in IMAGE_EXTS]
+    return sorted(paths, key=lambda p: p.name)
+
+
+def open_rgb(path: Path) -> Image.Image:
+    img = Image.open(path)
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    return img
+
+
+def extract_ts_sec(filename: str) -> Optional[float]:
+    m = TS_PATTERN.match(filename)
+    if not m:
+        return None
+    return int(m.group(1)) / 1000.0
+
+
+class ImageDirFrameSource:
+    """캡처 이미지 폴더(lol_client/<testset>)를 파일명 순서대로 프레임으로 순회."""
+
+    def __init__(self, folder: Path, limit: int = 0):
+        self.folder = Path(folder)
+        self.limit = limit
+        self.paths = list_images(self.folder)
+        if limit:
+            self.paths = self.paths[:limit]
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __iter__(self) -> Iterator[Frame]:
+        for idx, path in enumerate(self.paths, start=1):
+            yield Frame(
+                index=idx, name=path.name, ts=extract_ts_sec(path.name), image=open_rgb(path)
+            )
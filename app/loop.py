@@ -1,135 +1,197 @@
 from __future__ import annotations
-import time
-from typing import Iterable, Optional
+from functools import partial
+from typing import Optional
 
 from config.path import PATHS
-from core.ocr_engine import extract_text
-from core.lol_pick_coach import get_client, lol_mid_pick_coach_stream
-from core.lol_playplan_coach import get_playplan_coach_client, lol_playplan_stream
-
-from pipeline.buffer import StateBuffer
-from pipeline.classifier import StateClassifier
-from pipeline.normalizer import TextNormalizer
-from pipeline.pick_stage_detector import detect_pick_kind_from_banned_strips
-from pipeline.prepare_phase_detector import is_dual_timer_effective
-from pipeline.state_manager import StableStateManager
+from core.lol_pick_coach import get_client
+from core.lol_playplan_coach import get_playplan_coach_client, lol_playplan_stream, lol_playplan_update_stream
 
+from core.clock import SYSTEM_CLOCK, Clock
+from core.coach_resilience import CoachGuard, DeadlineExceeded, format_guard_stats
+from core.pick_coach_parser import PickCoachParser
+from core.ocr_pool import OcrPoolConfig, OcrWorkerPool
 from core.window_tracker import WindowTracker
 
 from app.settings import Settings
+from app.pacer import FramePacer
 from app.capture import get_frame
-from app.rois import extract_rois
-
-def run_streaming(label: str, stream_iter: Iterable[str]) -> str:
-    chunks: list[str] = []
-    start_t = time.perf_counter()
-    first_token_time: Optional[float] = None
-
-    for delta in stream_iter:
-        if first_token_time is None:
-            first_token_time = time.perf_counter()
-            print(f"\n[{label}] ⏱ 첫 토큰: {first_token_time - start_t:.2f}s\n")
-        print(delta, end="", flush=True)
-        chunks.append(delta)
-
-    end_t = time.perf_counter()
-    print(f"\n\n[{label}] ⏱ 전체: {end_t - start_t:.2f}s")
-    return "".join(chunks)
-
-def run_main(settings: Settings) -> None:
+from app.playplan import PlayplanDraft, progressive_playplan_stream
+from app.streaming import build_coach_guard, open_pick_coach_stream, pick_deadline, run_streaming
+from app.token_bus import ConsoleSubscriber, JsonlSubscriber, TokenBus, WebSocketSubscriber, format_stream_stats
+from app.session import ACTION_PICK_COACH, ACTION_PLAYPLAN_COACH, ACTION_PLAYPLAN_DRAFT, DraftSession
+
+def build_token_bus(settings: Settings) -> TokenBus:
+    """콘솔 + (설정 시) JSONL 기록 / 오버레이 WebSocket 구독자"""
+    bus = TokenBus([ConsoleSubscriber()])
+    if settings.coach_tokens_jsonl:
+        bus.subscribe(JsonlSubscriber(settings.coach_tokens_jsonl))
+    if settings.overlay_ws_port:
+        ws = bus.subscribe(WebSocketSubscriber(port=settings.overlay_ws_port))
+        print(f"🛰 overlay token stream: ws://{ws.host}:{ws.port}")
+    return bus
+
+def run_main(settings: Settings, clock: Clock = SYSTEM_CLOCK) -> None:
+    ocr_pool = None
+    if settings.ocr_workers > 0:
+        ocr_pool = OcrWorkerPool(
+            OcrPoolConfig(workers=settings.ocr_workers, roi_backends=tuple(settings.ocr_backends.items()))
+        ).start()
+    bus = build_token_bus(settings)
+    guard = build_coach_guard(settings, clock)
+
+    try:
+        _run_loop(settings, ocr_pool, clock, bus, guard)
+    finally:
+        bus.close()
+        print_token_stats(bus)
+        print(format_guard_stats("COACH", guard))
+        if ocr_pool is not None:
+            ocr_pool.close()
+
+def _run_loop(settings: Settings, ocr_pool, clock: Clock, bus: TokenBus, guard: CoachGuard) -> None:
     tracker = WindowTracker(settings.window_title)
+    session = DraftSession(settings, ocr_pool=ocr_pool, clock=clock)
 
-    normalizer = TextNormalizer()
-    classifier = StateClassifier()
+    pacer = FramePacer(1.0 / settings.target_fps, clock) if settings.target_fps > 0 else None
 
-    state_buf = StateBuffer(size=settings.state_buf_size)
-    dual_buf = StateBuffer(size=settings.dual_buf_size)
+    def pace() -> None:
+        if pacer is None:
+            clock.sleep(settings.sleep_sec)
+            return
 
-    state_manager = StableStateManager(min_duration=1.0, min_confidence=0.7)
+        pacer.wait()
+        every = settings.pacer_report_every
+        if every and pacer.frames and pacer.frames % every == 0:
+            print_pacer_stats(pacer)
 
     pick_coach_client = get_client()
     playplan_coach_client = get_playplan_coach_client()
-
-    pick_real_executed = False
+    draft: Optional[PlayplanDraft] = None
+
+    def open_playplan(picks_img, picks_known: Optional[int] = None):
+        return guard.stream(
+            lambda timeout_s: lol_playplan_stream(
+                picks_img,
+                client=playplan_coach_client,
+                model=settings.gemini_model,
+                timeout_s=timeout_s,
+                picks_known=picks_known,
+            )
+        )
+
+    def open_playplan_update(picks_img, d: PlayplanDraft):
+        return guard.stream(
+            lambda timeout_s: lol_playplan_update_stream(
+                picks_img,
+                draft_img=d.picks_img,
+                draft_text=d.text,
+                draft_picks_known=d.picks_known,
+                client=playplan_coach_client,
+                model=settings.gemini_model,
+                timeout_s=timeout_s,
+            )
+        )
 
     while True:
         frame_img, window_size = get_frame(tracker, settings.sleep_sec)
         if frame_img is None or window_size is None:
             print("[WARN] 롤 클라이언트를 찾을 수 없음/캡처 실패")
-            dual_buf.reset()
-            time.sleep(settings.sleep_sec)
+            session.reset_capture()
+            pace()
             continue
 
-        rois = extract_rois(frame_img, window_size)
+        res = session.step(frame_img, window_size)
 
-        if settings.debug_save:
+        if settings.debug_save and res.changed:
             frame_img.save(PATHS.LOL_CLIENT_CAPTURE_PNG)
-            rois.status_img.save(PATHS.BANPICK_STATUS_TEXT_CAPTURE_PNG)
+            session.rois.status_img.save(PATHS.BANPICK_STATUS_TEXT_CAPTURE_PNG)
 
-        status_text_raw = extract_text(rois.status_img)
-        status_text_norm = normalizer.normalize(status_text_raw)
-        raw_state = classifier.classify(status_text_norm)
+        # 상태가 바뀐 프레임에서만 출력 (DraftState diff)
+        diff = res.draft_diff
+        if diff:
+            print(f"[STATE] {res.draft_state} {diff}")
 
-        state_buf.push(raw_state)
-        major_state = state_buf.get_majority()
-        major_conf = state_buf.get_confidence()
-        stable_state = state_manager.update(major_state, major_conf)
-        print("stable state:", stable_state)
+        if res.pick_res is not None and "pick_kind" in diff:
+            print(f"[PICK] 판정: kind={res.pick_res.kind} std={res.pick_res.std:.2f}")
 
-        if stable_state == "PICK":
-            if raw_state == "BAN" or pick_real_executed:
-                time.sleep(settings.sleep_sec)
-                continue
+        if res.dual_now is not None and "dual" in diff:
+            print(f"[PREPARE] DualEffective: now={res.dual_now} stable={res.dual_stable} ({res.dual_conf:.2f})")
 
-            pick_res = detect_pick_kind_from_banned_strips(
-                rois.bans_my_img,
-                rois.bans_enemy_img,
-                std_threshold=settings.pick_std_threshold,
-            )
-            print(f"[PICK] 판정: kind={pick_res.kind} std={pick_res.std:.2f}")
-
-            if pick_res.kind == "PICK_REAL":
-                try:
-                    run_streaming(
-                        "PICK_COACH",
-                        lol_mid_pick_coach_stream(
-                            rois.picks_merged_img,
-                            client=pick_coach_client,
-                            model=settings.gemini_model,
+        if res.action is not None and guard.breaker.is_open:
+            # 실패 중인 엔드포인트는 두드리지 않는다 (차단 시간이 지나면 시험 호출 1번)
+            pace()
+            continue
+
+        if res.action == ACTION_PICK_COACH:
+            if res.draft_delta is not None:
+                print(f"[PICK] 픽 변화: {res.draft_delta.summary()} -> 픽 코치 다시")
+            picks_img = session.rois.picks_merged_img
+            try:
+                run_streaming(
+                    "PICK_COACH",
+                    guard.stream(
+                        lambda timeout_s: open_pick_coach_stream(
+                            settings, picks_img, client=pick_coach_client, timeout_s=timeout_s
                         ),
-                    )
-                except Exception as e:
-                    print("[ERR] Gemini 호출 실패:", repr(e))
-                    time.sleep(settings.sleep_sec)
-                    continue
-
-                pick_real_executed = True
-                time.sleep(settings.sleep_sec)
+                        pick_deadline(settings, res.pick_seconds_left, clock),
+                    ),
+                    bus=bus,
+                    parser=PickCoachParser(),
+                )
+            except DeadlineExceeded as e:
+                # 남은 픽 시간 안에 추천을 받을 수 없음 -> 이번 픽은 코치 없이
+                print(f"[PICK] {e} (남은 {res.pick_seconds_left}s)")
+            except Exception as e:
+                print("[ERR] Gemini 호출 실패:", repr(e))
+                print(format_guard_stats("COACH", guard))
+                pace()
                 continue
 
-        elif stable_state == "PREPARE":
-            dual_now = is_dual_timer_effective(
-                timer_bar_img=rois.timer_bar_img,
-                timer_digits_img=rois.timer_digits_img,
-            )
-            dual_buf.push(dual_now)
-            dual_stable = dual_buf.get_majority()
-            dual_conf = dual_buf.get_confidence()
+            session.mark_pick_coached()
 
-            print(f"[PREPARE] DualEffective: now={dual_now} stable={dual_stable} ({dual_conf:.2f})")
+        elif res.action == ACTION_PLAYPLAN_DRAFT:
+            # 밴픽 루프를 막지 않도록 백그라운드에서 생성, 출력은 최종 확정 때
+            print(f"[PICK] {res.picks_filled}/10 픽 확정 -> 플레이 플랜 초안 생성 시작")
+            picks_img = session.rois.picks_merged_img
+            draft = PlayplanDraft(picks_img, res.picks_filled, partial(open_playplan, picks_img, res.picks_filled))
+            draft.start()
+            session.mark_playplan_drafted()
 
-            if dual_stable is True and dual_conf >= settings.dual_conf_threshold:
-                print("[PREPARE] 양팀 모든 챔피언 픽 됐습니다 (stable)")
+        elif res.action == ACTION_PLAYPLAN_COACH:
+            print("[PREPARE] 양팀 모든 챔피언 픽 됐습니다 (stable)")
+            picks_img = session.rois.picks_merged_img
+            try:
                 run_streaming(
                     "PLAYPLAN_COACH",
-                    lol_playplan_stream(
-                        rois.picks_merged_img,
-                        client=playplan_coach_client,
-                        model=settings.gemini_model,
+                    progressive_playplan_stream(
+                        draft,
+                        lambda: open_playplan(picks_img),
+                        lambda d: open_playplan_update(picks_img, d),
                     ),
+                    bus=bus,
                 )
-                break
-        else:
-            dual_buf.reset()
+            except Exception as e:
+                print("[ERR] Gemini 호출 실패:", repr(e))
+                print(format_guard_stats("COACH", guard))
+                draft = None  # 다음 프레임에서 초안 없이 전체 플랜을 다시 요청
+                pace()
+                continue
+            session.mark_playplan_coached()
+            break
+
+        pace()
+
+    if pacer is not None:
+        print_pacer_stats(pacer)
+
+def print_pacer_stats(pacer: FramePacer) -> None:
+    s = pacer.stats()
+    print(
+        f"[PACE] target={s.target_fps}fps achieved={s.achieved_fps}fps"
+        f" overruns={s.overruns}/{s.frames} jitter={s.jitter_ms}ms work={s.mean_work_ms}ms"
+    )
 
-        time.sleep(settings.sleep_sec)
\ No newline at end of file
+def print_token_stats(bus: TokenBus) -> None:
+    for sub_history in [bus.producer_history] + [sub.history for sub in bus.subscribers]:
+        for stats in sub_history:
+            print(format_stream_stats(stats))
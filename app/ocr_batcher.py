@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from PIL import Image
+
+from core.ocr_engine import extract_text_batch
+from core.ocr_profiles import STATUS_PROFILE
+
+# (같은 프로필 이미지들, 프로필 이름) -> 텍스트들
+BatchFn = Callable[[Sequence[Image.Image], str], List[str]]
+
+
+@dataclass(frozen=True)
+class OcrBatchConfig:
+    max_batch: int = 8
+    # 첫 요청이 들어온 뒤 이 시간까지만 다른 세션 요청을 모은다 (지연 예산)
+    max_wait_ms: float = 15.0
+
+
+class OcrMicroBatcher:
+    """
+    여러 세션의 OCR 요청을 짧은 시간창 안에서 모아 한 번에 처리.
+    extract_text와 같은 시그니처(img, profile -> str)를 제공하므로
+    DraftSession(ocr=batcher.extract_text)처럼 그대로 주입할 수 있다.
+    모인 요청은 OCR 프로필별로 나눠 프로필마다 batch_fn을 1번 호출한다.
+    """
+
+    def __init__(
+        self, cfg: OcrBatchConfig = OcrBatchConfig(), batch_fn: BatchFn = extract_text_batch
+    ):
+        self.cfg = cfg
+        self.batch_fn = batch_fn
+        self._queue: "queue.Queue[Optional[Tuple[Image.Image, str, Future]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+        self.batches = 0
+        self.items = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.items / self.batches if self.batches else 0.0
+
+    def start(self) -> "OcrMicroBatcher":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="ocr-batcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def submit(self, img: Image.Image, profile: str = STATUS_PROFILE) -> Future:
+        fut: Future = Future()
+        self._queue.put((img, profile, fut))
+        return fut
+
+    def extract_text(self, img: Image.Image, profile: str = STATUS_PROFILE) -> str:
+        return self.submit(img, profile).result()
+
+    def _collect(self, first: Tuple[Image.Image, str, Future]) -> Tuple[list, bool]:
+        batch = [first]
+        deadline = time.perf_counter() + self.cfg.max_wait_ms / 1000.0
+
+        while len(batch) < self.cfg.max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+
+        return batch, False
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+
+            batch, stopping = self._collect(first)
+
+            by_profile: Dict[str, list] = {}
+            for img, profile, fut in batch:
+                by_profile.setdefault(profile, []).append((img, fut))
+
+            for profile, items in by_profile.items():
+                futures = [fut for _, fut in items]
+                try:
+                    texts = self.batch_fn([img for img, _ in items], profile)
+                    for fut, text in zip(futures, texts):
+                        fut.set_result(text)
+                except Exception as e:
+                    for fut in futures:
+                        fut.set_exception(e)
+
+                self.batches += 1
+                self.items += len(items)
+
+            if stopping:
+                return
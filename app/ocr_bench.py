@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import time
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+from PIL import Image
+
+from app.frame_source import ImageDirFrameSource
+from core.ocr_backends import PYTESSERACT_BACKEND, GlyphTemplates, get_backend
+from core.ocr_profiles import OcrProfile, prepare, profile_for_roi
+from core.roi_layout import get_roi_layout
+
+# 벤치마크 대상 ROI (OCR을 쓰는 ROI만)
+OCR_BENCH_ROIS = ("BANPICK_STATUS_TEXT", "BANPICK_TIMER_DIGITS")
+
+
+@dataclass(frozen=True)
+class OcrSample:
+    name: str  # "<testset>/<frame 파일명>"
+    roi: str
+    image: Image.Image
+
+
+def load_ocr_corpus(
+    folders: Iterable[Path], rois: Sequence[str] = OCR_BENCH_ROIS, limit: int = 0
+) -> List[OcrSample]:
+    """캡처 프레임 폴더들에서 ROI별 크롭을 모은다 (프레임 크기별 레이아웃 사용)."""
+    samples = []
+    for folder in folders:
+        for frame in ImageDirFrameSource(folder, limit=limit):
+            layout = get_roi_layout(frame.image.size)
+            for roi in rois:
+                samples.append(
+                    OcrSample(
+                        f"{Path(folder).name}/{frame.name}", roi, layout.crop(frame.image, roi)
+                    )
+                )
+    return samples
+
+
+def normalize_text(text: str) -> str:
+    """일치 비교용: 공백/줄바꿈 제거"""
+    return "".join(text.split())
+
+
+# ======================
+# Result
+# ======================
+@dataclass
+class BackendRun:
+    backend: str
+    roi: str
+    profile: str
+    samples: int = 0
+    errors: int = 0
+    skipped: Optional[str] = None  # 돌리지 못한 이유 (미설치 / 프로필 미지원)
+
+    total_s: float = 0.0
+    throughput_per_s: float = 0.0
+    latency_ms: Dict[str, float] = field(default_factory=dict)
+
+    # baseline 백엔드와 정규화 텍스트가 같은 비율 (baseline이 읽은 샘플 기준)
+    agreement: Optional[float] = None
+    mismatches: List[dict] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def _latency_stats(latencies: Sequence[float]) -> Dict[str, float]:
+    if not latencies:
+        return {}
+    ms = np.asarray(latencies) * 1000.0
+    return {
+        "mean": round(float(ms.mean()), 3),
+        "p50": round(float(np.percentile(ms, 50)), 3),
+        "p90": round(float(np.percentile(ms, 90)), 3),
+        "p99": round(float(np.percentile(ms, 99)), 3),
+        "max": round(float(ms.max()), 3),
+    }
+
+
+# ======================
+# Run
+# ======================
+def _run_backend(
+    backend_name: str, roi: str, profile: OcrProfile, samples: Sequence[OcrSample], warmup: int
+) -> tuple[BackendRun, List[Optional[str]]]:
+    run = BackendRun(backend=backend_name, roi=roi, profile=profile.name)
+    texts: List[Optional[str]] = [None] * len(samples)
+
+    try:
+        backend = get_backend(backend_name)
+    except RuntimeError as e:
+        run.skipped = str(e)
+        return run, texts
+    if not backend.supports(profile):
+        run.skipped = f"프로필 미지원: {profile.name}"
+        return run, texts
+
+    prepared = prepare(replace(profile, backend=backend_name))
+
+    # 첫 호출 비용(엔진 Init, 템플릿 생성)은 처리량에서 뺀다
+    for sample in samples[:warmup]:
+        try:
+            backend.read(sample.image, prepared)
+        except Exception:
+            pass
+
+    latencies = []
+    t_start = time.perf_counter()
+    for i, sample in enumerate(samples):
+        t0 = time.perf_counter()
+        try:
+            texts[i] = backend.read(sample.image, prepared)
+        except Exception:
+            run.errors += 1
+        latencies.append(time.perf_counter() - t0)
+    run.total_s = round(time.perf_counter() - t_start, 4)
+
+    run.samples = len(samples)
+    run.throughput_per_s = round(len(samples) / run.total_s, 2) if run.total_s > 0 else 0.0
+    run.latency_ms = _latency_stats(latencies)
+    return run, texts
+
+
+def benchmark_ocr_backends(
+    samples: Sequence[OcrSample],
+    backends: Sequence[str],
+    baseline: str = PYTESSERACT_BACKEND,
+    warmup: int = 2,
+    max_mismatches: int = 20,
+) -> List[BackendRun]:
+    """
+    ROI별로 모든 백엔드를 같은 샘플에 돌려 처리량 / 지연 분위수 / baseline과의 일치율을 잰다.
+    baseline이 읽지 못한(에러) 샘플은 일치율 계산에서 뺀다.
+    """
+    names = [baseline] + [b for b in backends if b != baseline]
+    runs: List[BackendRun] = []
+
+    by_roi: Dict[str, List[OcrSample]] = {}
+    for sample in samples:
+        by_roi.setdefault(sample.roi, []).append(sample)
+
+    for roi, roi_samples in by_roi.items():
+        profile = profile_for_roi(roi)
+        base_texts: List[Optional[str]] = []
+        for name in names:
+            run, texts = _run_backend(name, roi, profile, roi_samples, warmup)
+            if name == baseline:
+                base_texts = texts
+            elif run.skipped is None:
+                pairs = [
+                    (s, b, t) for s, b, t in zip(roi_samples, base_texts, texts) if b is not None
+                ]
+                if pairs:
+                    same = [normalize_text(b) == normalize_text(t or "") for _, b, t in pairs]
+                    run.agreement = round(sum(same) / len(pairs), 4)
+                    run.mismatches = [
+                        {"sample": s.name, "baseline": b, "text": t}
+                        for (s, b, t), ok in zip(pairs, same)
+                        if not ok
+                    ][:max_mismatches]
+            runs.append(run)
+    return runs
+
+
+def fit_templates_from_baseline(
+    samples: Sequence[OcrSample],
+    roi: str = "BANPICK_TIMER_DIGITS",
+    baseline: str = PYTESSERACT_BACKEND,
+) -> GlyphTemplates:
+    """baseline 백엔드가 읽은 텍스트를 정답으로 삼아 템플릿 매처 글리프를 학습."""
+    profile = profile_for_roi(roi)
+    prepared = prepare(replace(profile, backend=baseline))
+    backend = get_backend(baseline)
+
+    pairs = []
+    for sample in samples:
+        if sample.roi != roi:
+            continue
+        try:
+            text = backend.read(sample.image, prepared)
+        except Exception:
+            continue
+        text = "".join(ch for ch in text if ch in profile.whitelist)
+        if text:
+            pairs.append((sample.image, text))
+    return GlyphTemplates.fit(pairs, profile)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+from app.features import FrameFeatures, extract_features, extract_features_from_rois
+from app.frame_source import extract_ts_sec, open_rgb
+from app.roi_pack import RoiPack
+from app.session import (
+    ACTION_PICK_COACH,
+    ACTION_PLAYPLAN_COACH,
+    ACTION_PLAYPLAN_DRAFT,
+    DraftSession,
+    FrameResult,
+)
+from app.session_pool import warm_up_worker
+from app.settings import Settings
+from core.clock import FrameTimeline, VirtualClock
+
+# 파일명에 timestamp가 없을 때 가정하는 프레임 간격 (generate_test_images.py는 1초 간격)
+DEFAULT_FRAME_PERIOD_SEC = 1.0
+
+
+def _features_for_job(job: Tuple[int, str]) -> FrameFeatures:
+    index, path_str = job
+    path = Path(path_str)
+    img = open_rgb(path)
+    return extract_features(index, path.name, extract_ts_sec(path.name), img, img.size)
+
+
+def extract_features_parallel(
+    paths: Sequence[Path], workers: int = 0, chunksize: int = 4
+) -> List[FrameFeatures]:
+    """
+    프레임별 피처(디코드 + OCR + 판정값)를 프로세스 풀에서 병렬로 계산.
+    결과는 입력 순서 그대로 반환한다. workers=1이면 현재 프로세스에서 순차 계산.
+    """
+    jobs = [(idx, str(p)) for idx, p in enumerate(paths, start=1)]
+
+    if workers == 1:
+        return [_features_for_job(job) for job in jobs]
+
+    with ProcessPoolExecutor(
+        max_workers=workers or None,
+        initializer=warm_up_worker,
+        initargs=(((1600, 900),),),
+    ) as ex:
+        return list(ex.map(_features_for_job, jobs, chunksize=chunksize))
+
+
+@lru_cache(maxsize=4)
+def _open_pack(path_str: str) -> RoiPack:
+    # 워커 프로세스마다 1번만 memmap
+    return RoiPack(Path(path_str))
+
+
+def _features_for_pack_job(job: Tuple[str, int]) -> FrameFeatures:
+    path_str, pos = job
+    pack = _open_pack(path_str)
+    return extract_features_from_rois(
+        int(pack.index[pos]), pack.names[pos], pack.frame_ts(pos), pack.rois(pos)
+    )
+
+
+def extract_features_from_pack(
+    pack_path: Path, limit: int = 0, workers: int = 0, chunksize: int = 8
+) -> List[FrameFeatures]:
+    """ROI 팩에서 프레임별 피처 계산 (PNG 디코드 없이 팩의 ROI view만 읽는다)."""
+    n = len(RoiPack(pack_path))
+    jobs = [(str(pack_path), pos) for pos in range(min(n, limit) if limit else n)]
+
+    if workers == 1:
+        return [_features_for_pack_job(job) for job in jobs]
+
+    with ProcessPoolExecutor(
+        max_workers=workers or None, initializer=warm_up_worker, initargs=((),)
+    ) as ex:
+        return list(ex.map(_features_for_pack_job, jobs, chunksize=chunksize))
+
+
+def timed_features(
+    features: Iterable[FrameFeatures], frame_period_sec: float = DEFAULT_FRAME_PERIOD_SEC
+) -> List[Tuple[FrameFeatures, float]]:
+    """
+    피처 -> (피처, 프레임 시각). 순서는 파일 순서(index, 입력 순서와 무관), 시각은 benchmark/session_pool과 같은
+    FrameTimeline 규칙: timestamp 없는 프레임은 직전 + period, 뒤로 가는 timestamp는 경고 후 건너뜀.
+    """
+    timeline = FrameTimeline(frame_period_sec)
+    timed = []
+    for feat in sorted(features, key=lambda f: f.index):
+        t = timeline.next(feat.ts, feat.index)
+        if t is None:
+            print("[WARN] 프레임 시각이 뒤로 감, 건너뜀:", feat.name)
+            continue
+        timed.append((feat, t))
+    return timed
+
+
+class FeatureReplay:
+    """
+    미리 계산한 피처로 상태 머신을 파일 순서대로 순차 재생 (시각은 timed_features).
+    VirtualClock을 프레임 시각으로 맞추며 돌리므로 CPU 속도/병렬도와 무관하게 결정이 같다.
+
+    run_offline과 같은 규칙: PICK 코치는 (API 성공 여부와 무관하게) 1회,
+    PLAYPLAN 코치가 나오면 재생 종료.
+    """
+
+    def __init__(self, settings: Settings, frame_period_sec: float = DEFAULT_FRAME_PERIOD_SEC):
+        if settings.dual_timer_mode == "motion":
+            # 첫 프레임(step_features)이 아니라 재생을 만들 때 바로 알린다
+            raise ValueError("오프라인 피처 재생은 dual_timer_mode='motion'을 지원하지 않음")
+        self.settings = settings
+        self.frame_period_sec = frame_period_sec
+        self.clock = VirtualClock()
+        self.session = DraftSession(settings, session_id="offline", clock=self.clock)
+
+    def run(self, features: Iterable[FrameFeatures]) -> Iterator[Tuple[FrameFeatures, FrameResult]]:
+        for feat, t in timed_features(features, self.frame_period_sec):
+            self.clock.set(t)
+            res = self.session.step_features(feat)
+            yield feat, res
+
+            if res.action == ACTION_PICK_COACH:
+                self.session.mark_pick_coached()
+            elif res.action == ACTION_PLAYPLAN_DRAFT:
+                self.session.mark_playplan_drafted()
+            elif res.action == ACTION_PLAYPLAN_COACH:
+                self.session.mark_playplan_coached()
+                return
+
+        self.session.finish()
+
+
+def replay_decisions(
+    features: Iterable[FrameFeatures],
+    settings: Settings,
+    frame_period_sec: float = DEFAULT_FRAME_PERIOD_SEC,
+) -> List[Tuple[int, str]]:
+    """재생 결과 중 코치 호출 결정만 (frame index, action) 리스트로."""
+    replay = FeatureReplay(settings, frame_period_sec)
+    return [(feat.index, res.action) for feat, res in replay.run(features) if res.action]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import math
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from core.clock import SYSTEM_CLOCK, Clock
+
+
+@dataclass(frozen=True)
+class PacerStats:
+    target_fps: float
+    achieved_fps: float
+    frames: int
+    overruns: int  # 작업이 프레임 예산을 넘긴 횟수
+    overrun_ratio: float
+    max_overrun_ms: float
+    jitter_ms: float  # 실제 프레임 간격 - 목표 간격의 표준편차
+    mean_work_ms: float  # 프레임당 작업 시간 (대기 제외)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class FramePacer:
+    """
+    목표 프레임 간격(deadline) 기준 페이싱.
+    매 프레임 작업이 끝나면 wait()를 부르고, 다음 deadline까지 남은 시간만 잔다.
+
+    - 작업이 예산을 넘기면(overrun) 자지 않고 바로 다음 프레임
+    - 한 주기 이상 밀리면 deadline을 현재 시각 기준으로 다시 잡는다 (밀린 프레임을 몰아서 돌지 않음)
+    """
+
+    def __init__(self, period_sec: float, clock: Clock = SYSTEM_CLOCK):
+        if period_sec <= 0:
+            raise ValueError(f"period_sec는 0보다 커야 함: {period_sec}")
+        self.period = period_sec
+        self.clock = clock
+        self.reset()
+
+    def reset(self) -> None:
+        self._deadline: Optional[float] = None
+        self._started_at: Optional[float] = None
+        self._last_tick: Optional[float] = None
+
+        self.frames = 0
+        self.overruns = 0
+        self._max_overrun = 0.0
+        self._work_sum = 0.0
+
+        # 프레임 간격 오차 누적 (Welford)
+        self._n_intervals = 0
+        self._err_mean = 0.0
+        self._err_m2 = 0.0
+
+    def wait(self) -> float:
+        """
+        이번 프레임 작업이 끝났을 때 호출. 다음 deadline까지 자고, 잔 시간(초)을 반환.
+        첫 호출은 기준 시각만 잡는다.
+        """
+        now = self.clock.now()
+        if self._deadline is None:
+            self._started_at = now
+            self._last_tick = now
+            self._deadline = now + self.period
+            return 0.0
+
+        self.frames += 1
+        self._work_sum += now - self._last_tick
+
+        remaining = self._deadline - now
+        slept = 0.0
+        if remaining > 0:
+            self.clock.sleep(remaining)
+            slept = remaining
+            self._deadline += self.period
+        else:
+            self.overruns += 1
+            self._max_overrun = max(self._max_overrun, -remaining)
+            if -remaining >= self.period:
+                self._deadline = now + self.period
+            else:
+                self._deadline += self.period
+
+        tick = self.clock.now()
+        self._record_interval(tick - self._last_tick)
+        self._last_tick = tick
+        return slept
+
+    def _record_interval(self, interval: float) -> None:
+        err = interval - self.period
+        self._n_intervals += 1
+        delta = err - self._err_mean
+        self._err_mean += delta / self._n_intervals
+        self._err_m2 += delta * (err - self._err_mean)
+
+    def stats(self) -> PacerStats:
+        elapsed = (self._last_tick - self._started_at) if self._started_at is not None else 0.0
+        n = self.frames
+        return PacerStats(
+            target_fps=round(1.0 / self.period, 3),
+            achieved_fps=round(n / elapsed, 3) if elapsed > 0 else 0.0,
+            frames=n,
+            overruns=self.overruns,
+            overrun_ratio=round(self.overruns / n, 3) if n else 0.0,
+            max_overrun_ms=round(self._max_overrun * 1000.0, 3),
+            jitter_ms=round(math.sqrt(self._err_m2 / self._n_intervals) * 1000.0, 3)
+            if self._n_intervals
+            else 0.0,
+            mean_work_ms=round(self._work_sum * 1000.0 / n, 3) if n else 0.0,
+        )
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Iterable, Iterator, List, Optional
+
+# 한 경기 픽 수 (5 vs 5)
+TOTAL_PICKS = 10
+
+
+class PlayplanDraft:
+    """
+    픽이 8~9개 확정된 시점의 이미지로 플레이 플랜 초안을 백그라운드 스레드에서 미리 생성.
+    (밴픽 루프는 막지 않는다)
+
+    - replay(): 지금까지 받은 델타 + 생성 중이면 이어서 오는 델타
+    - 소비자가 없어도 끝까지 받아 text에 모은다
+    """
+
+    def __init__(self, picks_img, picks_known: int, open_stream: Callable[[], Iterable[str]]):
+        self.picks_img = picks_img
+        self.picks_known = picks_known
+        self._open_stream = open_stream
+
+        self.deltas: List[str] = []
+        self.error: Optional[BaseException] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+        self._cond = threading.Condition()
+        self._done = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def text(self) -> str:
+        with self._cond:
+            return "".join(self.deltas)
+
+    @property
+    def done(self) -> bool:
+        with self._cond:
+            return self._done
+
+    @property
+    def reusable(self) -> bool:
+        """모든 픽이 보이는 이미지로 만든 초안이면 업데이트 없이 그대로 쓴다"""
+        return self.picks_known >= TOTAL_PICKS
+
+    def start(self) -> "PlayplanDraft":
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="playplan-draft", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        try:
+            for delta in self._open_stream():
+                with self._cond:
+                    self.deltas.append(delta)
+                    self._cond.notify_all()
+        except Exception as e:
+            with self._cond:
+                self.error = e
+        finally:
+            with self._cond:
+                self._done = True
+                self.finished_at = time.perf_counter()
+                self._cond.notify_all()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: self._done, timeout)
+
+    def replay(self) -> Iterator[str]:
+        i = 0
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._done or i < len(self.deltas))
+                chunk = self.deltas[i:]
+                finished = self._done
+            i += len(chunk)
+            yield from chunk
+            if finished and i >= len(self.deltas):
+                return
+
+
+def progressive_playplan_stream(
+    draft: Optional[PlayplanDraft],
+    open_full: Callable[[], Iterable[str]],
+    open_update: Callable[[PlayplanDraft], Iterable[str]],
+) -> Iterator[str]:
+    """
+    최종 픽 확정 시점의 플레이 플랜 스트림.
+
+    - 초안 없음 / 초안이 아무 텍스트 없이 끝남(실패 포함): 처음부터 전체 플랜 (open_full)
+    - 초안이 일부만 보낸 뒤 실패: 보낸 부분 뒤에 전체 플랜을 이어서 (open_full, 반쪽 초안에 업데이트를 붙이지 않는다)
+    - 초안 있음: 초안(생성 중이면 이어서)을 먼저 흘려보내고,
+      10픽이 다 보이는 초안이면 그대로 끝, 아니면 바뀌는 점만 짧게 (open_update)
+    """
+    if draft is None:
+        yield from open_full()
+        return
+
+    yield from draft.replay()
+
+    if not draft.text.strip():
+        yield from open_full()
+        return
+
+    if draft.error is not None:
+        yield "\n\n"
+        yield from open_full()
+        return
+
+    if draft.reusable:
+        return
+
+    yield "\n\n"
+    yield from open_update(draft)
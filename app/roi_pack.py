@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import json
+import math
+import struct
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+from app.frame_source import extract_ts_sec, open_rgb
+from app.rois import ROI_SOURCES, Rois
+from core.roi_layout import get_roi_layout
+
+# 파일 구조: MAGIC(8) | header 길이(uint32 LE) | header JSON | (정렬 패딩) | 데이터 블록들
+# 데이터 블록: ROI별 (count, H, W, 3) uint8 + index(int32) + ts(float64, 없으면 NaN)
+PACK_MAGIC = b"LOLROIPK"
+PACK_VERSION = 1
+PACK_SUFFIX = ".roipack"
+_ALIGN = 64
+
+
+def _align(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def write_roi_pack(
+    paths: Sequence[Path], out_path: Path, roi_names: Sequence[str] = ROI_SOURCES
+) -> Path:
+    """
+    캡처 프레임들에서 ROI만 잘라 하나의 memory-mapped 팩 파일로 저장.
+    모든 프레임은 창 크기가 같아야 한다 (ROI별 배열 shape 고정).
+    """
+    if not paths:
+        raise ValueError("프레임이 없음")
+
+    window_size = open_rgb(paths[0]).size
+    layout = get_roi_layout(window_size)
+    count = len(paths)
+
+    rois: Dict[str, dict] = {}
+    offset = 0
+    for name in roi_names:
+        left, top, right, bottom = layout.rect(name)
+        shape = (count, bottom - top, right - left, 3)
+        rois[name] = {"shape": list(shape), "offset": offset}
+        offset = _align(offset + math.prod(shape))
+
+    index_offset = offset
+    ts_offset = _align(index_offset + 4 * count)
+    data_size = ts_offset + 8 * count
+
+    header = {
+        "version": PACK_VERSION,
+        "window_size": list(window_size),
+        "count": count,
+        "names": [p.name for p in paths],
+        "rois": rois,
+        "index_offset": index_offset,
+        "ts_offset": ts_offset,
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    data_start = _align(len(PACK_MAGIC) + 4 + len(header_bytes))
+
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_path.with_name(out_path.name + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(PACK_MAGIC)
+        f.write(struct.pack("<I", len(header_bytes)))
+        f.write(header_bytes)
+        f.truncate(data_start + data_size)
+
+    mm = np.memmap(tmp, dtype=np.uint8, mode="r+", offset=data_start, shape=(data_size,))
+    try:
+        arrays = _views(mm, header)
+        for pos, path in enumerate(paths):
+            img = open_rgb(path)
+            if img.size != tuple(window_size):
+                raise ValueError(
+                    f"창 크기가 다른 프레임: {path.name} {img.size} != {tuple(window_size)}"
+                )
+            for name in roi_names:
+                # PIL crop과 같은 결과(창 밖은 0 패딩)를 그대로 저장
+                arrays[name][pos] = np.asarray(layout.crop(img, name))
+
+        ts = [extract_ts_sec(p.name) for p in paths]
+        mm[index_offset : index_offset + 4 * count].view(np.int32)[:] = np.arange(1, count + 1)
+        mm[ts_offset : ts_offset + 8 * count].view(np.float64)[:] = [
+            np.nan if t is None else t for t in ts
+        ]
+        mm.flush()
+    finally:
+        del mm
+
+    tmp.replace(out_path)
+    return out_path
+
+
+def _views(mm: np.ndarray, header: dict) -> Dict[str, np.ndarray]:
+    out = {}
+    for name, spec in header["rois"].items():
+        shape = tuple(spec["shape"])
+        start = spec["offset"]
+        out[name] = mm[start : start + math.prod(shape)].reshape(shape)
+    return out
+
+
+class RoiPack:
+    """
+    ROI 팩 읽기 (읽기 전용 memmap).
+    arrays[roi_name][pos]는 복사 없는 (H, W, 3) view이고, 실제로 접근한 ROI 페이지만 디스크에서 읽힌다.
+
+    rois(pos)는 crop(pos, roi_name)을 loader로 쓰는 lazy Rois (Rois.from_loader).
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            if f.read(len(PACK_MAGIC)) != PACK_MAGIC:
+                raise ValueError(f"ROI 팩 파일이 아님: {self.path}")
+            (header_len,) = struct.unpack("<I", f.read(4))
+            self.header = json.loads(f.read(header_len).decode("utf-8"))
+
+        if self.header["version"] != PACK_VERSION:
+            raise ValueError(f"지원하지 않는 ROI 팩 버전: {self.header['version']}")
+
+        data_start = _align(len(PACK_MAGIC) + 4 + header_len)
+        self._mm = np.memmap(self.path, dtype=np.uint8, mode="r", offset=data_start)
+
+        self.window_size: Tuple[int, int] = tuple(self.header["window_size"])
+        self.names: List[str] = self.header["names"]
+        self.arrays: Dict[str, np.ndarray] = _views(self._mm, self.header)
+
+        count = self.header["count"]
+        i0, t0 = self.header["index_offset"], self.header["ts_offset"]
+        self.index = self._mm[i0 : i0 + 4 * count].view(np.int32)
+        self.ts = self._mm[t0 : t0 + 8 * count].view(np.float64)
+
+    def __len__(self) -> int:
+        return self.header["count"]
+
+    def frame_ts(self, pos: int) -> Optional[float]:
+        t = float(self.ts[pos])
+        return None if math.isnan(t) else t
+
+    def crop(self, pos: int, roi_name: str) -> Image.Image:
+        return Image.fromarray(self.arrays[roi_name][pos], "RGB")
+
+    def rois(self, pos: int) -> Rois:
+        return Rois.from_loader(partial(self.crop, pos))
+
+
+@dataclass(frozen=True)
+class PackedFrame:
+    index: int
+    name: str
+    ts: Optional[float]
+    rois: Rois
+
+
+class RoiPackFrameSource:
+    """ROI 팩을 프레임 순서대로 순회 (PNG 디코드 없음). DraftSession.step_rois에 바로 넣는다."""
+
+    def __init__(self, path: Path, limit: int = 0):
+        self.pack = RoiPack(path)
+        self.limit = limit
+
+    def __len__(self) -> int:
+        n = len(self.pack)
+        return min(n, self.limit) if self.limit else n
+
+    def __iter__(self) -> Iterator[PackedFrame]:
+        pack = self.pack
+        for pos in range(len(self)):
+            yield PackedFrame(
+                index=int(pack.index[pos]),
+                name=pack.names[pos],
+                ts=pack.frame_ts(pos),
+                rois=pack.rois(pos),
+            )
@@ -1,21 +1,162 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Tuple
+from functools import cached_property, partial
+from typing import Callable, Mapping, Optional, Tuple
 from PIL import Image
 
-from config.roi import ROI
-from core.roi_manager import crop_roi_relative_xy
+from core.roi_layout import (
+    ENEMY_TEAM_PICK_SLOTS,
+    MY_TEAM_PICK_SLOTS,
+    RoiLayout,
+    child_pixel_rect,
+    get_roi_layout,
+)
+
+class MissingCropError(LookupError):
+    """미리 잘린 크롭으로 만든 Rois(레이아웃 없음)에 없는 크롭을 요청함"""
 
-@dataclass(frozen=True)
 class Rois:
-    status_img: Image.Image
-    bans_my_img: Image.Image
-    bans_enemy_img: Image.Image
-    picks_my_img: Image.Image
-    picks_enemy_img: Image.Image
-    picks_merged_img: Image.Image
-    timer_bar_img: Image.Image
-    timer_digits_img: Image.Image
+    """
+    프레임 1장에 대한 ROI 크롭 모음 (lazy).
+    각 크롭은 처음 접근할 때만 만들어지고 이후에는 memoize 된다.
+    - BAN/UNKNOWN 경로는 status_img 하나만 크롭
+    - picks_merged_img(새 이미지 + paste 2회)는 코치 호출 시 최대 1회 생성
+
+    크롭 출처: 전체 프레임 + RoiLayout / from_crops(미리 잘린 크롭) / from_loader(레이아웃 ROI 이름 -> 이미지, 예: ROI 팩)
+    """
+
+    def __init__(self, frame_img: Optional[Image.Image], layout: Optional[RoiLayout]):
+        self.frame_img = frame_img
+        self.layout = layout
+        # 레이아웃 ROI 이름 -> 크롭 (없으면 미리 잘린 크롭만 쓸 수 있음)
+        self._load: Optional[Callable[[str], Image.Image]] = None
+        if layout is not None and frame_img is not None:
+            self._load = partial(layout.crop, frame_img)
+
+    @classmethod
+    def from_loader(cls, load: Callable[[str], Image.Image]) -> "Rois":
+        """
+        레이아웃 ROI 이름(BANPICK_STATUS_TEXT, ...)을 받아 이미지를 주는 함수로 lazy 크롭.
+        픽 슬롯처럼 loader에 없는 하위 ROI는 부모 크롭에서 다시 자른다.
+        """
+        rois = cls(None, None)
+        rois._load = load
+        return rois
+
+    @classmethod
+    def from_crops(cls, crops: Mapping[str, Image.Image]) -> "Rois":
+        """
+        이미 잘려 있는 ROI들로 Rois 구성 (예: 캡처 에이전트가 보낸 크롭).
+        crops 키는 속성 이름(status_img, bans_my_img, ...)을 그대로 쓴다.
+        picks_merged_img는 없으면 picks_my_img/picks_enemy_img로 필요할 때 만든다.
+        """
+        rois = cls(None, None)
+        for name, img in crops.items():
+            if name not in ROI_FIELDS:
+                raise ValueError(f"알 수 없는 ROI 이름: {name}")
+            vars(rois)[name] = img
+        return rois
+
+    def _crop(self, roi_name: str, attr: str) -> Image.Image:
+        if self._load is None:
+            raise MissingCropError(f"missing crop {attr} ({roi_name}): 보낸 크롭에 없고 원본 프레임도 없음")
+        return self._load(roi_name)
+
+    def can_crop(self, attr: str) -> bool:
+        """attr 크롭이 이미 있거나 만들 수 있는지"""
+        return attr in vars(self) or self._load is not None
+
+    def has_crop(self, attr: str) -> bool:
+        """attr 크롭이 이미 만들어져(또는 받아) 있는지 (새로 자르지 않음)"""
+        return attr in vars(self)
+
+    @cached_property
+    def status_img(self) -> Image.Image:
+        return self._crop("BANPICK_STATUS_TEXT", "status_img")
+
+    @cached_property
+    def bans_my_img(self) -> Image.Image:
+        return self._crop("BANNED_CHAMPIONS_MY_TEAM", "bans_my_img")
+
+    @cached_property
+    def bans_enemy_img(self) -> Image.Image:
+        return self._crop("BANNED_CHAMPIONS_ENEMY_TEAM", "bans_enemy_img")
+
+    @cached_property
+    def picks_my_img(self) -> Image.Image:
+        return self._crop("PICKED_CHAMPIONS_MY_TEAM", "picks_my_img")
+
+    @cached_property
+    def picks_enemy_img(self) -> Image.Image:
+        return self._crop("PICKED_CHAMPIONS_ENEMY_TEAM", "picks_enemy_img")
+
+    @cached_property
+    def picks_merged_img(self) -> Image.Image:
+        return merge_images_horizontal(self.picks_my_img, self.picks_enemy_img)
+
+    @cached_property
+    def my_pick_slot_imgs(self) -> Tuple[Image.Image, ...]:
+        return self._pick_slots("PICKED_CHAMPIONS_MY_TEAM", "picks_my_img", MY_TEAM_PICK_SLOTS)
+
+    @cached_property
+    def enemy_pick_slot_imgs(self) -> Tuple[Image.Image, ...]:
+        return self._pick_slots("PICKED_CHAMPIONS_ENEMY_TEAM", "picks_enemy_img", ENEMY_TEAM_PICK_SLOTS)
+
+    def _pick_slots(self, panel: str, panel_attr: str, slots: Tuple[str, ...]) -> Tuple[Image.Image, ...]:
+        # 전체 프레임이 있으면 슬롯 ROI를 바로 크롭, 없으면(미리 잘린 크롭/ROI 팩) 픽 패널에서 다시 자른다
+        if self.layout is not None and self.frame_img is not None:
+            return tuple(self.layout.crop(self.frame_img, name) for name in slots)
+        panel_img = getattr(self, panel_attr)
+        return tuple(panel_img.crop(child_pixel_rect(panel, name, panel_img.size)) for name in slots)
+
+    @cached_property
+    def my_ban_slot_imgs(self) -> Tuple[Image.Image, ...]:
+        return split_horizontal(self.bans_my_img, BAN_SLOTS_PER_TEAM)
+
+    @cached_property
+    def enemy_ban_slot_imgs(self) -> Tuple[Image.Image, ...]:
+        return split_horizontal(self.bans_enemy_img, BAN_SLOTS_PER_TEAM)
+
+    @cached_property
+    def timer_bar_img(self) -> Image.Image:
+        return self._crop("BANPICK_TIMER_BAR", "timer_bar_img")
+
+    @cached_property
+    def timer_digits_img(self) -> Image.Image:
+        return self._crop("BANPICK_TIMER_DIGITS", "timer_digits_img")
+
+    def materialized(self) -> Tuple[str, ...]:
+        """지금까지 실제로 만들어진 크롭 이름들 (디버그/테스트용)."""
+        return tuple(k for k in vars(self) if k.endswith("_img") and k != "frame_img")
+
+ROI_FIELDS = (
+    "status_img",
+    "bans_my_img",
+    "bans_enemy_img",
+    "picks_my_img",
+    "picks_enemy_img",
+    "picks_merged_img",
+    "timer_bar_img",
+    "timer_digits_img",
+)
+
+# Rois가 크롭하는 레이아웃 ROI 이름 (picks_merged_img는 picks 두 장으로 만든다)
+ROI_SOURCES = (
+    "BANPICK_STATUS_TEXT",
+    "BANNED_CHAMPIONS_MY_TEAM",
+    "BANNED_CHAMPIONS_ENEMY_TEAM",
+    "PICKED_CHAMPIONS_MY_TEAM",
+    "PICKED_CHAMPIONS_ENEMY_TEAM",
+    "BANPICK_TIMER_BAR",
+    "BANPICK_TIMER_DIGITS",
+)
+
+# 밴 strip 1개 = 밴 칸 5개가 가로로 같은 간격
+BAN_SLOTS_PER_TEAM = 5
+
+def split_horizontal(img: Image.Image, n: int) -> Tuple[Image.Image, ...]:
+    w, h = img.size
+    edges = [round(w * i / n) for i in range(n + 1)]
+    return tuple(img.crop((edges[i], 0, edges[i + 1], h)) for i in range(n))
 
 def merge_images_horizontal(img_left: Image.Image, img_right: Image.Image, bg_color=(255,255,255)) -> Image.Image:
     new_width = img_left.width + img_right.width
@@ -26,25 +167,4 @@ def merge_images_horizontal(img_left: Image.Image, img_right: Image.Image, bg_co
     return merged
 
 def extract_rois(frame_img: Image.Image, window_size: Tuple[int,int]) -> Rois:
-    status_img = crop_roi_relative_xy(frame_img, window_size, ROI.BANPICK_STATUS_TEXT)
-
-    bans_my_img = crop_roi_relative_xy(frame_img, window_size, ROI.BANNED_CHAMPIONS_MY_TEAM)
-    bans_enemy_img = crop_roi_relative_xy(frame_img, window_size, ROI.BANNED_CHAMPIONS_ENEMY_TEAM)
-
-    picks_my_img = crop_roi_relative_xy(frame_img, window_size, ROI.PICKED_CHAMPIONS_MY_TEAM)
-    picks_enemy_img = crop_roi_relative_xy(frame_img, window_size, ROI.PICKED_CHAMPIONS_ENEMY_TEAM)
-    picks_merged_img = merge_images_horizontal(picks_my_img, picks_enemy_img)
-
-    timer_bar_img = crop_roi_relative_xy(frame_img, window_size, ROI.BANPICK_TIMER_BAR)
-    timer_digits_img = crop_roi_relative_xy(frame_img, window_size, ROI.BANPICK_TIMER_DIGITS)
-
-    return Rois(
-        status_img=status_img,
-        bans_my_img=bans_my_img,
-        bans_enemy_img=bans_enemy_img,
-        picks_my_img=picks_my_img,
-        picks_enemy_img=picks_enemy_img,
-        picks_merged_img=picks_merged_img,
-        timer_bar_img=timer_bar_img,
-        timer_digits_img=timer_digits_img,
-    )
\ No newline at end of file
+    return Rois(frame_img, get_roi_layout(window_size))
@@ -0,0 +1,393 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import contextlib
+import io
+import json
+from functools import partial
+from http import HTTPStatus
+from typing import Dict, Iterator, Optional, Tuple
+
+from PIL import Image
+
+from app.ocr_batcher import OcrBatchConfig, OcrMicroBatcher
+from app.playplan import PlayplanDraft, progressive_playplan_stream
+from app.rois import Rois
+from app.session import (
+    ACTION_PICK_COACH,
+    ACTION_PLAYPLAN_COACH,
+    ACTION_PLAYPLAN_DRAFT,
+    DraftSession,
+    FrameResult,
+)
+from app.settings import Settings
+from app.streaming import build_coach_guard, pick_deadline
+from core.coach_resilience import Deadline, DeadlineExceeded
+from core.ocr_profiles import TIMER_DIGITS_PROFILE
+from core.pick_coach_parser import PickCoachParser, PickRecommendation, complete_early
+
+# ws://<host>:<port>/sessions/<session_id>
+SESSION_PATH_PREFIX = "/sessions/"
+
+
+def decode_image(data: bytes) -> Image.Image:
+    img = Image.open(io.BytesIO(data))
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    return img
+
+
+def decode_rois_message(msg: dict) -> Rois:
+    """{"type": "rois", "rois": {"status_img": <base64 png>, ...}} -> Rois"""
+    crops = {name: decode_image(base64.b64decode(b64)) for name, b64 in msg["rois"].items()}
+    return Rois.from_crops(crops)
+
+
+def _frame_event(seq: int, res: FrameResult) -> dict:
+    ev = {
+        "type": "frame",
+        "seq": seq,
+        "changed": res.changed,
+        "raw_state": res.raw_state,
+        "stable_state": res.stable_state,
+        "confidence": round(res.major_conf, 3),
+    }
+    if res.timer_left is not None:
+        ev["timer_left"] = round(res.timer_left, 1)
+    if res.pick_res is not None:
+        ev["pick"] = {"kind": res.pick_res.kind, "std": round(res.pick_res.std, 2)}
+    if res.draft_delta is not None:
+        ev["draft_delta"] = [str(e) for e in res.draft_delta.events]
+    if res.dual_now is not None:
+        ev["dual"] = {
+            "now": res.dual_now,
+            "stable": res.dual_stable,
+            "conf": round(res.dual_conf, 3),
+        }
+    if res.draft_diff:
+        ev["draft_state"] = res.draft_state.as_dict()
+        ev["diff"] = res.draft_diff.as_dict()
+    return ev
+
+
+class FrameIngestServer:
+    """
+    로컬 프레임 수집 서버 (WebSocket).
+
+    - 캡처 에이전트 1개 = 연결 1개 = DraftSession 1개 (같은 session_id로 이미 연결돼 있으면 1008로 거절)
+    - 바이너리 메시지: 전체 프레임 이미지(PNG/JPEG 등)
+    - 텍스트 메시지: {"type": "rois", "rois": {...}} 미리 잘린 ROI (base64)
+    - 서버 -> 클라이언트: frame / state / coach_start / coach_token / coach_item / coach_end / coach_error (JSON)
+      (frame: DraftState가 바뀐 프레임이면 draft_state + diff 포함)
+      (coach_item: 픽 코치 추천 1개가 완성될 때마다 {champion, score, lane, team})
+    - GET /health: 세션 수, OCR 배치 통계, 코치 회로 차단 상태
+
+    status/타이머 숫자 OCR은 모든 세션이 OcrMicroBatcher 하나를 공유해서 짧은 시간창 안에 (프로필별로) 묶어 처리하고,
+    세션별 판정(numpy/cv2)은 스레드에서 동시에 돈다.
+    코치 호출은 모든 세션이 CoachGuard 하나를 공유한다 (회로가 열려 있으면 코치 요청을 건너뛴다).
+    코치 스트림은 세션마다 태스크 1개로 돌고, 그동안에도 프레임 수신/판정은 멈추지 않는다.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        *,
+        no_api: bool = False,
+        batch_cfg: OcrBatchConfig = OcrBatchConfig(),
+    ):
+        self.settings = settings
+        self.host = host
+        self.port = port
+        self.no_api = no_api
+        self.batcher = OcrMicroBatcher(batch_cfg)
+        self.sessions: Dict[str, DraftSession] = {}
+        self.coach_guard = build_coach_guard(settings)
+
+    # ----------------------
+    # HTTP
+    # ----------------------
+    def _process_request(self, connection, request):
+        if request.path == "/health":
+            body = {
+                "sessions": {sid: s.metrics.as_dict() for sid, s in self.sessions.items()},
+                "ocr_batches": self.batcher.batches,
+                "ocr_mean_batch": round(self.batcher.mean_batch_size, 2),
+                "coach_breaker": self.coach_guard.breaker.stats().as_dict(),
+                "coach_guard": self.coach_guard.stats().as_dict(),
+            }
+            return connection.respond(HTTPStatus.OK, json.dumps(body, ensure_ascii=False) + "\n")
+        if not request.path.startswith(SESSION_PATH_PREFIX):
+            return connection.respond(HTTPStatus.NOT_FOUND, "unknown path\n")
+        return None
+
+    # ----------------------
+    # Coach streaming
+    # ----------------------
+    def _coach_stream(
+        self,
+        session: DraftSession,
+        action: str,
+        deadline: Optional[Deadline],
+        draft: Optional[PlayplanDraft],
+    ) -> Iterator[str]:
+        from app.streaming import open_pick_coach_stream
+        from core.lol_playplan_coach import (
+            get_playplan_coach_client,
+            lol_playplan_stream,
+            lol_playplan_update_stream,
+        )
+
+        guard = self.coach_guard
+        picks_img = session.rois.picks_merged_img
+        model = self.settings.gemini_model
+        if action == ACTION_PICK_COACH:
+            return guard.stream(
+                lambda timeout_s: open_pick_coach_stream(
+                    self.settings, picks_img, timeout_s=timeout_s
+                ),
+                deadline,
+            )
+
+        client = get_playplan_coach_client()
+        return progressive_playplan_stream(
+            draft,
+            lambda: guard.stream(
+                lambda timeout_s: lol_playplan_stream(
+                    picks_img, client=client, model=model, timeout_s=timeout_s
+                )
+            ),
+            lambda d: guard.stream(
+                lambda timeout_s: lol_playplan_update_stream(
+                    picks_img,
+                    draft_img=d.picks_img,
+                    draft_text=d.text,
+                    draft_picks_known=d.picks_known,
+                    client=client,
+                    model=model,
+                    timeout_s=timeout_s,
+                )
+            ),
+        )
+
+    def _start_draft(self, session: DraftSession, picks_known: int) -> PlayplanDraft:
+        from core.lol_playplan_coach import get_playplan_coach_client, lol_playplan_stream
+
+        picks_img = session.rois.picks_merged_img
+        client = get_playplan_coach_client()
+        model = self.settings.gemini_model
+        return PlayplanDraft(
+            picks_img,
+            picks_known,
+            lambda: self.coach_guard.stream(
+                lambda timeout_s: lol_playplan_stream(
+                    picks_img,
+                    client=client,
+                    model=model,
+                    timeout_s=timeout_s,
+                    picks_known=picks_known,
+                )
+            ),
+        ).start()
+
+    async def _run_coach(
+        self,
+        ws,
+        session: DraftSession,
+        action: str,
+        deadline: Optional[Deadline] = None,
+        draft: Optional[PlayplanDraft] = None,
+    ) -> bool:
+        loop = asyncio.get_running_loop()
+        tokens: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        def pump() -> None:
+            try:
+                stream = self._coach_stream(session, action, deadline, draft)
+                if action == ACTION_PICK_COACH:
+                    # 추천이 완성될 때마다 coach_item, 3개 모이면 스트림 조기 종료
+                    stream = complete_early(
+                        stream,
+                        PickCoachParser(),
+                        lambda rec: loop.call_soon_threadsafe(tokens.put_nowait, rec),
+                    )
+                for delta in stream:
+                    loop.call_soon_threadsafe(tokens.put_nowait, delta)
+            finally:
+                loop.call_soon_threadsafe(tokens.put_nowait, done)
+
+        await ws.send(json.dumps({"type": "coach_start", "coach": action}))
+        worker = asyncio.ensure_future(asyncio.to_thread(pump))
+
+        while True:
+            delta = await tokens.get()
+            if delta is done:
+                break
+            if isinstance(delta, PickRecommendation):
+                item = {"type": "coach_item", "coach": action, "data": delta.as_dict()}
+                await ws.send(json.dumps(item, ensure_ascii=False))
+                continue
+            await ws.send(
+                json.dumps(
+                    {"type": "coach_token", "coach": action, "text": delta}, ensure_ascii=False
+                )
+            )
+
+        try:
+            await worker
+        except DeadlineExceeded as e:
+            # 남은 픽 시간 안에 못 받음 -> 이번 픽은 코치 없이 넘어간다 (다시 요청하지 않음)
+            await ws.send(
+                json.dumps(
+                    {"type": "coach_error", "coach": action, "error": repr(e), "skipped": True}
+                )
+            )
+            return True
+        except Exception as e:
+            await ws.send(json.dumps({"type": "coach_error", "coach": action, "error": repr(e)}))
+            return False
+
+        await ws.send(json.dumps({"type": "coach_end", "coach": action}))
+        return True
+
+    # ----------------------
+    # Session handler
+    # ----------------------
+    async def _coach_task(
+        self,
+        ws,
+        session: DraftSession,
+        action: str,
+        deadline: Optional[Deadline],
+        draft: Optional[PlayplanDraft],
+    ) -> Tuple[str, bool]:
+        ok = await self._run_coach(ws, session, action, deadline, draft)
+        if action == ACTION_PLAYPLAN_COACH:
+            await ws.close()  # 최종 플랜까지 보냈으면 세션 종료
+        return action, ok
+
+    @classmethod
+    def _finish_coach(cls, session: DraftSession, task: asyncio.Task) -> bool:
+        """끝난 코치 태스크의 결과를 세션에 반영. 세션을 끝내야 하면 True"""
+        if task.cancelled() or task.exception() is not None:
+            return False  # 연결이 끊겨 보내지 못함 -> 반영하지 않는다
+        return cls._apply_coach(session, *task.result())
+
+    @staticmethod
+    def _apply_coach(session: DraftSession, action: str, ok: bool) -> bool:
+        if action == ACTION_PICK_COACH and ok:
+            session.mark_pick_coached()
+        elif action == ACTION_PLAYPLAN_COACH:
+            session.mark_playplan_coached()
+            return True
+        return False
+
+    async def _handle(self, ws) -> None:
+        session_id = ws.request.path[len(SESSION_PATH_PREFIX) :] or str(ws.remote_address)
+        if session_id in self.sessions:
+            # 같은 id로 살아있는 세션을 덮어쓰지 않는다 (앞 세션의 지표/상태가 사라짐)
+            await ws.close(code=1008, reason=f"session already connected: {session_id}")
+            return
+        session = DraftSession(
+            self.settings,
+            session_id=session_id,
+            ocr=self.batcher.extract_text,
+            digits_ocr=partial(self.batcher.extract_text, profile=TIMER_DIGITS_PROFILE),
+        )
+        self.sessions[session_id] = session
+
+        seq = 0
+        last_stable: Optional[str] = None
+        draft: Optional[PlayplanDraft] = None
+        # 진행 중인 코치 스트림. 프레임 수신은 그동안에도 계속되고,
+        # 결과(mark_*)는 다음 프레임을 판정하기 전에 이 루프에서 반영한다 (세션 상태는 루프만 바꾼다)
+        coach: Optional[asyncio.Task] = None
+        try:
+            async for message in ws:
+                seq += 1
+                if coach is not None and coach.done():
+                    finished = self._finish_coach(session, coach)
+                    coach = None
+                    if finished:
+                        break
+                try:
+                    if isinstance(message, bytes):
+                        img = decode_image(message)
+                        res = await asyncio.to_thread(session.step, img, img.size)
+                    else:
+                        rois = decode_rois_message(json.loads(message))
+                        res = await asyncio.to_thread(session.step_rois, rois)
+                except Exception as e:
+                    await ws.send(json.dumps({"type": "error", "seq": seq, "error": repr(e)}))
+                    continue
+
+                await ws.send(json.dumps(_frame_event(seq, res)))
+                if res.stable_state != last_stable:
+                    last_stable = res.stable_state
+                    await ws.send(
+                        json.dumps({"type": "state", "seq": seq, "state": res.stable_state})
+                    )
+
+                if res.action is None:
+                    continue
+
+                if res.action == ACTION_PLAYPLAN_DRAFT:
+                    # 백그라운드에서 생성, 클라이언트에는 최종 플랜 때 이어서 보낸다
+                    if not self.no_api and not self.coach_guard.breaker.is_open:
+                        draft = self._start_draft(session, res.picks_filled)
+                    session.mark_playplan_drafted()
+                    continue
+
+                if coach is not None:
+                    continue  # 코치 스트림 중: 끝난 뒤 프레임에서 다시 판단한다
+
+                if self.no_api:
+                    if self._apply_coach(session, res.action, True):
+                        break
+                elif self.coach_guard.breaker.is_open:
+                    continue  # 실패 중인 엔드포인트는 두드리지 않는다
+                else:
+                    deadline = None
+                    if res.action == ACTION_PICK_COACH:
+                        deadline = pick_deadline(self.settings, res.pick_seconds_left)
+                    coach = asyncio.create_task(
+                        self._coach_task(ws, session, res.action, deadline, draft)
+                    )
+        finally:
+            if coach is not None:
+                if not coach.done():
+                    coach.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await coach
+                else:
+                    self._finish_coach(session, coach)
+            session.finish()
+            self.sessions.pop(session_id, None)
+
+    async def serve(self) -> None:
+        from websockets.asyncio.server import serve
+
+        self.batcher.start()
+        try:
+            async with serve(
+                self._handle,
+                self.host,
+                self.port,
+                process_request=self._process_request,
+                max_size=16 * 1024 * 1024,  # 전체 프레임 PNG
+            ) as server:
+                print(
+                    f"🛰 frame ingest server: ws://{self.host}:{self.port}{SESSION_PATH_PREFIX}<session_id>"
+                )
+                await server.serve_forever()
+        finally:
+            self.batcher.stop()
+
+
+def run_server(
+    settings: Settings, host: str = "127.0.0.1", port: int = 8765, *, no_api: bool = False
+) -> None:
+    asyncio.run(FrameIngestServer(settings, host, port, no_api=no_api).serve())
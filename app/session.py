@@ -0,0 +1,598 @@
+from __future__ import annotations
+
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Optional, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+from app.features import FrameFeatures
+from app.rois import Rois, extract_rois
+from app.settings import Settings
+from core.clock import SYSTEM_CLOCK, Clock
+from core.ocr_engine import extract_text
+from core.ocr_pool import OcrWorkerPool
+from core.ocr_profiles import TIMER_DIGITS_PROFILE, set_roi_backends
+from pipeline.buffer import StateBuffer
+from pipeline.classifier import StateClassifier
+from pipeline.draft_state import (
+    CHAMP_SELECT_PHASES,
+    EMPTY_STATE,
+    DraftDiff,
+    DraftState,
+    advance_state,
+)
+from pipeline.dual_timer_motion_detector import DualTimerMotionDetector
+from pipeline.frame_change_detector import FrameChangeDetector
+from pipeline.normalizer import TextNormalizer
+from pipeline.pick_slot_detector import PickSlotConfig, PickSlotsResult, detect_pick_slots
+from pipeline.pick_slot_tracker import (
+    TEAM_MY,
+    DeltaDebouncer,
+    DraftDelta,
+    PickSlotTracker,
+    PickSlotTrackerConfig,
+    slot_fingerprint,
+)
+from pipeline.pick_stage_detector import PickStageResult, detect_pick_kind_from_banned_strips
+from pipeline.prepare_phase_detector import (
+    is_dual_timer_effective,
+    is_dual_timer_effective_from_digits_text,
+    read_timer_seconds,
+)
+from pipeline.state_manager import StableStateManager
+from pipeline.timer_bar_estimator import BarFill, TimerBarCountdown, measure_bar_fill
+
+# 세션이 호출 측에 요청하는 코치 호출 종류
+ACTION_PICK_COACH = "PICK_COACH"
+ACTION_PLAYPLAN_COACH = "PLAYPLAN_COACH"
+ACTION_PLAYPLAN_DRAFT = (
+    "PLAYPLAN_DRAFT"  # 픽이 다 끝나기 전 플레이 플랜 초안 (settings.playplan_draft_min_picks)
+)
+
+# DraftState 슬롯 지문의 팀별 (패널 크롭 속성, 슬롯 이미지 속성). MY 1~5, ENEMY 1~5 순서
+BAN_SLOT_CROPS = (("bans_my_img", "my_ban_slot_imgs"), ("bans_enemy_img", "enemy_ban_slot_imgs"))
+PICK_SLOT_CROPS = (
+    ("picks_my_img", "my_pick_slot_imgs"),
+    ("picks_enemy_img", "enemy_pick_slot_imgs"),
+)
+
+
+@dataclass
+class FrameResult:
+    changed: bool
+    raw_state: str
+    major_state: str
+    major_conf: float
+    stable_state: str
+    status_text_raw: str
+    status_text_norm: str
+    pick_res: Optional[PickStageResult] = None
+    dual_now: Optional[bool] = None
+    dual_stable: Optional[bool] = None
+    dual_conf: float = 0.0
+    action: Optional[str] = None
+    # PICK_COACH 요청 시 타이머에서 읽은 남은 픽 시간(초). 못 읽으면 None
+    pick_seconds_left: Optional[int] = None
+    # 픽 확정된 슬롯 수 (0~10). 플레이 플랜 초안 모드에서 PICK 상태일 때만
+    picks_filled: Optional[int] = None
+    # 첫 픽 코치 이후 슬롯 변화로 픽 코치를 다시 요청할 때, 무엇이 바뀌었는지
+    draft_delta: Optional[DraftDelta] = None
+    # 타이머 바로 추정한 현재 단계 남은 시간(초). 밴픽 단계면 매 프레임 (settings.timer_bar_countdown)
+    timer_left: Optional[float] = None
+    # 이번 프레임까지 반영된 밴픽 상태 스냅샷 + 직전 스냅샷 대비 변경점 (변경 없으면 빈 diff)
+    draft_state: Optional[DraftState] = None
+    draft_diff: Optional[DraftDiff] = None
+
+
+@dataclass
+class SessionMetrics:
+    session_id: str
+    frames: int = 0
+    changed_frames: int = 0
+    coach_calls: int = 0
+    pipeline_s: float = 0.0  # step() 안에서 쓴 시간 합
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def wall_s(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    @property
+    def fps(self) -> float:
+        wall = self.wall_s
+        return self.frames / wall if wall > 0 else 0.0
+
+    @property
+    def ms_per_frame(self) -> float:
+        return self.pipeline_s * 1000.0 / self.frames if self.frames else 0.0
+
+    def as_dict(self) -> dict:
+        d = asdict(self)
+        d.pop("started_at")
+        d.pop("finished_at")
+        d.update(wall_s=self.wall_s, fps=self.fps, ms_per_frame=self.ms_per_frame)
+        return d
+
+
+def _result_text(fut, timeout: float) -> str:
+    # 숫자 OCR 실패/시간 초과는 prepare_phase_detector와 같이 빈 결과(-> 시각적 fallback)로 본다
+    try:
+        return fut.result(timeout=timeout).text
+    except Exception:
+        return ""
+
+
+class DraftSession:
+    """
+    밴픽 스트림 1개(클라이언트/리플레이)에 대한 파이프라인 상태.
+    버퍼/StableStateManager/코치 실행 여부를 세션마다 따로 가지므로
+    한 프로세스 안에서 여러 세션을 독립적으로 돌릴 수 있다.
+
+    코치 호출 자체는 하지 않고 FrameResult.action으로 요청만 한다.
+    호출 측이 실행 후 mark_pick_coached()를 불러준다.
+    pick_recoach_on_delta면 첫 픽 코치 뒤에도 PICK 상태 동안 픽 슬롯 10개를 추적해서, 슬롯이 확정/변경되면
+    (디바운스 후, 내 픽이 아직 안 끝났을 때만) 픽 코치를 다시 요청한다 (FrameResult.draft_delta).
+
+    ocr: status OCR 함수 (기본 core.ocr_engine.extract_text). 서버 모드에서는
+         세션 간 마이크로 배치 OCR(OcrMicroBatcher.extract_text)을 주입한다.
+    digits_ocr: 타이머 숫자 OCR 함수 (기본은 prepare_phase_detector가 timer_digits 프로필로 직접 OCR).
+                서버 모드에서는 배처의 timer_digits 프로필 OCR을 주입한다.
+    ocr_pool: 주어지면 status OCR을 워커 프로세스로 보내고, 기다리는 동안
+              현재 stable 상태에 필요한 판정(밴 strip / dual timer)을 미리 계산한다.
+              PREPARE 상태에서는 타이머 숫자 OCR도 같은 풀에 동시에 보낸다 (dual_timer_mode="motion"이면 숫자 OCR 없음).
+    clock: StableStateManager의 시간 소스. 리플레이는 VirtualClock을 프레임 시각으로 맞춰 넣는다.
+
+    타이머 바 비율로 매 프레임 남은 시간을 추정하고(FrameResult.timer_left), 숫자 OCR을 읽을 때마다 보정한다.
+    보정이 믿을 만해지면(일치하는 측정 2번 이상) 픽 코치 데드라인용 남은 시간도 숫자 OCR 대신 이 추정값을 쓴다.
+
+    프레임별 판정(상태/픽 종류/타이머/dual/슬롯 지문)은 매 프레임 DraftState 스냅샷 하나로 합쳐
+    FrameResult.draft_state / draft_diff로 내보낸다. 소비 측은 diff에 있는 항목에만 반응하면 된다.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        session_id: str = "main",
+        ocr: Optional[Callable[[Image.Image], str]] = None,
+        digits_ocr: Optional[Callable[[Image.Image], str]] = None,
+        ocr_pool: Optional[OcrWorkerPool] = None,
+        clock: Clock = SYSTEM_CLOCK,
+    ):
+        self.settings = settings
+        self.session_id = session_id
+        self._ocr = ocr
+        self._digits_ocr = digits_ocr
+        self._ocr_pool = ocr_pool
+        self.clock = clock
+
+        # ROI별 OCR 백엔드 (프로세스 전역 프로필 레지스트리, 인라인/배처/숫자 OCR 모두 이 프로필을 쓴다)
+        set_roi_backends(settings.ocr_backends)
+
+        self.normalizer = TextNormalizer()
+        self.classifier = StateClassifier()
+
+        self.state_buf = StateBuffer(size=settings.state_buf_size)
+        self.dual_buf = StateBuffer(size=settings.dual_buf_size)
+
+        self.state_manager = StableStateManager(
+            min_duration=settings.stable_min_duration,
+            min_confidence=settings.stable_min_confidence,
+            clock=clock,
+        )
+        self.change_gate = FrameChangeDetector()
+        self.slot_tracker = PickSlotTracker(
+            PickSlotTrackerConfig(lock_sec=settings.pick_slot_lock_sec)
+        )
+        self.delta_debouncer = DeltaDebouncer(quiet_sec=settings.pick_delta_quiet_sec)
+        self._pending_delta: Optional[DraftDelta] = None
+        self.countdown = TimerBarCountdown()
+        self.dual_motion = DualTimerMotionDetector()
+
+        self.pick_real_executed = False
+        self.playplan_drafted = False
+        self.metrics = SessionMetrics(session_id=session_id)
+
+        # 직전 "변한" 프레임의 결과 (정적 프레임이면 그대로 재사용)
+        self.rois: Optional[Rois] = None
+        self._status_text_raw = ""
+        self._status_text_norm = ""
+        self._raw_state = "UNKNOWN"
+        self._pick_res: Optional[PickStageResult] = None
+        self._dual_now: Optional[bool] = None
+        self._pick_seconds: Optional[int] = None
+        self._pick_seconds_read = False
+        self._pick_slots: Optional[PickSlotsResult] = None
+        self._slot_fingerprints: Optional[Tuple[np.ndarray, ...]] = None
+        # DraftState용 슬롯 지문 (이미 잘린 크롭만, 재지 않은 팀은 이전 지문)
+        self._ban_fingerprints: Optional[Tuple[Optional[np.ndarray], ...]] = None
+        self._state_pick_fingerprints: Optional[Tuple[Optional[np.ndarray], ...]] = None
+        self._bar_fill: Optional[BarFill] = None
+        self.draft_state: DraftState = EMPTY_STATE
+
+    def reset_capture(self) -> None:
+        """캡처 실패 시 호출 (run_main의 dual_buf.reset()과 동일)."""
+        self.dual_buf.reset()
+        self.dual_motion.reset()
+        self.change_gate.reset()
+
+    def mark_pick_coached(self) -> None:
+        self.pick_real_executed = True
+        self.metrics.coach_calls += 1
+        # 코치가 본 화면 이후의 변화만 다음 재요청 대상
+        self._pending_delta = None
+        self.delta_debouncer.reset()
+
+    def mark_playplan_drafted(self) -> None:
+        self.playplan_drafted = True
+
+    def mark_playplan_coached(self) -> None:
+        self.metrics.coach_calls += 1
+
+    def finish(self) -> None:
+        self.metrics.finished_at = time.perf_counter()
+
+    def step(
+        self,
+        frame_img: Union[Image.Image, np.ndarray],
+        window_size: Tuple[int, int],
+        now: Optional[float] = None,
+    ) -> FrameResult:
+        """
+        전체 프레임 1장 처리 (변화 없는 프레임이면 직전 결과 재사용).
+        frame_img: PIL 이미지 또는 (H, W, 3) RGB 배열 (영상 소스의 재사용 버퍼 등).
+        now: 프레임 시각(초). 리플레이/벤치마크에서 가상 시계로 쓴다 (None이면 현재 시각).
+        """
+        t0 = time.perf_counter()
+        if self.metrics.started_at is None:
+            self.metrics.started_at = t0
+
+        try:
+            changed = (
+                self.change_gate.update(frame_img, window_size)
+                or not self.settings.frame_change_gate
+            )
+            if changed or self.rois is None:
+                self._analyze(extract_rois(frame_img, window_size))
+                changed = True
+            return self._decide(changed, now=now)
+        finally:
+            self.metrics.frames += 1
+            self.metrics.pipeline_s += time.perf_counter() - t0
+
+    def step_rois(self, rois: Rois, now: Optional[float] = None) -> FrameResult:
+        """캡처 측에서 미리 잘라 보낸(또는 ROI 팩에서 읽은) ROI 처리 (변화 판정은 보낸 쪽 책임)."""
+        t0 = time.perf_counter()
+        if self.metrics.started_at is None:
+            self.metrics.started_at = t0
+
+        try:
+            self._analyze(rois)
+            return self._decide(True, now=now)
+        finally:
+            self.metrics.frames += 1
+            self.metrics.pipeline_s += time.perf_counter() - t0
+
+    def step_features(self, feat: FrameFeatures, now: Optional[float] = None) -> FrameResult:
+        """
+        미리 뽑아 둔 프레임 피처로 상태 머신만 진행 (오프라인 재생용).
+        now: 프레임 시각(초). StableStateManager의 min_duration 판정에 쓰인다.
+        피처에는 타이머 바 이미지가 없어 dual은 symmetry 판정(feat.dual_now)만 재생할 수 있다.
+        """
+        if self.settings.dual_timer_mode == "motion":
+            raise ValueError(
+                "피처 재생은 dual_timer_mode='symmetry'만 지원 (motion은 연속 프레임 타이머 바가 필요)"
+            )
+        t0 = time.perf_counter()
+        if self.metrics.started_at is None:
+            self.metrics.started_at = t0
+
+        try:
+            self.rois = None
+            self._status_text_raw = feat.status_text_raw
+            self._status_text_norm = feat.status_text_norm
+            self._raw_state = feat.raw_state
+            self._pick_res = feat.pick_result(self.settings.pick_std_threshold)
+            self._dual_now = feat.dual_now
+            self._pick_seconds = None  # 피처에는 픽 타이머가 없음 -> 남은 시간 모름
+            self._pick_seconds_read = True
+            self._pick_slots = None
+            self._slot_fingerprints = None
+            self._ban_fingerprints = None
+            self._state_pick_fingerprints = None
+            self._bar_fill = None
+            self.metrics.changed_frames += 1
+            return self._decide(True, now=now)
+        finally:
+            self.metrics.frames += 1
+            self.metrics.pipeline_s += time.perf_counter() - t0
+
+    def _analyze(self, rois: Rois) -> None:
+        self.rois = rois
+        self._pick_res = None
+        self._dual_now = None
+        self._pick_seconds_read = False
+        self._pick_slots = None
+        self._slot_fingerprints = None
+        self._ban_fingerprints = None
+        self._state_pick_fingerprints = None
+        self._bar_fill = None
+
+        if self._ocr_pool is not None:
+            fut = self._ocr_pool.submit(rois.status_img)
+            self._prefetch_detectors()
+            try:
+                self._status_text_raw = fut.result(
+                    timeout=self._ocr_pool.cfg.result_timeout_sec
+                ).text
+            except Exception as e:
+                # 워커가 죽었거나 응답이 없음 -> 이번 프레임은 UNKNOWN (루프는 멈추지 않는다)
+                print(f"[WARN] status OCR 실패: {e!r}")
+                self._status_text_raw = ""
+        else:
+            ocr = self._ocr or extract_text
+            self._status_text_raw = ocr(rois.status_img)
+
+        self._status_text_norm = self.normalizer.normalize(self._status_text_raw)
+        self._raw_state = self.classifier.classify(self._status_text_norm)
+        self.metrics.changed_frames += 1
+
+    def _prefetch_detectors(self) -> None:
+        """
+        status OCR이 워커에서 도는 동안, 현재 stable 상태라면 곧 필요할 판정을 미리 계산.
+        (판정은 ROI만의 함수라 결과는 순차 실행과 같다)
+        """
+        current = self.state_manager.current_state
+        if current == "PICK" and not self.pick_real_executed:
+            self._pick_res = self._detect_pick()
+        elif current == "PREPARE" and self.settings.dual_timer_mode == "motion":
+            self._dual_now = self._detect_dual()
+        elif current == "PREPARE":
+            digits = self._ocr_pool.submit(self.rois.timer_digits_img, TIMER_DIGITS_PROFILE)
+            self._dual_now = self._detect_dual(
+                digits_text=_result_text(digits, self._ocr_pool.cfg.result_timeout_sec)
+            )
+
+    def _detect_pick(self) -> PickStageResult:
+        return detect_pick_kind_from_banned_strips(
+            self.rois.bans_my_img,
+            self.rois.bans_enemy_img,
+            std_threshold=self.settings.pick_std_threshold,
+        )
+
+    def _detect_pick_slots(self) -> PickSlotsResult:
+        if self._pick_slots is None:
+            self._pick_slots = detect_pick_slots(
+                self.rois.my_pick_slot_imgs,
+                self.rois.enemy_pick_slot_imgs,
+                PickSlotConfig(std_threshold=self.settings.pick_slot_std_threshold),
+            )
+        return self._pick_slots
+
+    def _track_pick_slots(self, now: float) -> None:
+        if self.rois is None:
+            return
+        slots = self._detect_pick_slots()
+        events = self.slot_tracker.update(
+            now, slots.my_filled + slots.enemy_filled, self._pick_fingerprints()
+        )
+        if not self.pick_real_executed:
+            return  # 첫 픽 코치 전의 변화는 첫 코치가 보는 화면에 이미 들어 있다
+
+        self.delta_debouncer.push(events)
+        delta = self.delta_debouncer.poll(now)
+        if delta is not None and self._my_pick_open():
+            self._pending_delta = delta
+
+    def _pick_fingerprints(self) -> Tuple[np.ndarray, ...]:
+        if self._slot_fingerprints is None:
+            imgs = self.rois.my_pick_slot_imgs + self.rois.enemy_pick_slot_imgs
+            self._slot_fingerprints = tuple(slot_fingerprint(img) for img in imgs)
+        return self._slot_fingerprints
+
+    def _cropped_slot_fingerprints(
+        self, prev: Tuple[Optional[np.ndarray], ...], teams: Tuple[Tuple[str, str], ...]
+    ) -> Optional[Tuple[Optional[np.ndarray], ...]]:
+        """
+        DraftState용 슬롯 지문: 이번 프레임에 이미 잘린(또는 받은) 팀 크롭의 슬롯만 잰다.
+        지문 때문에 새로 크롭하지 않는다 (lazy 크롭 유지, 보낸 크롭에 없는 ROI도 요청하지 않음).
+        teams: 팀별 (패널 크롭 속성, 슬롯 이미지 속성). 재지 않은 팀은 이전 지문 그대로, 아무것도 못 재면 None.
+        """
+        slots = list(prev)
+        measured = False
+        for team, (panel_attr, slots_attr) in enumerate(teams):
+            if not (self.rois.has_crop(slots_attr) or self.rois.has_crop(panel_attr)):
+                continue
+            imgs = getattr(self.rois, slots_attr)
+            start = team * len(imgs)
+            slots[start : start + len(imgs)] = [slot_fingerprint(img) for img in imgs]
+            measured = True
+        return tuple(slots) if measured else None
+
+    def _my_pick_open(self) -> bool:
+        slot = self.settings.my_pick_slot
+        if slot:
+            return not self.slot_tracker.is_locked(TEAM_MY, slot)
+        return not all(self.slot_tracker.locked[: self.slot_tracker.slots_per_team])
+
+    def _request_playplan_draft(self, res: FrameResult) -> None:
+        min_picks = self.settings.playplan_draft_min_picks
+        if min_picks <= 0 or self.playplan_drafted or self.rois is None:
+            return
+        res.picks_filled = self._detect_pick_slots().filled_count
+        if res.picks_filled >= min_picks:
+            res.action = ACTION_PLAYPLAN_DRAFT
+
+    def _read_pick_seconds(self) -> Optional[int]:
+        # 코치 요청이 여러 프레임 이어져도 타이머 OCR은 "변한" 프레임마다 1번만
+        if self._pick_seconds_read:
+            return self._pick_seconds
+        self._pick_seconds_read = True
+
+        digits_text = None
+        if self._digits_ocr is not None:
+            try:
+                digits_text = self._digits_ocr(self.rois.timer_digits_img)
+            except Exception:
+                digits_text = ""
+        self._pick_seconds = read_timer_seconds(self.rois.timer_digits_img, digits_text)
+        if self._pick_seconds is not None:
+            self.countdown.calibrate("PICK", self._pick_seconds)
+        return self._pick_seconds
+
+    def _pick_seconds_left(self, res: FrameResult, t: float) -> Optional[int]:
+        # 바 추정이 숫자 OCR과 여러 번 맞았으면 OCR 없이 (내림 = 보수적으로). 그래도 recheck_sec마다 OCR로 다시 확인
+        countdown = self.countdown
+        if (
+            res.timer_left is not None
+            and countdown.calibrated("PICK")
+            and not countdown.recheck_due("PICK", t)
+        ):
+            return int(res.timer_left)
+        return self._read_pick_seconds()
+
+    def _update_countdown(self, phase: str, t: float) -> Optional[float]:
+        if not self.settings.timer_bar_countdown:
+            return None
+        if phase not in CHAMP_SELECT_PHASES:
+            self.countdown.reset()
+            return None
+        if (
+            self.rois is None
+            or self._bar_fill is not None
+            or not self.rois.can_crop("timer_bar_img")
+        ):
+            # 피처 재생 / 정적 프레임 / 바 크롭을 안 보낸 에이전트: 마지막 추정에서 경과 시간만큼
+            return self.countdown.remaining(t)
+
+        self._bar_fill = measure_bar_fill(self.rois.timer_bar_img)
+        return self.countdown.update(t, phase, self._bar_fill)
+
+    def _detect_dual(self, digits_text: Optional[str] = None) -> bool:
+        if self.settings.dual_timer_mode == "motion":
+            # "변한" 프레임마다 1번씩 링 버퍼에 쌓는다. 판정 없음(준비 중/바가 멈춤) = dual 아님
+            return bool(self.dual_motion.update(self.rois.timer_bar_img))
+
+        if digits_text is None and self._digits_ocr is not None:
+            try:
+                digits_text = self._digits_ocr(self.rois.timer_digits_img)
+            except Exception:
+                digits_text = ""  # OCR 실패 -> 시각적 fallback
+
+        if digits_text is None:
+            return is_dual_timer_effective(
+                timer_bar_img=self.rois.timer_bar_img,
+                timer_digits_img=self.rois.timer_digits_img,
+            )
+        return is_dual_timer_effective_from_digits_text(
+            self.rois.timer_bar_img, self.rois.timer_digits_img, digits_text
+        )
+
+    def _decide(self, changed: bool, now: Optional[float] = None) -> FrameResult:
+        settings = self.settings
+        t = self.clock.now() if now is None else now
+
+        raw_state = self._raw_state
+        self.state_buf.push(raw_state)
+        major_state = self.state_buf.get_majority()
+        major_conf = self.state_buf.get_confidence()
+        stable_state = self.state_manager.update(major_state, major_conf, now=now)
+
+        res = FrameResult(
+            changed=changed,
+            raw_state=raw_state,
+            major_state=major_state,
+            major_conf=major_conf,
+            stable_state=stable_state,
+            status_text_raw=self._status_text_raw,
+            status_text_norm=self._status_text_norm,
+            timer_left=self._update_countdown(stable_state, t),
+        )
+
+        if stable_state == "PICK":
+            if settings.pick_recoach_on_delta:
+                self._track_pick_slots(t)
+
+            if raw_state != "BAN" and not self.pick_real_executed:
+                if self._pick_res is None:
+                    self._pick_res = self._detect_pick()
+                res.pick_res = self._pick_res
+
+                if self._pick_res.kind == "PICK_REAL":
+                    res.action = ACTION_PICK_COACH
+                    res.pick_seconds_left = self._pick_seconds_left(res, t)
+
+            elif raw_state != "BAN" and self._pending_delta is not None:
+                # 첫 코치 이후 픽이 새로 확정/변경됨 -> 바뀐 화면으로 다시
+                res.action = ACTION_PICK_COACH
+                res.draft_delta = self._pending_delta
+                res.pick_seconds_left = self._pick_seconds_left(res, t)
+
+            # 픽 코치가 우선, 초안은 그 다음 프레임부터
+            if res.action is None:
+                self._request_playplan_draft(res)
+
+        elif stable_state == "PREPARE":
+            if self._dual_now is None:
+                self._dual_now = self._detect_dual()
+            self.dual_buf.push(self._dual_now)
+            res.dual_now = self._dual_now
+            res.dual_stable = self.dual_buf.get_majority()
+            res.dual_conf = self.dual_buf.get_confidence()
+
+            if res.dual_stable is True and res.dual_conf >= settings.dual_conf_threshold:
+                res.action = ACTION_PLAYPLAN_COACH
+
+        else:
+            self.dual_buf.reset()
+            self.dual_motion.reset()
+
+        self._publish_state(res, t)
+        return res
+
+    def _publish_state(self, res: FrameResult, t: float) -> None:
+        """
+        이번 프레임 판정을 DraftState로 합친다.
+        이번 프레임에 재지 않은 필드(다른 단계의 판정, 밴픽 화면 밖의 슬롯)는 이전 값을 그대로 둔다 (ts로 얼마나 묵었는지 안다).
+        결정적 판정(raw 상태/픽 종류/타이머 숫자)의 신뢰도는 1.0.
+        """
+        prev = self.draft_state
+        fields = dict(
+            phase=prev.phase.observe(res.stable_state, res.major_conf, t),
+            raw_phase=prev.raw_phase.observe(res.raw_state, 1.0, t),
+        )
+        if self._pick_res is not None:
+            fields["pick_kind"] = prev.pick_kind.observe(self._pick_res.kind, 1.0, t)
+        if self._pick_seconds_read and self._pick_seconds is not None:
+            fields["timer_seconds"] = prev.timer_seconds.observe(self._pick_seconds, 1.0, t)
+        if res.dual_stable is not None:
+            fields["dual"] = prev.dual.observe(res.dual_stable, res.dual_conf, t)
+
+        if (
+            self.settings.draft_state_slots
+            and self.rois is not None
+            and res.stable_state in CHAMP_SELECT_PHASES
+        ):
+            if self._ban_fingerprints is None:
+                self._ban_fingerprints = self._cropped_slot_fingerprints(prev.bans, BAN_SLOT_CROPS)
+            if self._state_pick_fingerprints is None:
+                # 픽 슬롯 추적이 이번 프레임에 10칸을 다 쟀으면 그 지문을 그대로
+                self._state_pick_fingerprints = (
+                    self._slot_fingerprints
+                    or self._cropped_slot_fingerprints(prev.picks, PICK_SLOT_CROPS)
+                )
+            if self._ban_fingerprints is not None:
+                fields["bans"] = self._ban_fingerprints
+            if self._state_pick_fingerprints is not None:
+                fields["picks"] = self._state_pick_fingerprints
+        fields["picks_locked"] = self.slot_tracker.locked
+
+        self.draft_state, res.draft_diff = advance_state(
+            prev, t, cfg=self.slot_tracker.cfg, **fields
+        )
+        res.draft_state = self.draft_state
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from app.frame_source import ImageDirFrameSource
+from app.session import (
+    ACTION_PICK_COACH,
+    ACTION_PLAYPLAN_COACH,
+    ACTION_PLAYPLAN_DRAFT,
+    DraftSession,
+)
+from app.settings import Settings
+from core.clock import FrameTimeline, VirtualClock
+from core.roi_layout import get_roi_layout
+
+
+@dataclass(frozen=True)
+class SessionSpec:
+    session_id: str
+    source_dir: Path
+    settings: Settings = Settings()
+    no_api: bool = True
+    limit: int = 0
+    frame_period_sec: float = 1.0  # 파일명에 timestamp가 없을 때 프레임 간격
+
+
+@dataclass
+class SessionReport:
+    session_id: str
+    worker_pid: int
+    final_state: Optional[str] = None
+    actions: List[Tuple[int, str]] = field(default_factory=list)  # (frame index, action)
+    metrics: dict = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+def warm_up_worker(window_sizes: Sequence[Tuple[int, int]]) -> None:
+    """
+    워커 프로세스 초기화: 읽기 전용 공유 자원을 미리 준비한다.
+    - ROI 레이아웃(창 크기별 캐시)
+    - tesseract 실행 파일 확인(첫 OCR 호출 지연 제거)
+    같은 워커에서 도는 세션들은 이 캐시를 그대로 공유한다.
+    """
+    for size in window_sizes:
+        get_roi_layout(tuple(size))
+
+    try:
+        import pytesseract
+
+        pytesseract.get_tesseract_version()
+    except Exception:
+        pass
+
+
+def _run_coach(session: DraftSession, action: str) -> None:
+    # 코치 클라이언트는 프로세스별 싱글턴 (세션끼리는 공유해도 상태가 없음)
+    from app.streaming import open_pick_coach_stream, run_streaming
+    from core.lol_pick_coach import get_client
+    from core.lol_playplan_coach import get_playplan_coach_client, lol_playplan_stream
+    from core.pick_coach_parser import PickCoachParser
+
+    label = f"{session.session_id}:{action}"
+    picks_img = session.rois.picks_merged_img
+    model = session.settings.gemini_model
+
+    if action == ACTION_PICK_COACH:
+        run_streaming(
+            label,
+            open_pick_coach_stream(session.settings, picks_img, client=get_client()),
+            parser=PickCoachParser(),
+        )
+    else:
+        run_streaming(
+            label, lol_playplan_stream(picks_img, client=get_playplan_coach_client(), model=model)
+        )
+
+
+def run_session(spec: SessionSpec) -> SessionReport:
+    """세션 1개를 끝까지 돌린다. (프로세스 풀에서 실행되므로 top-level 함수)"""
+    report = SessionReport(session_id=spec.session_id, worker_pid=os.getpid())
+
+    # 프레임 시각 기반 가상 시계: 워커 부하/병렬도와 무관하게 같은 결정
+    clock = VirtualClock()
+    timeline = FrameTimeline(spec.frame_period_sec)
+    session = DraftSession(spec.settings, session_id=spec.session_id, clock=clock)
+
+    try:
+        for frame in ImageDirFrameSource(spec.source_dir, limit=spec.limit):
+            t = timeline.next(frame.ts, frame.index)
+            if t is None:
+                print(f"[WARN] {spec.session_id} 프레임 시각이 뒤로 감, 건너뜀:", frame.name)
+                continue
+            clock.set(t)
+            res = session.step(frame.image, frame.image.size)
+            report.final_state = res.stable_state
+
+            if res.action is None:
+                continue
+
+            report.actions.append((frame.index, res.action))
+            if res.action == ACTION_PLAYPLAN_DRAFT:
+                # 초안은 라이브 루프/서버 전용 (풀은 최종 플랜만 호출)
+                session.mark_playplan_drafted()
+                continue
+            ok = True
+            if not spec.no_api:
+                try:
+                    _run_coach(session, res.action)
+                except Exception as e:
+                    print(f"[ERR] {spec.session_id} Gemini 호출 실패:", repr(e))
+                    ok = False
+
+            if res.action == ACTION_PICK_COACH:
+                if not ok:
+                    continue  # run_main과 같이 다음 프레임에서 다시
+                session.mark_pick_coached()
+            elif res.action == ACTION_PLAYPLAN_COACH:
+                session.mark_playplan_coached()
+                break
+    except Exception as e:
+        report.error = repr(e)
+    finally:
+        session.finish()
+        report.metrics = session.metrics.as_dict()
+
+    return report
+
+
+class SessionPool:
+    """
+    독립적인 밴픽 세션 N개를 프로세스 풀에 나눠서 실행.
+    세션 상태(버퍼/StableStateManager/코치 여부)는 세션마다 따로,
+    ROI 레이아웃/OCR 엔진 같은 읽기 전용 자원은 워커 프로세스 단위로 공유.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        window_sizes: Sequence[Tuple[int, int]] = ((1600, 900),),
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.window_sizes = tuple(window_sizes)
+
+    def run(self, specs: Sequence[SessionSpec]) -> List[SessionReport]:
+        if self.max_workers <= 1:
+            warm_up_worker(self.window_sizes)
+            return [run_session(spec) for spec in specs]
+
+        reports: dict[str, SessionReport] = {}
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(specs)) or 1,
+            initializer=warm_up_worker,
+            initargs=(self.window_sizes,),
+        ) as ex:
+            futures = {ex.submit(run_session, spec): spec for spec in specs}
+            for fut in as_completed(futures):
+                spec = futures[fut]
+                try:
+                    reports[spec.session_id] = fut.result()
+                except Exception as e:
+                    reports[spec.session_id] = SessionReport(
+                        session_id=spec.session_id, worker_pid=-1, error=repr(e)
+                    )
+
+        return [reports[spec.session_id] for spec in specs]
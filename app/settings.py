@@ -1,17 +1,78 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict
 
 @dataclass(frozen=True)
 class Settings:
     sleep_sec: float = 0.01
 
+    # 목표 프레임 레이트 (0이면 페이싱 없이 매 프레임 sleep_sec 대기)
+    target_fps: float = 0.0
+
+    # 페이싱 통계 출력 주기 (프레임 수)
+    pacer_report_every: int = 100
+
     state_buf_size: int = 7
     dual_buf_size: int = 7
 
+    # StableStateManager: 상태 전환 최소 유지 시간(초) / 다수결 신뢰도
+    stable_min_duration: float = 1.0
+    stable_min_confidence: float = 0.7
+
     pick_std_threshold: float = 30.0
     dual_conf_threshold: float = 0.72
 
+    # PREPARE dual 타이머 판정: "symmetry"(정지 이미지 색 대칭 + 숫자 OCR 0초 예외)
+    # / "motion"(연속 프레임 바 차이 프로필로 양쪽이 같이 줄어드는지, OCR 없음)
+    dual_timer_mode: str = "symmetry"
+
     gemini_model: str = "gemini-2.5-pro"
+
+    # 픽 코치 레이싱: 보조 모델("" = 끔)을 gemini_model과 같이 보내 먼저 추천을 내는 쪽을 쓴다
+    # hedge_sec: 0이면 동시 출발, >0이면 gemini_model이 그 시간 안에 추천을 못 내면 보조 모델 출발
+    pick_race_model: str = ""
+    pick_race_hedge_sec: float = 0.0
+
+    # 코치 호출 복원력 (core/coach_resilience.py)
+    # 재시도는 남은 픽 시간(타이머 - margin) 안에 끝날 수 있을 때만, 연속 실패 N번이면 open_sec 동안 호출 차단
+    coach_max_attempts: int = 3
+    coach_breaker_failures: int = 3
+    coach_breaker_open_sec: float = 30.0
+    coach_deadline_margin_sec: float = 3.0
+    # 픽 타이머를 못 읽었을 때 가정할 남은 픽 시간(초)
+    pick_time_fallback_sec: float = 20.0
+
+    # 픽 슬롯 추적: 첫 픽 코치 뒤에도 슬롯이 확정/변경되면 (디바운스 후) 픽 코치를 다시 요청
+    # 기본 끔: my_pick_slot을 모르면 우리 팀 5칸이 다 확정될 때까지 계속 다시 부르게 된다 (main.py는 --my_slot을 주면 켠다)
+    pick_recoach_on_delta: bool = False
+    pick_slot_lock_sec: float = 1.0
+    pick_delta_quiet_sec: float = 0.8
+    # 내 픽 슬롯 번호 (1~5). 0이면 모름 -> 우리 팀 슬롯이 다 확정될 때까지 다시 요청
+    my_pick_slot: int = 0
+
+    # 플레이 플랜 초안: 픽이 N개(8~9) 확정되면 미리 생성하고, 최종 확정 때는 바뀌는 점만 짧게 (0 = 끔)
+    playplan_draft_min_picks: int = 0
+    # 픽 슬롯(챔피언 이름 줄) filled 판정 std 기준
+    pick_slot_std_threshold: float = 20.0
+
+    # 타이머 바 비율로 매 프레임 남은 시간 추정 (FrameResult.timer_left, 숫자 OCR로 보정되면 픽 데드라인에도 사용)
+    timer_bar_countdown: bool = True
+
+    # DraftState에 밴/픽 슬롯 지문을 담는다 (밴픽 화면에서 이미 잘린 밴/픽 크롭의 슬롯만, 지문 때문에 새로 크롭하지 않음)
+    draft_state_slots: bool = False
+
+    # 코치 토큰 버스 구독자: JSONL 기록 경로("" = 끔) / 오버레이 WebSocket 포트(0 = 끔)
+    coach_tokens_jsonl: str = ""
+    overlay_ws_port: int = 0
     debug_save: bool = False
 
+    # 직전 프레임과 같으면 ROI/OCR/판정을 건너뛰고 이전 결과 재사용
+    frame_change_gate: bool = True
+
+    # status OCR 워커 프로세스 수 (0이면 메인 루프에서 바로 OCR)
+    ocr_workers: int = 0
+
+    # ROI별 OCR 백엔드 덮어쓰기 (core/ocr_backends.py 이름, 예: {"BANPICK_TIMER_DIGITS": "template"})
+    ocr_backends: Dict[str, str] = field(default_factory=dict)
+
     window_title: str = "League of Legends"
\ No newline at end of file
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from app.settings import Settings
+from core.clock import SYSTEM_CLOCK, Clock
+from core.coach_resilience import CoachGuard, Deadline, ResilienceConfig
+from core.hedged_stream import HedgedStream
+from core.pick_coach_parser import PickCoachParser, complete_early, looks_like_recommendation
+
+if TYPE_CHECKING:
+    from app.token_bus import TokenBus
+
+
+def build_coach_guard(settings: Settings, clock: Clock = SYSTEM_CLOCK) -> CoachGuard:
+    """코치 호출 재시도/회로 차단 (픽/플레이플랜 코치가 같은 엔드포인트라 하나를 공유)"""
+    cfg = ResilienceConfig(
+        max_attempts=settings.coach_max_attempts,
+        failure_threshold=settings.coach_breaker_failures,
+        open_sec=settings.coach_breaker_open_sec,
+    )
+    return CoachGuard(cfg, clock=clock)
+
+
+def pick_deadline(
+    settings: Settings, seconds_left: Optional[int], clock: Clock = SYSTEM_CLOCK
+) -> Deadline:
+    """타이머의 남은 픽 시간 - margin (못 읽었으면 pick_time_fallback_sec)"""
+    sec = settings.pick_time_fallback_sec if seconds_left is None else float(seconds_left)
+    return Deadline.after(sec - settings.coach_deadline_margin_sec, clock)
+
+
+def open_pick_coach_stream(
+    settings: Settings, picks_img, client=None, timeout_s: Optional[float] = None
+) -> Iterable[str]:
+    """
+    픽 코치 스트림. settings.pick_race_model이 있으면 gemini_model과 레이싱(HedgedStream)해서
+    먼저 추천 제목 줄을 낸 모델의 스트림을 쓰고 나머지는 취소한다.
+    timeout_s: 요청(레이서)별 최대 대기 (CoachGuard가 남은 픽 시간으로 정한다)
+    """
+    from core.lol_pick_coach import get_client, lol_mid_pick_coach_stream
+
+    client = client or get_client()
+    models = [settings.gemini_model]
+    if settings.pick_race_model and settings.pick_race_model != settings.gemini_model:
+        models.append(settings.pick_race_model)
+    if len(models) == 1:
+        return lol_mid_pick_coach_stream(
+            picks_img, client=client, model=settings.gemini_model, timeout_s=timeout_s
+        )
+
+    def racer(model: str):
+        return model, lambda: lol_mid_pick_coach_stream(
+            picks_img, client=client, model=model, timeout_s=timeout_s
+        )
+
+    return HedgedStream(
+        [racer(m) for m in models],
+        hedge_after_sec=settings.pick_race_hedge_sec,
+        is_usable=looks_like_recommendation,
+        on_decided=lambda race: print(f"\n[RACE] {race.summary()}"),
+    )
+
+
+def run_streaming(
+    label: str,
+    stream_iter: Iterable[str],
+    bus: Optional["TokenBus"] = None,
+    parser: Optional[PickCoachParser] = None,
+) -> str:
+    """
+    bus가 있으면 토큰 버스로 발행만 하고(출력은 구독자 몫), 없으면 콘솔에 바로 출력.
+    parser(픽 코치): 추천이 완성될 때마다 parser.recommendations에 쌓이고, 다 모이면 스트림을 일찍 닫는다.
+    """
+    if bus is not None:
+        return bus.stream(label, stream_iter, parser=parser)
+    if parser is not None:
+        stream_iter = complete_early(stream_iter, parser)
+
+    chunks: list[str] = []
+    start_t = time.perf_counter()
+    first_token_time: Optional[float] = None
+
+    for delta in stream_iter:
+        if first_token_time is None:
+            first_token_time = time.perf_counter()
+            print(f"\n[{label}] ⏱ 첫 토큰: {first_token_time - start_t:.2f}s\n")
+        print(delta, end="", flush=True)
+        chunks.append(delta)
+
+    end_t = time.perf_counter()
+    print(f"\n\n[{label}] ⏱ 전체: {end_t - start_t:.2f}s")
+    return "".join(chunks)
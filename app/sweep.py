@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass, fields
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from app.features import FrameFeatures
+from app.offline import DEFAULT_FRAME_PERIOD_SEC, timed_features
+
+# 결정이 없을 때의 frame index
+NO_DECISION = -1
+
+
+@dataclass(frozen=True)
+class SweepGrid:
+    """
+    스윕할 파라미터 값 목록 (전체 조합 = 각 축의 곱).
+    이름은 Settings 필드와 같다.
+    """
+
+    state_buf_size: Tuple[int, ...] = (7,)
+    stable_min_confidence: Tuple[float, ...] = (0.7,)
+    stable_min_duration: Tuple[float, ...] = (1.0,)
+    pick_std_threshold: Tuple[float, ...] = (30.0,)
+    dual_buf_size: Tuple[int, ...] = (7,)
+    dual_conf_threshold: Tuple[float, ...] = (0.72,)
+
+    @property
+    def size(self) -> int:
+        n = 1
+        for f in fields(self):
+            n *= len(getattr(self, f.name))
+        return n
+
+
+@dataclass
+class SweepResult:
+    """
+    조합별 결과 (컬럼 배열, 길이 = grid.size).
+    pick_frame / playplan_frame: PICK_REAL / PREPARE-dual 결정이 난 프레임의 FrameFeatures.index
+    (없으면 NO_DECISION). PLAYPLAN 이후의 PICK 결정은 재생과 같게 버린다.
+    """
+
+    params: Dict[str, np.ndarray]
+    pick_frame: np.ndarray
+    playplan_frame: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.pick_frame)
+
+    def rows(self) -> Iterator[dict]:
+        for i in range(len(self)):
+            row = {k: v[i].item() for k, v in self.params.items()}
+            row["pick_frame"] = int(self.pick_frame[i])
+            row["playplan_frame"] = int(self.playplan_frame[i])
+            yield row
+
+
+# ======================
+# Rolling majority (StateBuffer와 같은 규칙)
+# ======================
+def rolling_majority(labels: np.ndarray, size: int, n_labels: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    매 프레임 push 후 StateBuffer(size).get_majority()/get_confidence()를 한 번에 계산.
+    동률이면 Counter.most_common처럼 윈도우 안에서 먼저 나온 값이 이긴다.
+    """
+    T = len(labels)
+    t = np.arange(T)
+    start = np.maximum(0, t - size + 1)
+    length = t + 1 - start
+
+    onehot = np.zeros((T + 1, n_labels), dtype=np.int32)
+    onehot[t + 1, labels] = 1
+    cum = np.cumsum(onehot, axis=0)
+    counts = cum[t + 1] - cum[start]  # (T, K)
+
+    # nxt[i, k]: i 이후(포함) 처음 k가 나오는 위치 -> 윈도우 안 첫 등장 위치
+    nxt = np.full((T + 1, n_labels), T, dtype=np.int64)
+    for i in range(T - 1, -1, -1):
+        nxt[i] = nxt[i + 1]
+        nxt[i, labels[i]] = i
+    first = nxt[start]  # (T, K)
+
+    best = counts.max(axis=1)
+    key = np.where(counts == best[:, None], first, T + 1)
+    major = key.argmin(axis=1)
+    return major, best / length
+
+
+# ======================
+# Stable state (조합 축으로 벡터화, 시간 축은 순차)
+# ======================
+def _stable_states(
+    major: np.ndarray, conf: np.ndarray, now: np.ndarray, min_conf: np.ndarray, min_dur: np.ndarray
+) -> np.ndarray:
+    """
+    StableStateManager.update를 C개 조합에 대해 동시에 진행.
+    major/conf: (C, T), min_conf/min_dur: (C,) -> stable: (C, T)
+    """
+    C, T = major.shape
+    stable = np.empty((C, T), dtype=major.dtype)
+
+    cur = major[:, 0].copy()
+    last = np.full(C, now[0])
+    stable[:, 0] = cur
+
+    for t in range(1, T):
+        cand = major[:, t]
+        change = (cand != cur) & (conf[:, t] >= min_conf) & (now[t] - last >= min_dur)
+        cur = np.where(change, cand, cur)
+        last = np.where(change, now[t], last)
+        stable[:, t] = cur
+    return stable
+
+
+# ======================
+# Dual buffer
+# ======================
+def _dual_decision_frames(
+    stable: np.ndarray,
+    dual_now: np.ndarray,
+    pick_id: int,
+    prepare_id: int,
+    size: int,
+    thresholds: np.ndarray,
+) -> np.ndarray:
+    """
+    stable 시퀀스 1개 + dual_buf 크기 1개에 대해, dual_conf 임계값별 PLAYPLAN 결정 위치(프레임 위치, 없으면 -1).
+
+    DraftSession 규칙: PREPARE 프레임에서만 push, PICK/PREPARE 외 상태에서는 reset.
+    """
+    pushed = np.flatnonzero(stable == prepare_id)
+    out = np.full(len(thresholds), -1, dtype=np.int64)
+    if len(pushed) == 0:
+        return out
+
+    reset = ~np.isin(stable, (pick_id, prepare_id))
+    seg = np.cumsum(reset)[pushed]  # push별 reset 구간 번호
+
+    j = np.arange(len(pushed))
+    seg_start = np.flatnonzero(np.r_[True, seg[1:] != seg[:-1]])
+    first_push_in_seg = seg_start[np.cumsum(np.r_[True, seg[1:] != seg[:-1]]) - 1]
+    start = np.maximum(j - size + 1, first_push_in_seg)
+    length = j + 1 - start
+
+    vals = dual_now[pushed]
+    cum_true = np.r_[0, np.cumsum(vals)]
+    n_true = cum_true[j + 1] - cum_true[start]
+    n_false = length - n_true
+
+    # 동률이면 윈도우 첫 값이 다수결 값
+    major_true = (n_true > n_false) | ((n_true == n_false) & vals[start])
+    conf = np.maximum(n_true, n_false) / length
+
+    hit = major_true[None, :] & (conf[None, :] >= thresholds[:, None])  # (D, P)
+    any_hit = hit.any(axis=1)
+    out[any_hit] = pushed[hit.argmax(axis=1)[any_hit]]
+    return out
+
+
+# ======================
+# Sweep
+# ======================
+def sweep(
+    features: Sequence[FrameFeatures],
+    grid: SweepGrid,
+    frame_period_sec: float = DEFAULT_FRAME_PERIOD_SEC,
+) -> SweepResult:
+    """
+    캐시된 피처로 FeatureReplay/replay_decisions와 같은 결정을 grid 전체 조합에 대해 계산.
+    - state_buf 크기별 rolling majority: 시간 축 벡터화
+    - StableStateManager: (state_buf, min_conf, min_dur) 조합 축 벡터화
+    - pick/dual 임계값: 결정 위치를 임계값 축으로 한 번에 계산
+    dual은 FeatureReplay와 같이 symmetry 판정(feat.dual_now)만 재생한다.
+    """
+    timed = timed_features(features, frame_period_sec)
+    ordered = [feat for feat, _ in timed]
+    if not ordered:
+        raise ValueError("features가 비어 있음")
+
+    names = sorted({f.raw_state for f in ordered} | {"PICK", "PREPARE", "BAN"})
+    label_id = {name: i for i, name in enumerate(names)}
+    pick_id, prepare_id, ban_id = label_id["PICK"], label_id["PREPARE"], label_id["BAN"]
+
+    labels = np.array([label_id[f.raw_state] for f in ordered], dtype=np.int64)
+    now = np.array([t for _, t in timed], dtype=np.float64)
+    ban_std = np.array([f.ban_std for f in ordered], dtype=np.float64)
+    dual_now = np.array([f.dual_now for f in ordered], dtype=bool)
+    frame_index = np.array([f.index for f in ordered], dtype=np.int64)
+    T = len(ordered)
+
+    # 1) state_buf 크기별 다수결
+    majors = {n: rolling_majority(labels, n, len(names)) for n in grid.state_buf_size}
+
+    # 2) stable 조합: (state_buf, min_conf, min_dur)
+    stable_combos = list(
+        itertools.product(grid.state_buf_size, grid.stable_min_confidence, grid.stable_min_duration)
+    )
+    major = np.stack([majors[n][0] for n, _, _ in stable_combos])
+    conf = np.stack([majors[n][1] for n, _, _ in stable_combos])
+    min_conf = np.array([c for _, c, _ in stable_combos], dtype=np.float64)
+    min_dur = np.array([d for _, _, d in stable_combos], dtype=np.float64)
+    stable = _stable_states(major, conf, now, min_conf, min_dur)  # (S, T)
+
+    # 3) PICK_REAL: stable=PICK, raw!=BAN, ban_std>=임계값 인 첫 프레임
+    pick_thr = np.array(grid.pick_std_threshold, dtype=np.float64)
+    pick_ok = (stable == pick_id) & (labels != ban_id)[None, :]  # (S, T)
+    pick_hit = pick_ok[:, None, :] & (
+        ban_std[None, None, :] >= pick_thr[None, :, None]
+    )  # (S, P, T)
+    pick_pos = np.where(pick_hit.any(axis=2), pick_hit.argmax(axis=2), T)  # (S, P)
+
+    # 4) PREPARE-dual: 같은 stable 시퀀스는 한 번만 계산
+    dual_thr = np.array(grid.dual_conf_threshold, dtype=np.float64)
+    uniq, inverse = np.unique(stable, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    plan_pos = np.empty(
+        (len(stable_combos), len(grid.dual_buf_size), len(dual_thr)), dtype=np.int64
+    )
+    for u, row in enumerate(uniq):
+        for b, size in enumerate(grid.dual_buf_size):
+            pos = _dual_decision_frames(row, dual_now, pick_id, prepare_id, size, dual_thr)
+            plan_pos[inverse == u, b] = np.where(pos < 0, T, pos)
+
+    # 5) 전체 조합 (S, P, B, D)
+    pick_full = np.broadcast_to(
+        pick_pos[:, :, None, None], (len(stable_combos), len(pick_thr)) + plan_pos.shape[1:]
+    )
+    plan_full = np.broadcast_to(plan_pos[:, None, :, :], pick_full.shape)
+    pick_full = np.where(pick_full < plan_full, pick_full, T)  # PLAYPLAN에서 재생 종료
+
+    lookup = np.r_[frame_index, NO_DECISION]
+    params: Dict[str, List] = {f.name: [] for f in fields(SweepGrid)}
+    for (sb, mc, md), ps, db, dc in itertools.product(
+        stable_combos, grid.pick_std_threshold, grid.dual_buf_size, grid.dual_conf_threshold
+    ):
+        params["state_buf_size"].append(sb)
+        params["stable_min_confidence"].append(mc)
+        params["stable_min_duration"].append(md)
+        params["pick_std_threshold"].append(ps)
+        params["dual_buf_size"].append(db)
+        params["dual_conf_threshold"].append(dc)
+
+    return SweepResult(
+        params={k: np.asarray(v) for k, v in params.items()},
+        pick_frame=lookup[pick_full.reshape(-1)],
+        playplan_frame=lookup[plan_full.reshape(-1)],
+    )
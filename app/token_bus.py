@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from core.clock import SYSTEM_CLOCK, Clock
+from core.pick_coach_parser import PickCoachParser, complete_early
+
+EVENT_START = "start"
+EVENT_TOKEN = "token"
+EVENT_END = "end"
+EVENT_ERROR = "error"
+EVENT_ITEM = "item"  # 스트림 중간에 파싱된 결과 (픽 추천 등)
+
+
+@dataclass(frozen=True)
+class TokenEvent:
+    kind: str  # start / token / item / end / error
+    label: str  # 코치 이름 (PICK_COACH 등)
+    seq: int  # 스트림 안 순번 (start=0)
+    ts: float  # 발행 시각 (clock 기준 초)
+    text: str = ""  # token: 델타, error: 에러 문자열
+    data: Optional[Dict[str, Any]] = None  # item: 파싱 결과
+
+    def as_message(self) -> dict:
+        """서버(FrameIngestServer)의 coach_* 메시지와 같은 모양 + seq/ts"""
+        msg = {
+            "type": f"coach_{self.kind}",
+            "coach": self.label,
+            "seq": self.seq,
+            "ts": round(self.ts, 4),
+        }
+        if self.kind == EVENT_TOKEN:
+            msg["text"] = self.text
+        elif self.kind == EVENT_ERROR:
+            msg["error"] = self.text
+        if self.data is not None:
+            msg["data"] = self.data
+        return msg
+
+
+# ======================
+# Stats
+# ======================
+@dataclass(frozen=True)
+class StreamStats:
+    label: str
+    subscriber: str
+    tokens: int
+    dropped: int
+    ttft_ms: Optional[float]  # start 발행 -> 첫 토큰 처리
+    gap_ms: Dict[str, float]  # 연속 토큰 처리 간격 (mean/p95/max)
+    max_lag_ms: float  # 발행 -> 처리까지 최대 지연 (버퍼 대기)
+    total_ms: float
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class _StreamRecorder:
+    def __init__(self, label: str, subscriber: str, started_at: float):
+        self.label = label
+        self.subscriber = subscriber
+        self.started_at = started_at
+        self.first_at: Optional[float] = None
+        self.last_at: Optional[float] = None
+        self.gaps: List[float] = []
+        self.max_lag = 0.0
+        self.tokens = 0
+
+    def token(self, now: float, published_at: float) -> None:
+        if self.first_at is None:
+            self.first_at = now
+        else:
+            self.gaps.append(now - self.last_at)
+        self.last_at = now
+        self.max_lag = max(self.max_lag, now - published_at)
+        self.tokens += 1
+
+    def finish(self, now: float, dropped: int) -> StreamStats:
+        gaps = np.asarray(self.gaps) * 1000.0
+        return StreamStats(
+            label=self.label,
+            subscriber=self.subscriber,
+            tokens=self.tokens,
+            dropped=dropped,
+            ttft_ms=None
+            if self.first_at is None
+            else round((self.first_at - self.started_at) * 1000.0, 3),
+            gap_ms={
+                "mean": round(float(gaps.mean()), 3),
+                "p95": round(float(np.percentile(gaps, 95)), 3),
+                "max": round(float(gaps.max()), 3),
+            }
+            if len(gaps)
+            else {},
+            max_lag_ms=round(self.max_lag * 1000.0, 3),
+            total_ms=round((now - self.started_at) * 1000.0, 3),
+        )
+
+
+# ======================
+# Subscriber
+# ======================
+class TokenSubscriber:
+    """
+    토큰 버스 구독자. 자기 스레드 + 크기 제한 버퍼에서 handle()을 순서대로 호출한다.
+    - offer()는 절대 막히지 않는다: 버퍼가 차면 가장 오래된 token 이벤트를 버린다 (start/end/error는 유지)
+    - 스트림마다 TTFT / 토큰 간격 / 버퍼 지연 / 버린 수를 기록 (history)
+    """
+
+    name = "subscriber"
+
+    def __init__(self, maxsize: int = 1024, clock: Clock = SYSTEM_CLOCK, history: int = 32):
+        self.maxsize = maxsize
+        self.clock = clock
+        self.history: Deque[StreamStats] = deque(maxlen=history)
+
+        self._buf: Deque[Optional[TokenEvent]] = deque()
+        self._cond = threading.Condition()
+        self._dropped: Dict[str, int] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._recorder: Optional[_StreamRecorder] = None
+
+    def handle(self, event: TokenEvent) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """stop() 뒤에 구독자 자원 정리 (파일/소켓)."""
+
+    # ----------------------
+    # Buffer
+    # ----------------------
+    def offer(self, event: TokenEvent) -> None:
+        with self._cond:
+            if len(self._buf) >= self.maxsize:
+                victim = next(
+                    (e for e in self._buf if e is not None and e.kind == EVENT_TOKEN), None
+                )
+                if victim is not None:
+                    self._buf.remove(victim)
+                    self._dropped[victim.label] = self._dropped.get(victim.label, 0) + 1
+            self._buf.append(event)
+            self._cond.notify()
+
+    def start(self) -> "TokenSubscriber":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=f"token-{self.name}", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """버퍼에 남은 이벤트를 다 처리한 뒤 종료."""
+        if self._thread is None:
+            return
+        with self._cond:
+            self._buf.append(None)
+            self._cond.notify()
+        self._thread.join(timeout)
+        self._thread = None
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._buf:
+                    self._cond.wait()
+                event = self._buf.popleft()
+            if event is None:
+                return
+
+            try:
+                self.handle(event)
+            except Exception as e:
+                print(f"[BUS] {self.name} 구독자 오류:", repr(e))
+            self._record(event)
+
+    def _record(self, event: TokenEvent) -> None:
+        now = self.clock.now()
+        if event.kind == EVENT_START:
+            self._recorder = _StreamRecorder(event.label, self.name, event.ts)
+        elif self._recorder is None:
+            return
+        elif event.kind == EVENT_TOKEN:
+            self._recorder.token(now, event.ts)
+        elif event.kind in (EVENT_END, EVENT_ERROR):
+            with self._cond:
+                dropped = self._dropped.pop(event.label, 0)
+            self.history.append(self._recorder.finish(now, dropped))
+            self._recorder = None
+
+    @property
+    def last_stats(self) -> Optional[StreamStats]:
+        return self.history[-1] if self.history else None
+
+
+class ConsoleSubscriber(TokenSubscriber):
+    """기존 run_streaming과 같은 콘솔 출력."""
+
+    name = "console"
+
+    def handle(self, event: TokenEvent) -> None:
+        if event.kind == EVENT_START:
+            self._started_at = event.ts
+            self._first = True
+            self._items = []
+        elif event.kind == EVENT_TOKEN:
+            if self._first:
+                self._first = False
+                print(f"\n[{event.label}] ⏱ 첫 토큰: {event.ts - self._started_at:.2f}s\n")
+            print(event.text, end="", flush=True)
+        elif event.kind == EVENT_ITEM:
+            # 토큰 출력 중간이라 줄을 바꾸지 않고 마지막에 모아서 보여준다
+            self._items.append(event.data)
+        elif event.kind == EVENT_END:
+            print(f"\n\n[{event.label}] ⏱ 전체: {event.ts - self._started_at:.2f}s")
+            for item in self._items:
+                print(f"[{event.label}] ✅ {_format_item(item)}")
+        else:
+            print(f"\n[{event.label}] ❌ {event.text}")
+
+
+def _format_item(item: Dict[str, Any]) -> str:
+    if "champion" in item:
+        return f"#{item['rank']} {item['champion']} {item['score']:g}/10 | 라인전: {item['lane']} | 팀가치: {item['team']}"
+    return json.dumps(item, ensure_ascii=False)
+
+
+class JsonlSubscriber(TokenSubscriber):
+    """이벤트 1개 = JSON 1줄. 스트림이 끝날 때마다 flush."""
+
+    name = "jsonl"
+
+    def __init__(self, path: Path, **kwargs):
+        super().__init__(**kwargs)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fp = self.path.open("a", encoding="utf-8")
+
+    def handle(self, event: TokenEvent) -> None:
+        self._fp.write(json.dumps(event.as_message(), ensure_ascii=False) + "\n")
+        if event.kind != EVENT_TOKEN:
+            self._fp.flush()
+
+    def close(self) -> None:
+        self._fp.close()
+
+
+class WebSocketSubscriber(TokenSubscriber):
+    """
+    오버레이용 로컬 WebSocket 브로드캐스트 (ws://<host>:<port>).
+    연결된 모든 클라이언트에 이벤트 JSON을 보낸다. 보내다 끊긴 연결은 버린다.
+    """
+
+    name = "websocket"
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8766, **kwargs):
+        super().__init__(**kwargs)
+        from websockets.sync.server import serve
+
+        self.host = host
+        self._clients: set = set()
+        self._clients_lock = threading.Lock()
+        self._server = serve(self._client, host, port)
+        self.port = self._server.socket.getsockname()[1]  # port=0이면 실제 할당 포트
+        self._server_thread = threading.Thread(
+            target=self._server.serve_forever, name="token-ws", daemon=True
+        )
+        self._server_thread.start()
+
+    def _client(self, ws) -> None:
+        with self._clients_lock:
+            self._clients.add(ws)
+        try:
+            for _ in ws:  # 클라이언트 메시지는 무시, 끊길 때까지 대기
+                pass
+        finally:
+            with self._clients_lock:
+                self._clients.discard(ws)
+
+    @property
+    def client_count(self) -> int:
+        with self._clients_lock:
+            return len(self._clients)
+
+    def handle(self, event: TokenEvent) -> None:
+        data = json.dumps(event.as_message(), ensure_ascii=False)
+        with self._clients_lock:
+            clients = list(self._clients)
+        for ws in clients:
+            try:
+                ws.send(data)
+            except Exception:
+                with self._clients_lock:
+                    self._clients.discard(ws)
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server_thread.join(timeout=5.0)
+
+
+# ======================
+# Bus
+# ======================
+class TokenBus:
+    """
+    코치 스트림을 1번만 읽어서 여러 구독자에게 나눠 준다 (fan-out).
+    발행은 구독자 버퍼에 넣기만 하므로 느린 구독자가 스트림 소비를 늦추지 않는다.
+    발행 측(producer) TTFT / 토큰 간격도 같은 형식으로 기록한다.
+    """
+
+    PRODUCER = "producer"
+
+    def __init__(self, subscribers: Sequence[TokenSubscriber] = (), clock: Clock = SYSTEM_CLOCK):
+        self.clock = clock
+        self.subscribers: List[TokenSubscriber] = []
+        self.producer_history: Deque[StreamStats] = deque(maxlen=32)
+        for sub in subscribers:
+            self.subscribe(sub)
+
+    def subscribe(self, sub: TokenSubscriber) -> TokenSubscriber:
+        self.subscribers.append(sub.start())
+        return sub
+
+    def publish(self, event: TokenEvent) -> None:
+        for sub in self.subscribers:
+            sub.offer(event)
+
+    def stream(
+        self, label: str, stream_iter: Iterable[str], parser: Optional[PickCoachParser] = None
+    ) -> str:
+        """
+        스트림을 끝까지 읽어 구독자들에게 발행하고 전체 텍스트를 반환. 스트림 예외는 error 발행 후 다시 던진다.
+        parser가 있으면 완성된 추천마다 item을 발행하고, 다 모이면 스트림을 일찍 닫는다.
+        """
+        chunks: List[str] = []
+        started_at = self.clock.now()
+        recorder = _StreamRecorder(label, self.PRODUCER, started_at)
+        self.publish(TokenEvent(EVENT_START, label, 0, started_at))
+
+        seq = 0
+
+        def on_item(rec) -> None:
+            nonlocal seq
+            seq += 1
+            self.publish(TokenEvent(EVENT_ITEM, label, seq, self.clock.now(), data=rec.as_dict()))
+
+        if parser is not None:
+            stream_iter = complete_early(stream_iter, parser, on_item)
+
+        try:
+            for delta in stream_iter:
+                seq += 1
+                now = self.clock.now()
+                recorder.token(now, now)
+                self.publish(TokenEvent(EVENT_TOKEN, label, seq, now, delta))
+                chunks.append(delta)
+        except Exception as e:
+            self.publish(TokenEvent(EVENT_ERROR, label, seq + 1, self.clock.now(), repr(e)))
+            self.producer_history.append(recorder.finish(self.clock.now(), 0))
+            raise
+
+        end_at = self.clock.now()
+        self.publish(TokenEvent(EVENT_END, label, seq + 1, end_at))
+        self.producer_history.append(recorder.finish(end_at, 0))
+        return "".join(chunks)
+
+    def stats(self) -> Dict[str, Optional[StreamStats]]:
+        """구독자별(+producer) 마지막 스트림 통계. 구독자는 아직 처리 중이면 이전 스트림 값."""
+        out: Dict[str, Optional[StreamStats]] = {
+            self.PRODUCER: self.producer_history[-1] if self.producer_history else None
+        }
+        for sub in self.subscribers:
+            out[sub.name] = sub.last_stats
+        return out
+
+    def close(self, timeout: float = 5.0) -> None:
+        """구독자들이 버퍼를 다 비우고 끝날 때까지 기다린다 (통계는 close 뒤에도 남는다)."""
+        for sub in self.subscribers:
+            sub.stop(timeout)
+
+    def __enter__(self) -> "TokenBus":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def format_stream_stats(stats: StreamStats) -> str:
+    gap = stats.gap_ms
+    return (
+        f"[TOKENS] {stats.label} {stats.subscriber}: ttft={stats.ttft_ms}ms tokens={stats.tokens}"
+        f" dropped={stats.dropped} gap_mean={gap.get('mean')}ms gap_p95={gap.get('p95')}ms"
+        f" max_lag={stats.max_lag_ms}ms"
+    )
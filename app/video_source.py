@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from app.rois import Rois
+from core.roi_layout import get_roi_layout
+
+
+@dataclass(frozen=True)
+class VideoFrame:
+    """
+    영상/파이프에서 읽은 프레임 1장.
+    array는 소스가 재사용하는 버퍼의 view라서 다음 프레임을 읽으면 덮어써진다 (보관하려면 copy).
+    """
+
+    index: int  # 내보낸 프레임 순번 (1부터)
+    source_index: int  # 원본 스트림 프레임 번호 (0부터, 건너뛴 프레임 포함)
+    ts: float  # 스트림 시작 기준 초
+    array: np.ndarray  # (H, W, 3) RGB uint8
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.array.shape[1], self.array.shape[0]
+
+    @property
+    def image(self) -> Image.Image:
+        """PIL 이미지 (전체 프레임 복사). 가능하면 DraftSession.step(frame.array, ...)을 쓴다."""
+        return Image.fromarray(self.array, "RGB")
+
+    def rois(self) -> Rois:
+        return Rois(self.array, get_roi_layout(self.size))
+
+
+class FrameSkipper:
+    """
+    src_fps 스트림에서 target_fps에 맞는 프레임만 고른다 (누적 오차 없이 정수 계산).
+    target_fps가 0이거나 src_fps 이상이면 모든 프레임을 쓴다.
+    """
+
+    def __init__(self, src_fps: float, target_fps: float = 0.0):
+        if src_fps <= 0:
+            raise ValueError(f"src_fps는 0보다 커야 함: {src_fps}")
+        self.src_fps = float(src_fps)
+        self.target_fps = float(target_fps)
+
+    def keep(self, i: int) -> bool:
+        if not self.target_fps or self.target_fps >= self.src_fps:
+            return True
+        if i == 0:
+            return True
+        ratio = self.target_fps / self.src_fps
+        return int(i * ratio) != int((i - 1) * ratio)
+
+
+# ======================
+# Video file (OpenCV)
+# ======================
+class VideoFileFrameSource:
+    """
+    녹화 영상 파일을 순차 디코드.
+    - 건너뛸 프레임은 grab()만 하고 retrieve/색 변환을 하지 않는다
+    - 쓰는 프레임은 같은 BGR/RGB 버퍼에 retrieve + cvtColor (프레임별 할당 없음)
+    """
+
+    def __init__(self, path: Path, target_fps: float = 0.0, limit: int = 0):
+        self.path = Path(path)
+        self.target_fps = target_fps
+        self.limit = limit
+
+        cap = cv2.VideoCapture(str(self.path))
+        if not cap.isOpened():
+            raise FileNotFoundError(f"영상을 열 수 없음: {self.path}")
+        self.src_fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self.frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        cap.release()
+
+    def __iter__(self) -> Iterator[VideoFrame]:
+        cap = cv2.VideoCapture(str(self.path))
+        skipper = FrameSkipper(self.src_fps, self.target_fps)
+        bgr: Optional[np.ndarray] = None
+        rgb: Optional[np.ndarray] = None
+
+        try:
+            emitted = 0
+            i = 0
+            while not (self.limit and emitted >= self.limit):
+                if not cap.grab():
+                    return
+                if skipper.keep(i):
+                    ok, out = cap.retrieve(bgr)
+                    if not ok:
+                        return
+                    if out is not bgr:
+                        # 첫 프레임(또는 해상도 변경) 때만 버퍼 할당
+                        bgr = out
+                        rgb = np.empty_like(bgr)
+                    cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB, dst=rgb)
+
+                    emitted += 1
+                    yield VideoFrame(index=emitted, source_index=i, ts=i / self.src_fps, array=rgb)
+                i += 1
+        finally:
+            cap.release()
+
+
+# ======================
+# Raw rgb24 stream (ffmpeg pipe 등)
+# ======================
+class RawRgbStreamFrameSource:
+    """
+    rawvideo rgb24 바이트 스트림을 프레임 단위로 읽는다.
+    매 프레임 같은 버퍼에 readinto 하므로 프레임별 할당이 없다.
+    (건너뛸 프레임도 스트림에서 읽어 버려야 하므로 같은 버퍼로 읽고 넘긴다)
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        width: int,
+        height: int,
+        src_fps: float,
+        target_fps: float = 0.0,
+        limit: int = 0,
+    ):
+        self.stream = stream
+        self.width = width
+        self.height = height
+        self.src_fps = src_fps
+        self.target_fps = target_fps
+        self.limit = limit
+        self._buf = np.empty((height, width, 3), dtype=np.uint8)
+
+    def _read_frame(self) -> bool:
+        view = memoryview(self._buf).cast("B")
+        got = 0
+        while got < len(view):
+            n = self.stream.readinto(view[got:])
+            if not n:
+                return False  # 스트림 끝 (잘린 마지막 프레임은 버린다)
+            got += n
+        return True
+
+    def __iter__(self) -> Iterator[VideoFrame]:
+        skipper = FrameSkipper(self.src_fps, self.target_fps)
+        emitted = 0
+        i = 0
+        while not (self.limit and emitted >= self.limit):
+            if not self._read_frame():
+                return
+            if skipper.keep(i):
+                emitted += 1
+                yield VideoFrame(
+                    index=emitted, source_index=i, ts=i / self.src_fps, array=self._buf
+                )
+            i += 1
+
+
+def ffmpeg_rgb24_command(
+    source: Union[str, Path],
+    width: int,
+    height: int,
+    fps: float = 0.0,
+    input_args: Tuple[str, ...] = (),
+) -> List[str]:
+    """
+    ffmpeg로 source를 (width x height) rgb24 rawvideo로 stdout에 내보내는 명령.
+    fps를 주면 ffmpeg fps 필터로 디코드 단계에서 프레임을 줄인다.
+    """
+    vf = f"scale={width}:{height}"
+    if fps:
+        vf = f"fps={fps},{vf}"
+    return [
+        "ffmpeg",
+        "-loglevel",
+        "error",
+        "-nostdin",
+        *input_args,
+        "-i",
+        str(source),
+        "-vf",
+        vf,
+        "-f",
+        "rawvideo",
+        "-pix_fmt",
+        "rgb24",
+        "-",
+    ]
+
+
+class FfmpegFrameSource:
+    """
+    ffmpeg 프로세스(영상 파일/캡처 장치/스트림 URL)의 rgb24 출력을 읽는 소스.
+    fps 필터를 쓰면 프레임 간격은 1/target_fps 로 본다.
+    """
+
+    def __init__(
+        self,
+        source: Union[str, Path],
+        width: int,
+        height: int,
+        src_fps: float = 30.0,
+        target_fps: float = 0.0,
+        limit: int = 0,
+        input_args: Tuple[str, ...] = (),
+    ):
+        self.cmd = ffmpeg_rgb24_command(source, width, height, target_fps, input_args)
+        self.width = width
+        self.height = height
+        self.fps = target_fps or src_fps
+        self.limit = limit
+
+    def __iter__(self) -> Iterator[VideoFrame]:
+        proc = subprocess.Popen(
+            self.cmd, stdout=subprocess.PIPE, bufsize=self.width * self.height * 3
+        )
+        try:
+            yield from RawRgbStreamFrameSource(
+                proc.stdout, self.width, self.height, self.fps, limit=self.limit
+            )
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.terminate()
+            proc.wait()
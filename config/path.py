@@ -21,5 +21,9 @@ class Paths:
     TEST_PICKED_CHAMPS_DIR: Path = TEST_IMAGES_DIR / "picked_champs"
     TEST_PICKED_CHAMPS_TEXT_ONLY_DIR: Path = TEST_IMAGES_DIR / "picked_champs_text_only"
 
+    FEATURE_CACHE_DIR: Path = CAPTURE_DIR / "feature_cache"
+    ROI_PACK_DIR: Path = CAPTURE_DIR / "roi_packs"
+    OCR_TEMPLATE_DIR: Path = CAPTURE_DIR / "ocr_templates"
+
 
 PATHS = Paths()
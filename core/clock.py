@@ -0,0 +1,83 @@
+# core/clock.py
+from __future__ import annotations
+
+import time
+from typing import Optional, Protocol
+
+
+# ======================
+# Interface
+# ======================
+class Clock(Protocol):
+    """
+    상태 머신/루프가 쓰는 시간 소스.
+    - now(): 초 단위 현재 시각
+    - sleep(sec): sec초 대기 (가상 시계는 시간만 앞당기고 바로 리턴)
+    """
+
+    def now(self) -> float: ...
+
+    def sleep(self, sec: float) -> None: ...
+
+
+# ======================
+# Implementations
+# ======================
+class SystemClock:
+    """실시간 (live 루프 기본값)."""
+
+    def now(self) -> float:
+        return time.time()
+
+    def sleep(self, sec: float) -> None:
+        if sec > 0:
+            time.sleep(sec)
+
+
+class VirtualClock:
+    """
+    리플레이용 가상 시계.
+    프레임 timestamp로 set()하면서 돌리면 CPU 속도와 무관하게 live와 같은 결정을 낸다.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self._now = float(start)
+
+    def now(self) -> float:
+        return self._now
+
+    def sleep(self, sec: float) -> None:
+        if sec > 0:
+            self._now += sec
+
+    def set(self, t: float) -> None:
+        """시각을 t로 이동 (뒤로 가는 건 허용하지 않음)."""
+        if t < self._now:
+            raise ValueError(f"가상 시계는 뒤로 갈 수 없음: {t} < {self._now}")
+        self._now = float(t)
+
+
+class FrameTimeline:
+    """
+    프레임 파일 시각 -> VirtualClock에 넣을 시각.
+    - 파일명에 timestamp가 없으면 직전 프레임 + period (첫 프레임은 순번 * period)
+    - 직전보다 이른 timestamp는 None (호출 쪽에서 경고 후 그 프레임을 건너뛴다)
+    timestamp 있는/없는 파일이 섞인 폴더에서도 시계가 뒤로 가지 않는다.
+    """
+
+    def __init__(self, period: float = 1.0):
+        self.period = period
+        self._last: Optional[float] = None
+
+    def next(self, ts: Optional[float], index: int) -> Optional[float]:
+        if ts is None:
+            t = index * self.period if self._last is None else self._last + self.period
+        elif self._last is not None and ts < self._last:
+            return None
+        else:
+            t = float(ts)
+        self._last = t
+        return t
+
+
+SYSTEM_CLOCK = SystemClock()
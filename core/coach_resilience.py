@@ -0,0 +1,311 @@
+# core/coach_resilience.py
+from __future__ import annotations
+
+import math
+import threading
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterable, Iterator, Optional
+
+from core.clock import SYSTEM_CLOCK, Clock
+
+BREAKER_CLOSED = "CLOSED"  # 정상 호출
+BREAKER_OPEN = "OPEN"  # 차단: 호출하지 않고 바로 CircuitOpenError
+BREAKER_HALF_OPEN = "HALF_OPEN"  # 차단 시간이 지남: 시험 호출 1개만 허용
+
+# 스트림 열기 함수: 이번 시도에 허용된 최대 대기(초)를 받는다
+OpenStream = Callable[[float], Iterable[str]]
+
+
+# ======================
+# Config
+# ======================
+@dataclass(frozen=True)
+class ResilienceConfig:
+    # 재시도: 첫 토큰이 오기 전에 실패한 경우만 (출력이 나간 뒤 재시도하면 토큰이 겹친다)
+    max_attempts: int = 3
+    backoff_sec: float = 0.3  # 첫 재시도 전 대기, 이후 2배씩
+    max_backoff_sec: float = 2.0
+
+    # 한 번 시도의 최대 대기 (남은 시간이 더 짧으면 그만큼으로 줄인다)
+    attempt_timeout_sec: float = 20.0
+
+    # 재시도 1번이 끝나는 데 걸린다고 볼 시간 (관측값이 쌓이면 EWMA로 갱신)
+    expected_call_sec: float = 6.0
+    call_ewma_alpha: float = 0.3
+
+    # 회로 차단: 연속 실패 N번이면 open_sec 동안 호출 차단
+    failure_threshold: int = 3
+    open_sec: float = 30.0
+
+
+class CircuitOpenError(RuntimeError):
+    """회로가 열려 있어서 호출하지 않음"""
+
+
+class DeadlineExceeded(TimeoutError):
+    """남은 시간 안에 호출(재시도)을 끝낼 수 없음"""
+
+
+# ======================
+# Deadline
+# ======================
+class Deadline:
+    """clock 기준 절대 시각까지의 남은 시간. at=None이면 마감 없음."""
+
+    def __init__(self, at: Optional[float], clock: Clock = SYSTEM_CLOCK):
+        self.at = at
+        self.clock = clock
+
+    @classmethod
+    def after(cls, sec: float, clock: Clock = SYSTEM_CLOCK) -> "Deadline":
+        return cls(clock.now() + sec, clock)
+
+    @classmethod
+    def never(cls, clock: Clock = SYSTEM_CLOCK) -> "Deadline":
+        return cls(None, clock)
+
+    def remaining(self) -> float:
+        if self.at is None:
+            return math.inf
+        return self.at - self.clock.now()
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+
+# ======================
+# Circuit breaker
+# ======================
+@dataclass
+class BreakerStats:
+    state: str
+    consecutive_failures: int
+    trips: int  # CLOSED/HALF_OPEN -> OPEN 횟수
+    rejected: int  # 회로가 열려 있어 막은 호출 수
+    retry_after_s: float
+    last_error: Optional[str]
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class CircuitBreaker:
+    """
+    연속 실패 failure_threshold번이면 OPEN -> open_sec 뒤 HALF_OPEN(시험 호출 1개)
+    -> 시험 호출 성공이면 CLOSED, 실패면 다시 OPEN.
+    여러 스레드(서버 세션)가 공유할 수 있다.
+    """
+
+    def __init__(
+        self, failure_threshold: int = 3, open_sec: float = 30.0, clock: Clock = SYSTEM_CLOCK
+    ):
+        self.failure_threshold = failure_threshold
+        self.open_sec = open_sec
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._state = BREAKER_CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._failures = 0
+        self._trips = 0
+        self._rejected = 0
+        self._last_error: Optional[str] = None
+
+    def _refresh(self) -> None:
+        # lock 안에서만 호출
+        if self._state == BREAKER_OPEN and self.clock.now() - self._opened_at >= self.open_sec:
+            self._state = BREAKER_HALF_OPEN
+            self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """지금 호출하면 막히는지 (HALF_OPEN에서 시험 호출이 진행 중이어도 True)"""
+        with self._lock:
+            self._refresh()
+            return self._state == BREAKER_OPEN or (
+                self._state == BREAKER_HALF_OPEN and self._probe_in_flight
+            )
+
+    def retry_after(self) -> float:
+        with self._lock:
+            if self._state != BREAKER_OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.open_sec - self.clock.now())
+
+    def allow(self) -> bool:
+        with self._lock:
+            self._refresh()
+            if self._state == BREAKER_CLOSED:
+                return True
+            if self._state == BREAKER_HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = BREAKER_CLOSED
+            self._probe_in_flight = False
+            self._failures = 0
+
+    def record_failure(self, error: BaseException) -> None:
+        with self._lock:
+            self._failures += 1
+            self._last_error = repr(error)
+            if self._state == BREAKER_HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != BREAKER_OPEN:
+                    self._trips += 1
+                self._state = BREAKER_OPEN
+                self._opened_at = self.clock.now()
+                self._probe_in_flight = False
+
+    def release(self) -> None:
+        """결과 없이 끝난 호출(소비자가 첫 토큰 전에 닫음): 시험 호출 자리만 돌려준다"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def stats(self) -> BreakerStats:
+        retry_after = self.retry_after()
+        with self._lock:
+            self._refresh()
+            return BreakerStats(
+                state=self._state,
+                consecutive_failures=self._failures,
+                trips=self._trips,
+                rejected=self._rejected,
+                retry_after_s=round(retry_after, 2),
+                last_error=self._last_error,
+            )
+
+
+# ======================
+# Guard
+# ======================
+@dataclass
+class GuardStats:
+    calls: int = 0
+    attempts: int = 0
+    retries: int = 0
+    retries_skipped: int = 0  # 남은 시간이 모자라 포기한 재시도
+    deadline_misses: int = 0  # 시작도 못 하고 마감이 지난 호출
+    expected_call_s: float = 0.0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class CoachGuard:
+    """
+    코치 스트림 호출을 감싸는 복원력 계층.
+
+    - 시도마다 남은 시간(deadline)만큼만 기다리도록 open_stream에 timeout을 넘긴다
+    - 첫 토큰 전에 실패하면, 백오프 + 예상 호출 시간이 남은 시간 안에 들어올 때만 재시도
+    - 실패는 CircuitBreaker에 기록 -> 연속 실패 시 한동안 호출 자체를 막는다 (CircuitOpenError)
+    - 첫 토큰 이후의 실패는 재시도하지 않고 그대로 던진다
+    """
+
+    def __init__(
+        self,
+        cfg: ResilienceConfig = ResilienceConfig(),
+        breaker: Optional[CircuitBreaker] = None,
+        clock: Clock = SYSTEM_CLOCK,
+    ):
+        self.cfg = cfg
+        self.clock = clock
+        self.breaker = breaker or CircuitBreaker(cfg.failure_threshold, cfg.open_sec, clock)
+
+        self._lock = threading.Lock()
+        self._stats = GuardStats(expected_call_s=cfg.expected_call_sec)
+
+    def _count(self, **inc: int) -> None:
+        with self._lock:
+            for k, v in inc.items():
+                setattr(self._stats, k, getattr(self._stats, k) + v)
+
+    def _observe_call(self, sec: float) -> None:
+        with self._lock:
+            a = self.cfg.call_ewma_alpha
+            self._stats.expected_call_s = (1.0 - a) * self._stats.expected_call_s + a * sec
+
+    def stats(self) -> GuardStats:
+        with self._lock:
+            return GuardStats(**asdict(self._stats))
+
+    def stream(self, open_stream: OpenStream, deadline: Optional[Deadline] = None) -> Iterator[str]:
+        cfg = self.cfg
+        deadline = deadline or Deadline.never(self.clock)
+        self._count(calls=1)
+
+        attempt = 0
+        backoff = cfg.backoff_sec
+        while True:
+            if deadline.expired:
+                self._count(deadline_misses=1)
+                raise DeadlineExceeded("남은 시간이 없어 코치 호출을 건너뜀")
+            if not self.breaker.allow():
+                raise CircuitOpenError(
+                    f"회로 차단 중 ({self.breaker.retry_after():.1f}s 후 재시도)"
+                )
+
+            attempt += 1
+            self._count(attempts=1)
+            timeout = min(cfg.attempt_timeout_sec, deadline.remaining())
+            t0 = self.clock.now()
+            it = None
+            started = False  # 첫 토큰을 받았는지
+            settled = False  # 이번 시도의 성공/실패를 breaker에 기록했는지
+            failed = False
+            try:
+                it = iter(open_stream(timeout))
+                for delta in it:
+                    if not started:
+                        started = settled = True
+                        self.breaker.record_success()
+                    yield delta
+                if not settled:
+                    settled = True
+                    self.breaker.record_success()
+                return
+            except Exception as e:
+                failed = settled = True
+                self.breaker.record_failure(e)
+                if started or attempt >= cfg.max_attempts or self.breaker.is_open:
+                    raise
+
+                wait = min(backoff, cfg.max_backoff_sec)
+                if deadline.remaining() < wait + self.stats().expected_call_s:
+                    self._count(retries_skipped=1)
+                    raise
+            finally:
+                if not settled:
+                    # 첫 토큰 전에 소비자가 닫음 -> 결과 없음
+                    self.breaker.release()
+                elif not failed:
+                    # 끝까지 받았거나 소비자가 일찍 닫음(추천 완성) -> 호출 1번으로 관측
+                    self._observe_call(self.clock.now() - t0)
+                close = getattr(it, "close", None)
+                if close is not None:
+                    close()
+
+            self._count(retries=1)
+            self.clock.sleep(wait)
+            backoff *= 2.0
+
+
+def format_guard_stats(label: str, guard: CoachGuard) -> str:
+    g = guard.stats()
+    b = guard.breaker.stats()
+    return (
+        f"[BREAKER] {label} state={b.state} fails={b.consecutive_failures} trips={b.trips} rejected={b.rejected}"
+        f" | calls={g.calls} attempts={g.attempts} retries={g.retries} skipped={g.retries_skipped}"
+        f" deadline_miss={g.deadline_misses} est_call={g.expected_call_s:.1f}s"
+    )
@@ -0,0 +1,223 @@
+# core/hedged_stream.py
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# (이름, 스트림을 여는 함수). 함수는 레이서 스레드에서 호출된다.
+Racer = Tuple[str, Callable[[], Iterable[str]]]
+
+
+def _non_blank(text: str) -> bool:
+    return bool(text.strip())
+
+
+# ======================
+# Stats
+# ======================
+@dataclass
+class RacerStats:
+    name: str
+    launched_at: Optional[float] = None  # 레이스 시작 기준 초
+    ttft_s: Optional[float] = None  # 레이스 시작 -> 첫 델타
+    usable_s: Optional[float] = None  # 레이스 시작 -> 쓸 만한 출력
+    error: Optional[str] = None
+    won: bool = False
+    cancelled: bool = False
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+# ======================
+# Hedged stream
+# ======================
+class HedgedStream:
+    """
+    같은 요청을 여러 모델(레이서)에 보내서 먼저 '쓸 만한' 출력을 낸 쪽 스트림만 흘려보낸다.
+
+    - hedge_after_sec == 0: 모든 레이서를 동시에 출발
+    - hedge_after_sec > 0: 앞 레이서가 그 시간 안에 쓸 만한 출력을 못 내면 다음 레이서 출발 (hedging)
+      앞 레이서들이 모두 실패하면 기다리지 않고 바로 다음 레이서 출발
+    - 승자가 정해지면 나머지는 취소: 레이서 스레드가 다음 델타에서 멈추고 자기 스트림을 닫는다
+      (첫 응답을 기다리며 막혀 있는 요청은 그 응답이 올 때 닫힌다)
+    - 아무도 쓸 만한 출력을 못 내고 다 끝나면, 가장 먼저 정상 종료한 레이서의 출력을 그대로 흘려보낸다
+      (is_usable이 놓친 형식이라도 빈 응답보다는 낫다)
+    - 모든 레이서가 실패하면 마지막 예외를 다시 던진다
+
+    on_decided: 승자가 정해질 때 1번 호출 (로그용)
+    """
+
+    def __init__(
+        self,
+        racers: Sequence[Racer],
+        hedge_after_sec: float = 0.0,
+        is_usable: Callable[[str], bool] = _non_blank,
+        on_decided: Optional[Callable[["HedgedStream"], None]] = None,
+    ):
+        if not racers:
+            raise ValueError("레이서가 최소 1개 필요")
+        self.racers = list(racers)
+        self.hedge_after_sec = hedge_after_sec
+        self.is_usable = is_usable
+        self.on_decided = on_decided
+
+        self.stats: List[RacerStats] = [RacerStats(name) for name, _ in self.racers]
+        self.winner: Optional[str] = None
+
+        self._events: "queue.Queue[Tuple[int, str, object]]" = queue.Queue()
+        self._cancel = [threading.Event() for _ in self.racers]
+        self._finished = set()  # 끝났거나 실패한 레이서
+
+    @property
+    def hedged(self) -> bool:
+        """2번째 이후 레이서가 실제로 출발했는지"""
+        return any(s.launched_at is not None for s in self.stats[1:])
+
+    def _cancel_racer(self, idx: int) -> None:
+        if self._cancel[idx].is_set():
+            return
+        self._cancel[idx].set()
+        stats = self.stats[idx]
+        if not stats.won and stats.launched_at is not None and idx not in self._finished:
+            stats.cancelled = True
+
+    def cancel(self) -> None:
+        """모든 레이서 중단 (소비자가 일찍 닫으면 승자 스트림도 닫는다)"""
+        for idx in range(len(self.racers)):
+            self._cancel_racer(idx)
+
+    # ----------------------
+    # Racer thread
+    # ----------------------
+    def _pump(self, idx: int) -> None:
+        _, open_stream = self.racers[idx]
+        cancel = self._cancel[idx]
+        it = None
+        try:
+            it = iter(open_stream())
+            for delta in it:
+                if cancel.is_set():
+                    break
+                self._events.put((idx, "delta", delta))
+        except Exception as e:
+            self._events.put((idx, "error", e))
+            return
+        finally:
+            close = getattr(it, "close", None)
+            if close is not None:
+                close()
+        self._events.put((idx, "done", None))
+
+    def _launch(self, idx: int, t0: float) -> None:
+        self.stats[idx].launched_at = round(time.perf_counter() - t0, 4)
+        threading.Thread(
+            target=self._pump, args=(idx,), name=f"race-{self.racers[idx][0]}", daemon=True
+        ).start()
+
+    # ----------------------
+    # Iterate
+    # ----------------------
+    def __iter__(self) -> Iterator[str]:
+        t0 = time.perf_counter()
+        n = len(self.racers)
+        buffers: List[List[str]] = [[] for _ in range(n)]
+        texts = [""] * n
+        running = set()
+        launched = 0
+        last_error: Optional[BaseException] = None
+        first_done: Optional[int] = (
+            None  # 가장 먼저 정상 종료한 레이서 (쓸 만한 출력이 없을 때 fallback)
+        )
+
+        def launch_next() -> None:
+            nonlocal launched
+            self._launch(launched, t0)
+            running.add(launched)
+            launched += 1
+
+        try:
+            launch_next()
+            while self.hedge_after_sec <= 0 and launched < n:
+                launch_next()
+
+            # 1) 승자 결정
+            winner = None
+            while winner is None:
+                if not running:
+                    if launched >= n:
+                        if first_done is not None:
+                            winner = first_done
+                            break
+                        if last_error is not None:
+                            raise last_error
+                        return
+                    launch_next()
+                    continue
+
+                timeout = None
+                if launched < n:
+                    timeout = max(0.0, t0 + self.hedge_after_sec * launched - time.perf_counter())
+                try:
+                    idx, kind, payload = self._events.get(timeout=timeout)
+                except queue.Empty:
+                    launch_next()
+                    continue
+
+                now = round(time.perf_counter() - t0, 4)
+                stats = self.stats[idx]
+                if kind == "delta":
+                    if stats.ttft_s is None:
+                        stats.ttft_s = now
+                    buffers[idx].append(payload)
+                    texts[idx] += payload
+                    if self.is_usable(texts[idx]):
+                        stats.usable_s = now
+                        winner = idx
+                else:
+                    running.discard(idx)
+                    self._finished.add(idx)
+                    if kind == "error":
+                        stats.error = repr(payload)
+                        last_error = payload
+                    elif first_done is None:
+                        first_done = idx
+
+            stats = self.stats[winner]
+            stats.won = True
+            self.winner = stats.name
+            for idx in range(n):
+                if idx != winner:
+                    self._cancel_racer(idx)
+            if self.on_decided is not None:
+                self.on_decided(self)
+
+            # 2) 승자 스트림 흘려보내기 (다른 레이서 이벤트는 버림)
+            yield from buffers[winner]
+            if winner in self._finished:
+                return  # fallback: 이미 끝난 스트림
+            while True:
+                idx, kind, payload = self._events.get()
+                if idx != winner:
+                    continue
+                if kind == "delta":
+                    yield payload
+                elif kind == "error":
+                    stats.error = repr(payload)
+                    raise payload
+                else:
+                    return
+        finally:
+            self.cancel()
+
+    def summary(self) -> str:
+        parts = []
+        for s in self.stats:
+            if s.launched_at is None:
+                continue
+            tag = "🏁" if s.won else ("✂" if s.cancelled else "❌" if s.error else "-")
+            parts.append(f"{tag} {s.name} ttft={s.ttft_s}s")
+        return f"hedged={self.hedged} | " + " | ".join(parts)
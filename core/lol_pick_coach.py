@@ -122,12 +122,14 @@ def lol_mid_pick_coach_stream(
     max_output_tokens: int = 500,
     thinking_budget: int = 256,
     api_key_env: str = "GEMINI_API_KEY",
+    timeout_s: Optional[float] = None,
 ) -> Iterator[str]:
     """
     (스트리밍) 밴픽 이미지 1장 -> 미드 픽 3개 추천 텍스트를 chunk 단위로 yield.
 
     - 프롬프트는 함수 내부에 '내장'되어 있음(나중에 분리 가능)
     - 입력은 PIL Image / bytes / 파일경로(str|Path) 지원
+    - timeout_s: 이 요청의 최대 대기(초). None이면 클라이언트 기본값
     """
     # ✅ client 주입되면 그걸 사용, 없으면 기존처럼 싱글턴 생성
     if client is None:
@@ -145,10 +147,16 @@ def lol_mid_pick_coach_stream(
         )
     ]
 
+    # 요청별 timeout (남은 픽 시간에 맞춰 클라이언트 기본 timeout보다 짧게)
+    http_options = None
+    if timeout_s is not None:
+        http_options = types.HttpOptions(timeout=int(timeout_s * 1000))
+
     config = types.GenerateContentConfig(
         temperature=temperature,
         max_output_tokens=max_output_tokens,
         thinking_config=types.ThinkingConfig(thinking_budget=thinking_budget),
+        http_options=http_options,
     )
 
     stream = client.models.generate_content_stream(
@@ -157,10 +165,16 @@ def lol_mid_pick_coach_stream(
         config=config,
     )
 
-    for chunk in stream:
-        t = chunk.text or ""
-        if t:
-            yield t
+    try:
+        for chunk in stream:
+            t = chunk.text or ""
+            if t:
+                yield t
+    finally:
+        # 소비자가 일찍 닫으면(추천 3개 완성 등) 남은 응답 스트림도 닫는다
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
 
 
 def lol_mid_pick_coach_run(
@@ -37,6 +37,24 @@ _PROMPT_LOL_PLAYPLAN = """너는 LoL(리그 오브 레전드) '미드' 전문 
 """
 
 
+# 픽이 다 안 끝났을 때 붙이는 안내 (초안)
+_PROMPT_DRAFT_NOTE = """
+참고: 아직 밴픽 진행 중이다. 10픽 중 {known}픽만 확정됐고 빈 슬롯은 미정이다.
+확정된 픽만으로 플랜을 세우고, 남은 픽에 따라 달라질 부분은 짧게 조건부로 적는다.
+"""
+
+# 최종 픽 확정 후: 이전 답변(초안)을 기준으로 바뀌는 점만
+_PROMPT_LOL_PLAYPLAN_UPDATE = """밴픽이 끝났다. 첨부된 이미지는 최종 픽 화면이다.
+바로 앞의 플레이 플랜은 픽이 다 확정되기 전에 쓴 초안이다.
+
+출력 규칙:
+1) 새로 확정된 픽: <팀> <챔프>, ...
+2) 초안에서 바뀌거나 추가되는 플레이 플랜만 짧게 (초안 내용 반복 금지)
+3) 바뀔 게 없으면 "초안 그대로 유효합니다." 한 줄만
+4) 말투는 존댓말로
+"""
+
+
 # =========================
 # Client 싱글턴
 # =========================
@@ -112,27 +130,95 @@ def lol_playplan_stream(
     max_output_tokens: int = 2000,
     thinking_budget: int = 256,
     api_key_env: str = "GEMINI_API_KEY",
+    timeout_s: Optional[float] = None,
+    picks_known: Optional[int] = None,
 ) -> Iterator[str]:
-
+    """
+    picks_known: 10 미만이면 밴픽 진행 중 초안 (확정된 픽 수를 프롬프트에 알린다)
+    """
     if client is None:
         client = _get_client(api_key_env)
 
-    img_bytes = _to_image_bytes(picked_champs_img, mime_type=mime_type)
+    contents = [_playplan_request(picked_champs_img, mime_type, picks_known)]
+    yield from _stream(
+        client, model, contents, temperature, max_output_tokens, thinking_budget, timeout_s
+    )
+
+
+def lol_playplan_update_stream(
+    picked_champs_img: InputImage,
+    *,
+    draft_img: InputImage,
+    draft_text: str,
+    draft_picks_known: int,
+    client: Optional[genai.Client] = None,
+    model: str = "gemini-2.5-pro",
+    mime_type: str = "image/png",
+    temperature: float = 0.2,
+    max_output_tokens: int = 600,
+    thinking_budget: int = 128,
+    api_key_env: str = "GEMINI_API_KEY",
+    timeout_s: Optional[float] = None,
+) -> Iterator[str]:
+    """
+    (스트리밍) 최종 픽 이미지 -> 초안 대비 바뀌는 플랜만 짧게.
+    초안 요청/답변을 대화 기록으로 넣어서 모델이 이전 답변을 참조하게 한다.
+    """
+    if client is None:
+        client = _get_client(api_key_env)
 
     contents = [
+        _playplan_request(draft_img, mime_type, draft_picks_known),
+        types.Content(role="model", parts=[types.Part.from_text(text=draft_text)]),
         types.Content(
             role="user",
             parts=[
-                types.Part.from_text(text=_PROMPT_LOL_PLAYPLAN),
-                types.Part.from_bytes(data=img_bytes, mime_type=mime_type),
+                types.Part.from_text(text=_PROMPT_LOL_PLAYPLAN_UPDATE),
+                types.Part.from_bytes(
+                    data=_to_image_bytes(picked_champs_img, mime_type=mime_type),
+                    mime_type=mime_type,
+                ),
             ],
-        )
+        ),
     ]
+    yield from _stream(
+        client, model, contents, temperature, max_output_tokens, thinking_budget, timeout_s
+    )
 
+
+def _playplan_request(img: InputImage, mime_type: str, picks_known: Optional[int]) -> types.Content:
+    prompt = _PROMPT_LOL_PLAYPLAN
+    if picks_known is not None and picks_known < 10:
+        prompt += _PROMPT_DRAFT_NOTE.format(known=picks_known)
+
+    return types.Content(
+        role="user",
+        parts=[
+            types.Part.from_text(text=prompt),
+            types.Part.from_bytes(
+                data=_to_image_bytes(img, mime_type=mime_type), mime_type=mime_type
+            ),
+        ],
+    )
+
+
+def _stream(
+    client: genai.Client,
+    model: str,
+    contents: List[types.Content],
+    temperature: float,
+    max_output_tokens: int,
+    thinking_budget: int,
+    timeout_s: Optional[float],
+) -> Iterator[str]:
     config = types.GenerateContentConfig(
         temperature=temperature,
         max_output_tokens=max_output_tokens,
         thinking_config=types.ThinkingConfig(thinking_budget=thinking_budget),
+        # 요청별 timeout (CoachGuard가 정한 시도별 최대 대기)
+        http_options=types.HttpOptions(timeout=int(timeout_s * 1000))
+        if timeout_s is not None
+        else None,
     )
 
     stream = client.models.generate_content_stream(
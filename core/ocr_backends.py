@@ -0,0 +1,391 @@
+# core/ocr_backends.py
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Protocol, Tuple, Union
+
+import cv2
+import numpy as np
+import pytesseract
+from PIL import Image
+
+from config.path import PATHS
+from core.ocr_profiles import OcrProfile, PreparedOcr, preprocess, to_dark_on_light
+
+ImageLike = Union[Image.Image, np.ndarray]
+
+PYTESSERACT_BACKEND = "pytesseract"
+TESSEROCR_BACKEND = "tesserocr"
+TEMPLATE_BACKEND = "template"
+
+
+# ======================
+# Interface
+# ======================
+class OcrBackend(Protocol):
+    """
+    OCR 엔진 1종. 전처리는 프로필 체인(core.ocr_profiles.preprocess)을 백엔드가 직접 적용한다.
+    - read: 텍스트만 (extract_text)
+    - read_with_conf: (텍스트, 평균 confidence 0~100) (extract_text_with_conf, OCR 워커 풀)
+    """
+
+    name: str
+
+    def supports(self, profile: OcrProfile) -> bool: ...
+
+    def read(self, img: ImageLike, prepared: PreparedOcr) -> str: ...
+
+    def read_with_conf(self, img: ImageLike, prepared: PreparedOcr) -> Tuple[str, float]: ...
+
+
+def _group_words(data: dict, n_slots: int, slot_of) -> List[Tuple[str, float]]:
+    """
+    image_to_data 결과를 slot별 (텍스트, 평균 conf)로 묶는다.
+    텍스트는 (block, par, line) 단위로 줄바꿈 (image_to_string과 같은 줄 구성).
+    """
+    lines: List[Dict[Tuple[int, int, int], List[str]]] = [{} for _ in range(n_slots)]
+    confs: List[List[float]] = [[] for _ in range(n_slots)]
+
+    for i, word in enumerate(data["text"]):
+        word = (word or "").strip()
+        if not word:
+            continue
+
+        slot = slot_of(i)
+        key = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+        lines[slot].setdefault(key, []).append(word)
+        confs[slot].append(float(data["conf"][i]))
+
+    out = []
+    for slot_lines, slot_confs in zip(lines, confs):
+        text = "\n".join(" ".join(ws) for ws in slot_lines.values()).strip()
+        conf = float(np.mean(slot_confs)) if slot_confs else 0.0
+        out.append((text, conf))
+    return out
+
+
+# ======================
+# pytesseract (CLI)
+# ======================
+class TesseractCliBackend:
+    """
+    기존 경로: pytesseract가 호출마다 tesseract 프로세스를 띄운다.
+    호출마다 프로세스 기동 비용이 든다 (많이 읽는 ROI는 tesserocr 백엔드가 싸다).
+    """
+
+    name = PYTESSERACT_BACKEND
+
+    def supports(self, profile: OcrProfile) -> bool:
+        return True
+
+    def read(self, img: ImageLike, prepared: PreparedOcr) -> str:
+        processed = preprocess(img, prepared.profile)
+        return pytesseract.image_to_string(
+            processed, lang=prepared.lang, config=prepared.config
+        ).strip()
+
+    def read_with_conf(self, img: ImageLike, prepared: PreparedOcr) -> Tuple[str, float]:
+        processed = preprocess(img, prepared.profile)
+        data = pytesseract.image_to_data(
+            processed,
+            lang=prepared.lang,
+            config=prepared.config,
+            output_type=pytesseract.Output.DICT,
+        )
+        return _group_words(data, 1, lambda i: 0)[0]
+
+
+# ======================
+# tesserocr (libtesseract, optional)
+# ======================
+class TesserocrBackend:
+    """
+    tesserocr(libtesseract 바인딩)로 프로필마다 TessBaseAPI를 1번만 Init 하고 재사용한다.
+    프로세스 기동/언어 데이터 로드가 호출마다 반복되지 않는다.
+    tesserocr는 선택 의존성: 없으면 생성 시 RuntimeError.
+    """
+
+    name = TESSEROCR_BACKEND
+
+    def __init__(self):
+        try:
+            import tesserocr
+        except ImportError as e:
+            raise RuntimeError("tesserocr가 설치되어 있지 않음 (pip install tesserocr)") from e
+        self._tesserocr = tesserocr
+        self._apis: Dict[OcrProfile, object] = {}
+        self._locks: Dict[OcrProfile, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def supports(self, profile: OcrProfile) -> bool:
+        return True
+
+    def _api(self, prepared: PreparedOcr):
+        p = prepared.profile
+        with self._guard:
+            api = self._apis.get(p)
+            if api is None:
+                variables = {}
+                if p.whitelist:
+                    variables["tessedit_char_whitelist"] = p.whitelist
+                if prepared.user_words_path:
+                    variables["user_words_file"] = prepared.user_words_path
+
+                kwargs = {"lang": p.lang, "psm": p.psm, "variables": variables}
+                if p.oem >= 0:
+                    kwargs["oem"] = p.oem
+                api = self._tesserocr.PyTessBaseAPI(**kwargs)
+                self._apis[p] = api
+                self._locks[p] = threading.Lock()
+            return api, self._locks[p]
+
+    def _recognize(
+        self, img: ImageLike, prepared: PreparedOcr, with_conf: bool
+    ) -> Tuple[str, float]:
+        processed = preprocess(img, prepared.profile)
+        api, lock = self._api(prepared)
+        # TessBaseAPI 1개는 스레드 안전하지 않다
+        with lock:
+            api.SetImage(Image.fromarray(processed))
+            text = api.GetUTF8Text().strip()
+            conf = float(api.MeanTextConf()) if with_conf else 0.0
+        return text, conf
+
+    def read(self, img: ImageLike, prepared: PreparedOcr) -> str:
+        return self._recognize(img, prepared, with_conf=False)[0]
+
+    def read_with_conf(self, img: ImageLike, prepared: PreparedOcr) -> Tuple[str, float]:
+        return self._recognize(img, prepared, with_conf=True)
+
+    def close(self) -> None:
+        with self._guard:
+            for api in self._apis.values():
+                api.End()
+            self._apis.clear()
+            self._locks.clear()
+
+
+# ======================
+# Template matcher
+# ======================
+# 글리프 정규화 크기 (H, W)
+GLYPH_SIZE = (32, 20)
+
+DEFAULT_TEMPLATE_PATH = PATHS.OCR_TEMPLATE_DIR / "timer_digits.npz"
+
+# 템플릿 매칭용 이진화: 프로필 배율로 확대 후 Otsu (글자가 채워진 모양).
+# tesseract용 적응형 이진화는 획 윤곽만 남기고 붙은 글자의 윤곽이 이어져서 분할에 맞지 않는다.
+TEMPLATE_PREPROCESS = ("gray", "scale", "blur3", "otsu")
+
+
+def binarize_for_templates(img: ImageLike, profile: OcrProfile) -> np.ndarray:
+    return preprocess(img, replace(profile, preprocess=TEMPLATE_PREPROCESS))
+
+
+def _glyph(mask: np.ndarray) -> np.ndarray:
+    """글자 bbox 마스크(bool) -> GLYPH_SIZE float32 (0~1)"""
+    h, w = GLYPH_SIZE
+    return cv2.resize(mask.astype(np.float32), (w, h), interpolation=cv2.INTER_AREA)
+
+
+def segment_glyphs(binary: np.ndarray, min_height_ratio: float = 0.35) -> List[np.ndarray]:
+    """
+    이진 이미지 -> 왼쪽부터 글자 글리프 목록.
+    - 다른 글자 bbox 안에 들어가는 연결 요소(0/8의 안쪽 윤곽 등)는 그 글자에 포함
+    - 가장 큰 글자 높이의 min_height_ratio 미만인 것(노이즈/점)은 버린다
+    """
+    fg = (to_dark_on_light(binary) == 0).astype(np.uint8)
+    n, _, stats, _ = cv2.connectedComponentsWithStats(fg, connectivity=8)
+    if n <= 1:
+        return []
+
+    boxes = sorted(
+        (tuple(stats[i, :4]) for i in range(1, n)), key=lambda b: b[2] * b[3], reverse=True
+    )
+    max_h = max(b[3] for b in boxes)
+
+    kept: List[Tuple[int, int, int, int]] = []
+    for x, y, w, h in boxes:
+        if h < max_h * min_height_ratio:
+            continue
+        if any(
+            kx <= x and ky <= y and x + w <= kx + kw and y + h <= ky + kh for kx, ky, kw, kh in kept
+        ):
+            continue
+        kept.append((x, y, w, h))
+
+    kept.sort(key=lambda b: b[0])
+    return [_glyph(fg[y : y + h, x : x + w] > 0) for x, y, w, h in kept]
+
+
+def render_text(text: str, font: int = cv2.FONT_HERSHEY_SIMPLEX, height: int = 30) -> np.ndarray:
+    """어두운 배경 위 밝은 글자 (게임 타이머와 같은 극성) RGB 이미지."""
+    scale = height / 38.0
+    (tw, th), base = cv2.getTextSize(text, font, scale, 2)
+    arr = np.full((height, tw + 16, 3), (20, 25, 30), dtype=np.uint8)
+    cv2.putText(arr, text, (8, (height + th) // 2), font, scale, (230, 220, 200), 2, cv2.LINE_AA)
+    return arr
+
+
+@dataclass(frozen=True)
+class GlyphTemplates:
+    chars: Tuple[str, ...]
+    glyphs: np.ndarray  # (N, GH, GW) float32
+
+    @classmethod
+    def render(cls, profile: OcrProfile) -> "GlyphTemplates":
+        """
+        학습 템플릿이 없을 때 쓰는 기본 템플릿.
+        whitelist 글자를 OpenCV Hershey 글꼴 2종으로 그려 쓴다.
+        """
+        pairs = [
+            (render_text(ch, font), ch)
+            for font in (cv2.FONT_HERSHEY_SIMPLEX, cv2.FONT_HERSHEY_DUPLEX)
+            for ch in profile.whitelist
+        ]
+        return cls.fit(pairs, profile, average=False)
+
+    @classmethod
+    def fit(
+        cls, samples: Iterable[Tuple[ImageLike, str]], profile: OcrProfile, average: bool = True
+    ) -> "GlyphTemplates":
+        """
+        (ROI 이미지, 정답 텍스트) 샘플 -> 템플릿 (binarize_for_templates로 분할).
+        average=True면 글자별 평균 글리프 1개, False면 샘플 글리프를 그대로 모두 쓴다.
+        분할된 글리프 수가 텍스트 길이와 다른 샘플은 건너뛴다.
+        """
+        by_char: Dict[str, List[np.ndarray]] = {}
+        for img, text in samples:
+            text = "".join(text.split())
+            glyphs = segment_glyphs(binarize_for_templates(img, profile))
+            if not text or len(glyphs) != len(text):
+                continue
+            for ch, g in zip(text, glyphs):
+                by_char.setdefault(ch, []).append(g)
+
+        if not by_char:
+            raise ValueError("템플릿을 만들 수 있는 샘플이 없음")
+
+        chars, glyphs = [], []
+        for ch in sorted(by_char):
+            group = [np.mean(by_char[ch], axis=0)] if average else by_char[ch]
+            chars.extend(ch for _ in group)
+            glyphs.extend(group)
+        return cls(tuple(chars), np.stack(glyphs).astype(np.float32))
+
+    def restrict(self, whitelist: str) -> "GlyphTemplates":
+        keep = [i for i, ch in enumerate(self.chars) if ch in whitelist]
+        return GlyphTemplates(tuple(self.chars[i] for i in keep), self.glyphs[keep])
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(path, chars=np.array(self.chars), glyphs=self.glyphs)
+
+    @classmethod
+    def load(cls, path: Path) -> "GlyphTemplates":
+        with np.load(Path(path)) as data:
+            return cls(tuple(str(c) for c in data["chars"]), data["glyphs"].astype(np.float32))
+
+
+def _zero_mean_unit(vectors: np.ndarray) -> np.ndarray:
+    flat = vectors.reshape(len(vectors), -1)
+    flat = flat - flat.mean(axis=1, keepdims=True)
+    norm = np.linalg.norm(flat, axis=1, keepdims=True)
+    return flat / np.maximum(norm, 1e-6)
+
+
+class TemplateMatchBackend:
+    """
+    whitelist가 있는 프로필(타이머 숫자 등) 전용 템플릿 매처.
+    확대 + Otsu 이진화 -> 연결 요소로 글자 분할 -> 템플릿과 정규화 상관계수로 글자별 최댓값 선택.
+    tesseract를 전혀 부르지 않으므로 숫자 1~2자리에는 가장 싸다.
+    """
+
+    name = TEMPLATE_BACKEND
+
+    def __init__(self, templates: Optional[GlyphTemplates] = None, min_score: float = 0.4):
+        # templates가 없으면 학습 템플릿 파일, 그것도 없으면 프로필별로 그린 기본 템플릿
+        if templates is None and DEFAULT_TEMPLATE_PATH.exists():
+            templates = GlyphTemplates.load(DEFAULT_TEMPLATE_PATH)
+        self.templates = templates
+        self.min_score = min_score
+        self._banks: Dict[OcrProfile, Tuple[Tuple[str, ...], np.ndarray]] = {}
+
+    def supports(self, profile: OcrProfile) -> bool:
+        if not profile.whitelist:
+            return False
+        return self.templates is None or any(ch in profile.whitelist for ch in self.templates.chars)
+
+    def _bank(self, profile: OcrProfile) -> Tuple[Tuple[str, ...], np.ndarray]:
+        bank = self._banks.get(profile)
+        if bank is None:
+            t = GlyphTemplates.render(profile) if self.templates is None else self.templates
+            t = t.restrict(profile.whitelist)
+            bank = (t.chars, _zero_mean_unit(t.glyphs))
+            self._banks[profile] = bank
+        return bank
+
+    def read_with_conf(self, img: ImageLike, prepared: PreparedOcr) -> Tuple[str, float]:
+        p = prepared.profile
+        if not self.supports(p):
+            raise ValueError(f"템플릿 매칭은 whitelist 프로필만 지원: {p.name}")
+
+        glyphs = segment_glyphs(binarize_for_templates(img, p))
+        if not glyphs:
+            return "", 0.0
+
+        chars, bank = self._bank(p)
+        scores = _zero_mean_unit(np.stack(glyphs)) @ bank.T  # (글리프 수, 템플릿 수)
+        best = scores.argmax(axis=1)
+
+        text, kept = [], []
+        for i, j in enumerate(best):
+            if scores[i, j] >= self.min_score:
+                text.append(chars[j])
+                kept.append(float(scores[i, j]))
+        return "".join(text), (float(np.mean(kept)) * 100.0 if kept else 0.0)
+
+    def read(self, img: ImageLike, prepared: PreparedOcr) -> str:
+        return self.read_with_conf(img, prepared)[0]
+
+
+# ======================
+# Registry
+# ======================
+OCR_BACKENDS: Dict[str, Callable[[], OcrBackend]] = {
+    PYTESSERACT_BACKEND: TesseractCliBackend,
+    TESSEROCR_BACKEND: TesserocrBackend,
+    TEMPLATE_BACKEND: TemplateMatchBackend,
+}
+
+
+def register_backend(name: str, factory: Callable[[], OcrBackend]) -> None:
+    """백엔드 추가/교체 (예: 학습한 템플릿으로 만든 TemplateMatchBackend)."""
+    OCR_BACKENDS[name] = factory
+    get_backend.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def get_backend(name: str) -> OcrBackend:
+    """이름 -> 백엔드 인스턴스 (프로세스당 1번만 생성)."""
+    try:
+        factory = OCR_BACKENDS[name]
+    except KeyError:
+        raise KeyError(f"알 수 없는 OCR 백엔드: {name}") from None
+    return factory()
+
+
+def available_backends() -> List[str]:
+    """이 환경에서 생성 가능한 백엔드 이름들 (선택 의존성이 없는 것은 제외)."""
+    names = []
+    for name in OCR_BACKENDS:
+        try:
+            get_backend(name)
+        except RuntimeError:
+            continue
+        names.append(name)
+    return names
@@ -1,32 +1,53 @@
 # core/ocr_engine.py
+from typing import List, Sequence, Tuple, Union
 
-import cv2
 import numpy as np
-import pytesseract
 from PIL import Image
 
+from core.ocr_backends import get_backend
+from core.ocr_profiles import STATUS_PROFILE, OcrProfile, prepare, preprocess
 
-def preprocess_for_ocr(pil_img: Image.Image):
-    """
-    OCR 정확도 향상을 위한 전처리
-    """
-    img = np.array(pil_img)
+ProfileArg = Union[str, OcrProfile]
 
-    # RGB → GRAY
-    gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
 
-    # 노이즈 제거
-    gray = cv2.GaussianBlur(gray, (5, 5), 0)
+def preprocess_for_ocr(
+    pil_img: Union[Image.Image, np.ndarray], profile: ProfileArg = STATUS_PROFILE
+):
+    """
+    OCR 정확도 향상을 위한 전처리 (프로필의 전처리 체인)
+    기본(status): GRAY -> 5x5 블러 -> Otsu 이진화
+    """
+    return preprocess(pil_img, profile)
 
-    # 이진화
-    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
 
-    return binary
+def extract_text(pil_img: Image.Image, profile: ProfileArg = STATUS_PROFILE) -> str:
+    """
+    profile: core/ocr_profiles.py의 프로필 이름 (기본 status = 배너 문장)
+    OCR 엔진은 프로필의 backend (core/ocr_backends.py 레지스트리)
+    """
+    prepared = prepare(profile)
+    return get_backend(prepared.profile.backend).read(pil_img, prepared)
 
 
-def extract_text(pil_img: Image.Image) -> str:
-    processed = preprocess_for_ocr(pil_img)
+def extract_text_batch(
+    pil_imgs: Sequence[Image.Image], profile: ProfileArg = STATUS_PROFILE
+) -> List[str]:
+    """
+    같은 프로필의 ROI 이미지 여러 장 -> 텍스트들 (OcrMicroBatcher의 batch_fn).
+    인라인 extract_text와 똑같은 백엔드 호출(프로필 psm, image_to_string)을 1장씩 한다.
+    서버(마이크로 배치)와 로컬 루프가 같은 프레임에서 다른 OCR 결과(= 다른 판정)를 내면 안 된다.
+    (여러 장을 세로로 쌓아 한 번에 읽으면 psm/단어 묶기가 달라져 결과가 달라진다.
+     tesseract 기동 비용을 줄이려면 프로세스 안에서 엔진을 재사용하는 tesserocr 백엔드를 쓴다)
+    """
+    prepared = prepare(profile)
+    backend = get_backend(prepared.profile.backend)
+    return [backend.read(img, prepared) for img in pil_imgs]
 
-    text = pytesseract.image_to_string(processed, lang="kor", config="--psm 6")
 
-    return text.strip()
+def extract_text_with_conf(img, profile: ProfileArg = STATUS_PROFILE) -> Tuple[str, float]:
+    """
+    extract_text와 같은 전처리/설정으로 읽고 (텍스트, 평균 단어 confidence 0~100)를 반환.
+    img: PIL Image 또는 (H, W, 3) RGB uint8 배열
+    """
+    prepared = prepare(profile)
+    return get_backend(prepared.profile.backend).read_with_conf(img, prepared)
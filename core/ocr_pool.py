@@ -0,0 +1,361 @@
+# core/ocr_pool.py
+from __future__ import annotations
+
+import multiprocessing as mp
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from core.ocr_engine import extract_text
+from core.ocr_profiles import STATUS_PROFILE, set_roi_backends
+
+# ((H, W, 3) RGB 배열, OCR 프로필 이름) -> (텍스트, confidence)
+OcrFn = Callable[[np.ndarray, str], Tuple[str, float]]
+
+
+def extract_text_inline_equivalent(arr: np.ndarray, profile: str) -> Tuple[str, float]:
+    """
+    기본 ocr_fn: 인라인 경로(core.ocr_engine.extract_text, image_to_string)와 같은 텍스트.
+    ocr_workers 설정에 따라 상태 판정이 달라지지 않게 한다. confidence는 읽지 않는다(-1).
+    (confidence가 필요하면 core.ocr_engine.extract_text_with_conf를 주입, 단 image_to_data 단어 묶기라 텍스트가 조금 다를 수 있음)
+    """
+    return extract_text(arr, profile), -1.0
+
+
+# ======================
+# Config / Result
+# ======================
+@dataclass(frozen=True)
+class OcrPoolConfig:
+    workers: int = 2
+
+    # 동시에 처리 중일 수 있는 ROI 수 (= shared memory 슬롯 수)
+    # 슬롯이 다 차면 submit()이 빈 슬롯이 생길 때까지 기다린다
+    slots: int = 8
+
+    # 슬롯 1개가 담을 수 있는 최대 ROI 크기 (H, W, C)
+    # 2560x1440 창의 status ROI(약 1126x115)까지 여유 있게
+    slot_shape: Tuple[int, int, int] = (256, 1280, 3)
+
+    # 결과 대기 최대 시간 (extract_text / DraftSession). 넘으면 TimeoutError
+    # 풀도 이 시간이 지난 요청은 TimeoutError로 끝내고 슬롯을 돌려받는다.
+    # 한 요청을 이 시간 넘게 잡고 있는 워커는 멈춘 것으로 보고 죽인 뒤 다시 띄운다
+    result_timeout_sec: float = 10.0
+
+    # 빈 슬롯 대기 최대 시간. 넘으면 호출 스레드에서 바로 OCR (슬롯이 다 막혀도 루프가 멈추지 않게)
+    slot_wait_sec: float = 2.0
+
+    # 워커 생존 확인 주기: 죽은 워커가 잡고 있던 요청은 실패 처리하고 워커를 다시 띄운다
+    liveness_interval_sec: float = 0.5
+
+    # ROI별 OCR 백엔드 덮어쓰기 ((ROI 이름, 백엔드 이름), ...). 워커 프로세스 시작 시 set_roi_backends()로 적용
+    roi_backends: Tuple[Tuple[str, str], ...] = ()
+
+
+@dataclass(frozen=True)
+class OcrResult:
+    text: str
+    conf: float  # -1이면 읽지 않음
+
+
+# ======================
+# Worker process
+# ======================
+def _worker_main(
+    shm_name: str,
+    slab_shape: Tuple[int, ...],
+    tasks: "mp.Queue",
+    results: "mp.Queue",
+    ocr_fn: OcrFn,
+    busy,
+    busy_since,
+    index: int,
+    roi_backends: Tuple[Tuple[str, str], ...] = (),
+) -> None:
+    # spawn 방식이면 부모의 프로필 레지스트리를 물려받지 않는다
+    set_roi_backends(dict(roi_backends))
+    shm = SharedMemory(name=shm_name)
+    slab = np.ndarray(slab_shape, dtype=np.uint8, buffer=shm.buf)
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+
+            slot, seq, h, w, profile = task
+            # 이 워커가 죽거나 멈추면 부모가 이 요청을 실패 처리한다
+            busy_since[index] = time.time()
+            busy[index] = seq
+            try:
+                # 슬롯 안의 ROI는 행 stride가 슬롯 폭 기준이라 연속 배열로 한 번 복사
+                text, conf = ocr_fn(np.ascontiguousarray(slab[slot, :h, :w]), profile)
+                results.put((slot, seq, text, conf, None))
+            except Exception as e:
+                results.put((slot, seq, "", 0.0, repr(e)))
+            busy[index] = -1
+    finally:
+        del slab
+        shm.close()
+
+
+# ======================
+# Pool
+# ======================
+class OcrWorkerPool:
+    """
+    tesseract OCR을 별도 프로세스들에서 돌리는 풀.
+
+    - ROI 픽셀은 shared memory 슬랩의 슬롯에 직접 써서 넘긴다 (이미지 pickling 없음)
+    - 큐로는 (slot, h, w, profile)만 오가고, 워커는 slot 번호로 (text, conf)를 돌려준다
+    - 슬롯 수만큼만 동시에 in-flight (bounded window)
+    - 결과 수집 스레드가 워커 생존도 확인: 죽은 워커의 요청은 RuntimeError로 끝내고 워커를 다시 띄운다
+    - result_timeout_sec이 지난 요청은 TimeoutError로 끝내고 슬롯을 돌려받는다.
+      그 시간 넘게 한 요청에 붙잡힌 워커(살아 있지만 멈춤)는 죽이고 다시 띄운다
+    - 빈 슬롯을 slot_wait_sec 안에 못 얻으면 호출 스레드에서 바로 OCR
+
+    ocr_fn은 워커 프로세스에서 호출되므로 top-level 함수여야 한다.
+    """
+
+    def __init__(
+        self, cfg: OcrPoolConfig = OcrPoolConfig(), ocr_fn: OcrFn = extract_text_inline_equivalent
+    ):
+        self.cfg = cfg
+        self.ocr_fn = ocr_fn
+
+        self._slab_shape = (cfg.slots,) + tuple(cfg.slot_shape)
+        self._shm: Optional[SharedMemory] = None
+        self._slab: Optional[np.ndarray] = None
+
+        self._ctx = mp.get_context()
+        self._tasks = None
+        self._results = None
+        self._procs: list = []
+        self._busy = None  # 워커별 처리 중 요청 번호 (-1 = 대기)
+        self._busy_since = None  # 워커별 처리 시작 시각 (time.time)
+        self._collector: Optional[threading.Thread] = None
+        self._closing = False
+
+        self._free: "queue.Queue[int]" = queue.Queue()
+        # slot -> (요청 번호, Future, 요청 시각). 요청 번호로 죽은 워커/시간 초과 요청의 늦은 결과를 거른다
+        self._pending: Dict[int, Tuple[int, Future, float]] = {}
+        self._seq = 0
+        self._lock = threading.Lock()
+
+        # 죽어서 다시 띄운 워커 수
+        self.worker_restarts = 0
+
+        # 슬롯보다 큰 ROI는 호출 스레드에서 바로 처리
+        self.oversize = 0
+
+        # 빈 슬롯을 못 얻어 호출 스레드에서 처리한 요청 수 / 시간 초과로 끝낸 요청 수
+        self.slot_timeouts = 0
+        self.result_timeouts = 0
+
+    # ----------------------
+    # Lifecycle
+    # ----------------------
+    def start(self) -> "OcrWorkerPool":
+        if self._shm is not None:
+            return self
+
+        self._shm = SharedMemory(create=True, size=int(np.prod(self._slab_shape)))
+        self._slab = np.ndarray(self._slab_shape, dtype=np.uint8, buffer=self._shm.buf)
+        for slot in range(self.cfg.slots):
+            self._free.put(slot)
+
+        self._tasks = self._ctx.Queue()
+        self._results = self._ctx.Queue()
+        self._busy = self._ctx.Array("i", [-1] * self.cfg.workers, lock=False)
+        self._busy_since = self._ctx.Array("d", [0.0] * self.cfg.workers, lock=False)
+        self._closing = False
+        self._procs = [self._spawn(i) for i in range(self.cfg.workers)]
+
+        self._collector = threading.Thread(
+            target=self._collect, name="ocr-pool-results", daemon=True
+        )
+        self._collector.start()
+        return self
+
+    def _spawn(self, index: int):
+        p = self._ctx.Process(
+            target=_worker_main,
+            args=(
+                self._shm.name,
+                self._slab_shape,
+                self._tasks,
+                self._results,
+                self.ocr_fn,
+                self._busy,
+                self._busy_since,
+                index,
+                self.cfg.roi_backends,
+            ),
+            daemon=True,
+        )
+        p.start()
+        return p
+
+    def close(self) -> None:
+        if self._shm is None:
+            return
+
+        self._closing = True
+        for _ in self._procs:
+            self._tasks.put(None)
+        for p in self._procs:
+            p.join(timeout=5)
+            if p.is_alive():
+                p.terminate()
+
+        self._results.put(None)
+        self._collector.join()
+
+        with self._lock:
+            for _, fut, _ in self._pending.values():
+                fut.set_exception(RuntimeError("OCR pool closed"))
+            self._pending.clear()
+
+        self._slab = None
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self) -> "OcrWorkerPool":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ----------------------
+    # Submit / collect
+    # ----------------------
+    def submit(self, img: Image.Image, profile: str = STATUS_PROFILE) -> Future:
+        """
+        ROI 1장 OCR 요청. Future[OcrResult] 반환 (슬롯이 없으면 빈 슬롯까지 대기).
+        profile: core/ocr_profiles.py의 프로필 이름
+        """
+        if self._shm is None:
+            raise RuntimeError("OcrWorkerPool.start()를 먼저 호출하세요")
+
+        arr = np.asarray(img.convert("RGB") if img.mode != "RGB" else img, dtype=np.uint8)
+        h, w = arr.shape[:2]
+        max_h, max_w, _ = self.cfg.slot_shape
+
+        if h > max_h or w > max_w:
+            self.oversize += 1
+            return self._run_inline(arr, profile)
+
+        try:
+            slot = self._free.get(timeout=self.cfg.slot_wait_sec)
+        except queue.Empty:
+            self.slot_timeouts += 1
+            return self._run_inline(arr, profile)
+
+        fut: Future = Future()
+        self._slab[slot, :h, :w] = arr
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+            self._pending[slot] = (seq, fut, time.monotonic())
+        self._tasks.put((slot, seq, h, w, profile))
+        return fut
+
+    def _run_inline(self, arr: np.ndarray, profile: str) -> Future:
+        fut: Future = Future()
+        try:
+            text, conf = self.ocr_fn(arr, profile)
+            fut.set_result(OcrResult(text=text, conf=conf))
+        except Exception as e:
+            fut.set_exception(e)
+        return fut
+
+    def extract_text(
+        self, img: Image.Image, profile: str = STATUS_PROFILE, timeout: Optional[float] = None
+    ) -> str:
+        """core.ocr_engine.extract_text 대체용 (블로킹, 기본 cfg.result_timeout_sec까지만 대기)."""
+        if timeout is None:
+            timeout = self.cfg.result_timeout_sec
+        return self.submit(img, profile).result(timeout=timeout).text
+
+    def _collect(self) -> None:
+        last_check = time.monotonic()
+        while True:
+            try:
+                item = self._results.get(timeout=self.cfg.liveness_interval_sec)
+            except queue.Empty:
+                item = ()
+
+            if item is None:
+                return
+            if item:
+                self._resolve(*item)
+
+            if time.monotonic() - last_check >= self.cfg.liveness_interval_sec:
+                last_check = time.monotonic()
+                self._check_workers()
+                self._expire_pending()
+
+    def _resolve(self, slot: int, seq: int, text: str, conf: float, err: Optional[str]) -> None:
+        with self._lock:
+            entry = self._pending.get(slot)
+            if entry is None or entry[0] != seq:
+                return  # 이미 실패 처리된 요청의 늦은 결과
+            del self._pending[slot]
+        self._free.put(slot)
+
+        fut = entry[1]
+        if err is not None:
+            fut.set_exception(RuntimeError(f"OCR worker error: {err}"))
+        else:
+            fut.set_result(OcrResult(text=text, conf=conf))
+
+    def _fail(self, seq: int, exc: BaseException) -> bool:
+        """요청 번호 seq가 아직 대기 중이면 exc로 끝내고 슬롯을 돌려받는다"""
+        with self._lock:
+            slot = next((k for k, (s, _, _) in self._pending.items() if s == seq), None)
+            entry = self._pending.pop(slot, None) if slot is not None else None
+        if entry is None:
+            return False
+        self._free.put(slot)
+        entry[1].set_exception(exc)
+        return True
+
+    def _check_workers(self) -> None:
+        if self._closing:
+            return
+        timeout = self.cfg.result_timeout_sec
+        for i, p in enumerate(self._procs):
+            seq = self._busy[i]
+            if p.is_alive():
+                if seq < 0 or time.time() - self._busy_since[i] < timeout:
+                    continue
+                # 살아 있지만 한 요청을 timeout 넘게 잡고 있음 -> 멈춘 것으로 보고 교체
+                p.terminate()
+                p.join(timeout=1)
+                exc: BaseException = TimeoutError(f"OCR worker hung > {timeout}s (restarted)")
+            else:
+                exc = RuntimeError(f"OCR worker died (exitcode={p.exitcode})")
+
+            self._busy[i] = -1
+            if seq >= 0:
+                self._fail(seq, exc)
+
+            self._procs[i] = self._spawn(i)
+            self.worker_restarts += 1
+
+    def _expire_pending(self) -> None:
+        """result_timeout_sec이 지난 요청은 끝내고 슬롯을 돌려받는다 (호출 측은 이미 기다리기를 그만뒀다)"""
+        deadline = time.monotonic() - self.cfg.result_timeout_sec
+        with self._lock:
+            expired = [seq for seq, _, t in self._pending.values() if t < deadline]
+        message = f"OCR result timeout ({self.cfg.result_timeout_sec}s)"
+        for seq in expired:
+            if self._fail(seq, TimeoutError(message)):
+                self.result_timeouts += 1
@@ -0,0 +1,218 @@
+# core/ocr_profiles.py
+from __future__ import annotations
+
+import hashlib
+import tempfile
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Mapping, Tuple, Union
+
+import cv2
+import numpy as np
+from PIL import Image
+
+
+# ======================
+# Profile
+# ======================
+@dataclass(frozen=True)
+class OcrProfile:
+    """
+    ROI 종류별 OCR 설정.
+    - lang / psm / oem: tesseract 인식 설정
+    - whitelist: 허용 문자 (비우면 제한 없음)
+    - user_words: 사전에 추가할 단어들 (배너 문구 등)
+    - preprocess: PREPROCESS_STEPS 이름 순서대로 적용
+    - scale: "scale" 단계의 확대 배율
+    - backend: core/ocr_backends.py에 등록된 OCR 백엔드 이름
+    """
+
+    name: str
+    lang: str = "kor"
+    psm: int = 6
+    oem: int = -1  # -1이면 tesseract 기본값
+    whitelist: str = ""
+    user_words: Tuple[str, ...] = ()
+    preprocess: Tuple[str, ...] = ("gray", "blur5", "otsu")
+    scale: float = 1.0
+    backend: str = "pytesseract"
+
+
+STATUS_PROFILE = "status"
+TIMER_DIGITS_PROFILE = "timer_digits"
+
+# 밴픽 배너에 나오는 단어들 (pipeline/classifier.py 규칙 문구 기준)
+BANNER_WORDS: Tuple[str, ...] = (
+    "금지할",
+    "챔피언을",
+    "선택하세요",
+    "장비를",
+    "준비하세요",
+    "전투",
+    "준비",
+)
+
+OCR_PROFILES: Dict[str, OcrProfile] = {
+    # 배너 문장: 기존 extract_text와 같은 전처리/psm + 배너 단어 사전
+    STATUS_PROFILE: OcrProfile(
+        name=STATUS_PROFILE,
+        lang="kor",
+        psm=6,
+        user_words=BANNER_WORDS,
+        preprocess=("gray", "blur5", "otsu"),
+    ),
+    # 중앙 타이머: 1~2자리 숫자 한 줄
+    TIMER_DIGITS_PROFILE: OcrProfile(
+        name=TIMER_DIGITS_PROFILE,
+        lang="eng",
+        psm=7,
+        whitelist="0123456789",
+        preprocess=("gray", "scale", "blur3", "adaptive_inv"),
+        scale=4.0,
+    ),
+}
+
+# ROI 이름 -> 프로필
+ROI_OCR_PROFILES: Dict[str, str] = {
+    "BANPICK_STATUS_TEXT": STATUS_PROFILE,
+    "BANPICK_TIMER_DIGITS": TIMER_DIGITS_PROFILE,
+}
+
+# set_roi_backends()가 덮어쓰기 전 원래 프로필
+_BASE_PROFILES: Dict[str, OcrProfile] = dict(OCR_PROFILES)
+
+
+def get_profile(profile: Union[str, OcrProfile]) -> OcrProfile:
+    if isinstance(profile, OcrProfile):
+        return profile
+    try:
+        return OCR_PROFILES[profile]
+    except KeyError:
+        raise KeyError(f"알 수 없는 OCR 프로필: {profile}") from None
+
+
+def profile_for_roi(roi_name: str) -> OcrProfile:
+    return get_profile(ROI_OCR_PROFILES.get(roi_name, STATUS_PROFILE))
+
+
+def set_roi_backends(overrides: Mapping[str, str]) -> None:
+    """
+    ROI 이름 -> OCR 백엔드 이름 (Settings.ocr_backends). 그 ROI가 쓰는 프로필의 backend만 바꾼다.
+    예: {"BANPICK_TIMER_DIGITS": "template"}
+    부를 때마다 원래 프로필에서 다시 적용한다 (빈 매핑 = 기본값 복원).
+    프로필 레지스트리는 프로세스 전역이라 OCR 워커 프로세스도 시작할 때 같은 값으로 부른다.
+    시작할 때 백엔드를 만들어 그 프로필을 지원하는지까지 확인한다 (첫 프레임이 아니라 여기서 실패).
+    """
+    from core.ocr_backends import get_backend  # ocr_backends가 이 모듈을 import
+
+    for roi_name, backend_name in overrides.items():
+        if roi_name not in ROI_OCR_PROFILES:
+            raise KeyError(f"OCR 프로필이 없는 ROI: {roi_name}")
+        backend = get_backend(backend_name)
+        profile = _BASE_PROFILES[ROI_OCR_PROFILES[roi_name]]
+        if not backend.supports(profile):
+            raise ValueError(
+                f"{roi_name}: OCR 백엔드 {backend_name}는 프로필 {profile.name}를 지원하지 않음"
+            )
+
+    OCR_PROFILES.update(_BASE_PROFILES)
+    for roi_name, backend in overrides.items():
+        name = ROI_OCR_PROFILES[roi_name]
+        OCR_PROFILES[name] = replace(OCR_PROFILES[name], backend=backend)
+
+
+# ======================
+# Preprocess
+# ======================
+def _gray(img: np.ndarray, p: OcrProfile) -> np.ndarray:
+    return cv2.cvtColor(img, cv2.COLOR_RGB2GRAY) if img.ndim == 3 else img
+
+
+def _scale(img: np.ndarray, p: OcrProfile) -> np.ndarray:
+    if p.scale == 1.0:
+        return img
+    h, w = img.shape[:2]
+    return cv2.resize(img, (int(w * p.scale), int(h * p.scale)), interpolation=cv2.INTER_CUBIC)
+
+
+def _otsu(img: np.ndarray, p: OcrProfile) -> np.ndarray:
+    _, binary = cv2.threshold(img, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    return binary
+
+
+def _adaptive_inv(img: np.ndarray, p: OcrProfile) -> np.ndarray:
+    # 밝은 숫자 -> 흰 배경 위 검은 글자
+    return cv2.adaptiveThreshold(
+        img, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY_INV, 31, 7
+    )
+
+
+PREPROCESS_STEPS: Dict[str, Callable[[np.ndarray, OcrProfile], np.ndarray]] = {
+    "gray": _gray,
+    "scale": _scale,
+    "blur3": lambda img, p: cv2.GaussianBlur(img, (3, 3), 0),
+    "blur5": lambda img, p: cv2.GaussianBlur(img, (5, 5), 0),
+    "otsu": _otsu,
+    "adaptive_inv": _adaptive_inv,
+}
+
+
+def preprocess(img: Union[Image.Image, np.ndarray], profile: Union[str, OcrProfile]) -> np.ndarray:
+    """img: PIL 이미지(RGB/L) 또는 (H, W[, 3]) 배열 -> 프로필 전처리 결과 (uint8 2D)."""
+    p = get_profile(profile)
+    if isinstance(img, Image.Image):
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        arr = np.asarray(img)
+    else:
+        arr = img
+
+    for step in p.preprocess:
+        arr = PREPROCESS_STEPS[step](arr, p)
+    return arr
+
+
+def to_dark_on_light(binary: np.ndarray) -> np.ndarray:
+    """테두리 다수값이 검정(0)이면 반전해서 '흰 배경 + 검은 글자'로 맞춘다."""
+    border = np.concatenate([binary[0], binary[-1], binary[:, 0], binary[:, -1]])
+    if np.mean(border) < 128:
+        return 255 - binary
+    return binary
+
+
+# ======================
+# Prepared engine config
+# ======================
+@dataclass(frozen=True)
+class PreparedOcr:
+    profile: OcrProfile
+    lang: str
+    config: str  # pytesseract config 문자열
+    user_words_path: str = ""  # 사전 파일 (user_words가 없으면 "")
+
+
+def _user_words_file(words: Tuple[str, ...]) -> Path:
+    digest = hashlib.sha1("\n".join(words).encode("utf-8")).hexdigest()[:12]
+    path = Path(tempfile.gettempdir()) / f"lol_ocr_user_words_{digest}.txt"
+    if not path.exists():
+        path.write_text("\n".join(words) + "\n", encoding="utf-8")
+    return path
+
+
+@lru_cache(maxsize=32)
+def _prepare(p: OcrProfile) -> PreparedOcr:
+    parts = [f"--psm {p.psm}"]
+    words_path = str(_user_words_file(p.user_words)) if p.user_words else ""
+    if p.oem >= 0:
+        parts.append(f"--oem {p.oem}")
+    if words_path:
+        parts.append(f"--user-words {words_path}")
+    if p.whitelist:
+        parts.append(f"-c tessedit_char_whitelist={p.whitelist}")
+    return PreparedOcr(profile=p, lang=p.lang, config=" ".join(parts), user_words_path=words_path)
+
+
+def prepare(profile: Union[str, OcrProfile]) -> PreparedOcr:
+    """프로필 -> tesseract 호출 설정 (프로필별 1번만 만들고 캐시)."""
+    return _prepare(get_profile(profile))
@@ -0,0 +1,144 @@
+# core/pick_coach_parser.py
+from __future__ import annotations
+
+import re
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterable, Iterator, List, Optional
+
+# _PROMPT_LOL_MID_COACH가 요구하는 추천 개수
+PICK_RECOMMENDATIONS = 3
+
+# 1) <챔피언> - <점수>/10   (번호/불릿/마크다운 굵게는 허용)
+_HEADLINE_RE = re.compile(
+    r"^(?:\d+[.)]\s*|[-*•]\s+)?\**\s*"
+    r"(?P<champion>[A-Za-z][A-Za-z'.& ]*?)\s*\**\s*[-–—:]\s*\**\s*"
+    r"(?P<score>\d+(?:\.\d+)?)\s*/\s*10\b"
+)
+
+# 2) 라인전: <근거> | 팀가치: <근거>
+_DETAIL_RE = re.compile(r"라인전\s*[:：]\s*(?P<lane>.*?)\s*\|\s*팀가치\s*[:：]\s*(?P<team>.*?)\s*$")
+
+
+# ======================
+# Result
+# ======================
+@dataclass(frozen=True)
+class PickRecommendation:
+    rank: int  # 1부터 (출력 순서)
+    champion: str
+    score: float  # 0~10
+    lane: str  # 라인전 근거
+    team: str  # 팀가치 근거
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def _parse_headline(line: str):
+    m = _HEADLINE_RE.match(line.strip())
+    if not m:
+        return None
+    score = float(m.group("score"))
+    if not 0.0 <= score <= 10.0:
+        return None
+    return m.group("champion").strip(), score
+
+
+def looks_like_recommendation(text: str) -> bool:
+    """첫 추천 제목 줄(<챔피언> - <점수>/10)이 보이면 True (레이싱의 '쓸 만한 출력' 기준)"""
+    return any(_parse_headline(line) is not None for line in text.split("\n"))
+
+
+def _parse_detail(line: str):
+    m = _DETAIL_RE.search(line.strip().strip("*"))
+    if not m:
+        return None
+    return m.group("lane").strip(), m.group("team").strip()
+
+
+# ======================
+# Parser
+# ======================
+class PickCoachParser:
+    """
+    픽 코치 스트림 델타를 받아 줄 단위로 해석하는 증분 파서.
+    추천 1개(제목 줄 + 근거 줄)가 완성되는 순간 PickRecommendation을 내보낸다.
+
+    - 줄은 개행이 와야 완성으로 본다 (마지막 줄은 finish()에서)
+    - 제목 줄 없이 온 근거 줄, 형식이 안 맞는 줄은 무시
+    - 근거 줄 전에 새 제목 줄이 오면 앞의 제목은 버린다
+    """
+
+    def __init__(self, expected: int = PICK_RECOMMENDATIONS):
+        self.expected = expected
+        self.recommendations: List[PickRecommendation] = []
+        self._buf = ""
+        self._pending = None  # (champion, score)
+
+    @property
+    def done(self) -> bool:
+        return len(self.recommendations) >= self.expected
+
+    def feed(self, delta: str) -> List[PickRecommendation]:
+        """델타 추가 -> 이번에 완성된 추천들"""
+        if self.done:
+            return []
+        self._buf += delta
+        *lines, self._buf = self._buf.split("\n")
+        return self._consume(lines)
+
+    def finish(self) -> List[PickRecommendation]:
+        """스트림 끝: 개행 없이 남은 마지막 줄까지 해석"""
+        rest, self._buf = self._buf, ""
+        return self._consume([rest]) if rest and not self.done else []
+
+    def _consume(self, lines: Iterable[str]) -> List[PickRecommendation]:
+        out = []
+        for line in lines:
+            if self.done:
+                break
+
+            headline = _parse_headline(line)
+            if headline is not None:
+                self._pending = headline
+                continue
+
+            detail = _parse_detail(line)
+            if detail is None or self._pending is None:
+                continue
+
+            champion, score = self._pending
+            self._pending = None
+            rec = PickRecommendation(len(self.recommendations) + 1, champion, score, *detail)
+            self.recommendations.append(rec)
+            out.append(rec)
+        return out
+
+
+def complete_early(
+    stream_iter: Iterable[str],
+    parser: PickCoachParser,
+    on_item: Optional[Callable[[PickRecommendation], None]] = None,
+) -> Iterator[str]:
+    """
+    델타를 그대로 흘려보내면서 parser에 먹이고, 추천이 expected개 모이면 원본 스트림을 닫고 끝낸다.
+    on_item: 추천이 완성될 때마다 호출 (델타를 흘려보낸 직후)
+    """
+    it = iter(stream_iter)
+    try:
+        for delta in it:
+            yield delta
+            for rec in parser.feed(delta):
+                if on_item is not None:
+                    on_item(rec)
+            if parser.done:
+                return
+
+        for rec in parser.finish():
+            if on_item is not None:
+                on_item(rec)
+    finally:
+        # 남은 응답은 받지 않는다 (genai 스트림 generator -> HTTP 스트림 종료)
+        close = getattr(it, "close", None)
+        if close is not None:
+            close()
@@ -0,0 +1,104 @@
+# core/roi_layout.py
+from __future__ import annotations
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+from config.roi import ROI, ROISet
+from core.roi_manager import PixelRect, roi_to_pixel_rect
+
+# 슬롯별 ROI 이름 (config/roi.py 정의 순서)
+MY_TEAM_PICK_SLOTS: Tuple[str, ...] = tuple(f"MY_TEAM_PICK{i}" for i in range(1, 6))
+MY_TEAM_POS_SLOTS: Tuple[str, ...] = tuple(f"MY_TEAM_POS{i}" for i in range(1, 6))
+ENEMY_TEAM_PICK_SLOTS: Tuple[str, ...] = tuple(f"ENEMY_TEAM_PICK{i}" for i in range(1, 6))
+
+
+def roi_items(roi_set: ROISet = ROI) -> Dict[str, Tuple[float, float, float, float]]:
+    """ROISet에 정의된 모든 ROI를 {이름: (x, y, w, h)}로 반환 (정의 순서 유지)."""
+    return {
+        name: value
+        for name, value in vars(type(roi_set)).items()
+        if name.isupper() and isinstance(value, tuple) and len(value) == 4
+    }
+
+
+class RoiLayout:
+    """
+    특정 창 크기(window_size)에 대해 미리 계산해 둔 ROI 픽셀 박스 모음.
+
+    - 창 크기가 같으면 매 프레임 float 계산 없이 정수 박스를 재사용
+    - PIL crop / numpy slicing 모두 같은 박스를 쓰므로 live/offline 크롭이 동일
+    """
+
+    __slots__ = ("window_size", "rects")
+
+    def __init__(self, window_size: Tuple[int, int], rects: Mapping[str, PixelRect]):
+        self.window_size = (int(window_size[0]), int(window_size[1]))
+        self.rects: Mapping[str, PixelRect] = MappingProxyType(dict(rects))
+
+    @classmethod
+    def compile(cls, window_size: Tuple[int, int], roi_set: ROISet = ROI) -> "RoiLayout":
+        rects = {
+            name: roi_to_pixel_rect(window_size, roi) for name, roi in roi_items(roi_set).items()
+        }
+        return cls(window_size, rects)
+
+    def rect(self, name: str) -> PixelRect:
+        return self.rects[name]
+
+    def crop(self, img: Union[Image.Image, np.ndarray], name: str) -> Image.Image:
+        """
+        img: PIL 이미지 또는 (H, W, 3) RGB 배열.
+        배열이면 ROI 부분만 복사해서 PIL 이미지로 만든다 (전체 프레임 변환 없음).
+        """
+        if isinstance(img, np.ndarray):
+            return Image.fromarray(np.ascontiguousarray(self.slice(img, name)))
+        return img.crop(self.rects[name])
+
+    def crop_many(
+        self, img: Image.Image, names: Optional[Iterable[str]] = None
+    ) -> Dict[str, Image.Image]:
+        keys = self.rects.keys() if names is None else names
+        return {name: img.crop(self.rects[name]) for name in keys}
+
+    def slice(self, frame: np.ndarray, name: str) -> np.ndarray:
+        """
+        frame: (H, W[, C]) 배열. 복사 없는 view를 반환한다.
+        창 밖으로 나가는 박스는 프레임 경계로 잘린다(PIL crop은 0으로 패딩).
+        """
+        left, top, right, bottom = self.rects[name]
+        return frame[max(top, 0) : max(bottom, 0), max(left, 0) : max(right, 0)]
+
+    def slice_many(
+        self, frame: np.ndarray, names: Optional[Iterable[str]] = None
+    ) -> Dict[str, np.ndarray]:
+        keys = self.rects.keys() if names is None else names
+        return {name: self.slice(frame, name) for name in keys}
+
+    def __repr__(self) -> str:
+        return f"RoiLayout(window_size={self.window_size}, rois={len(self.rects)})"
+
+
+@lru_cache(maxsize=64)
+def child_pixel_rect(parent: str, child: str, parent_size: Tuple[int, int]) -> PixelRect:
+    """
+    parent ROI 크롭(크기 parent_size) 안에서 child ROI의 픽셀 박스.
+    미리 잘린 패널 이미지(캡처 에이전트/ROI 팩의 picks_my_img 등)에서 슬롯을 다시 자를 때 쓴다.
+    """
+    items = roi_items()
+    px, py, pw, ph = items[parent]
+    cx, cy, cw, ch = items[child]
+    return roi_to_pixel_rect(parent_size, ((cx - px) / pw, (cy - py) / ph, cw / pw, ch / ph))
+
+
+@lru_cache(maxsize=8)
+def get_roi_layout(window_size: Tuple[int, int]) -> RoiLayout:
+    """
+    창 크기별 RoiLayout 캐시.
+    같은 크기면 이전에 컴파일한 레이아웃을 그대로 반환하고, 리사이즈 시에만 새로 만든다.
+    """
+    return RoiLayout.compile(window_size)
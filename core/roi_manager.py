@@ -1,5 +1,8 @@
 from PIL import Image
 
+# (left, top, right, bottom) 정수 픽셀 좌표
+PixelRect = tuple[int, int, int, int]
+
 
 def crop_roi_definite_xy(img: Image.Image, x: int, y: int, w: int, h: int) -> Image.Image:
     """
@@ -10,13 +13,13 @@ def crop_roi_definite_xy(img: Image.Image, x: int, y: int, w: int, h: int) -> Im
     return img.crop((x, y, x + w, y + h))
 
 
-def crop_roi_relative_xy(
-    img: Image.Image, window_size: tuple[int, int], roi: tuple[float, float, float, float]
-) -> Image.Image:
+def roi_to_pixel_rect(
+    window_size: tuple[int, int], roi: tuple[float, float, float, float]
+) -> PixelRect:
     """
-    img: 전체 캡처 이미지
-    window_size: 전체 캡처 이미지의 사이즈 (w, h)
-    roi: 원본 이미지 기준 상대적인 위치 (x, y, w, h)
+    상대 ROI (x, y, w, h)를 정수 픽셀 박스 (left, top, right, bottom)로 변환.
+    PIL Image.crop이 float 박스를 round 하는 것과 동일하게 반올림해서
+    crop_roi_relative_xy와 항상 같은 영역이 나온다.
     """
     o_w, o_h = window_size
     r_x, r_y, r_w, r_h = roi
@@ -25,4 +28,20 @@ def crop_roi_relative_xy(
     target_w = o_w * r_w
     target_h = o_h * r_h
 
-    return img.crop((target_x, target_y, target_x + target_w, target_y + target_h))
+    return (
+        int(round(target_x)),
+        int(round(target_y)),
+        int(round(target_x + target_w)),
+        int(round(target_y + target_h)),
+    )
+
+
+def crop_roi_relative_xy(
+    img: Image.Image, window_size: tuple[int, int], roi: tuple[float, float, float, float]
+) -> Image.Image:
+    """
+    img: 전체 캡처 이미지
+    window_size: 전체 캡처 이미지의 사이즈 (w, h)
+    roi: 원본 이미지 기준 상대적인 위치 (x, y, w, h)
+    """
+    return img.crop(roi_to_pixel_rect(window_size, roi))
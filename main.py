@@ -1,5 +1,71 @@
+import argparse
+from dataclasses import replace
+
 from app.settings import Settings
-from app.loop import run_main
 
 if __name__ == "__main__":
-    run_main(Settings())
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--serve", action="store_true", help="로컬 프레임 수집 서버 모드 (WebSocket)")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--no_api", action="store_true", help="서버 모드에서 코치(Gemini) 호출 생략")
+    parser.add_argument("--fps", type=float, default=Settings().target_fps, help="로컬 루프 목표 fps (0=고정 sleep)")
+    parser.add_argument("--tokens_jsonl", type=str, default="", help="코치 토큰 이벤트 JSONL 기록 경로")
+    parser.add_argument("--overlay_port", type=int, default=0, help="코치 토큰 오버레이 WebSocket 포트 (0=끔)")
+    parser.add_argument("--race_model", type=str, default="", help="픽 코치 레이싱 보조 모델 (예: gemini-2.5-flash)")
+    parser.add_argument("--hedge_sec", type=float, default=0.0, help="레이싱 헤지 지연 (0=동시 출발)")
+    parser.add_argument("--my_slot", type=int, default=0, help="내 픽 슬롯 번호 1~5 (주면 픽 변화 재코치를 켜고, 내 픽 확정 시 멈춤. 0=모름/끔)")
+    parser.add_argument("--draft_plan_at", type=int, default=0, help="픽 N개 확정 시 플레이 플랜 초안 생성 (0=끔, 예: 8)")
+    parser.add_argument(
+        "--dual_mode",
+        choices=("symmetry", "motion"),
+        default=Settings().dual_timer_mode,
+        help="PREPARE dual 타이머 판정 (symmetry=정지 이미지 대칭+숫자 OCR, motion=연속 프레임 바 움직임)",
+    )
+    parser.add_argument(
+        "--ocr_backend",
+        action="append",
+        default=[],
+        metavar="ROI=BACKEND",
+        help="ROI별 OCR 백엔드 (예: BANPICK_TIMER_DIGITS=template, 여러 번 지정 가능)",
+    )
+    args = parser.parse_args()
+
+    ocr_backends = {}
+    for item in args.ocr_backend:
+        roi, sep, backend = item.partition("=")
+        if not sep or not roi or not backend:
+            parser.error(f"--ocr_backend는 ROI=BACKEND 형식: {item}")
+        ocr_backends[roi] = backend
+    if ocr_backends:
+        from core.ocr_profiles import set_roi_backends
+
+        # 서버 모드는 첫 연결 때에야 세션을 만든다 -> 잘못된 ROI/백엔드는 여기서 바로 알린다
+        try:
+            set_roi_backends(ocr_backends)
+        except (KeyError, ValueError, RuntimeError) as e:
+            parser.error(f"--ocr_backend: {e.args[0]}")
+
+    settings = replace(
+        Settings(),
+        target_fps=args.fps,
+        coach_tokens_jsonl=args.tokens_jsonl,
+        overlay_ws_port=args.overlay_port,
+        pick_race_model=args.race_model,
+        pick_race_hedge_sec=args.hedge_sec,
+        playplan_draft_min_picks=args.draft_plan_at,
+        my_pick_slot=args.my_slot,
+        pick_recoach_on_delta=args.my_slot > 0,
+        dual_timer_mode=args.dual_mode,
+        ocr_backends=ocr_backends,
+    )
+
+    if args.serve:
+        from app.server import run_server
+
+        run_server(settings, args.host, args.port, no_api=args.no_api)
+    else:
+        # 윈도우 캡처(win32) 의존성은 로컬 모드에서만 로드
+        from app.loop import run_main
+
+        run_main(settings)
@@ -0,0 +1,332 @@
+# pipeline/draft_state.py
+from __future__ import annotations
+
+from typing import Any, FrozenSet, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pipeline.pick_slot_tracker import PickSlotTrackerConfig, fingerprint_distance
+
+# 밴픽 화면(ROI가 의미 있는) 단계
+CHAMP_SELECT_PHASES = frozenset({"BAN", "PICK", "PREPARE"})
+
+
+# ======================
+# Reading
+# ======================
+class Reading:
+    """
+    판정값 1개 + 신뢰도 + 관측 시각 (불변).
+    값이 그대로거나 다시 재지 않은 프레임에서는 같은 Reading 객체를 그대로 넘겨서 diff가 `is` 비교로 끝나게 한다.
+    (그래서 age(now)는 "이 값이 얼마나 오래 유지/방치됐는지")
+    """
+
+    __slots__ = ("value", "conf", "ts")
+
+    def __init__(self, value: Any = None, conf: float = 0.0, ts: Optional[float] = None):
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "conf", conf)
+        object.__setattr__(self, "ts", ts)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Reading은 불변")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Reading):
+            return NotImplemented
+        return (self.value, self.conf, self.ts) == (other.value, other.conf, other.ts)
+
+    def __hash__(self) -> int:
+        return hash((self.value, self.conf, self.ts))
+
+    def __repr__(self) -> str:
+        return f"Reading({self.value!r}, conf={self.conf:.2f}, ts={self.ts})"
+
+    def age(self, now: float) -> Optional[float]:
+        return None if self.ts is None else now - self.ts
+
+    def observe(self, value: Any, conf: float, ts: float) -> "Reading":
+        """
+        새 측정값 반영.
+        - 값/신뢰도가 같으면 자기 자신 (diff 없음)
+        - 값이 같고 신뢰도만 다르면 ts 유지 (ts = 그 값이 처음 관측된 시각)
+        """
+        if value == self.value:
+            return self if conf == self.conf else Reading(value, conf, self.ts)
+        return Reading(value, conf, ts)
+
+
+UNREAD = Reading()
+
+
+# ======================
+# Snapshot
+# ======================
+class DraftState:
+    """
+    프레임 1장에 대한 밴픽 상태 스냅샷 (불변, __slots__).
+
+    - phase/raw_phase/pick_kind/timer_seconds/dual: Reading (값 + 신뢰도 + 측정 시각)
+    - bans/picks: 슬롯별 지문(slot_fingerprint, 읽기 전용 배열) 10개씩 (MY 1~5, ENEMY 1~5). 재지 않은 슬롯은 None
+    - picks_locked: 슬롯별 픽 확정 여부 (PickSlotTracker)
+    """
+
+    __slots__ = (
+        "seq",
+        "ts",
+        "phase",
+        "raw_phase",
+        "pick_kind",
+        "timer_seconds",
+        "dual",
+        "bans",
+        "picks",
+        "picks_locked",
+    )
+
+    READING_FIELDS = ("phase", "raw_phase", "pick_kind", "timer_seconds", "dual")
+    SLOT_FIELDS = ("bans", "picks", "picks_locked")
+
+    def __init__(
+        self,
+        seq: int = 0,
+        ts: Optional[float] = None,
+        phase: Reading = UNREAD,
+        raw_phase: Reading = UNREAD,
+        pick_kind: Reading = UNREAD,
+        timer_seconds: Reading = UNREAD,
+        dual: Reading = UNREAD,
+        bans: Sequence[Optional[np.ndarray]] = (None,) * 10,
+        picks: Sequence[Optional[np.ndarray]] = (None,) * 10,
+        picks_locked: Tuple[bool, ...] = (False,) * 10,
+    ):
+        for name, value in (
+            ("seq", seq),
+            ("ts", ts),
+            ("phase", phase),
+            ("raw_phase", raw_phase),
+            ("pick_kind", pick_kind),
+            ("timer_seconds", timer_seconds),
+            ("dual", dual),
+            ("bans", _frozen_slots(bans)),
+            ("picks", _frozen_slots(picks)),
+            ("picks_locked", tuple(picks_locked)),
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DraftState는 불변 (replace()로 새 스냅샷을 만든다)")
+
+    def replace(self, **changes) -> "DraftState":
+        kwargs = {name: getattr(self, name) for name in self.__slots__}
+        kwargs.update(changes)
+        return DraftState(**kwargs)
+
+    def __eq__(self, other) -> bool:
+        # 값 비교 (리플레이 재현성 검증용). 프레임 간 변화 판정은 diff()
+        if not isinstance(other, DraftState):
+            return NotImplemented
+        scalars = ("seq", "ts", "picks_locked") + self.READING_FIELDS
+        return all(getattr(self, name) == getattr(other, name) for name in scalars) and all(
+            _same_slots(getattr(self, name), getattr(other, name)) for name in ("bans", "picks")
+        )
+
+    __hash__ = None
+
+    def diff(
+        self, prev: Optional["DraftState"], cfg: PickSlotTrackerConfig = PickSlotTrackerConfig()
+    ) -> "DraftDiff":
+        return diff_states(prev, self, cfg)
+
+    def as_dict(self) -> dict:
+        d = {"seq": self.seq, "ts": self.ts}
+        for name in self.READING_FIELDS:
+            r = getattr(self, name)
+            d[name] = {"value": r.value, "conf": round(r.conf, 3), "ts": r.ts}
+        d["picks_locked"] = list(self.picks_locked)
+        return d
+
+    def __repr__(self) -> str:
+        return (
+            f"DraftState(seq={self.seq}, phase={self.phase.value}, pick_kind={self.pick_kind.value},"
+            f" timer={self.timer_seconds.value}, dual={self.dual.value}, locked={sum(self.picks_locked)})"
+        )
+
+
+def _same_slots(a: Tuple[Optional[np.ndarray], ...], b: Tuple[Optional[np.ndarray], ...]) -> bool:
+    return a is b or all(
+        x is y or (x is not None and y is not None and np.array_equal(x, y)) for x, y in zip(a, b)
+    )
+
+
+def _frozen_slots(slots: Sequence[Optional[np.ndarray]]) -> Tuple[Optional[np.ndarray], ...]:
+    # 스냅샷 간에 공유되는 배열이라 제자리 수정을 막는다
+    for fp in slots:
+        if fp is not None and fp.flags.writeable:
+            fp.flags.writeable = False
+    return tuple(slots)
+
+
+EMPTY_STATE = DraftState()
+
+
+# ======================
+# Diff
+# ======================
+class DraftDiff:
+    """
+    연속 스냅샷 간 변경점.
+    fields: 값이 바뀐 Reading 필드 이름 (신뢰도/측정 시각만 바뀐 건 제외)
+    ban_slots/pick_slots/locked_slots: 바뀐 슬롯 인덱스 (0~9, MY 1~5 -> 0~4)
+    """
+
+    __slots__ = ("fields", "ban_slots", "pick_slots", "locked_slots")
+
+    def __init__(
+        self,
+        fields: FrozenSet[str] = frozenset(),
+        ban_slots: Tuple[int, ...] = (),
+        pick_slots: Tuple[int, ...] = (),
+        locked_slots: Tuple[int, ...] = (),
+    ):
+        object.__setattr__(self, "fields", frozenset(fields))
+        object.__setattr__(self, "ban_slots", tuple(ban_slots))
+        object.__setattr__(self, "pick_slots", tuple(pick_slots))
+        object.__setattr__(self, "locked_slots", tuple(locked_slots))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DraftDiff는 불변")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DraftDiff):
+            return NotImplemented
+        return (self.fields, self.ban_slots, self.pick_slots, self.locked_slots) == (
+            other.fields,
+            other.ban_slots,
+            other.pick_slots,
+            other.locked_slots,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.fields, self.ban_slots, self.pick_slots, self.locked_slots))
+
+    def __bool__(self) -> bool:
+        return bool(self.fields or self.ban_slots or self.pick_slots or self.locked_slots)
+
+    def __contains__(self, name: str) -> bool:
+        if name in self.fields:
+            return True
+        return (
+            bool(getattr(self, name, ()))
+            if name in ("ban_slots", "pick_slots", "locked_slots")
+            else False
+        )
+
+    def as_dict(self) -> dict:
+        return {
+            "fields": sorted(self.fields),
+            "ban_slots": list(self.ban_slots),
+            "pick_slots": list(self.pick_slots),
+            "locked_slots": list(self.locked_slots),
+        }
+
+    def __repr__(self) -> str:
+        parts = sorted(self.fields)
+        for name in ("ban_slots", "pick_slots", "locked_slots"):
+            slots = getattr(self, name)
+            if slots:
+                parts.append(f"{name}={list(slots)}")
+        return f"DraftDiff({', '.join(parts)})"
+
+
+NO_DIFF = DraftDiff()
+
+
+def _changed_flags(prev: Tuple[bool, ...], cur: Tuple[bool, ...]) -> Tuple[int, ...]:
+    if prev is cur:
+        return ()
+    return tuple(i for i, (a, b) in enumerate(zip(prev, cur)) if a != b)
+
+
+def _changed_fingerprints(
+    prev: Tuple[Optional[np.ndarray], ...],
+    cur: Tuple[Optional[np.ndarray], ...],
+    cfg: PickSlotTrackerConfig,
+) -> Tuple[int, ...]:
+    if prev is cur:
+        return ()
+    changed = []
+    for i, (a, b) in enumerate(zip(prev, cur)):
+        if a is b:
+            continue
+        # 한쪽만 측정됨 = 측정 범위가 바뀐 것 (밴픽 화면 진입/이탈)
+        if (
+            a is None
+            or b is None
+            or fingerprint_distance(a, b, cfg.pixel_delta) >= cfg.change_ratio
+        ):
+            changed.append(i)
+    return tuple(changed)
+
+
+def diff_states(
+    prev: Optional[DraftState],
+    cur: DraftState,
+    cfg: PickSlotTrackerConfig = PickSlotTrackerConfig(),
+) -> DraftDiff:
+    """
+    필드/슬롯 단위 비교. 재사용된 객체는 `is`로 바로 건너뛴다.
+    슬롯 지문은 PickSlotTracker와 같은 기준(달라진 셀 비율)이라 압축 노이즈로는 diff가 나지 않는다.
+    """
+    if prev is None:
+        prev = EMPTY_STATE
+    if prev is cur:
+        return NO_DIFF
+
+    fields = []
+    for name in DraftState.READING_FIELDS:
+        a, b = getattr(prev, name), getattr(cur, name)
+        if a is not b and a.value != b.value:
+            fields.append(name)
+
+    ban_slots = _changed_fingerprints(prev.bans, cur.bans, cfg)
+    pick_slots = _changed_fingerprints(prev.picks, cur.picks, cfg)
+    locked_slots = _changed_flags(prev.picks_locked, cur.picks_locked)
+    if not (fields or ban_slots or pick_slots or locked_slots):
+        return NO_DIFF
+    return DraftDiff(frozenset(fields), ban_slots, pick_slots, locked_slots)
+
+
+def _anchor(prev: Tuple, cur: Tuple, changed: Tuple[int, ...]) -> Tuple:
+    # diff 없는 슬롯은 이전 지문을 그대로 (조금씩 쌓이는 변화도 기준 지문 대비로 잡힌다)
+    if prev is cur or not changed:
+        return prev
+    return tuple(c if i in changed else p for i, (p, c) in enumerate(zip(prev, cur)))
+
+
+def advance_state(
+    prev: DraftState,
+    ts: float,
+    *,
+    cfg: PickSlotTrackerConfig = PickSlotTrackerConfig(),
+    **fields,
+) -> Tuple[DraftState, DraftDiff]:
+    """
+    새 측정값(fields)으로 다음 스냅샷 + diff.
+    아무 필드도 새 객체가 아니면 prev를 그대로 돌려준다 (seq 유지).
+    """
+    cur = prev.replace(**fields)
+    diff = diff_states(prev, cur, cfg)
+
+    bans = _anchor(prev.bans, cur.bans, diff.ban_slots)
+    picks = _anchor(prev.picks, cur.picks, diff.pick_slots)
+    locked = prev.picks_locked if not diff.locked_slots else cur.picks_locked
+    same = (
+        all(getattr(prev, name) is getattr(cur, name) for name in DraftState.READING_FIELDS)
+        and bans is prev.bans
+        and picks is prev.picks
+        and locked is prev.picks_locked
+    )
+    if same:
+        return prev, NO_DIFF
+    return cur.replace(seq=prev.seq + 1, ts=ts, bans=bans, picks=picks, picks_locked=locked), diff
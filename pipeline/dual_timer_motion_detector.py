@@ -0,0 +1,106 @@
+# pipeline/dual_timer_motion_detector.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+
+# ======================
+# Config
+# ======================
+@dataclass(frozen=True)
+class MotionDualConfig:
+    # 바 가로 프로필 칸 수 (700px 바 기준 칸당 ~11px)
+    bins: int = 64
+
+    # 가운데 숫자 밑은 양쪽 어디에도 넣지 않는다 (timer_bar_estimator와 같은 비율)
+    center_ignore_ratio: float = 0.125
+
+    # 최근 몇 프레임의 차이 프로필로 판정할지 / 최소 몇 개가 쌓여야 판정할지
+    ring_size: int = 8
+    min_frames: int = 4
+
+    # 칸별 밝기 차이가 이 값 미만이면 0 (압축 노이즈/깜빡임)
+    noise_floor: float = 2.0
+
+    # 한쪽 움직임 합이 이 값 이상이어야 "그쪽 바가 줄고 있음"
+    min_side_motion: float = 6.0
+
+    # 양쪽 움직임 비율(작은 쪽 / 큰 쪽)이 이 이상이면 dual
+    balance_threshold: float = 0.35
+
+
+# ======================
+# Profile
+# ======================
+def bar_profile(bar_img: Union[Image.Image, np.ndarray], bins: int = 64) -> np.ndarray:
+    """타이머 바 크롭 -> (bins,) float32 (컬럼 최대 밝기를 칸별 평균)"""
+    arr = np.asarray(bar_img.convert("RGB") if isinstance(bar_img, Image.Image) else bar_img)
+    col = arr.max(axis=(0, 2)).astype(np.float32)
+    w = col.shape[0] - col.shape[0] % bins
+    if w < bins:
+        return np.resize(col, bins)
+    return col[:w].reshape(bins, -1).mean(axis=1)
+
+
+# ======================
+# Detector
+# ======================
+class DualTimerMotionDetector:
+    """
+    연속 프레임의 타이머 바 움직임으로 dual(양쪽이 같이 줄어듦) / single(한쪽만) 판정.
+
+    - 프레임마다 바를 bins칸 프로필로 줄이고, 직전 프로필과의 차이만 링 버퍼에 쌓는다
+    - 좌/우 절반의 움직임 합을 비교: 양쪽 다 움직이고 비슷하면 dual, 한쪽만이면 single
+    - 아무 쪽도 안 움직이면 판정 없음(None): 타이머 0초 / 멈춤 = dual과 single이 똑같이 보이는 순간
+      (정지 이미지 대칭 판정의 숫자 OCR 예외 처리가 필요 없다)
+    """
+
+    def __init__(self, cfg: MotionDualConfig = MotionDualConfig()):
+        self.cfg = cfg
+        self._ring = np.zeros((cfg.ring_size, cfg.bins), dtype=np.float32)
+        half_ignore = cfg.center_ignore_ratio / 2.0
+        self._l_end = max(1, int(cfg.bins * (0.5 - half_ignore)))
+        self._r_start = min(cfg.bins - 1, int(cfg.bins * (0.5 + half_ignore)))
+        self.reset()
+
+    def reset(self) -> None:
+        self._ring[:] = 0.0
+        self._prev: Optional[np.ndarray] = None
+        self._count = 0
+        self._pos = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._count >= self.cfg.min_frames
+
+    def push(self, bar_img: Union[Image.Image, np.ndarray]) -> None:
+        profile = bar_profile(bar_img, self.cfg.bins)
+        if self._prev is not None:
+            diff = np.abs(profile - self._prev)
+            diff[diff < self.cfg.noise_floor] = 0.0
+            self._ring[self._pos] = diff
+            self._pos = (self._pos + 1) % self.cfg.ring_size
+            self._count = min(self._count + 1, self.cfg.ring_size)
+        self._prev = profile
+
+    def side_motion(self) -> Tuple[float, float]:
+        """링 버퍼 전체의 (왼쪽, 오른쪽) 움직임 합"""
+        total = self._ring.sum(axis=0)
+        return float(total[: self._l_end].sum()), float(total[self._r_start :].sum())
+
+    def decide(self) -> Optional[bool]:
+        if not self.ready:
+            return None
+        left, right = self.side_motion()
+        hi, lo = max(left, right), min(left, right)
+        if hi < self.cfg.min_side_motion:
+            return None
+        return lo >= self.cfg.min_side_motion and lo / hi >= self.cfg.balance_threshold
+
+    def update(self, bar_img: Union[Image.Image, np.ndarray]) -> Optional[bool]:
+        self.push(bar_img)
+        return self.decide()
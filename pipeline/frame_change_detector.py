@@ -0,0 +1,105 @@
+# pipeline/frame_change_detector.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from core.roi_layout import get_roi_layout
+
+# PIL 이미지 또는 (H, W, 3) RGB 배열
+Frame = Union[Image.Image, np.ndarray]
+
+
+# ======================
+# Config
+# ======================
+@dataclass(frozen=True)
+class FrameChangeConfig:
+    # 전체 프레임 썸네일 크기 (큰 변화: 배너 문구, 밴/픽 초상화 등)
+    thumb_size: Tuple[int, int] = (96, 54)
+
+    # 썸네일로는 묻혀버리는 작은 ROI는 원본 해상도로 따로 본다
+    # (타이머 바는 높이가 몇 px 뿐이라 썸네일에서 거의 안 보임)
+    watch_rois: Tuple[str, ...] = ("BANPICK_TIMER_BAR", "BANPICK_TIMER_DIGITS")
+
+    # 그레이 값 차이가 이 값 이상인 픽셀이 있으면 "변함"
+    pixel_threshold: int = 6
+
+    # 안전장치: 이 횟수만큼 연속으로 정적이면 한 번은 강제로 "변함" 처리
+    # (0이면 비활성)
+    max_static_frames: int = 100
+
+
+# ======================
+# Detector
+# ======================
+class FrameChangeDetector:
+    """
+    직전 프레임과 비교해서 파이프라인(ROI/OCR/판정)을 다시 돌릴 필요가 있는지 판단.
+    - 다운샘플 썸네일 + 작은 watch ROI의 그레이 값 최대 차이로 판정
+    - 변하지 않았으면 호출 측에서 직전 결과를 재사용하면 된다
+    """
+
+    def __init__(self, cfg: FrameChangeConfig = FrameChangeConfig()):
+        self.cfg = cfg
+        self._ref: Optional[List[np.ndarray]] = None  # 마지막 "변함" 프레임의 시그니처
+        self._static_count = 0
+
+    def reset(self) -> None:
+        self._ref = None
+        self._static_count = 0
+
+    def _signature(self, frame_img: Frame, window_size: Tuple[int, int]) -> List[np.ndarray]:
+        layout = get_roi_layout(window_size)
+
+        if isinstance(frame_img, np.ndarray):
+            # (H, W, 3) RGB 배열: 전체 프레임을 PIL로 바꾸지 않고 그대로 축소/슬라이스
+            thumb = cv2.resize(frame_img, self.cfg.thumb_size, interpolation=cv2.INTER_AREA)
+            parts = [cv2.cvtColor(thumb, cv2.COLOR_RGB2GRAY).astype(np.int16)]
+            for name in self.cfg.watch_rois:
+                roi = cv2.cvtColor(
+                    np.ascontiguousarray(layout.slice(frame_img, name)), cv2.COLOR_RGB2GRAY
+                )
+                parts.append(roi.astype(np.int16))
+            return parts
+
+        thumb = frame_img.resize(self.cfg.thumb_size, Image.BOX).convert("L")
+        parts = [np.asarray(thumb, dtype=np.int16)]
+
+        for name in self.cfg.watch_rois:
+            roi = layout.crop(frame_img, name).convert("L")
+            parts.append(np.asarray(roi, dtype=np.int16))
+
+        return parts
+
+    def update(self, frame_img: Frame, window_size: Tuple[int, int]) -> bool:
+        """
+        마지막으로 "변함" 처리된 프레임 대비 변했으면 True (그 프레임을 새 기준으로 기록).
+        직전 프레임과만 비교하면 한 프레임씩 조금씩 바뀌는 페이드가 끝까지 안 잡힌다.
+        첫 프레임/리사이즈 직후는 항상 True.
+        frame_img는 PIL 이미지 또는 (H, W, 3) RGB 배열 (한 detector에서는 한 종류만 쓴다).
+        """
+        sig = self._signature(frame_img, window_size)
+        ref = self._ref
+
+        if ref is None or len(ref) != len(sig):
+            return self._changed(sig)
+
+        for a, b in zip(ref, sig):
+            if a.shape != b.shape or int(np.abs(a - b).max(initial=0)) >= self.cfg.pixel_threshold:
+                return self._changed(sig)
+
+        self._static_count += 1
+        if self.cfg.max_static_frames and self._static_count >= self.cfg.max_static_frames:
+            return self._changed(sig)
+
+        return False
+
+    def _changed(self, sig: List[np.ndarray]) -> bool:
+        self._ref = sig
+        self._static_count = 0
+        return True
@@ -0,0 +1,83 @@
+# pipeline/pick_slot_detector.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image
+
+
+# ======================
+# Config
+# ======================
+@dataclass(frozen=True)
+class PickSlotConfig:
+    # 슬롯(챔피언 이름 줄) 내부 밝기 표준편차가 이 이상이면 "픽 확정"
+    # 빈 슬롯/선택 중 슬롯은 거의 단색이라 std가 낮다
+    std_threshold: float = 20.0
+
+    # 글자 획이 있어야 filled (단색 하이라이트/그라데이션 오탐 방지)
+    min_edge_density: float = 0.02
+
+
+@dataclass(frozen=True)
+class PickSlotsResult:
+    my_filled: Tuple[bool, ...]
+    enemy_filled: Tuple[bool, ...]
+    my_stds: Tuple[float, ...]
+    enemy_stds: Tuple[float, ...]
+
+    @property
+    def filled_count(self) -> int:
+        return sum(self.my_filled) + sum(self.enemy_filled)
+
+    @property
+    def total(self) -> int:
+        return len(self.my_filled) + len(self.enemy_filled)
+
+
+# ======================
+# Detect
+# ======================
+def _slot_stats(slot_img: Image.Image) -> Tuple[float, float]:
+    gray = cv2.cvtColor(np.asarray(slot_img.convert("RGB")), cv2.COLOR_RGB2GRAY)
+
+    # 테두리 UI 제외 (ban_detector와 같은 방식)
+    h, w = gray.shape[:2]
+    pad_x = int(w * 0.04)
+    pad_y = int(h * 0.10)
+    if h - 2 * pad_y > 4 and w - 2 * pad_x > 4:
+        gray = gray[pad_y : h - pad_y, pad_x : w - pad_x]
+
+    std = float(np.std(cv2.GaussianBlur(gray, (3, 3), 0)))
+    edges = cv2.Canny(gray, 40, 120)
+    return std, float(np.mean(edges > 0))
+
+
+def detect_slot_filled(
+    slot_img: Image.Image, cfg: PickSlotConfig = PickSlotConfig()
+) -> Tuple[bool, float]:
+    """슬롯 1개 -> (filled, std)"""
+    std, edge_density = _slot_stats(slot_img)
+    return (std >= cfg.std_threshold and edge_density >= cfg.min_edge_density), std
+
+
+def detect_pick_slots(
+    my_slot_imgs: Sequence[Image.Image],
+    enemy_slot_imgs: Sequence[Image.Image],
+    cfg: PickSlotConfig = PickSlotConfig(),
+) -> PickSlotsResult:
+    """
+    양 팀 픽 슬롯(챔피언 이름 줄)별로 픽이 확정됐는지 판정.
+    슬롯 ROI는 config/roi.py의 MY_TEAM_PICK1~5 / ENEMY_TEAM_PICK1~5.
+    """
+    my = [detect_slot_filled(img, cfg) for img in my_slot_imgs]
+    enemy = [detect_slot_filled(img, cfg) for img in enemy_slot_imgs]
+    return PickSlotsResult(
+        my_filled=tuple(f for f, _ in my),
+        enemy_filled=tuple(f for f, _ in enemy),
+        my_stds=tuple(round(s, 2) for _, s in my),
+        enemy_stds=tuple(round(s, 2) for _, s in enemy),
+    )
@@ -0,0 +1,203 @@
+# pipeline/pick_slot_tracker.py
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+TEAM_MY = "MY"
+TEAM_ENEMY = "ENEMY"
+
+SLOT_LOCKED = "LOCKED"  # 빈 슬롯 -> 픽 확정
+SLOT_CHANGED = "CHANGED"  # 확정된 슬롯 내용이 바뀜 (챔피언 교환 등)
+SLOT_CLEARED = "CLEARED"  # 확정된 슬롯이 다시 비었음
+
+# 슬롯 지문: 챔피언 이름 줄을 작은 흑백 썸네일로 (글자 2~3개만 달라도 잡히는 해상도)
+FINGERPRINT_SIZE = (64, 8)  # (w, h)
+
+
+# ======================
+# Config
+# ======================
+@dataclass(frozen=True)
+class PickSlotTrackerConfig:
+    # 지문 셀 중 밝기가 pixel_delta 넘게 달라진 비율이 change_ratio 이상이면 "내용이 바뀜"
+    # (평균 차이는 짧은 이름끼리(Zed/Zoe) 구분이 안 됨, 셀 비율은 압축 노이즈에 둔감)
+    pixel_delta: int = 16
+    change_ratio: float = 0.01
+
+    # filled + 지문이 이 시간 동안 그대로면 확정(lock)으로 본다 (호버/애니메이션 걸러냄)
+    lock_sec: float = 1.0
+
+
+# ======================
+# Fingerprint
+# ======================
+def slot_fingerprint(slot_img: Image.Image) -> np.ndarray:
+    """슬롯 1개 -> (8, 64) uint8 썸네일 (매 프레임 10개를 만들어도 싸다)"""
+    return np.asarray(slot_img.convert("L").resize(FINGERPRINT_SIZE, Image.BOX), dtype=np.uint8)
+
+
+def fingerprint_distance(a: np.ndarray, b: np.ndarray, pixel_delta: int = 16) -> float:
+    """밝기가 pixel_delta 넘게 달라진 셀 비율 (0~1)"""
+    return float(np.mean(np.abs(a.astype(np.int16) - b.astype(np.int16)) > pixel_delta))
+
+
+# ======================
+# Events
+# ======================
+@dataclass(frozen=True)
+class SlotEvent:
+    ts: float
+    team: str  # TEAM_MY | TEAM_ENEMY
+    slot: int  # 1~5
+    kind: str  # SLOT_LOCKED | SLOT_CHANGED | SLOT_CLEARED
+
+    def __str__(self) -> str:
+        return f"{self.team}{self.slot}:{self.kind}"
+
+
+@dataclass(frozen=True)
+class DraftDelta:
+    """디바운스된 슬롯 이벤트 묶음 (코치 재호출 1번 분량)"""
+
+    events: Tuple[SlotEvent, ...]
+    first_ts: float
+    fired_ts: float
+
+    def slots(self, team: Optional[str] = None) -> Tuple[Tuple[str, int], ...]:
+        seen = []
+        for e in self.events:
+            key = (e.team, e.slot)
+            if (team is None or e.team == team) and key not in seen:
+                seen.append(key)
+        return tuple(seen)
+
+    def summary(self) -> str:
+        return ", ".join(str(e) for e in self.events)
+
+
+# ======================
+# Tracker
+# ======================
+@dataclass
+class _SlotState:
+    filled: bool = False
+    locked: bool = False
+    fingerprint: Optional[np.ndarray] = None
+    stable_since: float = 0.0
+    locked_fingerprint: Optional[np.ndarray] = None
+    locked_at: Optional[float] = None
+
+
+class PickSlotTracker:
+    """
+    양 팀 픽 슬롯 10개의 지문을 매 프레임 비교해서 어느 슬롯이 언제 확정/변경됐는지 이벤트로 낸다.
+
+    - 슬롯 순서: MY 1~5, ENEMY 1~5
+    - filled(이름 줄에 글자 있음) + 지문이 lock_sec 동안 그대로 -> LOCKED
+    - 확정된 슬롯의 지문이 바뀐 뒤 다시 lock_sec 동안 그대로 -> CHANGED
+    - 확정된 슬롯이 비면 -> CLEARED
+    """
+
+    def __init__(
+        self, cfg: PickSlotTrackerConfig = PickSlotTrackerConfig(), slots_per_team: int = 5
+    ):
+        self.cfg = cfg
+        self.slots_per_team = slots_per_team
+        self._slots = [_SlotState() for _ in range(slots_per_team * 2)]
+
+    def reset(self) -> None:
+        self._slots = [_SlotState() for _ in range(self.slots_per_team * 2)]
+
+    def _key(self, idx: int) -> Tuple[str, int]:
+        team = TEAM_MY if idx < self.slots_per_team else TEAM_ENEMY
+        return team, idx % self.slots_per_team + 1
+
+    @property
+    def locked(self) -> Tuple[bool, ...]:
+        return tuple(s.locked for s in self._slots)
+
+    @property
+    def locked_count(self) -> int:
+        return sum(self.locked)
+
+    def is_locked(self, team: str, slot: int) -> bool:
+        offset = 0 if team == TEAM_MY else self.slots_per_team
+        return self._slots[offset + slot - 1].locked
+
+    def update(
+        self, now: float, filled: Sequence[bool], fingerprints: Sequence[np.ndarray]
+    ) -> List[SlotEvent]:
+        cfg = self.cfg
+        events: List[SlotEvent] = []
+
+        def moved(a: np.ndarray, b: np.ndarray) -> bool:
+            return fingerprint_distance(a, b, cfg.pixel_delta) >= cfg.change_ratio
+
+        for idx, (st, is_filled, fp) in enumerate(zip(self._slots, filled, fingerprints)):
+            if st.fingerprint is None or moved(fp, st.fingerprint):
+                st.stable_since = now
+            st.fingerprint = fp
+            st.filled = bool(is_filled)
+
+            if not st.filled:
+                if st.locked:
+                    st.locked = False
+                    st.locked_fingerprint = None
+                    events.append(SlotEvent(now, *self._key(idx), SLOT_CLEARED))
+                continue
+
+            settled = now - st.stable_since >= cfg.lock_sec
+            if not settled:
+                continue
+
+            if not st.locked:
+                st.locked = True
+                st.locked_fingerprint = fp
+                st.locked_at = now
+                events.append(SlotEvent(now, *self._key(idx), SLOT_LOCKED))
+            elif moved(fp, st.locked_fingerprint):
+                st.locked_fingerprint = fp
+                st.locked_at = now
+                events.append(SlotEvent(now, *self._key(idx), SLOT_CHANGED))
+
+        return events
+
+
+# ======================
+# Debounce
+# ======================
+@dataclass
+class DeltaDebouncer:
+    """
+    슬롯 이벤트를 모았다가 quiet_sec 동안 새 이벤트가 없으면(또는 max_wait_sec가 지나면) DraftDelta 1개로 낸다.
+    연달아 확정되는 픽(2픽 동시 턴 등)에 코치를 여러 번 부르지 않게 한다.
+    """
+
+    quiet_sec: float = 0.8
+    max_wait_sec: float = 3.0
+    _pending: List[SlotEvent] = field(default_factory=list)
+
+    def push(self, events: Sequence[SlotEvent]) -> None:
+        self._pending.extend(events)
+
+    def reset(self) -> None:
+        self._pending.clear()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def poll(self, now: float) -> Optional[DraftDelta]:
+        if not self._pending:
+            return None
+        first, last = self._pending[0].ts, self._pending[-1].ts
+        if now - last < self.quiet_sec and now - first < self.max_wait_sec:
+            return None
+
+        delta = DraftDelta(events=tuple(self._pending), first_ts=first, fired_ts=now)
+        self._pending.clear()
+        return delta
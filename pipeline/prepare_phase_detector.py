@@ -9,6 +9,8 @@ import cv2
 import numpy as np
 from PIL import Image
 
+from core.ocr_engine import extract_text
+from core.ocr_profiles import TIMER_DIGITS_PROFILE
 from pipeline.dual_timer_detector import SymmetryConfig, is_dual_sided_timer_cropped_symmetry
 
 
@@ -29,6 +31,9 @@ class PreparePhaseConfig:
     allow_digits_len_min: int = 1
     allow_digits_len_max: int = 2
 
+    # 숫자 OCR 프로필 (core/ocr_profiles.py)
+    digits_ocr_profile: str = TIMER_DIGITS_PROFILE
+
     # OCR 불안정할 때를 대비한 “이미지 기반” 보조 판정 사용 여부
     # (OCR이 실패하면 fallback으로 씀)
     use_visual_fallback: bool = True
@@ -41,31 +46,6 @@ class PreparePhaseConfig:
 # ======================
 # OCR helpers
 # ======================
-def _preprocess_digits_for_ocr(img: Image.Image) -> Image.Image:
-    """
-    숫자 OCR용 전처리:
-    - 그레이스케일
-    - 확대
-    - 대비 강화 + 이진화
-    """
-    rgb = img.convert("RGB")
-    arr = np.asarray(rgb, dtype=np.uint8)
-    gray = cv2.cvtColor(arr, cv2.COLOR_RGB2GRAY)
-
-    # 확대(숫자 작으면 OCR 흔들림 완화)
-    h, w = gray.shape
-    scale = 4
-    gray = cv2.resize(gray, (w * scale, h * scale), interpolation=cv2.INTER_CUBIC)
-
-    # 블러 -> 적응형 임계(명암 변화에 강함)
-    gray = cv2.GaussianBlur(gray, (3, 3), 0)
-    bin_img = cv2.adaptiveThreshold(
-        gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY_INV, 31, 7
-    )
-
-    return Image.fromarray(bin_img)
-
-
 def _extract_seconds_from_ocr_text(text: str, cfg: PreparePhaseConfig) -> Optional[int]:
     """
     OCR 텍스트에서 초(second) 숫자만 뽑아 int로 반환.
@@ -96,37 +76,14 @@ def _extract_seconds_from_ocr_text(text: str, cfg: PreparePhaseConfig) -> Option
 
 def _ocr_digits_seconds(digits_img: Image.Image, cfg: PreparePhaseConfig) -> Optional[int]:
     """
-    프로젝트의 core/ocr_engine.extract_text를 사용해서 숫자를 읽는다.
-    (시그니처가 다를 수 있어 안전하게 try 계열로 처리)
+    타이머 숫자 전용 OCR 프로필(숫자 whitelist, 한 줄, 4배 확대 + 적응형 이진화)로 읽는다.
+    OCR을 못 돌리면(tesseract 없음 등) None -> 시각적 fallback
     """
-    pre = _preprocess_digits_for_ocr(digits_img)
-
     try:
-        from core.ocr_engine import extract_text  # 네 프로젝트에 이미 존재
+        text = extract_text(digits_img, cfg.digits_ocr_profile)
     except Exception:
         return None
 
-    text = None
-
-    # 가능한 호출 시그니처를 유연하게 대응
-    for kwargs in (
-        {"psm": 7, "whitelist": "0123456789"},
-        {"psm": 8, "whitelist": "0123456789"},
-        {},  # 최후: 기본 호출
-    ):
-        try:
-            text = extract_text(pre, **kwargs)  # type: ignore
-            if isinstance(text, str) and text.strip():
-                break
-        except TypeError:
-            # kwargs 지원 안 하면 다음 시도
-            continue
-        except Exception:
-            continue
-
-    if not isinstance(text, str):
-        return None
-
     return _extract_seconds_from_ocr_text(text, cfg)
 
 
@@ -156,6 +113,18 @@ def _visual_near_zero_fallback(digits_img: Image.Image, cfg: PreparePhaseConfig)
 # ======================
 # Public API
 # ======================
+def _near_zero_from_seconds(
+    sec: Optional[int], timer_digits_img: Image.Image, cfg: PreparePhaseConfig
+) -> bool:
+    if sec is not None:
+        return sec <= cfg.near_zero_max_seconds
+
+    if cfg.use_visual_fallback:
+        return _visual_near_zero_fallback(timer_digits_img, cfg)
+
+    return False
+
+
 def is_timer_near_zero(
     timer_digits_img: Image.Image, cfg: PreparePhaseConfig = PreparePhaseConfig()
 ) -> bool:
@@ -163,13 +132,67 @@ def is_timer_near_zero(
     타이머 중앙 숫자가 0(또는 0에 준함)인지 판정.
     """
     sec = _ocr_digits_seconds(timer_digits_img, cfg)
-    if sec is not None:
-        return sec <= cfg.near_zero_max_seconds
+    return _near_zero_from_seconds(sec, timer_digits_img, cfg)
 
-    if cfg.use_visual_fallback:
-        return _visual_near_zero_fallback(timer_digits_img, cfg)
 
-    return False
+def read_timer_seconds(
+    timer_digits_img: Image.Image,
+    digits_text: Optional[str] = None,
+    cfg: PreparePhaseConfig = PreparePhaseConfig(),
+) -> Optional[int]:
+    """
+    타이머 중앙 숫자(남은 초)를 읽는다. 못 읽으면 None.
+    digits_text: 숫자 OCR 결과를 밖에서 받은 경우 (배처/워커 풀)
+    """
+    if digits_text is None:
+        return _ocr_digits_seconds(timer_digits_img, cfg)
+    return _extract_seconds_from_ocr_text(digits_text, cfg)
+
+
+@dataclass(frozen=True)
+class PrepareTimerFeatures:
+    seconds: Optional[int]  # 숫자 OCR 결과 (실패 시 None)
+    near_zero: bool
+    symmetry: bool  # 바 대칭(dual) 판정
+
+    @property
+    def dual_effective(self) -> bool:
+        # is_dual_timer_effective와 같은 규칙
+        return (not self.near_zero) and self.symmetry
+
+
+def analyze_prepare_timer(
+    timer_bar_img: Image.Image,
+    timer_digits_img: Image.Image,
+    cfg: PreparePhaseConfig = PreparePhaseConfig(),
+) -> PrepareTimerFeatures:
+    """
+    is_dual_timer_effective의 중간값들을 전부 계산해서 반환 (오프라인 피처 추출용).
+    short-circuit 없이 숫자/대칭을 모두 본다.
+    """
+    sec = _ocr_digits_seconds(timer_digits_img, cfg)
+    return PrepareTimerFeatures(
+        seconds=sec,
+        near_zero=_near_zero_from_seconds(sec, timer_digits_img, cfg),
+        symmetry=is_dual_sided_timer_cropped_symmetry(timer_bar_img, cfg.dual_cfg),
+    )
+
+
+def is_dual_timer_effective_from_digits_text(
+    timer_bar_img: Image.Image,
+    timer_digits_img: Image.Image,
+    digits_text: str,
+    cfg: PreparePhaseConfig = PreparePhaseConfig(),
+) -> bool:
+    """
+    is_dual_timer_effective와 같은 규칙이지만 숫자 OCR 결과를 밖에서 받는다.
+    (OCR 워커 풀/배처로 숫자 OCR을 status OCR과 같이 보낼 때)
+    """
+    sec = _extract_seconds_from_ocr_text(digits_text, cfg)
+    if _near_zero_from_seconds(sec, timer_digits_img, cfg):
+        return False
+
+    return is_dual_sided_timer_cropped_symmetry(timer_bar_img, cfg.dual_cfg)
 
 
 def is_dual_timer_effective(
@@ -1,15 +1,19 @@
-import time
+from core.clock import SYSTEM_CLOCK
 
 
 class StableStateManager:
-    def __init__(self, min_duration=1.0, min_confidence=0.6):
+    def __init__(self, min_duration=1.0, min_confidence=0.6, clock=SYSTEM_CLOCK):
+        # clock: 시간 소스 (리플레이에서는 core.clock.VirtualClock)
+        self.clock = clock
         self.current_state = None
-        self.last_change_time = time.time()
+        self.last_change_time = clock.now()
         self.min_duration = min_duration
         self.min_confidence = min_confidence
 
-    def update(self, candidate_state: str, confidence: float):
-        now = time.time()
+    def update(self, candidate_state: str, confidence: float, now: float = None):
+        # now: 주면 clock 대신 이 시각(초) 기준으로 판정
+        if now is None:
+            now = self.clock.now()
 
         if self.current_state is None:
             self.current_state = candidate_state
@@ -0,0 +1,199 @@
+# pipeline/timer_bar_estimator.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+from PIL import Image
+
+
+# ======================
+# Config
+# ======================
+@dataclass(frozen=True)
+class TimerBarConfig:
+    # 컬럼 최대 밝기(RGB 최대 채널)가 이 값 이상이면 바가 칠해진 컬럼
+    # (밴픽 배경은 어두운 남색이라 40~70 정도)
+    value_threshold: int = 100
+
+    # 가운데 숫자 밑(바 폭의 12.5%)은 양쪽 어디에도 넣지 않는다 (BANPICK_TIMER_DIGITS 폭 / BANPICK_TIMER_BAR 폭)
+    center_ignore_ratio: float = 0.125
+
+    # 칠해진 컬럼 마스크 이동 평균 폭 (튀는 파티클 1~2컬럼 무시)
+    smooth_columns: int = 5
+
+
+@dataclass(frozen=True)
+class CountdownConfig:
+    # 단계별 타이머 전체 길이(초). 숫자 OCR을 읽을 때마다 calibrate()로 보정된다
+    ban_sec: float = 30.0
+    pick_sec: float = 30.0
+    prepare_sec: float = 30.0
+
+    # 관측값 반영 비율 (예측 = 이전 추정 - 경과 시간)
+    alpha: float = 0.3
+
+    # 관측이 예측보다 전체 길이의 이 비율 넘게 길면 바가 다시 찬 것 (새 턴) -> 바로 관측값으로
+    refill_ratio: float = 0.15
+
+    # 숫자 OCR로 전체 길이를 보정할 때 반영 비율 / 바가 이보다 짧으면 보정에 안 씀 (비율 오차가 커짐)
+    calibrate_alpha: float = 0.5
+    calibrate_min_fill: float = 0.2
+
+    # 측정한 전체 길이가 설정 길이의 이 범위 밖이면 숫자 오독으로 보고 버린다 ("27" -> "2")
+    calibrate_min_ratio: float = 0.5
+    calibrate_max_ratio: float = 1.5
+
+    # 측정끼리 이 비율 안이면 일치. 일치하는 측정이 calibrate_min_agree번 모여야 바 추정을 믿는다
+    calibrate_agree_ratio: float = 0.1
+    calibrate_min_agree: int = 2
+
+    # 믿는 동안에도 이 간격(초)마다 숫자 OCR로 다시 확인 (recheck_due)
+    recheck_sec: float = 5.0
+
+
+# ======================
+# Measure
+# ======================
+@dataclass(frozen=True)
+class BarFill:
+    left: float  # 왼쪽(우리 팀) 절반 중 칠해진 비율 (0~1)
+    right: float  # 오른쪽(상대 팀) 절반 중 칠해진 비율 (0~1)
+
+    @property
+    def fraction(self) -> float:
+        # 한쪽 턴이면 그쪽만 칠해져 있다 -> 남은 시간은 긴 쪽 기준
+        return max(self.left, self.right)
+
+
+def measure_bar_fill(
+    bar_img: Union[Image.Image, np.ndarray], cfg: TimerBarConfig = TimerBarConfig()
+) -> BarFill:
+    """
+    타이머 바 크롭 -> 좌/우 절반별 칠해진 비율.
+    컬럼마다 최대 밝기 1개만 보는 벡터 연산이라 (700x6 px 기준) 수십 µs.
+    """
+    arr = np.asarray(bar_img.convert("RGB") if isinstance(bar_img, Image.Image) else bar_img)
+    col_value = arr.max(axis=(0, 2))  # (W,)
+    mask = (col_value >= cfg.value_threshold).astype(np.float32)
+
+    k = cfg.smooth_columns
+    if k > 1 and mask.shape[0] >= k:
+        mask = np.convolve(mask, np.ones(k, dtype=np.float32) / k, mode="same") >= 0.5
+
+    w = mask.shape[0]
+    half_ignore = cfg.center_ignore_ratio / 2.0
+    l_end = max(1, int(w * (0.5 - half_ignore)))
+    r_start = min(w - 1, int(w * (0.5 + half_ignore)))
+    return BarFill(left=float(np.mean(mask[:l_end])), right=float(np.mean(mask[r_start:])))
+
+
+# ======================
+# Countdown
+# ======================
+class TimerBarCountdown:
+    """
+    바 비율 -> 남은 초. 매 프레임 싸게 쓸 수 있는 카운트다운.
+
+    - 남은 초 = 비율 x 단계 전체 길이 (단계가 바뀌면 처음부터)
+    - 남은 시간은 1초에 1초씩 줄어든다는 걸 알고 있으니, 예측(이전 추정 - 경과)과 관측을 alpha로 섞는다
+    - 숫자 OCR을 읽은 프레임에서 calibrate()를 부르면 단계 전체 길이를 보정한다
+      (범위 밖 측정은 버리고, 서로 일치하는 측정이 2번 이상 모여야 calibrated, 보정값과 어긋나면 다시 처음부터)
+    """
+
+    def __init__(self, cfg: CountdownConfig = CountdownConfig()):
+        self.cfg = cfg
+        self._base: Dict[str, float] = {
+            "BAN": cfg.ban_sec,
+            "PICK": cfg.pick_sec,
+            "PREPARE": cfg.prepare_sec,
+        }
+        self._durations: Dict[str, float] = dict(self._base)
+        self._calibrated: Dict[str, int] = {}  # 일치한 측정 수 (calibrate_min_agree 이상이면 믿음)
+        self._pending: Dict[str, List[float]] = {}  # 아직 믿기 전, 서로 일치하는 측정들
+        self._checked_at: Dict[str, float] = {}  # 마지막으로 숫자 OCR과 맞춰 본 시각
+        self.reset()
+
+    def reset(self) -> None:
+        self.phase: Optional[str] = None
+        self._estimate: Optional[float] = None
+        self._ts: Optional[float] = None
+        self._fill: Optional[float] = None
+
+    def duration(self, phase: str) -> Optional[float]:
+        return self._durations.get(phase)
+
+    def calibrated(self, phase: str) -> bool:
+        return self._calibrated.get(phase, 0) >= self.cfg.calibrate_min_agree
+
+    def recheck_due(self, phase: str, now: float) -> bool:
+        """믿는 보정이라도 recheck_sec가 지났으면 숫자 OCR로 다시 확인할 때"""
+        checked = self._checked_at.get(phase)
+        return checked is None or now - checked >= self.cfg.recheck_sec
+
+    def remaining(self, now: float) -> Optional[float]:
+        """마지막 추정에서 경과 시간만큼 뺀 값 (측정 없는 프레임용)"""
+        if self._estimate is None:
+            return None
+        return max(0.0, self._estimate - (now - self._ts))
+
+    def update(self, now: float, phase: str, fill: BarFill) -> Optional[float]:
+        duration = self._durations.get(phase)
+        if duration is None:
+            self.reset()
+            return None
+
+        observed = fill.fraction * duration
+        predicted = self.remaining(now) if phase == self.phase else None
+
+        if predicted is None or observed - predicted > self.cfg.refill_ratio * duration:
+            estimate = observed
+        else:
+            estimate = predicted + self.cfg.alpha * (observed - predicted)
+
+        self.phase = phase
+        self._estimate = max(0.0, estimate)
+        self._ts = now
+        self._fill = fill.fraction
+        return self._estimate
+
+    def calibrate(self, phase: str, seconds: float) -> None:
+        """
+        숫자 OCR로 읽은 남은 초로 단계 전체 길이 보정 (같은 프레임의 바 비율 기준).
+        추정값도 OCR 값으로 맞춘다 (오독으로 버린 값은 제외).
+        """
+        if phase != self.phase or self._fill is None:
+            return
+
+        cfg = self.cfg
+        if self._fill >= cfg.calibrate_min_fill:
+            measured = seconds / self._fill
+            base = self._base[phase]
+            if not cfg.calibrate_min_ratio * base <= measured <= cfg.calibrate_max_ratio * base:
+                return  # 숫자 오독 -> 보정/추정 모두 그대로
+            self._checked_at[phase] = self._ts
+            self._fold(phase, measured)
+        self._estimate = float(seconds)
+
+    def _fold(self, phase: str, measured: float) -> None:
+        agree = self.cfg.calibrate_agree_ratio
+        if self.calibrated(phase):
+            duration = self._durations[phase]
+            if abs(measured - duration) <= agree * duration:
+                self._durations[phase] += self.cfg.calibrate_alpha * (measured - duration)
+                self._calibrated[phase] += 1
+                return
+            # 보정값과 어긋남 -> 다시 일치하는 측정이 모일 때까지 숫자 OCR로
+            self._pending[phase] = []
+
+        pending = self._pending.setdefault(phase, [])
+        mean = sum(pending) / len(pending) if pending else None
+        if mean is None or abs(measured - mean) > agree * mean:
+            pending[:] = [measured]
+        else:
+            pending.append(measured)
+        self._calibrated[phase] = len(pending)
+        if len(pending) >= self.cfg.calibrate_min_agree:
+            self._durations[phase] = sum(pending) / len(pending)
+            del self._pending[phase]
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+# ======================
+# Standard library
+# ======================
+import argparse
+import json
+from pathlib import Path
+
+from app.ocr_bench import (
+    OCR_BENCH_ROIS,
+    benchmark_ocr_backends,
+    fit_templates_from_baseline,
+    load_ocr_corpus,
+)
+
+# ======================
+# Local modules
+# ======================
+from config.path import PATHS
+from core.ocr_backends import DEFAULT_TEMPLATE_PATH, OCR_BACKENDS, PYTESSERACT_BACKEND
+from scripts.bench_replay import git_rev
+
+
+# ======================
+# Main
+# ======================
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="OCR 백엔드별 처리량 / 지연 분위수 / baseline 일치율 비교"
+    )
+    parser.add_argument(
+        "--testsets", default="", help="콤마 구분 (비우면 lol_client 아래 모든 테스트셋)"
+    )
+    parser.add_argument("--limit", type=int, default=0, help="테스트셋당 최대 프레임 수")
+    parser.add_argument("--rois", default=",".join(OCR_BENCH_ROIS))
+    parser.add_argument("--backends", default=",".join(OCR_BACKENDS), help="콤마 구분 백엔드 이름")
+    parser.add_argument("--baseline", default=PYTESSERACT_BACKEND)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument(
+        "--fit_templates",
+        action="store_true",
+        help=f"baseline 결과로 타이머 숫자 템플릿을 학습해 {DEFAULT_TEMPLATE_PATH.name}에 저장한 뒤 측정",
+    )
+    parser.add_argument("--out", type=Path, default=None, help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    root = PATHS.TEST_LOL_CLIENT_DIR
+    if args.testsets:
+        dirs = [root / name for name in args.testsets.split(",")]
+    else:
+        dirs = sorted(p for p in root.iterdir() if p.is_dir())
+    if not dirs:
+        raise FileNotFoundError(f"테스트셋 없음: {root}")
+
+    samples = load_ocr_corpus(dirs, rois=args.rois.split(","), limit=args.limit)
+    print(f"📂 샘플 수: {len(samples)} ({len(dirs)} testsets)")
+
+    if args.fit_templates:
+        templates = fit_templates_from_baseline(samples, baseline=args.baseline)
+        templates.save(DEFAULT_TEMPLATE_PATH)
+        print(f"💾 템플릿 저장: {DEFAULT_TEMPLATE_PATH} ({len(templates.chars)} glyphs)")
+
+    runs = benchmark_ocr_backends(
+        samples, args.backends.split(","), baseline=args.baseline, warmup=args.warmup
+    )
+
+    print("\n====================================")
+    for run in runs:
+        if run.skipped:
+            print(f"⏭ [{run.roi}] {run.backend}: {run.skipped}")
+            continue
+        agreement = "baseline" if run.backend == args.baseline else run.agreement
+        print(
+            f"[{run.roi}] {run.backend}: {run.throughput_per_s}/s | "
+            f"p50={run.latency_ms.get('p50')}ms p99={run.latency_ms.get('p99')}ms | "
+            f"errors={run.errors} | agreement={agreement}"
+        )
+
+    if args.out:
+        report = {
+            "git_rev": git_rev(),
+            "baseline": args.baseline,
+            "samples": len(samples),
+            "runs": [run.as_dict() for run in runs],
+        }
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(
+            json.dumps(report, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8"
+        )
+        print(f"\n💾 saved: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+# ======================
+# Standard library
+# ======================
+import argparse
+import json
+import subprocess
+from dataclasses import asdict
+from pathlib import Path
+
+from app.benchmark import LABELS_FILENAME, benchmark_session, load_transition_labels, summarize
+from app.frame_source import ImageDirFrameSource
+from app.settings import Settings
+
+# ======================
+# Local modules
+# ======================
+from config.path import PATHS, PROJECT_ROOT
+
+
+def git_rev() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return out.stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+# ======================
+# Main
+# ======================
+def main() -> None:
+    defaults = Settings()
+
+    parser = argparse.ArgumentParser(
+        description="라벨(transitions.json)이 있는 테스트셋으로 전환 지연/오탐/프레임 비용 측정"
+    )
+    parser.add_argument(
+        "--testsets", default="", help="콤마 구분 (비우면 transitions.json이 있는 모든 테스트셋)"
+    )
+    parser.add_argument("--limit", type=int, default=0)
+    parser.add_argument(
+        "--frame_period",
+        type=float,
+        default=1.0,
+        help="파일명에 timestamp가 없을 때 프레임 간격(초)",
+    )
+    parser.add_argument("--out", type=Path, default=None, help="결과 JSON 경로")
+
+    parser.add_argument("--pick_std", type=float, default=defaults.pick_std_threshold)
+    parser.add_argument("--dual_conf", type=float, default=defaults.dual_conf_threshold)
+    parser.add_argument("--state_buf", type=int, default=defaults.state_buf_size)
+    parser.add_argument("--dual_buf", type=int, default=defaults.dual_buf_size)
+    parser.add_argument("--min_conf", type=float, default=defaults.stable_min_confidence)
+    parser.add_argument("--min_dur", type=float, default=defaults.stable_min_duration)
+
+    args = parser.parse_args()
+
+    settings = Settings(
+        state_buf_size=args.state_buf,
+        dual_buf_size=args.dual_buf,
+        stable_min_duration=args.min_dur,
+        stable_min_confidence=args.min_conf,
+        pick_std_threshold=args.pick_std,
+        dual_conf_threshold=args.dual_conf,
+    )
+
+    root = PATHS.TEST_LOL_CLIENT_DIR
+    if args.testsets:
+        dirs = [root / name for name in args.testsets.split(",")]
+    else:
+        dirs = sorted(p.parent for p in root.glob(f"*/{LABELS_FILENAME}"))
+    if not dirs:
+        raise FileNotFoundError(f"{LABELS_FILENAME}가 있는 테스트셋 없음: {root}")
+
+    benches = []
+    for d in dirs:
+        labels = load_transition_labels(d, frame_period_sec=args.frame_period)
+        source = ImageDirFrameSource(d, limit=args.limit)
+        bench = benchmark_session(
+            d.name, source, labels, settings, frame_period_sec=args.frame_period
+        )
+        benches.append(bench)
+
+        print(f"\n📁 {d.name}: frames={bench.frames} | frame_ms={bench.frame_ms}")
+        for t in bench.transitions:
+            print(f"  → {t['state']}: latency={t['latency_s']}s ({t['latency_frames']} frames)")
+        for dec in bench.decisions:
+            print(f"  [{dec['action']}] frame={dec['frame']:04d} latency={dec['latency_s']}s")
+        for ft in bench.false_triggers:
+            print(
+                f"  ⚠ false {ft['kind']}: frame={ft['frame']:04d} {ft['state']} (truth={ft['truth']})"
+            )
+
+    report = {
+        "git_rev": git_rev(),
+        "settings": asdict(settings),
+        "summary": summarize(benches),
+        "sessions": [b.as_dict() for b in benches],
+    }
+
+    print("\n====================================")
+    print(json.dumps(report["summary"], ensure_ascii=False, indent=2))
+
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(
+            json.dumps(report, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8"
+        )
+        print(f"\n💾 saved: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
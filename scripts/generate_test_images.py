@@ -1,8 +1,7 @@
 import time
 
 from config.path import PATHS
-from config.roi import ROI
-from core.roi_manager import crop_roi_relative_xy
+from core.roi_layout import get_roi_layout
 from core.screen_capture import capture_window
 from core.window_tracker import WindowTracker
 
@@ -27,7 +26,7 @@ while True:
         img.save(lol_path)
 
         # ROI 캡처
-        roi_img = crop_roi_relative_xy(img, widnow_size, ROI.BANPICK_STATUS_TEXT)
+        roi_img = get_roi_layout(widnow_size).crop(img, "BANPICK_STATUS_TEXT")
 
         banpick_path = PATHS.TEST_BANPICK_STATUS_DIR / f"banpick_status_{timestamp}.png"
         roi_img.save(banpick_path)
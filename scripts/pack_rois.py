@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+# ======================
+# Standard library
+# ======================
+import argparse
+import time
+from pathlib import Path
+
+from app.frame_source import list_images
+from app.roi_pack import PACK_SUFFIX, RoiPack, write_roi_pack
+
+# ======================
+# Local modules
+# ======================
+from config.path import PATHS
+
+
+# ======================
+# Main
+# ======================
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="테스트셋 프레임의 ROI만 잘라 memory-mapped ROI 팩으로 저장"
+    )
+    parser.add_argument("--testset", required=True)
+    parser.add_argument("--limit", type=int, default=0)
+    parser.add_argument(
+        "--out", type=Path, default=None, help=f"기본: roi_packs/<testset>{PACK_SUFFIX}"
+    )
+    args = parser.parse_args()
+
+    test_dir = PATHS.TEST_LOL_CLIENT_DIR / args.testset
+    img_paths = list_images(test_dir) if test_dir.exists() else []
+    if not img_paths:
+        raise FileNotFoundError(f"이미지 없음: {test_dir}")
+    if args.limit:
+        img_paths = img_paths[: args.limit]
+
+    out = args.out or PATHS.ROI_PACK_DIR / f"{args.testset}{PACK_SUFFIX}"
+
+    t0 = time.perf_counter()
+    write_roi_pack(img_paths, out)
+    pack = RoiPack(out)
+
+    src_mb = sum(p.stat().st_size for p in img_paths) / 1e6
+    print(f"📦 {out}")
+    print(f"🖼 frames: {len(pack)} | window={pack.window_size} | rois={list(pack.arrays)}")
+    print(
+        f"💾 {src_mb:.1f}MB -> {out.stat().st_size / 1e6:.1f}MB in {time.perf_counter() - t0:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+# ======================
+# Standard library
+# ======================
+import argparse
+import time
+
+from app.session import (
+    ACTION_PICK_COACH,
+    ACTION_PLAYPLAN_COACH,
+    ACTION_PLAYPLAN_DRAFT,
+    DraftSession,
+)
+from app.settings import Settings
+from app.video_source import FfmpegFrameSource, VideoFileFrameSource
+
+# ======================
+# Local modules
+# ======================
+from core.clock import VirtualClock
+
+
+# ======================
+# Main
+# ======================
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="녹화 영상/ffmpeg 스트림을 실제 프레임 레이트로 재생하며 상태 전환 시각 측정 (API 호출 없음)"
+    )
+    parser.add_argument("source", help="영상 파일 경로 (--ffmpeg면 ffmpeg 입력)")
+    parser.add_argument("--ffmpeg", action="store_true", help="ffmpeg rgb24 파이프로 디코드")
+    parser.add_argument("--size", default="1600x900", help="--ffmpeg 출력 해상도 WxH")
+    parser.add_argument("--src_fps", type=float, default=30.0, help="--ffmpeg 입력 fps")
+    parser.add_argument("--fps", type=float, default=0.0, help="목표 fps (0=원본 그대로)")
+    parser.add_argument("--limit", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.ffmpeg:
+        w, h = (int(v) for v in args.size.lower().split("x"))
+        source = FfmpegFrameSource(
+            args.source, w, h, src_fps=args.src_fps, target_fps=args.fps, limit=args.limit
+        )
+    else:
+        source = VideoFileFrameSource(args.source, target_fps=args.fps, limit=args.limit)
+        print(f"🎞 {args.source}: {source.frame_count} frames @ {source.src_fps:.1f}fps")
+
+    clock = VirtualClock()
+    session = DraftSession(Settings(), session_id="video", clock=clock)
+    last_stable = None
+    frames = 0
+
+    t0 = time.perf_counter()
+    for frame in source:
+        frames += 1
+        clock.set(frame.ts)
+        res = session.step(frame.array, frame.size)
+
+        if res.stable_state != last_stable:
+            print(
+                f"[{frame.ts:8.3f}s] #{frame.source_index:06d} stable: {last_stable} -> {res.stable_state}"
+            )
+            last_stable = res.stable_state
+
+        if res.action is not None:
+            print(f"[{frame.ts:8.3f}s] #{frame.source_index:06d} [{res.action}]")
+            if res.action == ACTION_PICK_COACH:
+                session.mark_pick_coached()
+            elif res.action == ACTION_PLAYPLAN_DRAFT:
+                session.mark_playplan_drafted()
+            elif res.action == ACTION_PLAYPLAN_COACH:
+                session.mark_playplan_coached()
+                break
+
+    session.finish()
+    wall = time.perf_counter() - t0
+    m = session.metrics
+
+    print("\n====================================")
+    print(
+        f"✅ frames={frames} changed={m.changed_frames} | wall={wall:.2f}s ({frames / wall if wall else 0:.1f} fps)"
+        f" | pipeline={m.ms_per_frame:.2f}ms/frame"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,11 +7,6 @@ import argparse
 import time
 from pathlib import Path
 
-# ======================
-# Third-party
-# ======================
-from PIL import Image
-
 # ======================
 # Local modules
 # ======================
@@ -19,34 +14,16 @@ from config.path import PATHS
 
 from app.settings import Settings
 from app.rois import extract_rois
-from app.loop import run_streaming   # 🔥 여기서 재사용
-
-from core.ocr_engine import extract_text
-from core.lol_pick_coach import get_client, lol_mid_pick_coach_stream
+from app.frame_source import list_images, open_rgb
+from app.offline import FeatureReplay, extract_features_from_pack, extract_features_parallel
+from app.roi_pack import RoiPack
+from app.feature_store import FeatureStore, load_or_extract_features
+from app.session import ACTION_PICK_COACH, ACTION_PLAYPLAN_COACH
+from app.streaming import open_pick_coach_stream, run_streaming   # 🔥 여기서 재사용
+
+from core.lol_pick_coach import get_client
 from core.lol_playplan_coach import get_playplan_coach_client, lol_playplan_stream
-
-from pipeline.buffer import StateBuffer
-from pipeline.classifier import StateClassifier
-from pipeline.normalizer import TextNormalizer
-from pipeline.pick_stage_detector import detect_pick_kind_from_banned_strips
-from pipeline.prepare_phase_detector import is_dual_timer_effective
-from pipeline.state_manager import StableStateManager
-
-
-# ======================
-# Helpers
-# ======================
-def list_images(folder: Path) -> list[Path]:
-    exts = {".png", ".jpg", ".jpeg", ".webp", ".bmp"}
-    paths = [p for p in folder.iterdir() if p.is_file() and p.suffix.lower() in exts]
-    return sorted(paths, key=lambda p: p.name)
-
-
-def open_rgb(path: Path) -> Image.Image:
-    img = Image.open(path)
-    if img.mode != "RGB":
-        img = img.convert("RGB")
-    return img
+from core.pick_coach_parser import PickCoachParser
 
 
 # ======================
@@ -56,23 +33,29 @@ def main() -> None:
     defaults = Settings()
 
     parser = argparse.ArgumentParser()
-    parser.add_argument("--testset", required=True)
-    parser.add_argument("--sleep", type=float, default=defaults.sleep_sec)
+    parser.add_argument("--testset", default="")
+    parser.add_argument("--pack", type=Path, default=None, help="ROI 팩(scripts/pack_rois.py) 경로. 주면 PNG 대신 팩에서 읽는다")
     parser.add_argument("--limit", type=int, default=0)
     parser.add_argument("--no_api", action="store_true")
+    parser.add_argument("--workers", type=int, default=0, help="피처 추출 프로세스 수 (0=CPU 코어 수, 1=순차)")
+    parser.add_argument("--no_cache", action="store_true", help="피처 캐시를 쓰지 않고 매번 새로 추출")
+    parser.add_argument("--frame_period", type=float, default=1.0, help="파일명에 timestamp가 없을 때 프레임 간격(초)")
 
     parser.add_argument("--pick_std", type=float, default=defaults.pick_std_threshold)
     parser.add_argument("--dual_conf", type=float, default=defaults.dual_conf_threshold)
     parser.add_argument("--model", type=str, default=defaults.gemini_model)
     parser.add_argument("--state_buf", type=int, default=defaults.state_buf_size)
     parser.add_argument("--dual_buf", type=int, default=defaults.dual_buf_size)
+    parser.add_argument("--min_conf", type=float, default=defaults.stable_min_confidence)
+    parser.add_argument("--min_dur", type=float, default=defaults.stable_min_duration)
 
     args = parser.parse_args()
 
     settings = Settings(
-        sleep_sec=args.sleep,
         state_buf_size=args.state_buf,
         dual_buf_size=args.dual_buf,
+        stable_min_duration=args.min_dur,
+        stable_min_confidence=args.min_conf,
         pick_std_threshold=args.pick_std,
         dual_conf_threshold=args.dual_conf,
         gemini_model=args.model,
@@ -80,24 +63,26 @@ def main() -> None:
         window_title=defaults.window_title,
     )
 
-    test_dir = PATHS.TEST_LOL_CLIENT_DIR / args.testset
-    if not test_dir.exists():
-        raise FileNotFoundError(f"테스트셋 폴더 없음: {test_dir}")
-
-    img_paths = list_images(test_dir)
-    if not img_paths:
-        raise FileNotFoundError(f"이미지 없음: {test_dir}")
-
-    # ----------------------
-    # Init (main.py와 동일)
-    # ----------------------
-    normalizer = TextNormalizer()
-    classifier = StateClassifier()
-
-    state_buf = StateBuffer(size=settings.state_buf_size)
-    dual_buf = StateBuffer(size=settings.dual_buf_size)
-
-    state_manager = StableStateManager(min_duration=1.0, min_confidence=0.7)
+    pack = None
+    if args.pack:
+        pack = RoiPack(args.pack)
+        source_label = args.pack
+        total = min(len(pack), args.limit) if args.limit else len(pack)
+    else:
+        if not args.testset:
+            parser.error("--testset 또는 --pack 필요")
+
+        test_dir = PATHS.TEST_LOL_CLIENT_DIR / args.testset
+        if not test_dir.exists():
+            raise FileNotFoundError(f"테스트셋 폴더 없음: {test_dir}")
+
+        img_paths = list_images(test_dir)
+        if not img_paths:
+            raise FileNotFoundError(f"이미지 없음: {test_dir}")
+        if args.limit:
+            img_paths = img_paths[: args.limit]
+        source_label = test_dir
+        total = len(img_paths)
 
     pick_coach_client = None
     playplan_coach_client = None
@@ -105,116 +90,85 @@ def main() -> None:
         pick_coach_client = get_client()
         playplan_coach_client = get_playplan_coach_client()
 
-    pick_real_executed = False
-
-    print(f"📁 OFFLINE testset: {test_dir}")
-    print(f"🖼 frames: {len(img_paths)} | no_api={args.no_api} | sleep={settings.sleep_sec}")
+    print(f"📁 OFFLINE testset: {source_label}")
+    print(f"🖼 frames: {total} | no_api={args.no_api} | workers={args.workers or 'auto'}")
     print("====================================")
 
-    processed = 0
-
     # ----------------------
-    # Frame iteration
+    # 1) 프레임별 피처 (캐시 hit이면 재사용, 나머지만 병렬 추출)
     # ----------------------
-    for idx, frame_path in enumerate(img_paths, start=1):
-        if args.limit and processed >= args.limit:
-            break
-
-        frame_img = open_rgb(frame_path)
-        window_size = frame_img.size
+    t0 = time.perf_counter()
+    if pack is not None:
+        # 팩은 이미 ROI만 들어 있어 디코드 비용이 없으므로 캐시 없이 바로 계산
+        features = extract_features_from_pack(args.pack, limit=args.limit, workers=args.workers)
+        hits = 0
+    elif args.no_cache:
+        features = extract_features_parallel(img_paths, workers=args.workers)
+        hits = 0
+    else:
+        features, hits = load_or_extract_features(img_paths, FeatureStore(), workers=args.workers)
+    extract_s = time.perf_counter() - t0
+    print(f"⚙ features: {len(features)} frames (cache hit {hits}) in {extract_s:.2f}s")
 
-        rois = extract_rois(frame_img, window_size)
-
-        status_text_raw = extract_text(rois.status_img)
-        status_text_norm = normalizer.normalize(status_text_raw)
-        raw_state = classifier.classify(status_text_norm)
-
-        state_buf.push(raw_state)
-        major_state = state_buf.get_majority()
-        major_conf = state_buf.get_confidence()
+    # ----------------------
+    # 2) 상태 머신 순차 재생
+    # ----------------------
+    processed = 0
+    replay = FeatureReplay(settings, frame_period_sec=args.frame_period)
 
-        stable_state = state_manager.update(major_state, major_conf)
+    for feat, res in replay.run(features):
+        processed += 1
 
-        print(f"\n#[{idx:04d}] {frame_path.name}")
+        print(f"\n#[{feat.index:04d}] {feat.name}")
         print(
-            f" OCR='{status_text_raw}' | norm='{status_text_norm}'"
-            f" | raw={raw_state} | major={major_state}({major_conf:.2f}) | stable={stable_state}"
+            f" OCR='{feat.status_text_raw}' | norm='{feat.status_text_norm}'"
+            f" | raw={res.raw_state} | major={res.major_state}({res.major_conf:.2f}) | stable={res.stable_state}"
         )
 
-        # ----------------------
-        # State actions
-        # ----------------------
-        if stable_state == "PICK":
-            if raw_state == "BAN" or pick_real_executed:
-                processed += 1
-                time.sleep(settings.sleep_sec)
-                continue
-
-            pick_res = detect_pick_kind_from_banned_strips(
-                rois.bans_my_img,
-                rois.bans_enemy_img,
-                std_threshold=settings.pick_std_threshold,
-            )
-            print(f"[PICK] 판정: kind={pick_res.kind} std={pick_res.std:.2f}")
-
-            if pick_res.kind == "PICK_REAL":
-                if args.no_api:
-                    print("[PICK] (no_api) 호출 생략")
-                else:
-                    try:
-                        run_streaming(
-                            "PICK_COACH",
-                            lol_mid_pick_coach_stream(
-                                rois.picks_merged_img,
-                                client=pick_coach_client,
-                                model=settings.gemini_model,
-                            ),
-                        )
-                    except Exception as e:
-                        print("[ERR] Gemini 호출 실패:", repr(e))
-
-                pick_real_executed = True
-                processed += 1
-                time.sleep(settings.sleep_sec)
-                continue
-
-        elif stable_state == "PREPARE":
-            dual_now = is_dual_timer_effective(
-                timer_bar_img=rois.timer_bar_img,
-                timer_digits_img=rois.timer_digits_img,
-            )
+        if res.pick_res is not None:
+            print(f"[PICK] 판정: kind={res.pick_res.kind} std={res.pick_res.std:.2f}")
 
-            dual_buf.push(dual_now)
-            dual_stable = dual_buf.get_majority()
-            dual_conf = dual_buf.get_confidence()
+        if res.dual_now is not None:
+            print(f"[PREPARE] DualEffective: now={res.dual_now} stable={res.dual_stable} ({res.dual_conf:.2f})")
 
-            print(f"[PREPARE] DualEffective: now={dual_now} stable={dual_stable} ({dual_conf:.2f})")
+        if res.action is None:
+            continue
 
-            if dual_stable and dual_conf >= settings.dual_conf_threshold:
-                print("[PREPARE] 모든 챔피언 픽 완료 (stable)")
+        if res.action == ACTION_PLAYPLAN_COACH:
+            print("[PREPARE] 모든 챔피언 픽 완료 (stable)")
 
-                if args.no_api:
-                    print("[PREPARE] (no_api) 호출 생략")
-                else:
-                    run_streaming(
-                        "PLAYPLAN_COACH",
-                        lol_playplan_stream(
-                            rois.picks_merged_img,
-                            client=playplan_coach_client,
-                            model=settings.gemini_model,
-                        ),
-                    )
-                break
+        if args.no_api:
+            print(f"[{res.action}] (no_api) 호출 생략")
+            continue
 
+        if pack is not None:
+            picks_img = pack.rois(feat.index - 1).picks_merged_img
         else:
-            dual_buf.reset()
-
-        processed += 1
-        time.sleep(settings.sleep_sec)
+            frame_img = open_rgb(img_paths[feat.index - 1])
+            picks_img = extract_rois(frame_img, frame_img.size).picks_merged_img
+
+        if res.action == ACTION_PICK_COACH:
+            try:
+                run_streaming(
+                    "PICK_COACH",
+                    open_pick_coach_stream(settings, picks_img, client=pick_coach_client),
+                    parser=PickCoachParser(),
+                )
+            except Exception as e:
+                print("[ERR] Gemini 호출 실패:", repr(e))
+        else:
+            run_streaming(
+                "PLAYPLAN_COACH",
+                lol_playplan_stream(
+                    picks_img,
+                    client=playplan_coach_client,
+                    model=settings.gemini_model,
+                ),
+            )
 
     print("\n====================================")
-    print(f"✅ OFFLINE DONE. processed={processed} / total={len(img_paths)}")
+    print(f"✅ OFFLINE DONE. processed={processed} / total={total}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+# ======================
+# Standard library
+# ======================
+import argparse
+import time
+
+from app.session_pool import SessionPool, SessionSpec
+from app.settings import Settings
+
+# ======================
+# Local modules
+# ======================
+from config.path import PATHS
+
+
+# ======================
+# Main
+# ======================
+def main() -> None:
+    defaults = Settings()
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--testsets", nargs="+", required=True, help="lol_client 하위 테스트셋 폴더명들"
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="테스트셋마다 세션 몇 개씩 돌릴지")
+    parser.add_argument("--workers", type=int, default=0, help="프로세스 수 (0=CPU 코어 수)")
+    parser.add_argument("--limit", type=int, default=0)
+    parser.add_argument("--api", action="store_true", help="코치(Gemini) 호출까지 실행")
+
+    parser.add_argument("--pick_std", type=float, default=defaults.pick_std_threshold)
+    parser.add_argument("--dual_conf", type=float, default=defaults.dual_conf_threshold)
+    parser.add_argument("--state_buf", type=int, default=defaults.state_buf_size)
+    parser.add_argument("--dual_buf", type=int, default=defaults.dual_buf_size)
+
+    args = parser.parse_args()
+
+    settings = Settings(
+        state_buf_size=args.state_buf,
+        dual_buf_size=args.dual_buf,
+        pick_std_threshold=args.pick_std,
+        dual_conf_threshold=args.dual_conf,
+    )
+
+    specs = []
+    for testset in args.testsets:
+        test_dir = PATHS.TEST_LOL_CLIENT_DIR / testset
+        if not test_dir.exists():
+            raise FileNotFoundError(f"테스트셋 폴더 없음: {test_dir}")
+        for r in range(args.repeat):
+            specs.append(
+                SessionSpec(
+                    session_id=f"{testset}#{r}",
+                    source_dir=test_dir,
+                    settings=settings,
+                    no_api=not args.api,
+                    limit=args.limit,
+                )
+            )
+
+    pool = SessionPool(max_workers=args.workers or None)
+
+    print(f"🧵 sessions: {len(specs)} | workers: {pool.max_workers}")
+    print("====================================")
+
+    t0 = time.perf_counter()
+    reports = pool.run(specs)
+    wall = time.perf_counter() - t0
+
+    total_frames = 0
+    for rep in reports:
+        m = rep.metrics
+        total_frames += m.get("frames", 0)
+        print(
+            f"[{rep.session_id}] pid={rep.worker_pid} frames={m.get('frames', 0)}"
+            f" changed={m.get('changed_frames', 0)} fps={m.get('fps', 0.0):.1f}"
+            f" ms/frame={m.get('ms_per_frame', 0.0):.1f} final={rep.final_state}"
+            f" actions={rep.actions}"
+        )
+        if rep.error:
+            print(f"   ❌ error: {rep.error}")
+
+    print("\n====================================")
+    print(f"✅ SESSIONS DONE. frames={total_frames} wall={wall:.2f}s fps={total_frames / wall:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+# ======================
+# Standard library
+# ======================
+import argparse
+import csv
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Tuple
+
+from app.feature_store import FeatureStore, load_or_extract_features
+from app.frame_source import list_images
+from app.settings import Settings
+from app.sweep import NO_DECISION, SweepGrid, sweep
+
+# ======================
+# Local modules
+# ======================
+from config.path import PATHS
+
+
+# ======================
+# Helpers
+# ======================
+def parse_values(spec: str, cast=float) -> Tuple:
+    """
+    "20,30,40" 또는 "20:40:5" (start:stop:step, stop 포함) -> 값 튜플
+    """
+    if ":" in spec:
+        start, stop, step = (float(x) for x in spec.split(":"))
+        n = int(round((stop - start) / step)) + 1
+        return tuple(cast(round(start + i * step, 6)) for i in range(n))
+    return tuple(cast(x) for x in spec.split(","))
+
+
+def fmt_frame(idx: int) -> str:
+    return "-" if idx == NO_DECISION else f"{idx:04d}"
+
+
+# ======================
+# Main
+# ======================
+def main() -> None:
+    d = Settings()
+
+    parser = argparse.ArgumentParser(
+        description="캐시된 프레임 피처로 임계값/버퍼 크기 그리드 스윕"
+    )
+    parser.add_argument("--testset", required=True)
+    parser.add_argument("--limit", type=int, default=0)
+    parser.add_argument(
+        "--workers", type=int, default=0, help="캐시 miss 프레임 피처 추출 프로세스 수"
+    )
+    parser.add_argument(
+        "--frame_period",
+        type=float,
+        default=1.0,
+        help="파일명에 timestamp가 없을 때 프레임 간격(초)",
+    )
+    parser.add_argument("--out", type=Path, default=None, help="조합별 결과 CSV 경로")
+    parser.add_argument("--top", type=int, default=15, help="출력할 결과 그룹 수")
+
+    parser.add_argument("--state_buf", default=str(d.state_buf_size))
+    parser.add_argument("--min_conf", default=str(d.stable_min_confidence))
+    parser.add_argument("--min_dur", default=str(d.stable_min_duration))
+    parser.add_argument("--pick_std", default=str(d.pick_std_threshold))
+    parser.add_argument("--dual_buf", default=str(d.dual_buf_size))
+    parser.add_argument("--dual_conf", default=str(d.dual_conf_threshold))
+
+    args = parser.parse_args()
+
+    grid = SweepGrid(
+        state_buf_size=parse_values(args.state_buf, int),
+        stable_min_confidence=parse_values(args.min_conf),
+        stable_min_duration=parse_values(args.min_dur),
+        pick_std_threshold=parse_values(args.pick_std),
+        dual_buf_size=parse_values(args.dual_buf, int),
+        dual_conf_threshold=parse_values(args.dual_conf),
+    )
+
+    test_dir = PATHS.TEST_LOL_CLIENT_DIR / args.testset
+    img_paths = list_images(test_dir) if test_dir.exists() else []
+    if not img_paths:
+        raise FileNotFoundError(f"이미지 없음: {test_dir}")
+    if args.limit:
+        img_paths = img_paths[: args.limit]
+
+    print(f"📁 SWEEP testset: {test_dir}")
+    print(f"🧮 combinations: {grid.size}")
+
+    t0 = time.perf_counter()
+    features, hits = load_or_extract_features(img_paths, FeatureStore(), workers=args.workers)
+    print(
+        f"⚙ features: {len(features)} frames (cache hit {hits}) in {time.perf_counter() - t0:.2f}s"
+    )
+
+    t0 = time.perf_counter()
+    res = sweep(features, grid, frame_period_sec=args.frame_period)
+    sweep_s = time.perf_counter() - t0
+    print(f"⚡ sweep: {len(res)} combos in {sweep_s:.3f}s")
+    print("====================================")
+
+    # ----------------------
+    # (PICK 결정 프레임, PLAYPLAN 결정 프레임)별 조합 수
+    # ----------------------
+    outcomes = Counter(zip(res.pick_frame.tolist(), res.playplan_frame.tolist()))
+    names = {f.index: f.name for f in features}
+    for (pick, plan), n in outcomes.most_common(args.top):
+        print(
+            f" PICK_REAL@{fmt_frame(pick)} {names.get(pick, '')}"
+            f" | PLAYPLAN@{fmt_frame(plan)} {names.get(plan, '')} | combos={n}"
+        )
+
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        with args.out.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(
+                f, fieldnames=list(res.params) + ["pick_frame", "playplan_frame"]
+            )
+            writer.writeheader()
+            writer.writerows(res.rows())
+        print(f"\n💾 saved: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,12 @@ from config.roi import ROI
 from core.lol_pick_coach import get_client, lol_mid_pick_coach_stream
 from core.lol_playplan_coach import get_playplan_coach_client, lol_playplan_stream
 from core.ocr_engine import extract_text
+from core.roi_layout import (
+    ENEMY_TEAM_PICK_SLOTS,
+    MY_TEAM_PICK_SLOTS,
+    MY_TEAM_POS_SLOTS,
+    get_roi_layout,
+)
 from core.roi_manager import crop_roi_relative_xy
 from pipeline.buffer import StateBuffer
 from pipeline.classifier import StateClassifier
@@ -97,35 +103,13 @@ def merge_images_vertical(images: List[Image.Image], bg_color=(255, 255, 255)) -
 
 
 def crop_picked_champs_texts_area(img: Image.Image, window_size: tuple[int, int]):
-    my_picked_1 = crop_roi_relative_xy(img, window_size, ROI.MY_TEAM_PICK1)
-    my_picked_2 = crop_roi_relative_xy(img, window_size, ROI.MY_TEAM_PICK2)
-    my_picked_3 = crop_roi_relative_xy(img, window_size, ROI.MY_TEAM_PICK3)
-    my_picked_4 = crop_roi_relative_xy(img, window_size, ROI.MY_TEAM_PICK4)
-    my_picked_5 = crop_roi_relative_xy(img, window_size, ROI.MY_TEAM_PICK5)
-    enemy_picked_1 = crop_roi_relative_xy(img, window_size, ROI.ENEMY_TEAM_PICK1)
-    enemy_picked_2 = crop_roi_relative_xy(img, window_size, ROI.ENEMY_TEAM_PICK2)
-    enemy_picked_3 = crop_roi_relative_xy(img, window_size, ROI.ENEMY_TEAM_PICK3)
-    enemy_picked_4 = crop_roi_relative_xy(img, window_size, ROI.ENEMY_TEAM_PICK4)
-    enemy_picked_5 = crop_roi_relative_xy(img, window_size, ROI.ENEMY_TEAM_PICK5)
-    my_pos_1 = crop_roi_relative_xy(img, window_size, ROI.MY_TEAM_POS1)
-    my_pos_2 = crop_roi_relative_xy(img, window_size, ROI.MY_TEAM_POS2)
-    my_pos_3 = crop_roi_relative_xy(img, window_size, ROI.MY_TEAM_POS3)
-    my_pos_4 = crop_roi_relative_xy(img, window_size, ROI.MY_TEAM_POS4)
-    my_pos_5 = crop_roi_relative_xy(img, window_size, ROI.MY_TEAM_POS5)
-
-    my_list = [
-        my_pos_1,
-        my_picked_1,
-        my_pos_2,
-        my_picked_2,
-        my_pos_3,
-        my_picked_3,
-        my_pos_4,
-        my_picked_4,
-        my_pos_5,
-        my_picked_5,
-    ]
-    enemy_list = [enemy_picked_1, enemy_picked_2, enemy_picked_3, enemy_picked_4, enemy_picked_5]
+    layout = get_roi_layout(window_size)
+    my_picks = [layout.crop(img, name) for name in MY_TEAM_PICK_SLOTS]
+    my_poses = [layout.crop(img, name) for name in MY_TEAM_POS_SLOTS]
+
+    # 포지션 -> 픽 순서로 슬롯마다 번갈아 쌓는다
+    my_list = [slot_img for pair in zip(my_poses, my_picks) for slot_img in pair]
+    enemy_list = [layout.crop(img, name) for name in ENEMY_TEAM_PICK_SLOTS]
 
     my_picked_merge = merge_images_vertical(images=my_list)
     enemy_picked_merge = merge_images_vertical(images=enemy_list)
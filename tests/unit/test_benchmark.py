@@ -0,0 +1,86 @@
+import json
+
+from PIL import Image
+
+from app.benchmark import benchmark_session, load_transition_labels, summarize
+from app.frame_source import ImageDirFrameSource
+from app.settings import Settings
+
+# 프레임 전체 색(R)으로 status OCR 결과를 흉내 낸다
+STATE_COLOR = {"BAN": 40, "PICK": 120, "PREPARE": 200}
+COLOR_TEXT = {40: "금지할 챔피언", 120: "챔피언을 선택하세요", 200: "장비를 준비하세요"}
+
+
+def fake_ocr(img):
+    return COLOR_TEXT.get(img.getpixel((0, 0))[0], "")
+
+
+def make_testset(tmp_path, states, glitch=None):
+    """states 순서대로 1초 간격 프레임 저장 + transitions.json"""
+    names = []
+    for i, state in enumerate(states):
+        color = STATE_COLOR[glitch[1]] if glitch and i == glitch[0] else STATE_COLOR[state]
+        name = f"lol_client_{1770000000000 + i * 1000}.png"
+        Image.new("RGB", (1600, 900), (color, 40, 40)).save(tmp_path / name)
+        names.append(name)
+
+    transitions = []
+    for i in range(1, len(states)):
+        if states[i] != states[i - 1]:
+            transitions.append({"state": states[i], "frame": names[i]})
+    (tmp_path / "transitions.json").write_text(
+        json.dumps({"initial": states[0], "transitions": transitions})
+    )
+
+
+def run(tmp_path, settings=Settings()):
+    labels = load_transition_labels(tmp_path)
+    return benchmark_session("t", ImageDirFrameSource(tmp_path), labels, settings)
+
+
+def test_transition_latency_uses_virtual_clock(monkeypatch, tmp_path):
+    import app.session as session_mod
+
+    monkeypatch.setattr(session_mod, "extract_text", fake_ocr)
+    make_testset(tmp_path, ["BAN"] * 5 + ["PICK"] * 10)
+
+    bench = run(tmp_path)
+    assert bench.frames == 15
+    (t,) = bench.transitions
+    assert t["state"] == "PICK"
+    # state_buf=7에서 min_confidence(0.7)를 넘으려면 PICK 5/7 필요 -> 라벨 이후 4프레임(4초) 뒤
+    assert t["latency_frames"] == 4
+    assert t["latency_s"] == 4.0
+    assert bench.false_triggers == []
+    assert set(bench.frame_ms) == {"mean", "p50", "p95", "max"}
+
+
+def test_false_trigger_and_missed_transition(monkeypatch, tmp_path):
+    import app.session as session_mod
+
+    monkeypatch.setattr(session_mod, "extract_text", fake_ocr)
+    # PICK이 잠깐 나온 뒤 라벨에 없는 PREPARE를 stable로 넘기도록 buffer 1, duration 0
+    make_testset(tmp_path, ["BAN"] * 4 + ["PICK"] * 4, glitch=(1, "PREPARE"))
+
+    settings = Settings(state_buf_size=1, stable_min_duration=0.0)
+    bench = run(tmp_path, settings)
+
+    kinds = [(f["kind"], f["state"], f["truth"]) for f in bench.false_triggers]
+    assert ("state", "PREPARE", "BAN") in kinds
+
+    summary = summarize([bench])
+    assert summary["false_triggers"] >= 1
+    assert summary["transition_latency"]["PICK"]["missed"] == 0
+
+
+def test_mixed_timestamped_and_plain_names_do_not_abort(monkeypatch, tmp_path):
+    import app.session as session_mod
+
+    monkeypatch.setattr(session_mod, "extract_text", fake_ocr)
+    make_testset(tmp_path, ["BAN"] * 3 + ["PICK"] * 8)
+    # timestamp 없는 파일이 이름순으로 뒤에 섞여 있어도 (순번 * period는 훨씬 이른 시각)
+    Image.new("RGB", (1600, 900), (STATE_COLOR["PICK"], 40, 40)).save(tmp_path / "zz_extra.png")
+
+    bench = run(tmp_path)
+    assert bench.frames == 12
+    assert [t["state"] for t in bench.transitions] == ["PICK"]
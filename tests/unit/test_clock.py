@@ -0,0 +1,69 @@
+import pytest
+
+from app.features import FrameFeatures
+from app.session import DraftSession
+from app.settings import Settings
+from core.clock import FrameTimeline, VirtualClock
+from pipeline.state_manager import StableStateManager
+
+
+def make_feat(index, raw_state):
+    return FrameFeatures(
+        index=index,
+        name=f"{index}.png",
+        ts=None,
+        status_text_raw=raw_state,
+        status_text_norm=raw_state,
+        raw_state=raw_state,
+        ban_std=45.0,
+        timer_seconds=None,
+        timer_near_zero=False,
+        dual_symmetry=True,
+    )
+
+
+def test_virtual_clock_sleep_and_set():
+    clock = VirtualClock(10.0)
+    clock.sleep(0.5)
+    assert clock.now() == 10.5
+
+    clock.set(12.0)
+    assert clock.now() == 12.0
+    with pytest.raises(ValueError):
+        clock.set(11.0)
+
+
+def test_frame_timeline_never_goes_backwards():
+    timeline = FrameTimeline(period=0.5)
+    assert timeline.next(None, 1) == 0.5  # 첫 프레임은 순번 * period
+    assert timeline.next(100.0, 2) == 100.0
+    assert timeline.next(None, 3) == 100.5  # timestamp 없는 프레임은 직전 + period
+    assert timeline.next(90.0, 4) is None  # 뒤로 가는 timestamp는 건너뜀
+    assert timeline.next(101.0, 5) == 101.0
+
+
+def test_state_manager_uses_injected_clock():
+    clock = VirtualClock(100.0)
+    sm = StableStateManager(min_duration=1.0, min_confidence=0.5, clock=clock)
+
+    assert sm.update("BAN", 1.0) == "BAN"
+    clock.sleep(0.5)
+    assert sm.update("PICK", 1.0) == "BAN"  # min_duration 미달
+    clock.sleep(0.5)
+    assert sm.update("PICK", 1.0) == "PICK"
+
+
+def test_virtual_clock_replay_matches_explicit_timestamps():
+    """clock을 프레임 시각으로 맞추는 것과 now=를 직접 넘기는 것은 같은 결정을 낸다"""
+    states = ["BAN"] * 4 + ["PICK"] * 6 + ["PREPARE"] * 10
+    times = [i * 0.4 for i in range(len(states))]
+
+    clock = VirtualClock()
+    with_clock = DraftSession(Settings(), clock=clock)
+    explicit = DraftSession(Settings())
+
+    for i, (state, t) in enumerate(zip(states, times), start=1):
+        clock.set(t)
+        a = with_clock.step_features(make_feat(i, state))
+        b = explicit.step_features(make_feat(i, state), now=t)
+        assert a == b
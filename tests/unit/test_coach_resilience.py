@@ -0,0 +1,170 @@
+import pytest
+
+from core.clock import VirtualClock
+from core.coach_resilience import (
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    CoachGuard,
+    Deadline,
+    DeadlineExceeded,
+    ResilienceConfig,
+)
+
+
+class FlakyEndpoint:
+    """fail_first번은 첫 토큰 전에 실패, 이후 deltas를 낸다. 시도마다 받은 timeout 기록"""
+
+    def __init__(self, fail_first=0, deltas=("a", "b"), fail_after_first=False):
+        self.fail_first = fail_first
+        self.deltas = deltas
+        self.fail_after_first = fail_after_first
+        self.timeouts = []
+
+    def __call__(self, timeout_s):
+        self.timeouts.append(timeout_s)
+        return self._gen(len(self.timeouts))
+
+    def _gen(self, attempt):
+        if attempt <= self.fail_first:
+            raise ConnectionError(f"503 #{attempt}")
+        for d in self.deltas:
+            yield d
+        if self.fail_after_first:
+            raise ConnectionError("stream reset")
+
+
+def test_breaker_trips_and_recovers_through_half_open():
+    clock = VirtualClock()
+    b = CircuitBreaker(failure_threshold=2, open_sec=10.0, clock=clock)
+
+    b.record_failure(RuntimeError("x"))
+    assert b.state == BREAKER_CLOSED
+    b.record_failure(RuntimeError("x"))
+    assert b.state == BREAKER_OPEN and b.is_open
+    assert not b.allow()
+    assert b.stats().rejected == 1
+
+    clock.sleep(10.0)
+    assert b.state == BREAKER_HALF_OPEN
+    assert b.allow()  # 시험 호출 1개
+    assert not b.allow()  # 시험 호출 중에는 막힘
+    b.record_success()
+    assert b.state == BREAKER_CLOSED
+    assert b.stats().trips == 1
+
+
+def test_half_open_probe_failure_reopens():
+    clock = VirtualClock()
+    b = CircuitBreaker(failure_threshold=3, open_sec=5.0, clock=clock)
+    for _ in range(3):
+        b.record_failure(RuntimeError("x"))
+    clock.sleep(5.0)
+    assert b.allow()
+    b.record_failure(RuntimeError("again"))
+    assert b.state == BREAKER_OPEN
+    assert b.retry_after() == pytest.approx(5.0)
+    assert b.stats().trips == 2
+
+
+def test_guard_retries_before_first_token():
+    clock = VirtualClock()
+    guard = CoachGuard(ResilienceConfig(max_attempts=3, backoff_sec=0.5), clock=clock)
+    endpoint = FlakyEndpoint(fail_first=2)
+
+    assert "".join(guard.stream(endpoint, Deadline.after(30.0, clock))) == "ab"
+    assert len(endpoint.timeouts) == 3
+    assert clock.now() == pytest.approx(0.5 + 1.0)  # 백오프 2배
+    assert guard.stats().retries == 2
+    assert guard.breaker.state == BREAKER_CLOSED
+
+
+def test_retry_skipped_when_it_cannot_finish_before_deadline():
+    clock = VirtualClock()
+    guard = CoachGuard(ResilienceConfig(expected_call_sec=6.0), clock=clock)
+    endpoint = FlakyEndpoint(fail_first=1)
+
+    with pytest.raises(ConnectionError):
+        list(guard.stream(endpoint, Deadline.after(4.0, clock)))
+    assert len(endpoint.timeouts) == 1
+    assert guard.stats().retries_skipped == 1
+
+
+def test_attempt_timeout_is_capped_by_remaining_time():
+    clock = VirtualClock()
+    guard = CoachGuard(ResilienceConfig(attempt_timeout_sec=20.0), clock=clock)
+    endpoint = FlakyEndpoint()
+
+    list(guard.stream(endpoint, Deadline.after(7.5, clock)))
+    list(guard.stream(endpoint))
+    assert endpoint.timeouts == [7.5, 20.0]
+
+
+def test_no_retry_after_output_started():
+    guard = CoachGuard(ResilienceConfig(max_attempts=3), clock=VirtualClock())
+    endpoint = FlakyEndpoint(fail_after_first=True)
+
+    out = []
+    with pytest.raises(ConnectionError):
+        for d in guard.stream(endpoint):
+            out.append(d)
+    assert out == ["a", "b"]
+    assert len(endpoint.timeouts) == 1
+
+
+def test_expired_deadline_skips_call():
+    clock = VirtualClock()
+    guard = CoachGuard(clock=clock)
+    endpoint = FlakyEndpoint()
+
+    with pytest.raises(DeadlineExceeded):
+        list(guard.stream(endpoint, Deadline.after(-1.0, clock)))
+    assert endpoint.timeouts == []
+    assert guard.stats().deadline_misses == 1
+
+
+def test_open_breaker_rejects_without_calling():
+    clock = VirtualClock()
+    guard = CoachGuard(
+        ResilienceConfig(max_attempts=1, failure_threshold=2, open_sec=30.0), clock=clock
+    )
+    endpoint = FlakyEndpoint(fail_first=10)
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            list(guard.stream(endpoint))
+    with pytest.raises(CircuitOpenError):
+        list(guard.stream(endpoint))
+    assert len(endpoint.timeouts) == 2
+    assert guard.breaker.stats().rejected == 1
+
+
+def test_probe_slot_released_when_consumer_closes_before_first_token():
+    clock = VirtualClock()
+    b = CircuitBreaker(failure_threshold=1, open_sec=1.0, clock=clock)
+    b.record_failure(RuntimeError("x"))
+    clock.sleep(1.0)
+    guard = CoachGuard(breaker=b, clock=clock)
+
+    it = guard.stream(FlakyEndpoint())
+    next(it)  # 첫 토큰 -> 성공 기록
+    it.close()
+    assert b.state == BREAKER_CLOSED
+
+    b.record_failure(RuntimeError("x"))
+    clock.sleep(1.0)
+    assert b.allow() and b.is_open
+    b.release()
+    assert not b.is_open
+
+
+def test_pick_deadline_uses_timer_or_fallback():
+    from app.settings import Settings
+    from app.streaming import pick_deadline
+
+    clock = VirtualClock(100.0)
+    s = Settings(coach_deadline_margin_sec=3.0, pick_time_fallback_sec=20.0)
+    assert pick_deadline(s, 25, clock).remaining() == pytest.approx(22.0)
+    assert pick_deadline(s, None, clock).remaining() == pytest.approx(17.0)
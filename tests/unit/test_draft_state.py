@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.session import DraftSession
+from app.settings import Settings
+from pipeline.draft_state import (
+    EMPTY_STATE,
+    NO_DIFF,
+    DraftState,
+    Reading,
+    advance_state,
+    diff_states,
+)
+from pipeline.pick_stage_detector import PickStageResult
+
+WINDOW_SIZE = (1600, 900)
+
+
+def fp(value):
+    return np.full((8, 64), value, dtype=np.uint8)
+
+
+def test_snapshot_is_immutable():
+    state = DraftState(phase=Reading("PICK", 0.9, 1.0))
+    with pytest.raises(AttributeError):
+        state.phase = Reading("BAN", 1.0, 2.0)
+    with pytest.raises(AttributeError):
+        state.phase.value = "BAN"
+
+    state = state.replace(picks=[fp(10)] + [None] * 9)
+    with pytest.raises(ValueError):
+        state.picks[0][0, 0] = 0  # 지문 배열도 읽기 전용
+
+
+def test_observe_keeps_object_and_onset_time():
+    r = Reading("PICK", 0.8, 1.0)
+    assert r.observe("PICK", 0.8, 2.0) is r
+
+    conf_only = r.observe("PICK", 0.9, 2.0)
+    assert conf_only is not r and conf_only.ts == 1.0
+
+    changed = r.observe("PREPARE", 0.9, 3.0)
+    assert changed.ts == 3.0 and changed.age(4.5) == 1.5
+
+
+def test_diff_reports_fields_and_slots():
+    prev = DraftState(phase=Reading("PICK", 1.0, 0.0), picks=[fp(0)] * 10)
+    cur = prev.replace(
+        phase=Reading("PICK", 0.7, 0.0),  # 신뢰도만 바뀜 -> diff 아님
+        dual=Reading(True, 0.8, 1.0),
+        picks=[fp(0)] * 3 + [fp(200)] + [fp(0)] * 6,
+        picks_locked=(False,) * 3 + (True,) + (False,) * 6,
+    )
+
+    diff = diff_states(prev, cur)
+    assert diff.fields == {"dual"}
+    assert diff.pick_slots == (3,) and diff.locked_slots == (3,) and diff.ban_slots == ()
+    assert "dual" in diff and "pick_slots" in diff and "phase" not in diff
+    assert diff_states(cur, cur) is NO_DIFF
+
+
+def test_slot_noise_is_not_a_diff_and_drift_is_anchored():
+    noisy = fp(100).copy()
+    noisy[0, 0] = 140  # 셀 1개(0.2%)만 튐 = 압축 노이즈
+
+    state, diff = advance_state(EMPTY_STATE, 0.0, picks=[fp(100)] * 10)
+    assert diff.pick_slots == tuple(range(10)) and state.seq == 1
+
+    same, diff = advance_state(state, 1.0, picks=[noisy] + [fp(100)] * 9)
+    assert not diff and same is state  # 바뀐 게 없으면 이전 스냅샷 그대로
+
+    # 조금씩 밀려도 기준 지문이 고정이라 누적되면 잡힌다
+    drift = fp(100)
+    drift[:, :2] = 200
+    nxt, diff = advance_state(state, 2.0, picks=[drift] + [fp(100)] * 9)
+    assert diff.pick_slots == (0,) and nxt.seq == 2 and nxt.ts == 2.0
+    assert nxt.picks[1] is state.picks[1]
+
+
+def test_session_publishes_state_only_on_change(monkeypatch):
+    from app import session as mod
+
+    monkeypatch.setattr(mod, "extract_text", lambda img: "챔피언을 선택하세요")
+    monkeypatch.setattr(
+        mod,
+        "detect_pick_kind_from_banned_strips",
+        lambda my, enemy, std_threshold=0.0: PickStageResult(kind="PICK_REAL", std=99.0),
+    )
+    session = DraftSession(Settings(draft_state_slots=True), digits_ocr=lambda img: "24")
+    frame = Image.new("RGB", WINDOW_SIZE, (30, 30, 30))
+
+    res = session.step(frame, WINDOW_SIZE, now=0.0)
+    state = res.draft_state
+    assert {"phase", "raw_phase", "pick_kind", "timer_seconds"} <= res.draft_diff.fields
+    assert state.phase.value == "PICK" and state.pick_kind.value == "PICK_REAL"
+    assert state.timer_seconds.value == 24 and state.timer_seconds.ts == 0.0
+    # 밴 strip은 픽 종류 판정이 이미 잘랐고, 픽 패널은 아무도 안 잘랐다 (지문 때문에 새로 자르지 않음)
+    assert all(b is not None for b in state.bans) and all(p is None for p in state.picks)
+    assert "picks_my_img" not in session.rois.materialized()
+
+    res = session.step(frame, WINDOW_SIZE, now=0.5)
+    assert not res.draft_diff and res.draft_state is state
+
+
+def test_step_rois_with_partial_crops_fingerprints_only_sent_slots(monkeypatch):
+    from app import session as mod
+    from app.rois import Rois
+    from pipeline import prepare_phase_detector as ppd
+
+    monkeypatch.setattr(mod, "extract_text", lambda img: "장비를 준비하세요")
+    monkeypatch.setattr(ppd, "is_dual_sided_timer_cropped_symmetry", lambda img, cfg=None: True)
+
+    crops = {
+        "status_img": Image.new("RGB", (700, 60), (20, 20, 20)),
+        "picks_my_img": Image.new("RGB", (300, 500), (60, 40, 40)),
+        "picks_enemy_img": Image.new("RGB", (300, 500), (40, 40, 60)),
+        "timer_bar_img": Image.new("RGB", (700, 6), (20, 30, 50)),
+        "timer_digits_img": Image.new("RGB", (88, 44), (20, 20, 20)),
+    }
+    session = DraftSession(
+        Settings(draft_state_slots=True, stable_min_duration=0.0), digits_ocr=lambda img: "25"
+    )
+    res = session.step_rois(Rois.from_crops(crops), now=0.0)
+
+    # 밴 크롭은 안 보냈다 -> 요청하지 않고 비워 둔다, 픽은 보낸 패널에서 슬롯 지문
+    assert res.action == mod.ACTION_PLAYPLAN_COACH
+    assert all(b is None for b in res.draft_state.bans)
+    assert all(p is not None for p in res.draft_state.picks)
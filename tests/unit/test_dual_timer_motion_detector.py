@@ -0,0 +1,91 @@
+import numpy as np
+from PIL import Image, ImageDraw
+
+from app.session import ACTION_PLAYPLAN_COACH, DraftSession
+from app.settings import Settings
+from core.roi_layout import get_roi_layout
+from pipeline.dual_timer_motion_detector import DualTimerMotionDetector, bar_profile
+
+WINDOW_SIZE = (1600, 900)
+BAR_W = 700
+
+
+def make_bar(left_fill, right_fill, w=BAR_W, h=6):
+    """가운데로 줄어드는 바: 각 절반의 안쪽 left_fill/right_fill 만큼 칠함"""
+    img = Image.new("RGB", (w, h), (20, 30, 50))
+    draw = ImageDraw.Draw(img)
+    half = w * (0.5 - 0.0625)
+    if left_fill > 0:
+        draw.rectangle((int(half * (1 - left_fill)), 0, int(half) - 1, h - 1), fill=(200, 170, 90))
+    if right_fill > 0:
+        start = int(w - half)
+        draw.rectangle((start, 0, start + int(half * right_fill) - 1, h - 1), fill=(200, 170, 90))
+    return img
+
+
+def shrinking(left=True, right=True, frames=8, start=0.8, step=0.01):
+    for i in range(frames):
+        f = start - i * step
+        yield make_bar(f if left else 0.0, f if right else 0.0)
+
+
+def run(det, bars):
+    res = None
+    for bar in bars:
+        res = det.update(bar)
+    return res
+
+
+def test_profile_is_tiny():
+    assert bar_profile(make_bar(0.5, 0.5), bins=64).shape == (64,)
+    assert bar_profile(np.zeros((3, 20, 3), dtype=np.uint8), bins=64).shape == (64,)
+
+
+def test_both_sides_shrinking_is_dual():
+    det = DualTimerMotionDetector()
+    assert det.update(make_bar(0.9, 0.9)) is None  # 차이가 쌓이기 전
+    assert run(det, shrinking()) is True
+
+
+def test_one_side_shrinking_is_single():
+    assert run(DualTimerMotionDetector(), shrinking(left=False)) is False
+    assert run(DualTimerMotionDetector(), shrinking(right=False)) is False
+
+
+def test_static_or_empty_bar_is_undecided():
+    # 0초(빈 바) / 멈춘 바: dual인지 알 수 없다
+    assert run(DualTimerMotionDetector(), [make_bar(0.0, 0.0)] * 8) is None
+    assert run(DualTimerMotionDetector(), [make_bar(0.6, 0.6)] * 8) is None
+
+    # 칸당 1~2 정도 흔들리는 노이즈도 움직임 아님
+    rng = np.random.default_rng(0)
+    base = np.asarray(make_bar(0.6, 0.6)).astype(np.int16)
+    noisy = [
+        np.clip(base + rng.integers(-1, 2, base.shape), 0, 255).astype(np.uint8) for _ in range(8)
+    ]
+    assert run(DualTimerMotionDetector(), noisy) is None
+
+
+def test_session_motion_mode_needs_no_digits_ocr(monkeypatch):
+    from app import session as mod
+
+    monkeypatch.setattr(mod, "extract_text", lambda img: "장비를 준비하세요")
+
+    def digits_ocr(img):
+        raise AssertionError("motion 모드는 숫자 OCR을 안 쓴다")
+
+    layout = get_roi_layout(WINDOW_SIZE)
+    left, top, right, bottom = layout.rect("BANPICK_TIMER_BAR")
+    session = DraftSession(
+        Settings(dual_timer_mode="motion", stable_min_duration=0.0), digits_ocr=digits_ocr
+    )
+
+    res = None
+    for i, bar in enumerate(shrinking(frames=16, step=0.02)):
+        frame = Image.new("RGB", WINDOW_SIZE, (30, 30, 30))
+        frame.paste(bar.resize((right - left, bottom - top)), (left, top))
+        res = session.step(frame, WINDOW_SIZE, now=i * 0.1)
+        if res.action is not None:
+            break
+
+    assert res.action == ACTION_PLAYPLAN_COACH and res.dual_stable is True
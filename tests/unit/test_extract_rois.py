@@ -0,0 +1,52 @@
+import pytest
+from PIL import Image
+
+from app.rois import MissingCropError, Rois, extract_rois
+from config.roi import ROI
+from core.roi_manager import crop_roi_relative_xy
+
+
+def make_dummy_frame(w=1600, h=900, color=(10, 20, 30)):
+    return Image.new("RGB", (w, h), color)
+
+
+def test_rois_are_lazy():
+    """
+    status_img만 접근하면 나머지 크롭은 만들어지지 않아야 함
+    """
+    frame = make_dummy_frame()
+    rois = extract_rois(frame, frame.size)
+
+    assert rois.materialized() == ()
+
+    _ = rois.status_img
+    assert rois.materialized() == ("status_img",)
+
+
+def test_picks_merged_built_once():
+    """
+    picks_merged_img는 한 번 만든 뒤 같은 객체를 재사용
+    """
+    frame = make_dummy_frame()
+    rois = extract_rois(frame, frame.size)
+
+    first = rois.picks_merged_img
+    assert rois.picks_merged_img is first
+    assert first.width == rois.picks_my_img.width + rois.picks_enemy_img.width
+
+
+def test_lazy_crop_matches_relative_crop():
+    frame = make_dummy_frame(1280, 720)
+    rois = extract_rois(frame, frame.size)
+
+    expected = crop_roi_relative_xy(frame, frame.size, ROI.BANPICK_TIMER_DIGITS)
+    assert rois.timer_digits_img.size == expected.size
+    assert rois.timer_digits_img.tobytes() == expected.tobytes()
+
+
+def test_from_crops_missing_crop_is_named():
+    rois = Rois.from_crops({"status_img": make_dummy_frame(100, 20)})
+    assert rois.can_crop("status_img") and not rois.can_crop("timer_bar_img")
+
+    with pytest.raises(MissingCropError, match="timer_bar_img"):
+        _ = rois.timer_bar_img
@@ -0,0 +1,66 @@
+from PIL import Image
+
+from app.feature_store import FeatureStore, load_or_extract_features
+
+
+def make_frames(tmp_path, n=4):
+    paths = []
+    for i in range(n):
+        p = tmp_path / f"lol_client_{1770000000000 + i * 1000}.png"
+        Image.new("RGB", (1600, 900), (10 * i, 20, 30)).save(p)
+        paths.append(p)
+    return paths
+
+
+def patch_ocr(monkeypatch):
+    from app import features as mod
+
+    calls = {"n": 0}
+
+    def fake_ocr(img):
+        calls["n"] += 1
+        return "금지할 챔피언을 선택하세요"
+
+    monkeypatch.setattr(mod, "extract_text", fake_ocr)
+    return calls
+
+
+def test_second_run_hits_cache(monkeypatch, tmp_path):
+    calls = patch_ocr(monkeypatch)
+    (tmp_path / "frames").mkdir()
+    paths = make_frames(tmp_path / "frames")
+    store_path = tmp_path / "cache" / "features.npz"
+
+    first, hits1 = load_or_extract_features(paths, FeatureStore(store_path), workers=1)
+    assert hits1 == 0
+    assert calls["n"] == len(paths)
+
+    second, hits2 = load_or_extract_features(paths, FeatureStore(store_path), workers=1)
+    assert hits2 == len(paths)
+    assert calls["n"] == len(paths)  # OCR 다시 안 돌림
+    assert second == first
+
+
+def test_cache_keyed_by_content_not_name(monkeypatch, tmp_path):
+    """
+    같은 내용의 프레임을 다른 이름으로 복사해도 캐시 hit, index/name/ts는 새 경로 기준
+    """
+    patch_ocr(monkeypatch)
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    paths = make_frames(tmp_path / "a", n=2)
+    store = FeatureStore(tmp_path / "features.npz")
+    orig, _ = load_or_extract_features(paths, store, workers=1)
+
+    renamed = tmp_path / "b" / "lol_client_1780000000000.png"
+    renamed.write_bytes(paths[1].read_bytes())
+
+    feats, hits = load_or_extract_features(
+        [renamed], FeatureStore(tmp_path / "features.npz"), workers=1
+    )
+    assert hits == 1
+    assert feats[0].index == 1
+    assert feats[0].name == renamed.name
+    assert feats[0].ts == 1780000000.0
+    assert feats[0].raw_state == orig[1].raw_state
+    assert feats[0].ban_std == orig[1].ban_std
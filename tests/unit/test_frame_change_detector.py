@@ -0,0 +1,61 @@
+from PIL import Image, ImageDraw
+
+from core.roi_layout import get_roi_layout
+from pipeline.frame_change_detector import FrameChangeConfig, FrameChangeDetector
+
+WINDOW_SIZE = (1600, 900)
+
+
+def make_dummy_frame(color=(40, 40, 40)):
+    return Image.new("RGB", WINDOW_SIZE, color)
+
+
+def test_first_frame_is_changed():
+    det = FrameChangeDetector()
+    assert det.update(make_dummy_frame(), WINDOW_SIZE) is True
+
+
+def test_identical_frame_is_static():
+    det = FrameChangeDetector()
+    det.update(make_dummy_frame(), WINDOW_SIZE)
+    assert det.update(make_dummy_frame(), WINDOW_SIZE) is False
+
+
+def test_small_timer_bar_change_detected():
+    """
+    썸네일에서는 묻히는 타이머 바(몇 px 높이) 변화도 잡아야 함
+    """
+    det = FrameChangeDetector()
+    det.update(make_dummy_frame(), WINDOW_SIZE)
+
+    frame = make_dummy_frame()
+    left, top, right, bottom = get_roi_layout(WINDOW_SIZE).rect("BANPICK_TIMER_BAR")
+    ImageDraw.Draw(frame).rectangle((left, top, left + 20, bottom - 1), fill=(200, 60, 60))
+
+    assert det.update(frame, WINDOW_SIZE) is True
+
+
+def test_forced_refresh_after_max_static_frames():
+    det = FrameChangeDetector(FrameChangeConfig(max_static_frames=3))
+    det.update(make_dummy_frame(), WINDOW_SIZE)
+
+    results = [det.update(make_dummy_frame(), WINDOW_SIZE) for _ in range(3)]
+    assert results == [False, False, True]
+
+
+def test_reset_forces_change():
+    det = FrameChangeDetector()
+    det.update(make_dummy_frame(), WINDOW_SIZE)
+    det.reset()
+    assert det.update(make_dummy_frame(), WINDOW_SIZE) is True
+
+
+def test_slow_fade_is_detected_against_last_changed_frame():
+    """
+    프레임당 3씩(임계값 6 미만) 밝아지는 페이드도 누적되면 잡아야 함
+    """
+    det = FrameChangeDetector()
+    changed = [det.update(make_dummy_frame((v, v, v)), WINDOW_SIZE) for v in range(40, 220, 3)]
+
+    assert changed[0] is True
+    assert sum(changed) >= 25  # 대략 2프레임마다 1번
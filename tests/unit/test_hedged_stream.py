@@ -0,0 +1,124 @@
+import threading
+import time
+
+import pytest
+
+from core.hedged_stream import HedgedStream
+from core.pick_coach_parser import looks_like_recommendation
+
+
+class FakeModel:
+    """first_delay 뒤 첫 델타, 이후 gap 간격으로 deltas를 내는 가짜 스트림"""
+
+    def __init__(self, deltas, first_delay=0.0, gap=0.0, error=None):
+        self.deltas = deltas
+        self.first_delay = first_delay
+        self.gap = gap
+        self.error = error
+        self.opened = 0
+        self.closed = threading.Event()
+
+    def __call__(self):
+        self.opened += 1
+        return self._gen()
+
+    def _gen(self):
+        try:
+            time.sleep(self.first_delay)
+            if self.error is not None:
+                raise self.error
+            for i, d in enumerate(self.deltas):
+                if i:
+                    time.sleep(self.gap)
+                yield d
+        finally:
+            self.closed.set()
+
+
+def test_concurrent_race_picks_first_usable_and_cancels_loser():
+    strong = FakeModel(["Orianna - 9/10\n", "..."], first_delay=0.3)
+    fast = FakeModel(["Galio - 7/10\n", "라인전: a | 팀가치: b\n"], first_delay=0.01, gap=0.01)
+
+    race = HedgedStream([("pro", strong), ("flash", fast)], hedge_after_sec=0.0)
+    text = "".join(race)
+
+    assert text == "Galio - 7/10\n라인전: a | 팀가치: b\n"
+    assert race.winner == "flash"
+    assert strong.closed.wait(1.0)  # 첫 델타에서 멈추고 닫힘
+
+    by_name = {s.name: s for s in race.stats}
+    assert by_name["flash"].won and not by_name["flash"].cancelled
+    assert by_name["pro"].cancelled and not by_name["pro"].won
+
+
+def test_hedge_not_launched_when_primary_is_fast():
+    primary = FakeModel(["a", "b"], first_delay=0.0)
+    backup = FakeModel(["x"])
+
+    race = HedgedStream([("pro", primary), ("flash", backup)], hedge_after_sec=0.5)
+    assert "".join(race) == "ab"
+    assert backup.opened == 0
+    assert not race.hedged
+
+
+def test_hedge_launches_after_deadline():
+    primary = FakeModel(["slow"], first_delay=1.0)
+    backup = FakeModel(["quick"], first_delay=0.0)
+
+    t0 = time.perf_counter()
+    race = HedgedStream([("pro", primary), ("flash", backup)], hedge_after_sec=0.05)
+    assert "".join(race) == "quick"
+    assert time.perf_counter() - t0 < 0.5
+    assert race.hedged and race.winner == "flash"
+    assert race.stats[1].launched_at >= 0.05
+
+
+def test_failed_primary_launches_backup_immediately():
+    primary = FakeModel([], error=RuntimeError("503"))
+    backup = FakeModel(["ok"])
+
+    t0 = time.perf_counter()
+    race = HedgedStream([("pro", primary), ("flash", backup)], hedge_after_sec=5.0)
+    assert "".join(race) == "ok"
+    assert time.perf_counter() - t0 < 1.0
+    assert "503" in race.stats[0].error
+
+
+def test_all_racers_fail_raises():
+    race = HedgedStream(
+        [
+            ("pro", FakeModel([], error=RuntimeError("a"))),
+            ("flash", FakeModel([], error=ValueError("b"))),
+        ]
+    )
+    with pytest.raises((RuntimeError, ValueError)):
+        list(race)
+
+
+def test_usable_predicate_waits_for_recommendation_line():
+    # 머리말만 내는 모델보다 추천 제목 줄을 먼저 낸 모델이 이긴다
+    chatty = FakeModel(["네, 분석해 보겠습니다.\n", "Orianna - 8/10\n"], first_delay=0.0, gap=0.2)
+    direct = FakeModel(["Galio - 7/10\n"], first_delay=0.05)
+
+    race = HedgedStream([("pro", chatty), ("flash", direct)], is_usable=looks_like_recommendation)
+    assert "".join(race) == "Galio - 7/10\n"
+    assert race.winner == "flash"
+
+
+def test_no_usable_output_falls_back_to_first_finished_racer():
+    # 추천 제목 형식을 놓쳐도 빈 응답 대신 먼저 끝난 레이서 출력을 그대로
+    pro = FakeModel(["오리아나 - 8/10 ", "라인전 강함\n"], first_delay=0.05)
+    flash = FakeModel(["잘 모르겠습니다\n"], first_delay=0.2)
+
+    race = HedgedStream([("pro", pro), ("flash", flash)], is_usable=looks_like_recommendation)
+    assert "".join(race) == "오리아나 - 8/10 라인전 강함\n"
+    assert race.winner == "pro" and race.stats[0].won and race.stats[0].usable_s is None
+
+
+def test_early_close_stops_winner():
+    model = FakeModel(["a"] * 100, gap=0.01)
+    race = HedgedStream([("pro", model)])
+    it = iter(race)
+    assert next(it) == "a"
+    it.close()
+    assert model.closed.wait(1.0)
@@ -0,0 +1,151 @@
+from dataclasses import replace
+
+import cv2
+import pytest
+from PIL import Image
+
+from core import ocr_backends
+from core.ocr_backends import (
+    TEMPLATE_BACKEND,
+    GlyphTemplates,
+    TemplateMatchBackend,
+    get_backend,
+    register_backend,
+    render_text,
+)
+from core.ocr_engine import extract_text, extract_text_batch
+from core.ocr_profiles import STATUS_PROFILE, TIMER_DIGITS_PROFILE, get_profile, prepare
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    # 테스트에서 등록한 백엔드가 다른 테스트로 새지 않게
+    monkeypatch.setattr(ocr_backends, "OCR_BACKENDS", dict(ocr_backends.OCR_BACKENDS))
+    get_backend.cache_clear()
+    yield ocr_backends.OCR_BACKENDS
+    get_backend.cache_clear()
+
+
+class FakeBackend:
+    def __init__(self, name, answer, whitelist_only=False):
+        self.name = name
+        self.answer = answer
+        self.whitelist_only = whitelist_only
+        self.calls = 0
+
+    def supports(self, profile):
+        return bool(profile.whitelist) or not self.whitelist_only
+
+    def read(self, img, prepared):
+        self.calls += 1
+        return self.answer(img) if callable(self.answer) else self.answer
+
+    def read_with_conf(self, img, prepared):
+        return self.read(img, prepared), 90.0
+
+
+def digits_img(text, font=cv2.FONT_HERSHEY_SIMPLEX):
+    return Image.fromarray(render_text(text, font))
+
+
+def test_template_backend_reads_rendered_digits(registry):
+    digits = replace(get_profile(TIMER_DIGITS_PROFILE), backend=TEMPLATE_BACKEND)
+    for text in ("0", "7", "25", "30"):
+        for font in (cv2.FONT_HERSHEY_SIMPLEX, cv2.FONT_HERSHEY_DUPLEX):
+            assert extract_text(digits_img(text, font), digits) == text
+
+    # whitelist 없는 문장 프로필은 지원하지 않는다
+    assert not get_backend(TEMPLATE_BACKEND).supports(get_profile(STATUS_PROFILE))
+
+
+def test_fit_templates_roundtrip(tmp_path):
+    profile = get_profile(TIMER_DIGITS_PROFILE)
+    samples = [(digits_img(str(n)), str(n)) for n in range(10, 31)]
+    templates = GlyphTemplates.fit(samples, profile)
+    assert templates.chars == tuple("0123456789")
+
+    path = tmp_path / "digits.npz"
+    templates.save(path)
+    loaded = GlyphTemplates.load(path)
+    assert loaded.chars == templates.chars
+
+    backend = TemplateMatchBackend(loaded)
+    assert backend.read(digits_img("19"), prepare(profile)) == "19"
+
+
+def test_extract_text_dispatches_to_profile_backend(registry):
+    fake = FakeBackend("fake", "42")
+    register_backend("fake", lambda: fake)
+    profile = replace(get_profile(TIMER_DIGITS_PROFILE), backend="fake")
+
+    img = Image.new("RGB", (40, 20))
+    assert extract_text(img, profile) == "42"
+
+    # CLI가 아닌 백엔드는 쌓아 읽지 않고 1장씩
+    assert extract_text_batch([img, img, img], profile) == ["42", "42", "42"]
+    assert fake.calls == 4
+
+
+def test_get_backend_unknown(registry):
+    with pytest.raises(KeyError):
+        get_backend("nope")
+
+
+def test_benchmark_reports_agreement_and_skips(registry):
+    from app.ocr_bench import OcrSample, benchmark_ocr_backends
+
+    def missing():
+        raise RuntimeError("not installed")
+
+    # 이미지 폭으로 샘플 구분
+    register_backend("base", lambda: FakeBackend("base", lambda img: str(img.width)))
+    register_backend(
+        "half", lambda: FakeBackend("half", lambda img: str(img.width) if img.width % 2 else "x")
+    )
+    register_backend("digits_only", lambda: FakeBackend("digits_only", "1", whitelist_only=True))
+    register_backend("missing", missing)
+
+    samples = [
+        OcrSample(f"s{w}", roi, Image.new("RGB", (w, 10)))
+        for w in (11, 12, 13, 14)
+        for roi in ("BANPICK_STATUS_TEXT", "BANPICK_TIMER_DIGITS")
+    ]
+    runs = benchmark_ocr_backends(
+        samples, ["half", "digits_only", "missing"], baseline="base", warmup=0
+    )
+    by_key = {(r.roi, r.backend): r for r in runs}
+
+    base = by_key[("BANPICK_STATUS_TEXT", "base")]
+    assert base.samples == 4 and base.agreement is None
+    assert set(base.latency_ms) == {"mean", "p50", "p90", "p99", "max"}
+
+    half = by_key[("BANPICK_STATUS_TEXT", "half")]
+    assert half.agreement == 0.5
+    assert [m["sample"] for m in half.mismatches] == ["s12", "s14"]
+
+    assert by_key[("BANPICK_STATUS_TEXT", "digits_only")].skipped
+    assert by_key[("BANPICK_TIMER_DIGITS", "digits_only")].agreement == 0.0
+    assert by_key[("BANPICK_TIMER_DIGITS", "missing")].skipped == "not installed"
+
+
+def test_cli_batch_matches_inline_extract_text(monkeypatch):
+    """서버(마이크로 배치)와 로컬 루프가 같은 크롭에서 같은 텍스트를 내야 한다"""
+    import numpy as np
+    import pytesseract
+
+    def fake_image_to_string(img, lang, config):
+        # 프로필 psm/전처리 결과가 다르면 텍스트도 달라지게
+        return f"{config.split()[1]}:{img.shape}:{int(img.mean())}\n"
+
+    monkeypatch.setattr(pytesseract, "image_to_string", fake_image_to_string)
+    monkeypatch.setattr(
+        pytesseract,
+        "image_to_data",
+        lambda *a, **k: pytest.fail("배치도 인라인과 같은 image_to_string 경로"),
+    )
+
+    imgs = [Image.fromarray(np.full((20, 80 + i, 3), 60 * i, dtype=np.uint8)) for i in range(3)]
+    for profile in (STATUS_PROFILE, TIMER_DIGITS_PROFILE):
+        assert extract_text_batch(imgs, profile) == [extract_text(img, profile) for img in imgs]
+        assert extract_text_batch(imgs[:1], profile) == [extract_text(imgs[0], profile)]
+    assert extract_text_batch([], STATUS_PROFILE) == []
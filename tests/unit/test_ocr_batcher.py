@@ -0,0 +1,57 @@
+import threading
+
+from PIL import Image
+
+from app.ocr_batcher import OcrBatchConfig, OcrMicroBatcher
+
+
+def make_dummy_img(w=100, h=20, color=(0, 0, 0)):
+    return Image.new("RGB", (w, h), color)
+
+
+def test_requests_from_many_threads_are_batched():
+    """
+    짧은 시간창 안에 들어온 요청들은 한 번의 batch_fn 호출로 묶여야 함
+    """
+    batch_sizes = []
+
+    def fake_batch(imgs, profile):
+        batch_sizes.append(len(imgs))
+        return [f"w={img.width}" for img in imgs]
+
+    batcher = OcrMicroBatcher(OcrBatchConfig(max_batch=8, max_wait_ms=200), batch_fn=fake_batch)
+    batcher.start()
+
+    results = {}
+    barrier = threading.Barrier(4)
+
+    def worker(i):
+        barrier.wait()
+        results[i] = batcher.extract_text(make_dummy_img(w=100 + i))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    batcher.stop()
+
+    assert results == {i: f"w={100 + i}" for i in range(4)}
+    assert sum(batch_sizes) == 4
+    assert len(batch_sizes) < 4
+
+
+def test_batch_error_propagates_to_callers():
+    def failing_batch(imgs, profile):
+        raise RuntimeError("ocr down")
+
+    batcher = OcrMicroBatcher(OcrBatchConfig(max_wait_ms=1), batch_fn=failing_batch).start()
+    fut = batcher.submit(make_dummy_img())
+    batcher.stop()
+
+    try:
+        fut.result(timeout=1)
+    except RuntimeError as e:
+        assert "ocr down" in str(e)
+    else:
+        raise AssertionError("예외가 전달되지 않음")
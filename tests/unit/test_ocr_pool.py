@@ -0,0 +1,124 @@
+import time
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from core.ocr_pool import OcrPoolConfig, OcrWorkerPool
+from core.ocr_profiles import STATUS_PROFILE, TIMER_DIGITS_PROFILE
+
+
+def fake_ocr(arr, profile):
+    """워커 프로세스에서 호출: shared memory로 넘어온 픽셀을 그대로 요약"""
+    h, w = arr.shape[:2]
+    return f"{h}x{w}:{int(arr.sum())}", 90.0
+
+
+def backend_ocr(arr, profile):
+    from core.ocr_profiles import get_profile
+
+    return get_profile(profile).backend, -1.0
+
+
+def make_noise_img(w, h, seed):
+    rng = np.random.default_rng(seed)
+    return Image.fromarray(rng.integers(0, 256, size=(h, w, 3), dtype=np.uint8))
+
+
+def test_pool_returns_results_by_slot():
+    """
+    슬롯 수보다 많은 요청도 순서대로 올바른 결과를 받아야 함
+    """
+    imgs = [make_noise_img(40 + i, 10 + i, seed=i) for i in range(10)]
+
+    with OcrWorkerPool(
+        OcrPoolConfig(workers=2, slots=3, slot_shape=(64, 128, 3)), ocr_fn=fake_ocr
+    ) as pool:
+        futures = [pool.submit(img) for img in imgs]
+        results = [f.result(timeout=10) for f in futures]
+
+    for img, res in zip(imgs, results):
+        arr = np.asarray(img)
+        assert res.text == f"{img.height}x{img.width}:{int(arr.sum())}"
+        assert res.conf == 90.0
+
+
+def test_workers_apply_roi_backend_overrides():
+    cfg = OcrPoolConfig(
+        workers=1,
+        slots=2,
+        slot_shape=(64, 128, 3),
+        roi_backends=(("BANPICK_TIMER_DIGITS", "template"),),
+    )
+    with OcrWorkerPool(cfg, ocr_fn=backend_ocr) as pool:
+        assert pool.extract_text(make_noise_img(20, 10, seed=0), TIMER_DIGITS_PROFILE) == "template"
+        assert pool.extract_text(make_noise_img(20, 10, seed=0), STATUS_PROFILE) == "pytesseract"
+
+
+def test_oversize_roi_runs_inline():
+    with OcrWorkerPool(
+        OcrPoolConfig(workers=1, slots=2, slot_shape=(8, 8, 3)), ocr_fn=fake_ocr
+    ) as pool:
+        text = pool.extract_text(make_noise_img(20, 20, seed=1))
+
+    assert text.startswith("20x20:")
+    assert pool.oversize == 1
+
+
+def dying_ocr(arr, profile):
+    """높이 13인 ROI에서는 워커 프로세스가 그대로 죽는다"""
+    import os
+
+    if arr.shape[0] == 13:
+        os._exit(3)
+    return fake_ocr(arr, profile)
+
+
+def test_dead_worker_fails_its_request_and_is_restarted():
+    cfg = OcrPoolConfig(workers=1, slots=2, slot_shape=(64, 128, 3), liveness_interval_sec=0.05)
+    with OcrWorkerPool(cfg, ocr_fn=dying_ocr) as pool:
+        doomed = pool.submit(make_noise_img(20, 13, seed=0))
+        with pytest.raises(RuntimeError, match="died"):
+            doomed.result(timeout=10)
+
+        # 슬롯이 풀리고 새 워커가 다음 요청을 처리한다
+        for seed in range(3):
+            assert pool.extract_text(make_noise_img(20, 10, seed=seed)).startswith("10x20:")
+        assert pool.worker_restarts == 1
+
+
+def hanging_ocr(arr, profile):
+    """높이 13인 ROI에서는 워커가 살아 있는 채로 멈춘다"""
+    if arr.shape[0] == 13:
+        time.sleep(60)
+    return fake_ocr(arr, profile)
+
+
+def test_hung_worker_is_replaced_and_its_slot_reclaimed():
+    cfg = OcrPoolConfig(
+        workers=1,
+        slots=1,
+        slot_shape=(64, 128, 3),
+        result_timeout_sec=0.3,
+        liveness_interval_sec=0.05,
+    )
+    with OcrWorkerPool(cfg, ocr_fn=hanging_ocr) as pool:
+        stuck = pool.submit(make_noise_img(20, 13, seed=0))
+        with pytest.raises(TimeoutError):
+            stuck.result(timeout=10)
+
+        # 슬롯 1개가 돌아오고 새 워커가 처리한다 (루프가 멈추지 않는다)
+        assert pool.extract_text(make_noise_img(20, 10, seed=1), timeout=10).startswith("10x20:")
+        assert pool.worker_restarts == 1
+
+
+def test_no_free_slot_falls_back_to_inline_ocr():
+    cfg = OcrPoolConfig(
+        workers=1, slots=1, slot_shape=(64, 128, 3), result_timeout_sec=30.0, slot_wait_sec=0.1
+    )
+    with OcrWorkerPool(cfg, ocr_fn=hanging_ocr) as pool:
+        pool.submit(make_noise_img(20, 13, seed=0))  # 유일한 슬롯을 잡고 멈춤
+        t0 = time.perf_counter()
+        assert pool.extract_text(make_noise_img(20, 10, seed=1)).startswith("10x20:")
+        assert time.perf_counter() - t0 < 5.0
+        assert pool.slot_timeouts == 1
@@ -0,0 +1,115 @@
+import cv2
+import numpy as np
+import pytest
+from PIL import Image
+
+from core.ocr_profiles import (
+    BANNER_WORDS,
+    STATUS_PROFILE,
+    TIMER_DIGITS_PROFILE,
+    prepare,
+    preprocess,
+    profile_for_roi,
+    set_roi_backends,
+)
+
+
+def make_noise_img(w=88, h=44, seed=0):
+    rng = np.random.default_rng(seed)
+    return Image.fromarray(rng.integers(0, 256, size=(h, w, 3), dtype=np.uint8))
+
+
+def test_status_profile_matches_legacy_preprocess():
+    img = make_noise_img()
+    gray = cv2.GaussianBlur(cv2.cvtColor(np.array(img), cv2.COLOR_RGB2GRAY), (5, 5), 0)
+    _, expected = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+
+    assert np.array_equal(preprocess(img, STATUS_PROFILE), expected)
+
+
+def test_digits_profile_scales_and_binarizes():
+    img = make_noise_img()
+    out = preprocess(img, TIMER_DIGITS_PROFILE)
+
+    assert out.shape == (44 * 4, 88 * 4)
+    assert set(np.unique(out)) <= {0, 255}
+    # L 모드 입력도 그대로 받는다
+    assert preprocess(img.convert("L"), TIMER_DIGITS_PROFILE).shape == out.shape
+
+
+def test_prepared_config_is_cached_and_restricted():
+    digits = prepare(TIMER_DIGITS_PROFILE)
+    assert digits is prepare(TIMER_DIGITS_PROFILE)
+    assert digits.lang == "eng"
+    assert "--psm 7" in digits.config
+    assert "tessedit_char_whitelist=0123456789" in digits.config
+
+    status = prepare(STATUS_PROFILE)
+    words_path = status.config.split("--user-words ")[1].split()[0]
+    with open(words_path, encoding="utf-8") as f:
+        assert tuple(f.read().split()) == BANNER_WORDS
+
+
+def test_profile_for_roi():
+    assert profile_for_roi("BANPICK_TIMER_DIGITS").name == TIMER_DIGITS_PROFILE
+    assert profile_for_roi("BANPICK_STATUS_TEXT").name == STATUS_PROFILE
+
+
+def test_roi_backend_override_from_settings():
+    from app.session import DraftSession
+    from app.settings import Settings
+
+    try:
+        DraftSession(Settings(ocr_backends={"BANPICK_TIMER_DIGITS": "template"}))
+        assert profile_for_roi("BANPICK_TIMER_DIGITS").backend == "template"
+        assert prepare(TIMER_DIGITS_PROFILE).profile.backend == "template"
+        assert profile_for_roi("BANPICK_STATUS_TEXT").backend == "pytesseract"
+
+        # 덮어쓰기 없는 설정이면 원래 백엔드로
+        DraftSession(Settings())
+        assert profile_for_roi("BANPICK_TIMER_DIGITS").backend == "pytesseract"
+
+        with pytest.raises(KeyError):
+            set_roi_backends({"BANPICK_TIMER_BAR": "template"})
+
+        # 잘못된 설정은 첫 프레임이 아니라 세션 시작 시 실패, 기존 프로필은 그대로
+        with pytest.raises(KeyError):
+            DraftSession(Settings(ocr_backends={"BANPICK_TIMER_DIGITS": "nope"}))
+        with pytest.raises(ValueError):
+            # 템플릿 매칭은 whitelist 프로필만
+            DraftSession(Settings(ocr_backends={"BANPICK_STATUS_TEXT": "template"}))
+        assert profile_for_roi("BANPICK_STATUS_TEXT").backend == "pytesseract"
+    finally:
+        set_roi_backends({})
+
+
+def test_digits_ocr_uses_digits_profile(monkeypatch):
+    from pipeline import prepare_phase_detector as mod
+
+    seen = []
+
+    def fake_extract_text(img, profile=STATUS_PROFILE):
+        seen.append(profile)
+        return "12\n"
+
+    monkeypatch.setattr(mod, "extract_text", fake_extract_text)
+    assert mod._ocr_digits_seconds(make_noise_img(), mod.PreparePhaseConfig()) == 12
+    assert seen == [TIMER_DIGITS_PROFILE]
+
+
+def test_session_digits_ocr_injection(monkeypatch):
+    """
+    주입된 숫자 OCR이 0초를 읽으면 대칭이어도 dual=False
+    """
+    from app import session as session_mod
+    from app.settings import Settings
+    from pipeline import prepare_phase_detector as mod
+
+    monkeypatch.setattr(session_mod, "extract_text", lambda img: "장비를 준비하세요")
+    monkeypatch.setattr(mod, "is_dual_sided_timer_cropped_symmetry", lambda img, cfg=None: True)
+
+    for digits, expected in (("0", False), ("25", True)):
+        session = session_mod.DraftSession(Settings(), digits_ocr=lambda img, d=digits: d)
+        res = session.step(Image.new("RGB", (1600, 900), (20, 20, 20)), (1600, 900))
+        assert res.stable_state == "PREPARE"
+        assert res.dual_now is expected
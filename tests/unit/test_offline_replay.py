@@ -0,0 +1,117 @@
+import pytest
+from PIL import Image
+
+from app.features import FrameFeatures
+from app.offline import extract_features_parallel, replay_decisions, timed_features
+from app.session import ACTION_PICK_COACH, ACTION_PLAYPLAN_COACH
+from app.settings import Settings
+
+
+def make_feat(index, raw_state, ts=None, ban_std=0.0, dual=False):
+    return FrameFeatures(
+        index=index,
+        name=f"frame_{index}.png",
+        ts=ts,
+        status_text_raw=raw_state,
+        status_text_norm=raw_state,
+        raw_state=raw_state,
+        ban_std=ban_std,
+        timer_seconds=None,
+        timer_near_zero=False,
+        dual_symmetry=dual,
+    )
+
+
+def make_session_features():
+    """BAN 5프레임 -> PICK(밴 채워짐) 10프레임 -> PREPARE(dual) 10프레임, 1초 간격"""
+    feats = []
+    idx = 0
+    for state, n, kw in (
+        ("BAN", 5, {}),
+        ("PICK", 10, {"ban_std": 45.0}),
+        ("PREPARE", 10, {"dual": True}),
+    ):
+        for _ in range(n):
+            idx += 1
+            feats.append(make_feat(idx, state, **kw))
+    return feats
+
+
+def test_replay_decisions():
+    decisions = replay_decisions(make_session_features(), Settings())
+
+    assert [a for _, a in decisions] == [ACTION_PICK_COACH, ACTION_PLAYPLAN_COACH]
+    pick_idx, plan_idx = decisions[0][0], decisions[1][0]
+    assert 6 <= pick_idx <= 15
+    assert 16 <= plan_idx <= 25
+
+
+def test_replay_order_independent_of_input_order():
+    feats = make_session_features()
+    assert replay_decisions(list(reversed(feats)), Settings()) == replay_decisions(
+        feats, Settings()
+    )
+
+
+def test_motion_dual_mode_is_rejected_for_feature_replay():
+    # 피처에는 타이머 바가 없어 motion 판정을 재생할 수 없다 -> 조용히 symmetry로 바꾸지 않는다
+    with pytest.raises(ValueError):
+        replay_decisions(make_session_features(), Settings(dual_timer_mode="motion"))
+
+
+def test_pick_threshold_applied_at_replay():
+    """
+    ban_std가 임계값보다 낮으면 PICK_FAKE -> PICK 코치 없음
+    """
+    decisions = replay_decisions(make_session_features(), Settings(pick_std_threshold=60.0))
+    assert ACTION_PICK_COACH not in [a for _, a in decisions]
+
+
+def test_min_duration_uses_frame_timestamps():
+    """
+    프레임 간격이 0.1초면 min_duration(1초) 때문에 상태 전환이 늦어진다
+    """
+    fast = [
+        make_feat(i, "BAN" if i <= 5 else "PICK", ts=i * 0.1, ban_std=45.0) for i in range(1, 31)
+    ]
+    slow = [
+        make_feat(i, "BAN" if i <= 5 else "PICK", ts=i * 1.0, ban_std=45.0) for i in range(1, 31)
+    ]
+
+    fast_idx = replay_decisions(fast, Settings())[0][0]
+    slow_idx = replay_decisions(slow, Settings())[0][0]
+    assert fast_idx > slow_idx
+
+
+def test_mixed_frame_names_use_frame_timeline():
+    # 파일 순서 그대로, ts 없는 프레임은 직전 + period, 뒤로 가는 ts는 건너뜀 (benchmark/session_pool과 같은 규칙)
+    feats = [
+        make_feat(1, "BAN", ts=100.0),
+        make_feat(2, "BAN"),
+        make_feat(3, "BAN", ts=90.0),
+        make_feat(4, "BAN", ts=102.0),
+    ]
+    assert [(f.index, t) for f, t in timed_features(feats, 1.0)] == [
+        (1, 100.0),
+        (2, 101.0),
+        (4, 102.0),
+    ]
+
+
+def test_parallel_extraction_matches_sequential(monkeypatch, tmp_path):
+    from app import features as mod
+
+    monkeypatch.setattr(mod, "extract_text", lambda img: "챔피언을 선택하세요")
+
+    paths = []
+    for i in range(6):
+        p = tmp_path / f"lol_client_{1770000000000 + i * 1000}.png"
+        Image.new("RGB", (1600, 900), (10 * i, 20, 30)).save(p)
+        paths.append(p)
+
+    seq = extract_features_parallel(paths, workers=1)
+    par = extract_features_parallel(paths, workers=2, chunksize=2)
+
+    assert seq == par
+    assert [f.raw_state for f in seq] == ["PICK"] * 6
+    assert seq[1].ts == 1770000001.0
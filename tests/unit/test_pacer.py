@@ -0,0 +1,50 @@
+import pytest
+
+from app.pacer import FramePacer
+from core.clock import VirtualClock
+
+
+def run_frames(pacer, clock, work_secs):
+    pacer.wait()  # 기준 시각
+    slept = []
+    for w in work_secs:
+        clock.sleep(w)  # 프레임 작업
+        slept.append(pacer.wait())
+    return slept
+
+
+def test_sleeps_only_remaining_budget():
+    clock = VirtualClock()
+    pacer = FramePacer(0.1, clock)
+
+    slept = run_frames(pacer, clock, [0.03, 0.07, 0.01])
+    assert slept == pytest.approx([0.07, 0.03, 0.09])
+    assert clock.now() == pytest.approx(0.3)
+
+    s = pacer.stats()
+    assert s.achieved_fps == pytest.approx(10.0)
+    assert s.overruns == 0
+    assert s.jitter_ms == pytest.approx(0.0, abs=1e-6)
+
+
+def test_overrun_accounting_and_resync():
+    clock = VirtualClock()
+    pacer = FramePacer(0.1, clock)
+
+    # 0.13s 작업은 0.03s overrun -> 다음 deadline은 원래 격자(0.2) 유지
+    # 0.35s 작업은 한 주기 이상 밀림 -> 현재 시각 기준으로 deadline 재설정
+    slept = run_frames(pacer, clock, [0.13, 0.02, 0.35, 0.02])
+    assert slept == pytest.approx([0.0, 0.05, 0.0, 0.08])
+
+    s = pacer.stats()
+    assert s.frames == 4
+    assert s.overruns == 2
+    assert s.overrun_ratio == 0.5
+    assert s.max_overrun_ms == pytest.approx(250.0)
+    assert s.jitter_ms > 0
+    assert s.achieved_fps < s.target_fps
+
+
+def test_rejects_non_positive_period():
+    with pytest.raises(ValueError):
+        FramePacer(0)
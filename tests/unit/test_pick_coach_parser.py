@@ -0,0 +1,101 @@
+import pytest
+
+from app.token_bus import EVENT_END, EVENT_ITEM, TokenBus, TokenSubscriber
+from core.pick_coach_parser import PickCoachParser, complete_early
+
+RESPONSE = (
+    "Orianna - 8/10\n"
+    "라인전: 사거리 우위로 견제 가능 | 팀가치: 한타 이니시 보조\n"
+    "Galio - 7.5/10\n"
+    "라인전: 마법 피해 상대로 단단함 | 팀가치: 합류 속도\n"
+    "Malzahar - 7/10\n"
+    "라인전: 로밍 억제 | 팀가치: 확정 CC\n"
+)
+
+
+def chunked(text, size=5):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def test_emits_each_recommendation_when_two_lines_complete():
+    parser = PickCoachParser()
+    emitted_at = []
+    for i, delta in enumerate(chunked(RESPONSE)):
+        for rec in parser.feed(delta):
+            emitted_at.append((i, rec.champion))
+
+    assert [c for _, c in emitted_at] == ["Orianna", "Galio", "Malzahar"]
+    # 첫 추천은 응답 1/3 지점쯤에서 나온다
+    assert emitted_at[0][0] < len(chunked(RESPONSE)) // 2
+
+    first = parser.recommendations[0]
+    assert (first.rank, first.score, first.lane, first.team) == (
+        1,
+        8.0,
+        "사거리 우위로 견제 가능",
+        "한타 이니시 보조",
+    )
+    assert parser.recommendations[1].score == 7.5
+    assert parser.done
+
+
+def test_tolerates_numbering_and_markdown():
+    text = (
+        "1) **Dr. Mundo - 9/10**\n"
+        "2) 라인전: 버티기 | 팀가치: 탱킹\n"
+        "라인전: 제목 없는 근거 | 팀가치: 무시\n"
+        "- Kai'Sa: 6/10\n"
+        "라인전: a | 팀가치: b"  # 마지막 줄은 개행 없음
+    )
+    parser = PickCoachParser()
+    recs = parser.feed(text) + parser.finish()
+    assert [(r.champion, r.score) for r in recs] == [("Dr. Mundo", 9.0), ("Kai'Sa", 6.0)]
+    assert not parser.done
+
+
+def test_complete_early_closes_source_after_three():
+    state = {"pulled": 0, "closed": False}
+
+    def source():
+        try:
+            for delta in chunked(RESPONSE + "추가 설명은 금지인데 계속 나오는 문장들...\n" * 20):
+                state["pulled"] += 1
+                yield delta
+        finally:
+            state["closed"] = True
+
+    parser = PickCoachParser()
+    items = []
+    text = "".join(complete_early(source(), parser, items.append))
+
+    assert [r.rank for r in items] == [1, 2, 3]
+    assert state["closed"]
+    assert text.startswith(RESPONSE[: len(RESPONSE) - 5])
+    assert len(text) < len(RESPONSE) + 5
+
+
+class Collector(TokenSubscriber):
+    name = "collector"
+
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def handle(self, event):
+        self.events.append(event)
+
+
+def test_bus_publishes_items_before_end():
+    sub = Collector()
+    with TokenBus([sub]) as bus:
+        bus.stream("PICK_COACH", iter(chunked(RESPONSE + "tail\n" * 50)), parser=PickCoachParser())
+
+    kinds = [e.kind for e in sub.events]
+    assert kinds.count(EVENT_ITEM) == 3
+    assert kinds[-1] == EVENT_END
+    first_item = kinds.index(EVENT_ITEM)
+    assert first_item < kinds.index(EVENT_ITEM, first_item + 1)
+    assert sub.events[first_item].data["champion"] == "Orianna"
+    # tail은 받지 않았다
+    assert "tail" not in "".join(e.text for e in sub.events)
+    assert sub.last_stats.tokens == pytest.approx(len(chunked(RESPONSE)), abs=1)
@@ -0,0 +1,59 @@
+import cv2
+import numpy as np
+from PIL import Image
+
+from app.rois import Rois, extract_rois
+from pipeline.pick_slot_detector import detect_pick_slots, detect_slot_filled
+
+SLOT_SIZE = (246, 24)
+
+
+def make_slot(name=None):
+    arr = np.full((SLOT_SIZE[1], SLOT_SIZE[0], 3), 18, dtype=np.uint8)
+    if name:
+        cv2.putText(
+            arr, name, (12, 18), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (235, 220, 180), 1, cv2.LINE_AA
+        )
+    return Image.fromarray(arr)
+
+
+def test_slot_with_champion_name_is_filled():
+    filled, std = detect_slot_filled(make_slot("Orianna"))
+    empty, empty_std = detect_slot_filled(make_slot())
+
+    assert filled and not empty
+    assert std > empty_std
+
+
+def test_count_filled_slots_across_teams():
+    my = [make_slot(n) for n in ("Galio", "Sion", "Orianna", None, None)]
+    enemy = [make_slot(n) for n in ("Ahri", "Zed", "Lulu", "Jinx", None)]
+
+    res = detect_pick_slots(my, enemy)
+    assert res.my_filled == (True, True, True, False, False)
+    assert res.enemy_filled == (True, True, True, True, False)
+    assert res.filled_count == 7 and res.total == 10
+
+
+def test_slots_from_prepared_panel_match_frame_crops():
+    """
+    캡처 에이전트가 보낸 픽 패널 크롭에서 다시 자른 슬롯 == 전체 프레임에서 자른 슬롯 (크기 +-1px)
+    """
+    ys, xs = np.mgrid[0:900, 0:1600]
+    frame = Image.fromarray(
+        np.stack([xs % 256, ys % 256, (xs + ys) % 256], axis=-1).astype(np.uint8)
+    )
+
+    direct = extract_rois(frame, frame.size)
+    prepared = Rois.from_crops(
+        {"picks_my_img": direct.picks_my_img, "picks_enemy_img": direct.picks_enemy_img}
+    )
+
+    for a, b in zip(
+        direct.my_pick_slot_imgs + direct.enemy_pick_slot_imgs,
+        prepared.my_pick_slot_imgs + prepared.enemy_pick_slot_imgs,
+    ):
+        assert abs(a.width - b.width) <= 1 and abs(a.height - b.height) <= 1
+        h, w = min(a.height, b.height), min(a.width, b.width)
+        diff = np.abs(np.asarray(a, dtype=int)[:h, :w] - np.asarray(b, dtype=int)[:h, :w])
+        assert np.median(diff) <= 2
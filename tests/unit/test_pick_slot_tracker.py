@@ -0,0 +1,172 @@
+import cv2
+import numpy as np
+from PIL import Image
+
+from app.session import ACTION_PICK_COACH, DraftSession
+from app.settings import Settings
+from core.roi_layout import get_roi_layout
+from pipeline.pick_slot_tracker import (
+    SLOT_CHANGED,
+    SLOT_CLEARED,
+    SLOT_LOCKED,
+    TEAM_ENEMY,
+    TEAM_MY,
+    DeltaDebouncer,
+    PickSlotTracker,
+    SlotEvent,
+)
+
+WINDOW_SIZE = (1600, 900)
+EMPTY = [False] * 10
+
+
+def fp(value):
+    return np.full((8, 64), value, dtype=np.uint8)
+
+
+def fps(**slots):
+    # slots: s0=값 ... (나머지 슬롯은 0)
+    return [fp(slots.get(f"s{i}", 0)) for i in range(10)]
+
+
+def filled(*idx):
+    return [i in idx for i in range(10)]
+
+
+def test_slot_locks_only_after_staying_unchanged():
+    tracker = PickSlotTracker()
+
+    # 호버: 내용이 계속 바뀌면 확정 아님
+    for t, v in [(0.0, 100), (0.5, 160), (1.0, 100)]:
+        assert tracker.update(t, filled(6), fps(s6=v)) == []
+
+    assert tracker.update(1.6, filled(6), fps(s6=100)) == []
+    events = tracker.update(2.0, filled(6), fps(s6=100))
+    assert events == [SlotEvent(2.0, TEAM_ENEMY, 2, SLOT_LOCKED)]
+    assert tracker.is_locked(TEAM_ENEMY, 2) and tracker.locked_count == 1
+
+
+def test_locked_slot_change_and_clear():
+    tracker = PickSlotTracker()
+    tracker.update(0.0, filled(0), fps(s0=100))
+    assert [e.kind for e in tracker.update(1.0, filled(0), fps(s0=100))] == [SLOT_LOCKED]
+
+    # 다른 챔피언으로 교환 -> 다시 lock_sec 동안 그대로여야 CHANGED
+    assert tracker.update(2.0, filled(0), fps(s0=200)) == []
+    assert [e.kind for e in tracker.update(3.0, filled(0), fps(s0=200))] == [SLOT_CHANGED]
+
+    events = tracker.update(4.0, EMPTY, fps())
+    assert [(e.team, e.slot, e.kind) for e in events] == [(TEAM_MY, 1, SLOT_CLEARED)]
+
+
+def test_debouncer_coalesces_bursts():
+    deb = DeltaDebouncer(quiet_sec=0.8, max_wait_sec=3.0)
+    deb.push([SlotEvent(1.0, TEAM_ENEMY, 1, SLOT_LOCKED)])
+    deb.push([SlotEvent(1.5, TEAM_ENEMY, 2, SLOT_LOCKED)])
+
+    assert deb.poll(2.0) is None
+    delta = deb.poll(2.4)
+    assert delta is not None
+    assert delta.slots() == ((TEAM_ENEMY, 1), (TEAM_ENEMY, 2))
+    assert deb.poll(5.0) is None
+
+    # 계속 이벤트가 들어와도 max_wait_sec가 지나면 낸다
+    for t in (10.0, 10.5, 11.0, 11.5, 12.0, 12.5):
+        deb.push([SlotEvent(t, TEAM_MY, 3, SLOT_CHANGED)])
+    assert deb.poll(13.0) is not None
+
+
+# ----------------------------
+# 세션: 첫 픽 코치 이후 슬롯 변화 -> 다시 요청
+# ----------------------------
+def make_frame(names):
+    """names: {"ENEMY_TEAM_PICK1": "Ahri", ...} 슬롯 이름 줄에 글자를 그린 프레임"""
+    arr = np.full((WINDOW_SIZE[1], WINDOW_SIZE[0], 3), 30, dtype=np.uint8)
+    layout = get_roi_layout(WINDOW_SIZE)
+    for roi, text in names.items():
+        left, top, right, bottom = layout.rect(roi)
+        cv2.putText(
+            arr,
+            text,
+            (left + 12, bottom - 6),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.6,
+            (235, 220, 180),
+            1,
+            cv2.LINE_AA,
+        )
+    return Image.fromarray(arr)
+
+
+def patch_pick_real(monkeypatch):
+    from app import session as mod
+    from pipeline.pick_stage_detector import PickStageResult
+
+    monkeypatch.setattr(mod, "extract_text", lambda img: "챔피언을 선택하세요")
+    monkeypatch.setattr(
+        mod,
+        "detect_pick_kind_from_banned_strips",
+        lambda my, enemy, std_threshold=0.0: PickStageResult(kind="PICK_REAL", std=99.0),
+    )
+
+
+def run_frames(session, frames):
+    return [session.step(img, WINDOW_SIZE, now=t) for t, img in frames]
+
+
+def test_recoach_fires_once_per_debounced_enemy_lock(monkeypatch):
+    patch_pick_real(monkeypatch)
+    session = DraftSession(
+        Settings(frame_change_gate=False, pick_recoach_on_delta=True, my_pick_slot=3)
+    )
+
+    res = session.step(make_frame({}), WINDOW_SIZE, now=0.0)
+    assert res.action == ACTION_PICK_COACH and res.draft_delta is None
+    session.mark_pick_coached()
+
+    ahri = make_frame({"ENEMY_TEAM_PICK1": "Ahri"})
+    results = run_frames(session, [(1.0, ahri), (1.5, ahri), (2.1, ahri), (2.5, ahri)])
+    assert [r.action for r in results] == [None] * 4  # 확정(2.1) 후 디바운스 대기
+
+    res = session.step(ahri, WINDOW_SIZE, now=3.0)
+    assert res.action == ACTION_PICK_COACH
+    assert [str(e) for e in res.draft_delta.events] == ["ENEMY1:LOCKED"]
+    session.mark_pick_coached()
+
+    # 새 정보가 없으면 다시 부르지 않는다 (짧은 이름끼리 바뀌어도 잡는지는 아래)
+    assert [r.action for r in run_frames(session, [(3.5, ahri), (5.0, ahri)])] == [None, None]
+
+    # 교환: Ahri -> Zed
+    zed = make_frame({"ENEMY_TEAM_PICK1": "Zed"})
+    run_frames(session, [(6.0, zed), (7.1, zed)])
+    res = session.step(zed, WINDOW_SIZE, now=8.0)
+    assert res.action == ACTION_PICK_COACH
+    assert [str(e) for e in res.draft_delta.events] == ["ENEMY1:CHANGED"]
+
+
+def test_no_recoach_after_my_pick_locked(monkeypatch):
+    patch_pick_real(monkeypatch)
+    session = DraftSession(
+        Settings(frame_change_gate=False, pick_recoach_on_delta=True, my_pick_slot=3)
+    )
+    session.step(make_frame({}), WINDOW_SIZE, now=0.0)
+    session.mark_pick_coached()
+
+    mine = make_frame({"MY_TEAM_PICK3": "Galio"})
+    run_frames(session, [(1.0, mine), (2.1, mine)])
+    assert session.slot_tracker.is_locked(TEAM_MY, 3)
+
+    both = make_frame({"MY_TEAM_PICK3": "Galio", "ENEMY_TEAM_PICK1": "Ahri"})
+    results = run_frames(session, [(t, both) for t in (3.0, 4.1, 5.0, 6.0)])
+    assert all(r.action is None for r in results)
+
+
+def test_recoach_is_off_by_default(monkeypatch):
+    patch_pick_real(monkeypatch)
+    session = DraftSession(Settings(frame_change_gate=False))
+    session.step(make_frame({}), WINDOW_SIZE, now=0.0)
+    session.mark_pick_coached()
+
+    ahri = make_frame({"ENEMY_TEAM_PICK1": "Ahri"})
+    results = run_frames(session, [(t, ahri) for t in (1.0, 2.1, 3.0, 4.0)])
+    assert all(r.action is None for r in results)
@@ -0,0 +1,80 @@
+import threading
+import time
+
+from app.playplan import PlayplanDraft, progressive_playplan_stream
+
+
+def slow_stream(deltas, gap=0.01, error=None):
+    def open_stream():
+        for d in deltas:
+            time.sleep(gap)
+            yield d
+        if error is not None:
+            raise error
+
+    return open_stream
+
+
+def fail_if_called(*_):
+    raise AssertionError("호출되면 안 됨")
+
+
+def test_draft_runs_in_background_and_replays_in_order():
+    gate = threading.Event()
+
+    def open_stream():
+        yield "A"
+        gate.wait(1.0)
+        yield "B"
+
+    draft = PlayplanDraft("img", 8, open_stream).start()
+    time.sleep(0.05)
+    assert draft.text == "A" and not draft.done  # 루프는 막지 않고 생성 중
+
+    gate.set()
+    assert list(draft.replay()) == ["A", "B"]
+    assert draft.done and draft.text == "AB"
+
+
+def test_final_plan_is_draft_plus_short_update():
+    draft = PlayplanDraft("draft_img", 8, slow_stream(["plan ", "v1"])).start()
+    seen = []
+
+    def open_update(d):
+        seen.append((d.picks_img, d.text, d.picks_known))
+        return iter(["delta"])
+
+    out = "".join(progressive_playplan_stream(draft, fail_if_called, open_update))
+    assert out == "plan v1\n\ndelta"
+    assert seen == [("draft_img", "plan v1", 8)]
+
+
+def test_draft_with_all_picks_is_reused_as_is():
+    draft = PlayplanDraft("img", 10, slow_stream(["full plan"])).start()
+    assert (
+        "".join(progressive_playplan_stream(draft, fail_if_called, fail_if_called)) == "full plan"
+    )
+
+
+def test_no_draft_or_failed_draft_falls_back_to_full_plan():
+    assert (
+        "".join(progressive_playplan_stream(None, lambda: iter(["full"]), fail_if_called)) == "full"
+    )
+
+    failed = PlayplanDraft("img", 9, slow_stream([], error=ConnectionError("503"))).start()
+    assert (
+        "".join(progressive_playplan_stream(failed, lambda: iter(["full"]), fail_if_called))
+        == "full"
+    )
+
+
+def test_draft_failing_mid_stream_falls_back_to_full_plan():
+    draft = PlayplanDraft("img", 9, slow_stream(["part"], error=ConnectionError("reset"))).start()
+    out = "".join(progressive_playplan_stream(draft, lambda: iter(["full"]), fail_if_called))
+    assert out == "part\n\nfull"  # 반쪽 초안에 업데이트를 붙이지 않고 전체 플랜
+
+
+def test_empty_draft_falls_back_to_full_plan():
+    draft = PlayplanDraft("img", 9, slow_stream(["", " "])).start()
+    out = "".join(progressive_playplan_stream(draft, lambda: iter(["full"]), fail_if_called))
+    assert out.strip() == "full"
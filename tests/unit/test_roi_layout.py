@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from config.roi import ROI
+from core.roi_layout import (
+    ENEMY_TEAM_PICK_SLOTS,
+    MY_TEAM_PICK_SLOTS,
+    MY_TEAM_POS_SLOTS,
+    RoiLayout,
+    get_roi_layout,
+    roi_items,
+)
+from core.roi_manager import crop_roi_relative_xy
+
+
+# ----------------------------
+# 유틸: 픽셀마다 값이 다른 더미 프레임
+# ----------------------------
+def make_gradient_frame(w: int, h: int) -> Image.Image:
+    ys, xs = np.mgrid[0:h, 0:w]
+    arr = np.stack([xs % 256, ys % 256, (xs + ys) % 256], axis=-1).astype(np.uint8)
+    return Image.fromarray(arr)
+
+
+@pytest.mark.parametrize("window_size", [(1600, 900), (1280, 720), (1024, 576), (1601, 899)])
+def test_layout_crop_matches_relative_crop(window_size):
+    """
+    컴파일된 레이아웃 크롭은 crop_roi_relative_xy와 픽셀 단위로 같아야 함
+    """
+    frame = make_gradient_frame(*window_size)
+    layout = RoiLayout.compile(window_size)
+
+    for name, roi in roi_items().items():
+        expected = np.asarray(crop_roi_relative_xy(frame, window_size, roi))
+        assert np.array_equal(np.asarray(layout.crop(frame, name)), expected), name
+
+
+def test_layout_slice_matches_crop():
+    """
+    numpy slicing 결과는 PIL crop 결과와 같아야 함 (창 안쪽 ROI 기준)
+    """
+    window_size = (1600, 900)
+    frame = make_gradient_frame(*window_size)
+    arr = np.asarray(frame)
+    layout = get_roi_layout(window_size)
+
+    sliced = layout.slice_many(arr)
+    for name in layout.rects:
+        assert np.array_equal(sliced[name], np.asarray(layout.crop(frame, name))), name
+
+
+def test_layout_contains_every_slot_roi():
+    layout = get_roi_layout((1600, 900))
+
+    for name in MY_TEAM_PICK_SLOTS + MY_TEAM_POS_SLOTS + ENEMY_TEAM_PICK_SLOTS:
+        assert name in layout.rects
+
+    # 1600x900 기준 주석 좌표 (149, 156, 246, 24)
+    assert layout.rect("MY_TEAM_PICK1") == (149, 156, 395, 180)
+    assert len(layout.rects) == len(roi_items(ROI))
+
+
+def test_layout_cached_per_window_size():
+    """
+    같은 창 크기면 재사용, 리사이즈 시에만 새로 컴파일
+    """
+    a = get_roi_layout((1600, 900))
+    b = get_roi_layout((1600, 900))
+    c = get_roi_layout((1280, 720))
+
+    assert a is b
+    assert c is not a
+    assert c.window_size == (1280, 720)
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.features import extract_features
+from app.offline import extract_features_from_pack
+from app.roi_pack import RoiPack, RoiPackFrameSource, write_roi_pack
+from app.rois import extract_rois
+
+
+def make_frames(tmp_path, n=3, size=(1600, 900)):
+    rng = np.random.default_rng(0)
+    paths = []
+    for i in range(n):
+        arr = rng.integers(0, 256, size=(size[1], size[0], 3), dtype=np.uint8)
+        p = tmp_path / f"lol_client_{1770000000000 + i * 1000}.png"
+        Image.fromarray(arr, "RGB").save(p)
+        paths.append(p)
+    return paths
+
+
+def test_pack_rois_match_png_crops(tmp_path):
+    paths = make_frames(tmp_path)
+    pack_path = write_roi_pack(paths, tmp_path / "s.roipack")
+
+    frames = list(RoiPackFrameSource(pack_path))
+    assert [f.index for f in frames] == [1, 2, 3]
+    assert frames[1].ts == 1770000001.0
+    assert frames[2].name == paths[2].name
+
+    for frame, path in zip(frames, paths):
+        img = Image.open(path).convert("RGB")
+        expected = extract_rois(img, img.size)
+        for attr in ("status_img", "bans_my_img", "timer_digits_img", "picks_merged_img"):
+            assert np.array_equal(
+                np.asarray(getattr(frame.rois, attr)), np.asarray(getattr(expected, attr))
+            )
+
+    # 팩 Rois는 lazy loader 기반 (프레임/레이아웃 없음), 픽 슬롯은 패널에서 다시 자른다
+    rois = RoiPack(pack_path).rois(0)
+    assert rois.frame_img is None and rois.layout is None
+    assert rois.materialized() == ()
+    assert len(rois.my_pick_slot_imgs) == 5
+
+
+def test_pack_arrays_are_memmap_views(tmp_path):
+    pack = RoiPack(write_roi_pack(make_frames(tmp_path, n=2), tmp_path / "s.roipack"))
+
+    status = pack.arrays["BANPICK_STATUS_TEXT"]
+    assert status.shape[0] == 2
+    assert isinstance(status.base, np.memmap) or isinstance(status, np.memmap)
+    assert not status.flags.writeable
+
+
+def test_pack_rejects_mixed_window_sizes(tmp_path):
+    (tmp_path / "b").mkdir()
+    paths = make_frames(tmp_path, n=1) + make_frames(tmp_path / "b", n=1, size=(1280, 720))
+    with pytest.raises(ValueError):
+        write_roi_pack(paths, tmp_path / "s.roipack")
+
+
+def test_features_from_pack_match_png(monkeypatch, tmp_path):
+    from app import features as mod
+
+    monkeypatch.setattr(mod, "extract_text", lambda img: "챔피언을 선택하세요")
+
+    paths = make_frames(tmp_path)
+    pack_path = write_roi_pack(paths, tmp_path / "s.roipack")
+
+    from_pack = extract_features_from_pack(pack_path, workers=1)
+    from_png = []
+    for i, p in enumerate(paths, start=1):
+        img = Image.open(p).convert("RGB")
+        from_png.append(extract_features(i, p.name, 1770000000.0 + (i - 1), img, img.size))
+
+    assert from_pack == from_png
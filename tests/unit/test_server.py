@@ -0,0 +1,126 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import app.server as server_mod
+from app.server import FrameIngestServer
+from app.session import ACTION_PICK_COACH, FrameResult
+from app.settings import Settings
+
+
+class FakeWs:
+    """_handle이 쓰는 만큼만 흉내 낸 연결: 큐에 넣은 메시지를 받고, 보낸 이벤트를 모은다"""
+
+    def __init__(self, path):
+        self.request = SimpleNamespace(path=path)
+        self.remote_address = ("127.0.0.1", 1)
+        self.inbox: asyncio.Queue = asyncio.Queue()
+        self.sent = []
+        self.closed = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        msg = await self.inbox.get()
+        if msg is None:
+            raise StopAsyncIteration
+        return msg
+
+    async def send(self, data):
+        self.sent.append(json.loads(data))
+
+    async def close(self, code=1000, reason=""):
+        self.closed = (code, reason)
+        self.inbox.put_nowait(None)
+
+
+class FakeSession:
+    """매 프레임 픽 코치를 요청하다가 mark_pick_coached 이후로는 요청하지 않는 세션"""
+
+    def __init__(self, settings, session_id, **_):
+        self.session_id = session_id
+        self.coached = 0
+        self.finished = False
+
+    def step_rois(self, rois):
+        return FrameResult(
+            changed=True,
+            raw_state="PICK",
+            major_state="PICK",
+            major_conf=1.0,
+            stable_state="PICK",
+            status_text_raw="",
+            status_text_norm="",
+            action=None if self.coached else ACTION_PICK_COACH,
+        )
+
+    def mark_pick_coached(self):
+        self.coached += 1
+
+    def finish(self):
+        self.finished = True
+
+
+def make_server(monkeypatch):
+    monkeypatch.setattr(server_mod, "DraftSession", FakeSession)
+    monkeypatch.setattr(server_mod, "decode_rois_message", lambda msg: None)
+    return FrameIngestServer(Settings())
+
+
+def test_frames_keep_flowing_while_coach_streams(monkeypatch):
+    srv = make_server(monkeypatch)
+    starts = []
+
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def slow_coach(ws, session, action, deadline, draft):
+            starts.append(action)
+            await gate.wait()
+            return True
+
+        srv._run_coach = slow_coach
+        ws = FakeWs("/sessions/a")
+        handler = asyncio.create_task(srv._handle(ws))
+        for _ in range(3):
+            ws.inbox.put_nowait("{}")
+        await asyncio.sleep(0.1)
+        frames = [e for e in ws.sent if e["type"] == "frame"]
+        session = srv.sessions["a"]
+        assert len(frames) == 3  # 코치가 끝나지 않았어도 프레임은 계속 처리
+        assert starts == [ACTION_PICK_COACH]  # 진행 중에는 같은 코치를 또 시작하지 않는다
+
+        gate.set()
+        await asyncio.sleep(0.05)
+        ws.inbox.put_nowait("{}")
+        await asyncio.sleep(0.1)
+        assert session.coached == 1  # 다음 프레임 판정 전에 반영
+        assert starts == [ACTION_PICK_COACH]
+
+        ws.inbox.put_nowait(None)
+        await handler
+        assert session.finished and "a" not in srv.sessions
+
+    asyncio.run(scenario())
+
+
+def test_duplicate_session_id_is_rejected(monkeypatch):
+    srv = make_server(monkeypatch)
+
+    async def scenario():
+        first = FakeWs("/sessions/a")
+        handler = asyncio.create_task(srv._handle(first))
+        await asyncio.sleep(0.05)
+        live = srv.sessions["a"]
+
+        second = FakeWs("/sessions/a")
+        await srv._handle(second)
+        assert second.closed is not None and second.closed[0] == 1008
+        assert srv.sessions["a"] is live and not live.finished  # 살아있는 세션은 그대로
+
+        first.inbox.put_nowait(None)
+        await handler
+        assert "a" not in srv.sessions
+
+    asyncio.run(scenario())
@@ -0,0 +1,151 @@
+from PIL import Image
+
+from app.session import ACTION_PICK_COACH, DraftSession
+from app.session_pool import SessionPool, SessionSpec
+from app.settings import Settings
+from pipeline.pick_stage_detector import PickStageResult
+
+WINDOW_SIZE = (1600, 900)
+
+
+def make_dummy_frame(color=(30, 30, 30)):
+    return Image.new("RGB", WINDOW_SIZE, color)
+
+
+def patch_pipeline(monkeypatch, text="챔피언을 선택하세요", kind="PICK_REAL"):
+    from app import session as mod
+
+    calls = {"ocr": 0}
+
+    def fake_ocr(img):
+        calls["ocr"] += 1
+        return text
+
+    monkeypatch.setattr(mod, "extract_text", fake_ocr)
+    monkeypatch.setattr(
+        mod,
+        "detect_pick_kind_from_banned_strips",
+        lambda my, enemy, std_threshold=0.0: PickStageResult(kind=kind, std=99.0),
+    )
+    return calls
+
+
+def test_static_frames_reuse_ocr(monkeypatch):
+    """
+    같은 프레임이 반복되면 OCR은 첫 프레임에서만 실행
+    """
+    calls = patch_pipeline(monkeypatch)
+    session = DraftSession(Settings())
+
+    for _ in range(5):
+        res = session.step(make_dummy_frame(), WINDOW_SIZE)
+
+    assert calls["ocr"] == 1
+    assert session.metrics.frames == 5
+    assert session.metrics.changed_frames == 1
+    assert res.stable_state == "PICK"
+
+
+def test_pick_coach_requested_until_marked(monkeypatch):
+    patch_pipeline(monkeypatch)
+    session = DraftSession(Settings())
+
+    res = session.step(make_dummy_frame(), WINDOW_SIZE)
+    assert res.action == ACTION_PICK_COACH
+
+    session.mark_pick_coached()
+    res = session.step(make_dummy_frame(), WINDOW_SIZE)
+    assert res.action is None
+
+
+def test_sessions_are_independent(monkeypatch):
+    patch_pipeline(monkeypatch)
+    a = DraftSession(Settings(), session_id="a")
+    b = DraftSession(Settings(), session_id="b")
+
+    a.step(make_dummy_frame(), WINDOW_SIZE)
+    a.mark_pick_coached()
+
+    res_b = b.step(make_dummy_frame(), WINDOW_SIZE)
+    assert res_b.action == ACTION_PICK_COACH
+    assert b.pick_real_executed is False
+
+
+def test_pool_inline_runs_each_session(monkeypatch, tmp_path):
+    patch_pipeline(monkeypatch)
+    for i in range(3):
+        make_dummy_frame().save(tmp_path / f"lol_client_{1770000000000 + i * 1000}.png")
+
+    specs = [SessionSpec(session_id=f"s{i}", source_dir=tmp_path) for i in range(2)]
+    reports = SessionPool(max_workers=1).run(specs)
+
+    assert [r.session_id for r in reports] == ["s0", "s1"]
+    for rep in reports:
+        assert rep.error is None
+        assert rep.metrics["frames"] == 3
+        assert rep.actions == [(1, ACTION_PICK_COACH)]
+
+
+def test_pool_retries_pick_coach_after_failure(monkeypatch, tmp_path):
+    from app import session_pool as pool_mod
+
+    patch_pipeline(monkeypatch)
+
+    def failing_coach(session, action):
+        raise RuntimeError("503")
+
+    monkeypatch.setattr(pool_mod, "_run_coach", failing_coach)
+    for i in range(3):
+        make_dummy_frame().save(tmp_path / f"lol_client_{1770000000000 + i * 1000}.png")
+
+    (rep,) = SessionPool(max_workers=1).run([SessionSpec("s0", tmp_path, no_api=False)])
+
+    # 실패한 픽 코치는 코치 완료로 치지 않고 다음 프레임에서 다시 요청
+    assert rep.error is None
+    assert rep.actions == [(i, ACTION_PICK_COACH) for i in (1, 2, 3)]
+    assert rep.metrics["coach_calls"] == 0
+
+
+def test_pick_coach_request_reads_remaining_pick_time(monkeypatch):
+    patch_pipeline(monkeypatch)
+    digits_calls = []
+
+    def digits_ocr(img):
+        digits_calls.append(img)
+        return "24"
+
+    session = DraftSession(Settings(), digits_ocr=digits_ocr)
+    for _ in range(3):
+        res = session.step(make_dummy_frame(), WINDOW_SIZE)
+
+    assert res.action == ACTION_PICK_COACH
+    assert res.pick_seconds_left == 24
+    assert len(digits_calls) == 1  # 정적 프레임은 다시 읽지 않음
+
+
+def test_playplan_draft_requested_once_enough_picks_lock_in(monkeypatch):
+    from app import session as mod
+    from app.session import ACTION_PLAYPLAN_DRAFT
+    from pipeline.pick_slot_detector import PickSlotsResult
+
+    patch_pipeline(monkeypatch, kind="PICK_FAKE")
+    filled = {"n": 7}
+
+    def fake_slots(my, enemy, cfg):
+        n = filled["n"]
+        flags = tuple(i < n for i in range(10))
+        return PickSlotsResult(flags[:5], flags[5:], (0.0,) * 5, (0.0,) * 5)
+
+    monkeypatch.setattr(mod, "detect_pick_slots", fake_slots)
+    session = DraftSession(Settings(playplan_draft_min_picks=8))
+
+    res = session.step(make_dummy_frame(), WINDOW_SIZE)
+    assert res.action is None and res.picks_filled == 7
+
+    filled["n"] = 8
+    res = session.step(make_dummy_frame((120, 60, 200)), WINDOW_SIZE)
+    assert res.action == ACTION_PLAYPLAN_DRAFT and res.picks_filled == 8
+
+    session.mark_playplan_drafted()
+    res = session.step(make_dummy_frame((200, 200, 40)), WINDOW_SIZE)
+    assert res.action is None
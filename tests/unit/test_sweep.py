@@ -0,0 +1,80 @@
+import random
+from dataclasses import replace
+
+import numpy as np
+
+from app.features import FrameFeatures
+from app.offline import replay_decisions
+from app.session import ACTION_PICK_COACH, ACTION_PLAYPLAN_COACH
+from app.settings import Settings
+from app.sweep import NO_DECISION, SweepGrid, rolling_majority, sweep
+from pipeline.buffer import StateBuffer
+
+
+def make_feat(index, raw_state, ts, ban_std, dual):
+    return FrameFeatures(
+        index=index,
+        name=f"frame_{index}.png",
+        ts=ts,
+        status_text_raw=raw_state,
+        status_text_norm=raw_state,
+        raw_state=raw_state,
+        ban_std=ban_std,
+        timer_seconds=None,
+        timer_near_zero=False,
+        dual_symmetry=dual,
+    )
+
+
+def make_noisy_session(seed):
+    """BAN -> PICK -> PREPARE 흐름에 OCR 오인식/밴 std/dual 흔들림을 섞은 프레임들"""
+    rng = random.Random(seed)
+    feats = []
+    ts = 0.0
+    idx = 0
+    for state, n in (("BAN", 12), ("PICK", 20), ("PREPARE", 20), ("FIGHT", 4)):
+        for _ in range(n):
+            idx += 1
+            ts += rng.choice((0.3, 0.5, 1.0))
+            raw = state if rng.random() > 0.3 else rng.choice(("UNKNOWN", "BAN", "PICK", "PREPARE"))
+            feats.append(make_feat(idx, raw, ts, rng.uniform(10, 60), rng.random() > 0.35))
+    return feats
+
+
+def test_rolling_majority_matches_state_buffer():
+    rng = np.random.default_rng(0)
+    labels = rng.integers(0, 3, size=60)
+    for size in (1, 2, 4, 7):
+        major, conf = rolling_majority(labels, size, 3)
+        buf = StateBuffer(size=size)
+        for t, lab in enumerate(labels):
+            buf.push(int(lab))
+            assert major[t] == buf.get_majority()
+            assert conf[t] == buf.get_confidence()
+
+
+def test_sweep_matches_sequential_replay():
+    grid = SweepGrid(
+        state_buf_size=(3, 7),
+        stable_min_confidence=(0.5, 0.7),
+        stable_min_duration=(0.5, 1.0, 2.0),
+        pick_std_threshold=(25.0, 40.0),
+        dual_buf_size=(4, 7),
+        dual_conf_threshold=(0.6, 0.8),
+    )
+
+    for seed in range(5):
+        feats = make_noisy_session(seed)
+        if seed % 2:
+            # timestamp 있는/없는 파일명이 섞인 폴더: 재생과 sweep이 같은 시각 규칙을 써야 한다
+            feats = [replace(f, ts=None) if f.index % 4 == 0 else f for f in feats]
+        res = sweep(feats, grid)
+        assert len(res) == grid.size
+
+        for row in res.rows():
+            settings = Settings(
+                **{k: row[k] for k in row if k not in ("pick_frame", "playplan_frame")}
+            )
+            decisions = dict((a, i) for i, a in replay_decisions(feats, settings))
+            assert row["pick_frame"] == decisions.get(ACTION_PICK_COACH, NO_DECISION), row
+            assert row["playplan_frame"] == decisions.get(ACTION_PLAYPLAN_COACH, NO_DECISION), row
@@ -0,0 +1,138 @@
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from app.session import ACTION_PICK_COACH, DraftSession
+from app.settings import Settings
+from core.roi_layout import get_roi_layout
+from pipeline.pick_stage_detector import PickStageResult
+from pipeline.timer_bar_estimator import BarFill, TimerBarCountdown, measure_bar_fill
+
+WINDOW_SIZE = (1600, 900)
+BAR_W = 700
+
+
+def make_bar(left_fill, right_fill, w=BAR_W, h=6):
+    """가운데로 줄어드는 바: 각 절반의 안쪽 left_fill/right_fill 만큼 칠함"""
+    img = Image.new("RGB", (w, h), (20, 30, 50))
+    draw = ImageDraw.Draw(img)
+    half = w * (0.5 - 0.0625)
+    if left_fill > 0:
+        draw.rectangle((int(half * (1 - left_fill)), 0, int(half) - 1, h - 1), fill=(200, 170, 90))
+    if right_fill > 0:
+        start = int(w - half)
+        draw.rectangle((start, 0, start + int(half * right_fill) - 1, h - 1), fill=(200, 170, 90))
+    return img
+
+
+def test_measure_bar_fill_per_side():
+    fill = measure_bar_fill(make_bar(0.5, 0.0))
+    assert fill.left == pytest.approx(0.5, abs=0.02) and fill.right == pytest.approx(0.0, abs=0.02)
+
+    fill = measure_bar_fill(np.asarray(make_bar(0.8, 0.8)))
+    assert fill.left == pytest.approx(0.8, abs=0.02) and fill.fraction == pytest.approx(
+        0.8, abs=0.02
+    )
+
+
+def test_particles_do_not_count_as_fill():
+    img = make_bar(0.0, 0.0)
+    img.putpixel((40, 2), (255, 255, 255))
+    assert measure_bar_fill(img).fraction == 0.0
+
+
+def test_countdown_smooths_and_resets_on_refill():
+    cd = TimerBarCountdown()
+    assert cd.update(0.0, "PICK", BarFill(1.0, 0.0)) == pytest.approx(30.0)
+
+    # 관측이 튀어도(1초 뒤 26초) 예측(29초) 쪽으로 당겨진다
+    est = cd.update(1.0, "PICK", BarFill(26 / 30, 0.0))
+    assert 26.0 < est < 29.0
+    assert cd.remaining(2.0) == pytest.approx(est - 1.0)
+
+    # 바가 다시 참 = 새 턴
+    assert cd.update(5.0, "PICK", BarFill(1.0, 0.0)) == pytest.approx(30.0)
+
+    # 단계가 바뀌면 그 단계 길이로 새로 시작
+    assert cd.update(6.0, "PREPARE", BarFill(0.5, 0.5)) == pytest.approx(15.0)
+
+
+def test_calibrate_learns_phase_duration():
+    cd = TimerBarCountdown()
+    cd.update(0.0, "PICK", BarFill(0.5, 0.0))
+    assert not cd.calibrated("PICK")
+
+    cd.calibrate("PICK", 13)  # 바 절반 = 13초 -> 전체 26초
+    assert not cd.calibrated("PICK") and cd.remaining(0.0) == 13.0  # 한 번으로는 안 믿는다
+
+    cd.update(1.0, "PICK", BarFill(0.45, 0.0))
+    cd.calibrate("PICK", 12)  # 26.7초: 일치
+    assert cd.calibrated("PICK") and cd.duration("PICK") == pytest.approx(26.3, abs=0.1)
+
+
+def test_calibrate_rejects_misread_and_rechecks():
+    cd = TimerBarCountdown()
+    cd.update(0.0, "PICK", BarFill(0.9, 0.0))
+    cd.calibrate("PICK", 2)  # "27" -> "2": 2.2초짜리 타이머는 없다
+    assert cd.duration("PICK") == 30.0 and cd.remaining(0.0) == pytest.approx(27.0)
+
+    for t, fill, secs in ((1.0, 0.9, 27), (2.0, 0.87, 26)):
+        cd.update(t, "PICK", BarFill(fill, 0.0))
+        cd.calibrate("PICK", secs)
+    assert cd.calibrated("PICK")
+    assert not cd.recheck_due("PICK", 5.0) and cd.recheck_due("PICK", 7.0)
+
+    # 다시 읽은 값이 보정값과 어긋나면 다시 두 번 맞을 때까지 믿지 않는다
+    cd.update(8.0, "PICK", BarFill(0.5, 0.0))
+    cd.calibrate("PICK", 20)  # 40초
+    assert not cd.calibrated("PICK")
+
+
+def test_session_uses_calibrated_bar_for_pick_deadline(monkeypatch):
+    from app import session as mod
+
+    monkeypatch.setattr(mod, "extract_text", lambda img: "챔피언을 선택하세요")
+    monkeypatch.setattr(
+        mod,
+        "detect_pick_kind_from_banned_strips",
+        lambda my, enemy, std_threshold=0.0: PickStageResult(kind="PICK_REAL", std=99.0),
+    )
+    digits_calls = []
+
+    def digits_ocr(img):
+        digits_calls.append(img)
+        return "15"
+
+    def frame(fill, bg):
+        img = Image.new("RGB", WINDOW_SIZE, bg)
+        left, top, right, bottom = get_roi_layout(WINDOW_SIZE).rect("BANPICK_TIMER_BAR")
+        img.paste(make_bar(fill, 0.0, right - left, bottom - top), (left, top))
+        return img
+
+    session = DraftSession(Settings(), digits_ocr=digits_ocr)
+    for i, (fill, t) in enumerate(((0.5, 0.0), (0.5, 0.5))):
+        res = session.step(frame(fill, (30 + 40 * i, 30, 30)), WINDOW_SIZE, now=t)
+        assert res.action == ACTION_PICK_COACH
+        assert res.pick_seconds_left == 15 and len(digits_calls) == i + 1  # 숫자 OCR + 보정
+        session.pick_real_executed = False  # 다시 요청되는 상황
+    assert session.countdown.calibrated("PICK")
+    assert session.countdown.duration("PICK") == pytest.approx(30.0, abs=1.0)
+
+    res = session.step(frame(0.4, (32, 32, 60)), WINDOW_SIZE, now=3.0)
+    assert res.action == ACTION_PICK_COACH
+    assert len(digits_calls) == 2  # 두 번 맞은 뒤에는 OCR 없이 바 추정
+    assert res.pick_seconds_left == int(res.timer_left) and 11 <= res.pick_seconds_left <= 12
+
+    session.pick_real_executed = False
+    session.step(frame(0.2, (34, 34, 60)), WINDOW_SIZE, now=9.0)
+    assert len(digits_calls) == 3  # recheck_sec가 지나면 다시 숫자 OCR로 확인
+
+
+def test_countdown_skips_when_bar_crop_is_not_sent(monkeypatch):
+    from app import session as mod
+    from app.rois import Rois
+
+    monkeypatch.setattr(mod, "extract_text", lambda img: "금지할 챔피언")
+    session = DraftSession(Settings(stable_min_duration=0.0))
+    res = session.step_rois(Rois.from_crops({"status_img": Image.new("RGB", (700, 60))}), now=0.0)
+    assert res.stable_state == "BAN" and res.timer_left is None
@@ -0,0 +1,133 @@
+import json
+import threading
+import time
+
+import pytest
+
+from app.token_bus import (
+    EVENT_END,
+    EVENT_ERROR,
+    EVENT_START,
+    EVENT_TOKEN,
+    JsonlSubscriber,
+    TokenBus,
+    TokenSubscriber,
+    WebSocketSubscriber,
+)
+from core.clock import VirtualClock
+
+
+class Collector(TokenSubscriber):
+    def __init__(self, name="collector", gate=None, **kwargs):
+        super().__init__(**kwargs)
+        self.name = name
+        self.gate = gate
+        self.events = []
+
+    def handle(self, event):
+        if self.gate is not None:
+            self.gate.wait()
+        self.events.append(event)
+
+
+def test_fan_out_preserves_order():
+    a, b = Collector("a"), Collector("b")
+    with TokenBus([a, b]) as bus:
+        text = bus.stream("PICK_COACH", iter(["안녕", "하세요", "!"]))
+    assert text == "안녕하세요!"
+
+    for sub in (a, b):
+        assert [e.kind for e in sub.events] == [
+            EVENT_START,
+            EVENT_TOKEN,
+            EVENT_TOKEN,
+            EVENT_TOKEN,
+            EVENT_END,
+        ]
+        assert "".join(e.text for e in sub.events) == text
+        assert sub.last_stats.tokens == 3 and sub.last_stats.dropped == 0
+
+
+def test_slow_subscriber_does_not_block_stream():
+    gate = threading.Event()
+    slow = Collector("slow", gate=gate, maxsize=4)
+    fast = Collector("fast")
+    bus = TokenBus([slow, fast])
+
+    t0 = time.perf_counter()
+    text = bus.stream("PLAYPLAN_COACH", (str(i % 10) for i in range(200)))
+    assert time.perf_counter() - t0 < 1.0  # slow 구독자는 막혀 있음
+    assert len(text) == 200
+
+    gate.set()
+    bus.close()
+
+    assert [e.kind for e in slow.events][0] == EVENT_START
+    assert slow.events[-1].kind == EVENT_END
+    assert slow.last_stats.dropped == 200 - slow.last_stats.tokens
+    assert slow.last_stats.dropped > 0
+
+    assert fast.last_stats.tokens == 200
+    assert fast.last_stats.dropped == 0
+
+
+def test_producer_ttft_and_gaps():
+    clock = VirtualClock()
+
+    def stream():
+        clock.sleep(0.5)
+        for t in ("a", "b", "c"):
+            yield t
+            clock.sleep(0.1)
+
+    with TokenBus(clock=clock) as bus:
+        bus.stream("PICK_COACH", stream())
+
+    s = bus.stats()[TokenBus.PRODUCER]
+    assert s.ttft_ms == pytest.approx(500.0)
+    assert s.gap_ms["mean"] == pytest.approx(100.0)
+    assert s.tokens == 3
+
+
+def test_stream_error_is_published_and_raised():
+    sub = Collector()
+
+    def broken():
+        yield "x"
+        raise RuntimeError("boom")
+
+    with TokenBus([sub]) as bus:
+        with pytest.raises(RuntimeError):
+            bus.stream("PICK_COACH", broken())
+
+    assert [e.kind for e in sub.events] == [EVENT_START, EVENT_TOKEN, EVENT_ERROR]
+    assert "boom" in sub.events[-1].text
+
+
+def test_jsonl_subscriber(tmp_path):
+    path = tmp_path / "tokens.jsonl"
+    with TokenBus([JsonlSubscriber(path)]) as bus:
+        bus.stream("PICK_COACH", iter(["가", "나"]))
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [m["type"] for m in lines] == ["coach_start", "coach_token", "coach_token", "coach_end"]
+    assert [m.get("text") for m in lines[1:3]] == ["가", "나"]
+
+
+def test_websocket_subscriber_broadcasts():
+    from websockets.sync.client import connect
+
+    ws_sub = WebSocketSubscriber(port=0)
+    bus = TokenBus([ws_sub])
+    try:
+        with connect(f"ws://127.0.0.1:{ws_sub.port}") as client:
+            deadline = time.time() + 5
+            while ws_sub.client_count == 0 and time.time() < deadline:
+                time.sleep(0.01)
+
+            bus.stream("PICK_COACH", iter(["a", "b"]))
+            msgs = [json.loads(client.recv(timeout=5)) for _ in range(4)]
+    finally:
+        bus.close()
+
+    assert [m["type"] for m in msgs] == ["coach_start", "coach_token", "coach_token", "coach_end"]
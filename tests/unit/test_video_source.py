@@ -0,0 +1,85 @@
+import io
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from app.video_source import FrameSkipper, RawRgbStreamFrameSource, VideoFileFrameSource
+from pipeline.frame_change_detector import FrameChangeDetector
+
+W, H = 160, 90
+
+
+def raw_stream(n):
+    """프레임 i의 모든 픽셀 값이 i인 rgb24 스트림"""
+    return io.BytesIO(b"".join(bytes([i]) * (W * H * 3) for i in range(n)))
+
+
+def test_frame_skipper_keeps_target_rate():
+    skipper = FrameSkipper(src_fps=60, target_fps=15)
+    kept = [i for i in range(120) if skipper.keep(i)]
+    assert len(kept) == 30
+    assert kept[:4] == [0, 4, 8, 12]
+
+    assert all(FrameSkipper(30, 0).keep(i) for i in range(10))
+    assert all(FrameSkipper(30, 60).keep(i) for i in range(10))
+
+
+def test_raw_stream_reuses_buffer_and_skips():
+    src = RawRgbStreamFrameSource(raw_stream(12), W, H, src_fps=30, target_fps=10)
+
+    seen = []
+    buffers = set()
+    for frame in src:
+        seen.append((frame.index, frame.source_index, int(frame.array[0, 0, 0])))
+        buffers.add(frame.array.__array_interface__["data"][0])
+
+    assert seen == [(1, 0, 0), (2, 3, 3), (3, 6, 6), (4, 9, 9)]
+    assert len(buffers) == 1
+
+
+def test_raw_stream_drops_truncated_tail_and_limit():
+    data = raw_stream(3).getvalue()[:-10]
+    assert [f.source_index for f in RawRgbStreamFrameSource(io.BytesIO(data), W, H, 30)] == [0, 1]
+    assert len(list(RawRgbStreamFrameSource(raw_stream(5), W, H, 30, limit=2))) == 2
+
+
+def test_video_file_source(tmp_path):
+    path = tmp_path / "clip.avi"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 30, (W, H))
+    for i in range(9):
+        bgr = np.zeros((H, W, 3), dtype=np.uint8)
+        bgr[..., 2] = 20 * i  # R 채널
+        writer.write(bgr)
+    writer.release()
+
+    src = VideoFileFrameSource(path, target_fps=10)
+    frames = [
+        (f.source_index, f.ts, int(f.array[H // 2, W // 2, 0]), f.array.ctypes.data) for f in src
+    ]
+
+    assert [f[0] for f in frames] == [0, 3, 6]
+    assert frames[1][1] == 0.1
+    assert [abs(f[2] - 20 * f[0]) <= 4 for f in frames] == [True] * 3  # MJPG 손실 허용
+    assert len({f[3] for f in frames}) == 1
+
+
+def test_change_detector_accepts_arrays():
+    base = np.full((900, 1600, 3), 50, dtype=np.uint8)
+    det = FrameChangeDetector()
+
+    assert det.update(base, (1600, 900)) is True
+    assert det.update(base.copy(), (1600, 900)) is False
+
+    changed = base.copy()
+    changed[60:104, 760:840] = 200  # 타이머 숫자 영역
+    assert det.update(changed, (1600, 900)) is True
+
+    # PIL 경로와 같은 ROI 크롭
+    from core.roi_layout import get_roi_layout
+
+    layout = get_roi_layout((1600, 900))
+    assert np.array_equal(
+        np.asarray(layout.crop(changed, "BANPICK_TIMER_DIGITS")),
+        np.asarray(layout.crop(Image.fromarray(changed), "BANPICK_TIMER_DIGITS")),
+    )